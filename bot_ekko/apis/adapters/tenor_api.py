@@ -1,6 +1,7 @@
 import os
 import random
 import requests
+from functools import partial
 from typing import Optional, Any
 from requests import Response
 
@@ -31,13 +32,14 @@ class TenorAPI:
         self.temp_dir = os.path.join(os.getcwd(), "bot_ekko", "assets", "temp_gifs")
         os.makedirs(self.temp_dir, exist_ok=True)
 
-    def fetch_random_gif(self, query: str, limit: int = 1) -> None:
+    def fetch_random_gif(self, query: str, limit: int = 1, enqueue: bool = False) -> None:
         """
         Fetches a random GIF for the given query.
 
         Args:
             query (str): Search term.
             limit (int, optional): Number of results to fetch to pick from. Defaults to 1.
+            enqueue (bool, optional): Queue the GIF behind playing media instead of showing it now.
         """
         # Tenor V2 Endpoint
         url = "https://tenor.googleapis.com/v2/search"
@@ -49,9 +51,9 @@ class TenorAPI:
             "media_filter": "gif" 
         }
         logger.info(f"Fetching Tenor gif for: {query}")
-        self.external_apis.get(url, params=params, callback=self._on_gif_received)
+        self.external_apis.get(url, params=params, callback=partial(self._on_gif_received, enqueue=enqueue))
 
-    def _on_gif_received(self, response: Optional[Response]) -> None:
+    def _on_gif_received(self, response: Optional[Response], enqueue: bool = False) -> None:
         """Callback for when GIF metadata is received."""
         if not response or response.status_code != 200:
             logger.error(f"Failed to fetch Tenor metadata: {response.status_code if response else 'No Response'}")
@@ -76,11 +78,11 @@ class TenorAPI:
                 logger.error("No GIF URL found in media formats")
                 return
 
-            self._download_gif(gif_url)
+            self._download_gif(gif_url, enqueue)
         except Exception as e:
             logger.error(f"Error parsing Tenor response: {e}")
 
-    def _download_gif(self, url: str) -> None:
+    def _download_gif(self, url: str, enqueue: bool = False) -> None:
         """Downloads the GIF from the URL."""
         try:
             response = requests.get(url) 
@@ -92,18 +94,21 @@ class TenorAPI:
                     f.write(response.content)
                 
                 logger.info(f"Downloaded GIF to {filepath}")
-                self._trigger_display(filepath)
+                self._trigger_display(filepath, enqueue)
             else:
                 logger.error(f"Failed to download GIF content: {response.status_code}")
         except Exception as e:
             logger.error(f"Error downloading GIF: {e}")
 
-    def _trigger_display(self, filepath: str) -> None:
-        """Issues a command to display the downloaded GIF."""
+    def _trigger_display(self, filepath: str, enqueue: bool = False) -> None:
+        """Issues a command to display (or enqueue) the downloaded GIF."""
         params = {
             "target_state": "CANVAS",
+            "show": "gif",
+            "value": filepath,
             "media_type": "gif",
             "media_path": filepath,
+            "enqueue": enqueue,
             "save_history": True
         }
         self.command_center.issue_command(CommandNames.CHANGE_STATE, params=params)
@@ -0,0 +1,227 @@
+import itertools
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from bot_ekko.core.logger import get_logger
+from bot_ekko.core.models import CommandNames
+
+if TYPE_CHECKING:
+    from bot_ekko.core.command_center import CommandCenter
+    from bot_ekko.core.state_machine import StateHandler
+
+logger = get_logger("StateArbiter")
+
+
+class ClaimSource:
+    ADAPTER = "adapter"  # idle moods and the adapter's own state progressions (WAKING -> ACTIVE)
+    SCHEDULER = "scheduler"
+    GESTURE = "gesture"
+    BLE = "ble"
+    INTERRUPTS = "interrupts"
+
+
+# Higher wins; a source not listed here claims at 0
+CLAIM_PRIORITIES: Dict[str, int] = {
+    ClaimSource.ADAPTER: 0,
+    ClaimSource.SCHEDULER: 10,
+    ClaimSource.GESTURE: 20,
+    ClaimSource.BLE: 30,
+    ClaimSource.INTERRUPTS: 40,
+}
+
+
+class Claim:
+    """
+    A source's desired state.
+    hold_ms None holds until released; 0 is a one-shot request, dropped once it has been arbitrated;
+    > 0 holds for that long.
+    """
+    __slots__ = ("source", "state", "params", "priority", "expires_at", "seq")
+
+    def __init__(self, source: str, state: str, params: Optional[dict], priority: int,
+                 expires_at: Optional[int], seq: int):
+        self.source = source
+        self.state = state
+        self.params = params
+        self.priority = priority
+        self.expires_at = expires_at
+        self.seq = seq
+
+    @property
+    def one_shot(self) -> bool:
+        return self.expires_at == -1
+
+    def __repr__(self):
+        return f"Claim({self.source}: {self.state}, P:{self.priority})"
+
+
+class ClaimOutcome:
+    """Result of the last arbitration for a source's claim."""
+    __slots__ = ("source", "state", "won", "reason", "winner")
+
+    def __init__(self, source: str, state: str, won: bool, reason: str, winner: Optional[str]):
+        self.source = source
+        self.state = state
+        self.won = won
+        self.reason = reason
+        self.winner = winner
+
+    def __repr__(self):
+        return f"{self.source} -> {self.state}: {self.reason}"
+
+
+class StateArbiter:
+    """
+    Decides the state from prioritized claims of every behaviour source.
+
+    Sources call claim()/release() (through CommandCenter.request_state()/release_state()) instead of
+    issuing CHANGE_STATE themselves. update() runs once per frame on the main loop and recomputes the
+    winner only when a claim changed, expired or the state was changed by someone else; each change of
+    winner issues at most one transition. Losing sources can read why from outcome().
+    """
+    def __init__(self, command_center: "CommandCenter", state_handler: "StateHandler",
+                 priorities: Optional[Dict[str, int]] = None) -> None:
+        """
+        Args:
+            command_center (CommandCenter): Executes the winning transition.
+            state_handler (StateHandler): Current state, transition graph and clock.
+            priorities (dict, optional): Source -> priority. Defaults to CLAIM_PRIORITIES.
+        """
+        self.command_center = command_center
+        self.state_handler = state_handler
+        self.priorities = dict(priorities if priorities is not None else CLAIM_PRIORITIES)
+        self.claims: Dict[str, Claim] = {}
+        self.outcomes: Dict[str, ClaimOutcome] = {}
+        self._seq = itertools.count()
+        self._dirty = False
+        self._next_expiry: Optional[int] = None
+        self._last_state: Optional[str] = None
+        # Claim (and its seq) whose transition was last issued, so an unchanged winner is not re-issued
+        self._issued: Optional[Claim] = None
+        self.transitions = 0
+
+    def claim(self, source: str, state: str, params: Optional[dict] = None, hold_ms: Optional[int] = 0) -> None:
+        """
+        Sets a source's desired state, replacing its previous claim. Repeating the same claim is a no-op.
+
+        Args:
+            source (str): ClaimSource value.
+            state (str): Desired state.
+            params (dict, optional): Params for the transition.
+            hold_ms (int, optional): 0 (default) for a one-shot request, None to hold until released,
+                > 0 to hold for that many ms.
+        """
+        if hold_ms is None:
+            expires_at = None
+        elif hold_ms == 0:
+            expires_at = -1
+        else:
+            expires_at = self.state_handler.clock.ticks() + hold_ms
+            if self._next_expiry is None or expires_at < self._next_expiry:
+                self._next_expiry = expires_at
+
+        current = self.claims.get(source)
+        if current is not None and current.state == state and current.params == params \
+                and (current.expires_at is None) == (expires_at is None) and current.one_shot == (expires_at == -1):
+            # Same claim: a timed one is refreshed in place, without a new arbitration
+            current.expires_at = expires_at
+            return
+
+        self.claims[source] = Claim(source, state, params, self.priorities.get(source, 0), expires_at,
+                                    next(self._seq))
+        self._dirty = True
+
+    def release(self, source: str) -> None:
+        """
+        Withdraws a source's claim. The next best claim (if any) becomes the winner.
+
+        Args:
+            source (str): ClaimSource value.
+        """
+        if self.claims.pop(source, None) is not None:
+            self._dirty = True
+
+    def outcome(self, source: str) -> Optional[ClaimOutcome]:
+        """
+        Args:
+            source (str): ClaimSource value.
+
+        Returns:
+            Optional[ClaimOutcome]: Whether the source's last arbitrated claim won and why not, or None.
+        """
+        return self.outcomes.get(source)
+
+    def winner(self) -> Optional[Claim]:
+        """
+        Returns:
+            Optional[Claim]: The claim whose transition was last issued, if it is still held.
+        """
+        issued = self._issued
+        return issued if issued is not None and self.claims.get(issued.source) is issued else None
+
+    def update(self) -> None:
+        """
+        Arbitrates if anything changed since the last call. Call once per frame, after the command queue is drained.
+        """
+        state_handler = self.state_handler
+        current_state = state_handler.get_state()
+        if current_state != self._last_state:
+            self._last_state = current_state
+            self._dirty = True
+
+        if self._next_expiry is not None and state_handler.clock.ticks() > self._next_expiry:
+            self._expire(state_handler.clock.ticks())
+
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._arbitrate(current_state)
+
+    def _expire(self, now: int) -> None:
+        next_expiry = None
+        for source, claim in list(self.claims.items()):
+            if claim.expires_at is None or claim.expires_at < 0:
+                continue
+            if claim.expires_at < now:
+                del self.claims[source]
+                self.outcomes[source] = ClaimOutcome(source, claim.state, False, "expired", None)
+                self._dirty = True
+            elif next_expiry is None or claim.expires_at < next_expiry:
+                next_expiry = claim.expires_at
+        self._next_expiry = next_expiry
+
+    def _arbitrate(self, current_state: str) -> None:
+        # Highest priority first; equal priorities go to the latest claim
+        ranked: List[Claim] = sorted(self.claims.values(), key=lambda c: (c.priority, c.seq), reverse=True)
+        winner: Optional[Claim] = None
+        for claim in ranked:
+            if winner is not None:
+                self._lose(claim, f"outranked by {winner.source} ({winner.state}, P:{winner.priority})", winner.source)
+                continue
+            if claim.state != current_state and self.state_handler.resolve_transition(claim.state, claim.params) is None:
+                self._lose(claim, f"transition {current_state} -> {claim.state} denied", None)
+                continue
+            winner = claim
+
+        if winner is None:
+            return
+        self.outcomes[winner.source] = ClaimOutcome(winner.source, winner.state, True, "won", winner.source)
+        if winner.one_shot:
+            del self.claims[winner.source]
+
+        if winner is self._issued:
+            return
+        self._issued = winner
+        if winner.state == current_state:
+            return
+
+        logger.info(f"{winner.source} wins: {current_state} -> {winner.state}")
+        params = dict(winner.params or {}, target_state=winner.state)
+        self.transitions += 1
+        # The state change itself triggers the next arbitration, which retries claims denied from the old state
+        self.command_center.execute(CommandNames.CHANGE_STATE, params=params)
+
+    def _lose(self, claim: Claim, reason: str, winner: Optional[str]) -> None:
+        logger.debug(f"{claim.source} claim for {claim.state} lost: {reason}")
+        self.outcomes[claim.source] = ClaimOutcome(claim.source, claim.state, False, reason, winner)
+        if claim.one_shot:
+            del self.claims[claim.source]
@@ -1,13 +1,20 @@
+import signal
 import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import multiprocessing
 from bot_ekko.core.errors import (
     ServiceInitializationError,
     ServiceDependencyError
 )
 from bot_ekko.core.logger import get_logger
+from bot_ekko.core.recorder import InputRecorder
+from bot_ekko.core.clock import Clock, RealClock
+from bot_ekko.core.shared_stats import SharedStats
+from bot_ekko.core.metrics import REGISTRY, CounterChild, GaugeChild
 import pygame
 
 class ServiceStatus(Enum):
@@ -18,11 +25,35 @@ class ServiceStatus(Enum):
     STOPPED = "STOPPED"
     ERROR = "ERROR"
 
+# Status codes stored in shared memory (index into this tuple)
+_STATUSES = tuple(ServiceStatus)
+
+SERVICE_EVENTS = REGISTRY.counter("ekko_service_events_total", "Events counted by services (increment_stat).",
+                                  ("service", "stat"))
+SERVICE_STATS = REGISTRY.gauge("ekko_service_stat", "Numeric service stats (update_stat and ProcessService slots).",
+                               ("service", "stat"))
+SERVICE_UPDATE_SECONDS = REGISTRY.histogram("ekko_service_update_seconds", "Duration of update() on the main loop.",
+                                            ("service",))
+SERVICE_RUNNING = REGISTRY.gauge("ekko_service_running", "1 while the service is RUNNING.", ("service",))
+
+
+def _running(ref: "weakref.ref[BaseService]") -> int:
+    service = ref()
+    if service is None:
+        raise LookupError("service is gone")
+    return int(service.status == ServiceStatus.RUNNING)
+
 class BaseService(ABC):
     """
     Base class for all services.
     Provides basic status tracking and stats capabilities.
     """
+    # Keys (ServicesConfig fields) of services that must be up before this one starts.
+    # The built-in services declare none: they subscribe to the event bus in their constructors, before
+    # any service starts, and the hardware they set up (serial port, hci0 via hciconfig, PyAudio stream,
+    # gesture socket) isn't shared. It's for plugins that need another service's device or output.
+    depends_on: Tuple[str, ...] = ()
+
     def __init__(self, name: str, enabled: bool = False):
         """
         Initialize the BaseService.
@@ -35,8 +66,22 @@ class BaseService(ABC):
         self.logger = get_logger(f"service.{name}")
         self._status = ServiceStatus.NOT_INITIALIZED
         self._stats: Dict[str, Any] = {}
+        # Metric children, looked up once per key (see core/metrics.py)
+        self._counters: Dict[str, CounterChild] = {}
+        self._gauges: Dict[str, GaugeChild] = {}
+        self._update_time = SERVICE_UPDATE_SECONDS.labels(service=name)
+        # Read at scrape time, so it follows status changes made in a child process too
+        SERVICE_RUNNING.labels(service=name).set_function(lambda ref=weakref.ref(self): _running(ref))
         self._service_initialized = False
         self._enabled = enabled
+        # Raw inputs are appended here when recording (see InputRecorder)
+        self.recorder: Optional[InputRecorder] = None
+        # Set when new input is waiting for update(); the manager skips clean services
+        self._dirty = False
+        # Liveness: service loops call heartbeat(); the supervisor restarts a service whose
+        # last heartbeat is older than heartbeat_timeout seconds (None = loop doesn't heartbeat)
+        self.last_heartbeat = time.monotonic()
+        self.heartbeat_timeout: Optional[float] = None
     
     @property
     def enabled(self) -> bool:
@@ -54,32 +99,83 @@ class BaseService(ABC):
 
     @property
     def stats(self) -> Dict[str, Any]:
-        """Dict[str, Any]: A copy of the service statistics."""
-        return self._stats.copy()
+        """Dict[str, Any]: A copy of the service statistics, counters included."""
+        stats = self._stats.copy()
+        for key, counter in list(self._counters.items()):
+            stats[key] = counter.value
+        return stats
 
     def update_stat(self, key: str, value: Any) -> None:
         """
-        Update a statistic value.
+        Update a statistic value. Numbers are also exported as ekko_service_stat.
 
         Args:
             key (str): The statistic name.
             value (Any): The value to set.
         """
         self._stats[key] = value
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            gauge = self._gauges.get(key)
+            if gauge is None:
+                gauge = self._gauges.setdefault(key, SERVICE_STATS.labels(service=self.service_name, stat=key))
+            gauge.set(value)
 
     def increment_stat(self, key: str, amount: int = 1) -> None:
         """
-        Increment a numeric statistic.
+        Increment a counter (ekko_service_events_total). Safe from any thread.
 
         Args:
             key (str): The statistic name.
             amount (int, optional): Amount to increment by. Defaults to 1.
         """
-        current = self._stats.get(key, 0)
-        if isinstance(current, (int, float)):
-            self._stats[key] = current + amount
-        else:
-            self.logger.warning(f"Cannot increment non-numeric stat: {key}")
+        counter = self._counters.get(key)
+        if counter is None:
+            current = self._stats.get(key, 0)
+            if not isinstance(current, (int, float)):
+                self.logger.warning(f"Cannot increment non-numeric stat: {key}")
+                return
+            counter = self._counters.setdefault(key, SERVICE_EVENTS.labels(service=self.service_name, stat=key))
+            if key in self._stats:
+                # Set with update_stat before; the counter carries on from that value
+                counter.inc(self._stats.pop(key))
+        counter.inc(amount)
+
+    def heartbeat(self) -> None:
+        """Records that the service loop is alive. Called from the service's own thread."""
+        self.last_heartbeat = time.monotonic()
+
+    def mark_dirty(self) -> None:
+        """
+        Flags that update() has work to do. Safe to call from any thread;
+        call it after publishing the input so update() is guaranteed to see it.
+        """
+        self._dirty = True
+
+    def consume_dirty(self) -> bool:
+        """
+        Clears the dirty flag. Called on the main loop right before update().
+
+        Returns:
+            bool: True if the service was marked dirty since the last call.
+        """
+        dirty = self._dirty
+        self._dirty = False
+        return dirty
+
+    def record_update(self, elapsed_ms: float) -> None:
+        """
+        Accumulates the cost of one update() call in the stats (updates, update_time_ms, update_time_max_ms)
+        and the ekko_service_update_seconds histogram. Called on the main loop only.
+
+        Args:
+            elapsed_ms (float): Duration of the call.
+        """
+        self._update_time.observe(elapsed_ms / 1000)
+        stats = self._stats
+        stats["updates"] = stats.get("updates", 0) + 1
+        stats["update_time_ms"] = stats.get("update_time_ms", 0.0) + elapsed_ms
+        if elapsed_ms > stats.get("update_time_max_ms", 0.0):
+            stats["update_time_max_ms"] = elapsed_ms
 
     def set_status(self, status: ServiceStatus) -> None:
         """
@@ -102,6 +198,18 @@ class BaseService(ABC):
         self._status = ServiceStatus.INITIALIZED
         self.logger.info(f"Service: {self.service_name} initialized")
 
+    def reconfigure(self, config: Any) -> bool:
+        """
+        Applies a changed config without restarting, if the service supports it.
+
+        Args:
+            config (Any): The service's new pydantic config.
+
+        Returns:
+            bool: True if applied in place, False if the service has to be recreated.
+        """
+        return False
+
     @abstractmethod
     def start(self) -> None:
         """Start the service."""
@@ -177,6 +285,7 @@ class ThreadedService(BaseService, threading.Thread):
     def run(self) -> None:
         """Main thread loop wrapper."""
         self.set_status(ServiceStatus.RUNNING)
+        self.heartbeat()
         try:
             self._run()
         except Exception as e:
@@ -197,17 +306,76 @@ class ThreadedService(BaseService, threading.Thread):
 class ProcessService(BaseService, multiprocessing.Process):
     """
     Service that runs in its own process.
+
+    Status, heartbeat, last_error and the slots declared in stat_counters / stat_gauges live in a
+    shared memory block (SharedStats), so update_stat()/increment_stat() in the child are visible
+    to the parent's stats, status and supervisor. Other keys stay local to the calling process.
     """
+    # Integer and float stats the child reports to the parent
+    stat_counters: Tuple[str, ...] = ()
+    stat_gauges: Tuple[str, ...] = ()
+
     def __init__(self, name: str, daemon: bool = True):
+        # Created first: BaseService.__init__ already writes _status and last_heartbeat
+        self._shared = SharedStats(self.stat_counters, self.stat_gauges)
         BaseService.__init__(self, name)
         multiprocessing.Process.__init__(self, name=name, daemon=daemon)
         self._stop_event = multiprocessing.Event()
+        # The slots are exported from the parent, read from shared memory at scrape time
+        shared = weakref.ref(self._shared)
+        for key in self.stat_counters + self.stat_gauges:
+            SERVICE_STATS.labels(service=name, stat=key).set_function(lambda key=key: shared().get(key))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Metric children hold locks; a spawned child looks up its own
+        state = self.__dict__.copy()
+        state.update(_counters={}, _gauges={}, _update_time=None)
+        return state
+
+    @property
+    def _status(self) -> ServiceStatus:
+        return _STATUSES[self._shared.status]
+
+    @_status.setter
+    def _status(self, status: ServiceStatus) -> None:
+        self._shared.status = _STATUSES.index(status)
+
+    @property
+    def last_heartbeat(self) -> float:
+        return self._shared.heartbeat
+
+    @last_heartbeat.setter
+    def last_heartbeat(self, value: float) -> None:
+        self._shared.heartbeat = value
 
     @property
     def status(self) -> ServiceStatus:
-        if self.is_alive():
-            return ServiceStatus.RUNNING
-        return self._status
+        status = self._status
+        if status == ServiceStatus.RUNNING and self.exitcode is not None:
+            # The child exited without reporting (killed, segfault)
+            return ServiceStatus.ERROR
+        return status
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Dict[str, Any]: Local stats merged with the live shared ones."""
+        stats = super().stats
+        stats.update(self._shared.snapshot())
+        return stats
+
+    def update_stat(self, key: str, value: Any) -> None:
+        if key == "last_error":
+            self._shared.last_error = str(value)
+        elif self._shared.has(key):
+            self._shared.set(key, value)
+        else:
+            super().update_stat(key, value)
+
+    def increment_stat(self, key: str, amount: int = 1) -> None:
+        if self._shared.has(key):
+            self._shared.increment(key, amount)
+        else:
+            super().increment_stat(key, amount)
 
     def init(self) -> None:
         super().init()
@@ -224,21 +392,33 @@ class ProcessService(BaseService, multiprocessing.Process):
         if self.is_alive():
             self.logger.warning("Service is already running")
             return
-            
-        multiprocessing.Process.start(self)
-        # Optimistically set status in parent, though property uses is_alive()
+
+        # Set before the child runs, so a child that finishes at once isn't overwritten with RUNNING
         self.set_status(ServiceStatus.RUNNING)
+        try:
+            multiprocessing.Process.start(self)
+        except Exception:
+            self.set_status(ServiceStatus.ERROR)
+            raise
 
     def stop(self) -> None:
-        """Signal the service to stop."""
+        """Signal the service to stop. The child reports STOPPED when it exits."""
         self.logger.info("Stopping service...")
         self._stop_event.set()
         # We don't verify stop here, caller should join() or check status
 
+    def close(self) -> None:
+        """Releases the process and its shared stats block. Call after join()."""
+        multiprocessing.Process.close(self)
+        self._shared.close()
+
     def run(self) -> None:
         """Main process loop wrapper."""
-        # Note: In child process, self._status updates are local
+        # A forked child inherits the parent's SIGTERM handler (pygame/SDL installs one),
+        # which would make terminate() a no-op
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
         self.set_status(ServiceStatus.RUNNING)
+        self.heartbeat()
         try:
             self._run()
         except Exception as e:
@@ -260,9 +440,11 @@ class ProcessService(BaseService, multiprocessing.Process):
 
 class BasePhysicsEngine(ABC):
 
-    def __init__(self):
+    def __init__(self, clock: Optional[Clock] = None):
         self.target_x, self.target_y = 0, 0
         self.last_gaze = 0
+        # Adapters replace this with their own clock
+        self.clock: Clock = clock or RealClock()
     
     
     def set_look_at(self, x: int, y: int) -> None:
@@ -275,8 +457,13 @@ class BasePhysicsEngine(ABC):
         """
         self.target_x = x
         self.target_y = y
-        self.last_gaze = pygame.time.get_ticks()
+        self.last_gaze = self.clock.ticks()
         logger.debug(f"Eyes set to look at ({x}, {y})")
+
+    def blink(self) -> None:
+        """Starts a blink unless one is already in progress."""
+        if self.blink_phase == "IDLE":
+            self.blink_phase = "CLOSING"
         
 from abc import abstractmethod
 from datetime import datetime
@@ -284,8 +471,9 @@ import pygame
 from bot_ekko.core.render_engine import AbstractRenderEngine
 from bot_ekko.core.state_registry import StateRegistry
 from bot_ekko.core.logger import get_logger
-from bot_ekko.core.models import CommandNames
+from bot_ekko.core.arbiter import ClaimSource
 from bot_ekko.core.scheduler import Scheduler
+from bot_ekko.sys_config import SCHEDULE_GRACE_MS, SCHEDULE_RECHECK_MS
 
 logger = get_logger("BaseStateRenderer")
 
@@ -294,18 +482,39 @@ class BaseStateRenderer(AbstractRenderEngine):
     Base class for state-based renderers.
     Handles scheduling and dynamic dispatch to state handlers.
     """
-    def __init__(self, state_machine):
+    def __init__(self, state_machine, clock: Optional[Clock] = None):
         self.state_machine = state_machine
         self.state_handler = None
         self.command_center = None
         self.scheduler = None
+        # Time and RNG for idle behaviour and schedules
+        self.clock: Clock = clock or RealClock()
+        # Set to 0 after resuming from a checkpoint: the resumed state is already correct
+        self.schedule_grace_ms = SCHEDULE_GRACE_MS
+        # The schedule is only re-evaluated at its next boundary (in ticks) or when the state changes
+        self._schedule_state: Optional[str] = None
+        self._schedule_due = 0
 
     def set_dependencies(self, state_handler, command_center, system_config=None):
         self.state_handler = state_handler
         self.command_center = command_center
         
         events = system_config.schedules if system_config else []
-        self.scheduler = Scheduler(events)
+        self.scheduler = Scheduler(events, clock=self.clock)
+        self._schedule_state = None
+
+    def reload_schedules(self, events) -> None:
+        """
+        Swaps in new schedule events (config hot-reload) and re-evaluates them on the next update.
+
+        Args:
+            events (List[Dict]): Schedule entries from config.json.
+        """
+        if self.scheduler is None:
+            self.scheduler = Scheduler(events, clock=self.clock)
+        else:
+            self.scheduler.set_events(events)
+        self._schedule_state = None
 
     def update(self, now: int) -> None:
         """
@@ -339,16 +548,54 @@ class BaseStateRenderer(AbstractRenderEngine):
         """
         pass
 
+    def get_physics_engine(self) -> Optional[BasePhysicsEngine]:
+        """
+        Returns the physics engine driven by LOOK_AT and BLINK commands.
+        Subclasses with a physics engine should override this.
+        """
+        return None
+
+    # Physics engine attributes saved with state contexts. Empty: contexts use get_physics_state().
+    physics_fields: Tuple[str, ...] = ()
+
+    def capture_physics(self, out: List[Any]) -> None:
+        """
+        Copies the physics_fields values into a preallocated list (no dict is built).
+
+        Args:
+            out (List[Any]): List of len(physics_fields).
+        """
+        engine = self.get_physics_engine()
+        for index, name in enumerate(self.physics_fields):
+            out[index] = getattr(engine, name)
+
+    def restore_physics(self, values: List[Any]) -> None:
+        """
+        Writes values captured by capture_physics() back to the physics engine.
+
+        Args:
+            values (List[Any]): Values in physics_fields order.
+        """
+        engine = self.get_physics_engine()
+        for name, value in zip(self.physics_fields, values):
+            setattr(engine, name, value)
+
     def _check_schedule(self, now):
-        # Grace period on startup (2 seconds) to ensure we start in ACTIVE/Initial state
-        if now < 2000:
+        # Grace period on startup to ensure we start in ACTIVE/Initial state
+        if now < self.schedule_grace_ms:
             return
 
         current_state = self.state_handler.get_state()
-        if current_state == StateRegistry.CHAT:
+        if current_state == self._schedule_state and now < self._schedule_due:
             return
 
-        now_dt = datetime.now()
+        now_dt = self.clock.now()
+        self._schedule_state = current_state
+        # Re-check at least every SCHEDULE_RECHECK_MS so wall-clock jumps (NTP sync) are picked up
+        next_change = self.scheduler.next_change_at(now_dt)
+        wait_ms = SCHEDULE_RECHECK_MS if next_change is None else \
+            min(SCHEDULE_RECHECK_MS, (next_change - now_dt).total_seconds() * 1000)
+        self._schedule_due = now + wait_ms
         
         result = self.scheduler.get_target_state(now_dt, current_state)
 
@@ -360,12 +607,14 @@ class BaseStateRenderer(AbstractRenderEngine):
             cmd_params["_source"] = "scheduler"
             cmd_params["target_state"] = target_state
             
-            # Scheduler says we should be in target_state
-            if current_state != target_state:
+            # Scheduler says we should be in target_state (unless the transition graph rejects it, e.g. during CHAT).
+            # The claim is held until the schedule ends
+            if current_state != target_state and self.state_handler.resolve_transition(target_state, cmd_params):
                 logger.info(f"Triggering {target_state} state from schedule with params: {params}")
-                self.command_center.issue_command(CommandNames.CHANGE_STATE, params=cmd_params)
+                self.command_center.request_state(ClaimSource.SCHEDULER, target_state, cmd_params, hold_ms=None)
         else:
             # No active schedule
+            self.command_center.release_state(ClaimSource.SCHEDULER)
             # Check if we are currently in a state triggered by the scheduler
             current_params = self.state_handler.current_state_params or {}
             
@@ -375,7 +624,7 @@ class BaseStateRenderer(AbstractRenderEngine):
             if source == "scheduler":
                 if current_state == StateRegistry.SLEEPING:
                      logger.info("Triggering WAKING state (Schedule ended)")
-                     self.command_center.issue_command(CommandNames.CHANGE_STATE, params={"target_state": StateRegistry.WAKING})
+                     self.command_center.request_state(ClaimSource.SCHEDULER, StateRegistry.WAKING)
                 else:
                      logger.info(f"Reverting to ACTIVE from {current_state} (Schedule ended)")
-                     self.command_center.issue_command(CommandNames.CHANGE_STATE, params={"target_state": StateRegistry.ACTIVE})
+                     self.command_center.request_state(ClaimSource.SCHEDULER, StateRegistry.ACTIVE)
@@ -0,0 +1,320 @@
+import json
+import mmap
+import os
+import struct
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from bot_ekko.core.interrupts import INTERRUPT_CONTEXT_OWNER, InterruptHandler, InterruptItem
+from bot_ekko.core.logger import get_logger
+from bot_ekko.core.state_machine import StateHandler
+from bot_ekko.core.state_registry import StateRegistry
+
+logger = get_logger("Checkpoint")
+
+CHECKPOINT_MAGIC = b"EKCP"
+# magic, sequence number, wall time (s), payload length, payload crc32
+CHECKPOINT_HEADER = struct.Struct("<4sQdII")
+
+
+class CheckpointFile:
+    """
+    Fixed-size memory-mapped file with two alternating slots.
+
+    Each write goes to the slot not holding the latest checkpoint, payload first and header last,
+    so a crash mid-write leaves the previous checkpoint readable. Writes land in the page cache:
+    they survive a process crash without an fsync per write.
+    """
+    def __init__(self, path: str, slot_size: int) -> None:
+        """
+        Opens (or creates) the checkpoint file.
+
+        Args:
+            path (str): File path.
+            slot_size (int): Bytes per slot, header included.
+        """
+        self.path = path
+        self.slot_size = slot_size
+        size = slot_size * 2
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size != size:
+                os.ftruncate(fd, size)
+            self._map = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        self._seq, self._slot = self._latest()
+
+    def _read_slot(self, slot: int) -> Optional[Tuple[int, float, bytes]]:
+        offset = slot * self.slot_size
+        magic, seq, wall_time, length, crc = CHECKPOINT_HEADER.unpack_from(self._map, offset)
+        if magic != CHECKPOINT_MAGIC or length > self.slot_size - CHECKPOINT_HEADER.size:
+            return None
+        start = offset + CHECKPOINT_HEADER.size
+        payload = self._map[start:start + length]
+        if zlib.crc32(payload) != crc:
+            return None
+        return seq, wall_time, payload
+
+    def _latest(self) -> Tuple[int, int]:
+        best_seq, best_slot = 0, -1
+        for slot in (0, 1):
+            record = self._read_slot(slot)
+            if record and record[0] > best_seq:
+                best_seq, best_slot = record[0], slot
+        return best_seq, best_slot
+
+    def write(self, payload: bytes) -> bool:
+        """
+        Writes a checkpoint.
+
+        Args:
+            payload (bytes): Serialized checkpoint.
+
+        Returns:
+            bool: False if the payload doesn't fit in a slot.
+        """
+        if len(payload) > self.slot_size - CHECKPOINT_HEADER.size:
+            logger.warning(f"Checkpoint of {len(payload)} bytes doesn't fit in {self.slot_size} byte slot")
+            return False
+        slot = 1 - self._slot if self._slot >= 0 else 0
+        offset = slot * self.slot_size
+        # Invalidate, write the payload, then publish it with the header
+        self._map[offset:offset + 4] = b"\0\0\0\0"
+        start = offset + CHECKPOINT_HEADER.size
+        self._map[start:start + len(payload)] = payload
+        self._seq += 1
+        CHECKPOINT_HEADER.pack_into(self._map, offset, CHECKPOINT_MAGIC, self._seq, time.time(), len(payload), zlib.crc32(payload))
+        self._slot = slot
+        return True
+
+    def read(self) -> Optional[Tuple[float, bytes]]:
+        """
+        Returns:
+            Optional[Tuple[float, bytes]]: (wall time, payload) of the latest valid checkpoint, or None.
+        """
+        if self._slot < 0:
+            return None
+        record = self._read_slot(self._slot)
+        return (record[1], record[2]) if record else None
+
+    def clear(self) -> None:
+        """Invalidates both slots."""
+        for slot in (0, 1):
+            offset = slot * self.slot_size
+            self._map[offset:offset + 4] = b"\0\0\0\0"
+        self._slot = -1
+
+    def close(self) -> None:
+        self._map.close()
+
+
+def _json_safe(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Drops params values that can't be stored in a checkpoint."""
+    if params is None:
+        return None
+    safe = {}
+    for key, value in params.items():
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            continue
+        safe[key] = value
+    return safe
+
+
+class StateCheckpointer:
+    """
+    Periodically checkpoints the state handler, interrupt table and physics, and resumes from it on startup.
+
+    update() is called every frame; it writes on state/params/interrupt changes and every `interval_ms`.
+    """
+    def __init__(self, state_handler: StateHandler, interrupt_handler: InterruptHandler, path: str,
+                 interval_ms: int = 1000, max_age: float = 300, slot_size: int = 8192) -> None:
+        """
+        Initialize the checkpointer.
+
+        Args:
+            state_handler (StateHandler): State to checkpoint.
+            interrupt_handler (InterruptHandler): Interrupts to checkpoint.
+            path (str): Checkpoint file path.
+            interval_ms (int, optional): Write interval when nothing changes. Defaults to 1000.
+            max_age (float, optional): Seconds after which a checkpoint is too old to resume from. Defaults to 300.
+            slot_size (int, optional): Bytes reserved per checkpoint. Defaults to 8192.
+        """
+        self.state_handler = state_handler
+        self.interrupt_handler = interrupt_handler
+        self.interval_ms = interval_ms
+        self.max_age = max_age
+        self.file = CheckpointFile(path, slot_size)
+
+        self._physics_buffer: List[Any] = [None] * len(state_handler.physics_fields)
+        self._last_write = 0
+        self._last_key: Optional[Tuple] = None
+        self.writes = 0
+
+    def _change_key(self) -> Tuple:
+        state_handler = self.state_handler
+        interrupts = self.interrupt_handler
+        return (state_handler.get_state(), id(state_handler.current_state_params),
+                tuple(interrupts.active_interrupts), interrupts.is_interrupted)
+
+    def update(self, now: int) -> None:
+        """
+        Writes a checkpoint if the state changed or the interval elapsed.
+
+        Args:
+            now (int): Current ticks (ms).
+        """
+        key = self._change_key()
+        if key != self._last_key or now - self._last_write >= self.interval_ms:
+            self.save(now, key)
+
+    def save(self, now: int, key: Optional[Tuple] = None) -> None:
+        """
+        Writes a checkpoint now.
+
+        Args:
+            now (int): Current ticks (ms).
+            key (Tuple, optional): Precomputed change key.
+        """
+        payload = json.dumps(self.capture(now), separators=(",", ":")).encode()
+        if self.file.write(payload):
+            self.writes += 1
+        self._last_write = now
+        self._last_key = key if key is not None else self._change_key()
+
+    def capture(self, now: int) -> Dict[str, Any]:
+        """
+        Builds the checkpoint payload.
+
+        Args:
+            now (int): Current ticks (ms).
+
+        Returns:
+            Dict[str, Any]: JSON-serializable checkpoint.
+        """
+        state_handler = self.state_handler
+        interrupts = self.interrupt_handler
+        context = state_handler.get_owned_ctx(INTERRUPT_CONTEXT_OWNER)
+        return {
+            "state": {
+                "state": state_handler.get_state(),
+                "params": _json_safe(state_handler.current_state_params),
+                "elapsed_ms": now - state_handler.state_entry_time,
+                **self._capture_physics(),
+            },
+            "interrupted": interrupts.is_interrupted,
+            "interrupts": [
+                {
+                    "name": item.name,
+                    "target_state": item.target_state,
+                    "priority": item.priority,
+                    "remaining_ms": max(0, item.duration - (now - item.start_time)),
+                    "params": _json_safe(item.params),
+                }
+                for item in interrupts.active_interrupts.values()
+            ],
+            "context": None if context is None else {
+                "state": context.state,
+                "params": _json_safe(context.params),
+                "elapsed_ms": now - context.state_entry_time,
+                "physics": list(context.physics) if context.physics_state is None else None,
+                "physics_state": context.physics_state,
+            },
+        }
+
+    def _capture_physics(self) -> Dict[str, Any]:
+        render_engine = self.state_handler.render_engine
+        if self.state_handler.physics_fields:
+            render_engine.capture_physics(self._physics_buffer)
+            return {"physics": self._physics_buffer, "physics_state": None}
+        return {"physics": None, "physics_state": render_engine.get_physics_state()}
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns:
+            Optional[Dict[str, Any]]: The latest checkpoint, or None if missing, corrupt or too old.
+        """
+        record = self.file.read()
+        if record is None:
+            return None
+        wall_time, payload = record
+        age = time.time() - wall_time
+        if age > self.max_age or age < 0:
+            logger.info(f"Ignoring checkpoint from {age:.0f}s ago")
+            return None
+        try:
+            return json.loads(payload)
+        except ValueError as e:
+            logger.warning(f"Unreadable checkpoint: {e}")
+            return None
+
+    def restore(self, now: Optional[int] = None) -> bool:
+        """
+        Resumes state, interrupts and physics from the latest checkpoint.
+
+        Args:
+            now (int, optional): Current ticks (ms). Defaults to the state handler clock.
+
+        Returns:
+            bool: True if a checkpoint was restored.
+        """
+        checkpoint = self.load()
+        if checkpoint is None:
+            return False
+        if now is None:
+            now = self.state_handler.clock.ticks()
+        state_handler = self.state_handler
+        interrupts = self.interrupt_handler
+
+        # The interrupted context goes back into history first, so the interrupt can restore it when it ends
+        context = checkpoint.get("context")
+        if context and StateRegistry.has_state(context["state"]):
+            self._apply(context, now)
+            state_handler.save_state_ctx(owner=INTERRUPT_CONTEXT_OWNER)
+
+        current = checkpoint["state"]
+        if not StateRegistry.has_state(current["state"]):
+            logger.warning(f"Checkpoint state {current['state']} is not registered; not resuming")
+            return False
+        self._apply(current, now)
+
+        interrupts.restore_interrupts(
+            (
+                InterruptItem(
+                    name=item["name"],
+                    target_state=item["target_state"],
+                    priority=item["priority"],
+                    duration=item["remaining_ms"],
+                    start_time=now,
+                    params=item["params"] or {},
+                )
+                for item in checkpoint.get("interrupts", [])
+            ),
+            checkpoint.get("interrupted", False),
+        )
+        # The restored state already matches the interrupt, so nothing else would claim it for the arbiter
+        interrupts.resume()
+
+        logger.info(f"Resumed {current['state']} from checkpoint with {len(interrupts.active_interrupts)} interrupts")
+        self._last_key = self._change_key()
+        self._last_write = now
+        return True
+
+    def _apply(self, saved: Dict[str, Any], now: int) -> None:
+        state_handler = self.state_handler
+        state_handler.set_state(saved["state"], params=saved["params"], force=True)
+        state_handler.state_entry_time = now - saved["elapsed_ms"]
+        if saved.get("physics_state") is not None:
+            state_handler.render_engine.set_physics_state(saved["physics_state"])
+        elif saved.get("physics") and len(saved["physics"]) == len(state_handler.physics_fields):
+            state_handler.render_engine.restore_physics(saved["physics"])
+
+    def clear(self) -> None:
+        """Drops the checkpoint (e.g. on a clean shutdown) so the next start is a cold start."""
+        self.file.clear()
+
+    def close(self) -> None:
+        self.file.close()
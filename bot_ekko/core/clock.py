@@ -0,0 +1,112 @@
+import random
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pygame
+
+
+class Clock(ABC):
+    """
+    Source of time and randomness for the core, adapters and media.
+
+    ticks() replaces pygame.time.get_ticks(), time() replaces time.time(), now() replaces datetime.now()
+    and `random` replaces the module-level random functions, so a whole bot can run on simulated time
+    with a seeded RNG.
+    """
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Args:
+            seed (int, optional): RNG seed. Defaults to None (unseeded).
+        """
+        self.random = random.Random(seed)
+
+    @abstractmethod
+    def ticks(self) -> int:
+        """Milliseconds since the clock started."""
+        pass
+
+    @abstractmethod
+    def time(self) -> float:
+        """Seconds since the epoch."""
+        pass
+
+    def now(self) -> datetime:
+        """Local datetime."""
+        return datetime.fromtimestamp(self.time())
+
+
+class RealClock(Clock):
+    """Wall-clock time: what the bot uses on the device."""
+    def ticks(self) -> int:
+        return pygame.time.get_ticks()
+
+    def time(self) -> float:
+        return time.time()
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+
+class FixedStepClock(Clock):
+    """
+    Simulated time that only moves when advanced.
+    The main loop (or a test) calls step() once per frame, or advance() to jump.
+    """
+    def __init__(self, start: Optional[datetime] = None, step_ms: int = 16, seed: Optional[int] = 0) -> None:
+        """
+        Args:
+            start (datetime, optional): Simulated datetime at tick 0. Defaults to now.
+            step_ms (int, optional): Milliseconds per step(). Defaults to 16.
+            seed (int, optional): RNG seed. Defaults to 0.
+        """
+        super().__init__(seed)
+        self.start = start or datetime.now()
+        self._start_time = self.start.timestamp()
+        self.step_ms = step_ms
+        self._ticks = 0
+
+    def step(self) -> int:
+        """Advances by step_ms. Returns the new ticks."""
+        self._ticks += self.step_ms
+        return self._ticks
+
+    def advance(self, ms: int) -> int:
+        """Advances by `ms`. Returns the new ticks."""
+        self._ticks += ms
+        return self._ticks
+
+    def ticks(self) -> int:
+        return self._ticks
+
+    def time(self) -> float:
+        return self._start_time + self._ticks / 1000
+
+    def now(self) -> datetime:
+        return self.start + timedelta(milliseconds=self._ticks)
+
+
+class AcceleratedClock(Clock):
+    """Real time running `factor` times faster, starting at `start`."""
+    def __init__(self, factor: float, start: Optional[datetime] = None, seed: Optional[int] = None) -> None:
+        """
+        Args:
+            factor (float): Simulated seconds per real second.
+            start (datetime, optional): Simulated datetime at tick 0. Defaults to now.
+            seed (int, optional): RNG seed. Defaults to None.
+        """
+        super().__init__(seed)
+        self.factor = factor
+        self.start = start or datetime.now()
+        self._start_time = self.start.timestamp()
+        self._origin = time.monotonic()
+
+    def ticks(self) -> int:
+        return int((time.monotonic() - self._origin) * self.factor * 1000)
+
+    def time(self) -> float:
+        return self._start_time + self.ticks() / 1000
+
+    def now(self) -> datetime:
+        return self.start + timedelta(milliseconds=self.ticks())
@@ -1,45 +1,291 @@
 from bot_ekko.core.models import CommandNames, CommandCtx
 from bot_ekko.core.state_machine import StateHandler
+from bot_ekko.core.state_registry import StateRegistry
 from bot_ekko.core.logger import get_logger
+from bot_ekko.core.recorder import InputRecorder
+from bot_ekko.core.arbiter import StateArbiter
+from bot_ekko.sys_config import STATE_CLAIM_HOLD_MS
 import queue
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 
 logger = get_logger("CommandCenter")
 
+# Handler signature: handler(params) -> None. Params may be None.
+CommandHandler = Callable[[Optional[dict]], None]
+
+# Params each command needs; checked once at the ingestion edge (BLE, sockets), not per dispatch
+REQUIRED_PARAMS: Dict[CommandNames, Tuple[str, ...]] = {
+    CommandNames.CHANGE_STATE: ("target_state",),
+    CommandNames.RESTORE_STATE: (),
+    CommandNames.LOOK_AT: ("x", "y"),
+    CommandNames.PLAY_MEDIA: ("show", "value"),
+    CommandNames.SET_PARAM: ("key", "value"),
+    CommandNames.BLINK: (),
+    CommandNames.BATCH: ("commands",),
+}
+
+# Commands that may change state and take "save_history"; inside a batch history is saved once for the group
+STATE_COMMANDS = (CommandNames.CHANGE_STATE, CommandNames.PLAY_MEDIA)
+
 
 class Command:
-    def __init__(self, command_ctx: CommandCtx, state_handler: StateHandler):
-        self.command_ctx = command_ctx
-        self.state_handler = state_handler
-    
-    def execute(self):
-        if not self.state_handler:
-            logger.error("All commands must come through CommandCenter, with StateHandler injected")
-            return
-        # Custom handling for save_history
-        if self.command_ctx.params and self.command_ctx.params.get("save_history"):
-            self.state_handler.save_state_ctx()
-
-        # Command Dispatch
-        if self.command_ctx.name == CommandNames.CHANGE_STATE:
-            target_state = self.command_ctx.params["target_state"]
-            self.state_handler.set_state(target_state, self.command_ctx.params)
-        elif self.command_ctx.name == CommandNames.RESTORE_STATE:
-            self.state_handler.restore_state_ctx()
-        else:
-            logger.warning(f"Unknown command: {self.command_ctx.name}")
+    """
+    Lightweight command record put on the command queue.
+    Slotted and unvalidated: in-process issuers are trusted, external input goes through CommandCenter.ingest().
+    """
+    __slots__ = ("name", "params")
+
+    def __init__(self, name: CommandNames, params: Optional[dict] = None):
+        self.name = name
+        self.params = params
+
+    def __repr__(self):
+        return f"{self.name}: {self.params}"
 
 
 class CommandCenter:
+    """
+    Issues commands onto the main loop queue and dispatches them to registered handlers.
+    """
     def __init__(self, command_queue: queue.Queue, state_handler: StateHandler):
         self.command_queue = command_queue
         self.state_handler = state_handler
-    
+        # Every issued command is appended here when recording
+        self.recorder: Optional[InputRecorder] = None
+        # Decides between state requests of competing sources; without one, requests are issued directly
+        self.arbiter: Optional[StateArbiter] = None
+        self.handlers: Dict[CommandNames, CommandHandler] = {
+            CommandNames.CHANGE_STATE: self._handle_change_state,
+            CommandNames.RESTORE_STATE: self._handle_restore_state,
+            CommandNames.LOOK_AT: self._handle_look_at,
+            CommandNames.PLAY_MEDIA: self._handle_play_media,
+            CommandNames.SET_PARAM: self._handle_set_param,
+            CommandNames.BLINK: self._handle_blink,
+            CommandNames.BATCH: self._handle_batch,
+        }
+
+    def register_handler(self, command_name: CommandNames, handler: CommandHandler) -> None:
+        """
+        Registers (or replaces) the handler for a command type.
+
+        Args:
+            command_name (CommandNames): Command type.
+            handler (Callable[[Optional[dict]], None]): Called with the command params on the main thread.
+        """
+        self.handlers[command_name] = handler
+
+    def set_arbiter(self, arbiter: Optional[StateArbiter]) -> None:
+        """
+        Routes request_state()/release_state() through a state arbiter.
+
+        Args:
+            arbiter (StateArbiter, optional): The arbiter, or None to issue requests directly.
+        """
+        self.arbiter = arbiter
+
+    def request_state(self, source: str, target_state: str, params: Optional[dict] = None,
+                      hold_ms: Optional[int] = 0) -> None:
+        """
+        Asks for a state on behalf of a behaviour source (scheduler, interrupts, moods, gestures, BLE).
+
+        Args:
+            source (str): ClaimSource value; decides the priority of the request.
+            target_state (str): Desired state.
+            params (dict, optional): Params for the state.
+            hold_ms (int, optional): 0 (default) for a one-shot request, None to hold until release_state(),
+                > 0 to hold for that many ms. Only used with an arbiter.
+        """
+        if self.arbiter is not None:
+            self.arbiter.claim(source, target_state, params, hold_ms)
+        else:
+            self.issue_command(CommandNames.CHANGE_STATE, params=dict(params or {}, target_state=target_state))
+
+    def release_state(self, source: str) -> None:
+        """
+        Withdraws a source's held state request.
+
+        Args:
+            source (str): ClaimSource value.
+        """
+        if self.arbiter is not None:
+            self.arbiter.release(source)
+
+    def execute(self, command_name: CommandNames, *_, params: Optional[dict] = None) -> None:
+        """
+        Records and runs a command immediately instead of queueing it. Main loop only.
+
+        Args:
+            command_name (CommandNames): Command type.
+            params (dict, optional): Command params.
+        """
+        if self.recorder:
+            self.recorder.record_command(command_name, params)
+        self.dispatch(Command(command_name, params))
+
     def issue_command(self, command_name: CommandNames, *_, params: Optional[dict] = None):
-        command_ctx = CommandCtx(name=command_name, params=params)
-        command = Command(command_ctx, self.state_handler)
-        logger.info(f"Issuing command: {command.command_ctx.name}, params: {command.command_ctx.params}") 
-        self.command_queue.put(command)
+        logger.debug("Issuing command: %s, params: %s", command_name, params)
+        if self.recorder:
+            self.recorder.record_command(command_name, params)
+        self.command_queue.put(Command(command_name, params))
+
+    def issue_batch(self, commands: Iterable[Tuple[CommandNames, Optional[dict]]]) -> None:
+        """
+        Enqueues a group of commands that the main loop applies together in one frame,
+        with one history save and one transition log entry.
+
+        Args:
+            commands (Iterable[Tuple[CommandNames, Optional[dict]]]): (command name, params) pairs, in order.
+        """
+        batch = tuple(Command(name, params) for name, params in commands)
+        logger.debug("Issuing batch: %s", batch)
+        if self.recorder:
+            self.recorder.record_command(CommandNames.BATCH, {"commands": batch})
+        self.command_queue.put(Command(CommandNames.BATCH, {"commands": batch}))
+
+    def ingest(self, command_name: Any, params: Optional[dict] = None, source: Optional[str] = None) -> bool:
+        """
+        Validates a command from an external source and issues it.
+
+        Args:
+            command_name (Any): CommandNames member or its string value (e.g. "change_state").
+            params (dict, optional): Command params.
+            source (str, optional): ClaimSource of the input. A CHANGE_STATE from a source goes through
+                request_state() and is held for STATE_CLAIM_HOLD_MS.
+
+        Returns:
+            bool: False if the command was rejected.
+        """
+        command = self._validate(command_name, params)
+        if command is None:
+            return False
+        if source is not None and command.name == CommandNames.CHANGE_STATE:
+            params = {key: value for key, value in command.params.items() if key != "target_state"}
+            self.request_state(source, command.params["target_state"], params, hold_ms=STATE_CLAIM_HOLD_MS)
+            return True
+        self.issue_command(command.name, params=command.params)
+        return True
+
+    def ingest_batch(self, commands: Iterable[Tuple[Any, Optional[dict]]]) -> bool:
+        """
+        Validates a group of external commands and issues them as one batch.
+        The whole batch is rejected if any command is invalid.
+
+        Args:
+            commands (Iterable[Tuple[Any, Optional[dict]]]): (command name, params) pairs.
+
+        Returns:
+            bool: False if the batch was rejected.
+        """
+        validated: List[Command] = []
+        for command_name, params in commands:
+            command = self._validate(command_name, params)
+            if command is None or command.name == CommandNames.BATCH:
+                return False
+            validated.append(command)
+        self.issue_batch((command.name, command.params) for command in validated)
+        return True
+
+    def _validate(self, command_name: Any, params: Optional[dict]) -> Optional[Command]:
+        try:
+            command_ctx = CommandCtx(name=command_name, params=params)
+        except ValueError as e:
+            logger.warning(f"Rejected command {command_name}: {e}")
+            return None
+
+        missing = [key for key in REQUIRED_PARAMS.get(command_ctx.name, ()) if key not in (command_ctx.params or {})]
+        if missing:
+            logger.warning(f"Rejected command {command_ctx.name}: missing params {missing}")
+            return None
+        if command_ctx.name == CommandNames.CHANGE_STATE and not StateRegistry.has_state(command_ctx.params["target_state"]):
+            logger.warning(f"Rejected command {command_ctx.name}: unknown state {command_ctx.params['target_state']}")
+            return None
+        return Command(command_ctx.name, command_ctx.params)
+
+    def dispatch(self, command: Command) -> None:
+        """
+        Runs a command's handler. Called from the main loop.
+
+        Args:
+            command (Command): The command to run.
+        """
+        handler = self.handlers.get(command.name)
+        if handler is None:
+            logger.warning(f"Unknown command: {command.name}")
+            return
+        handler(command.params)
+
+    def _handle_change_state(self, params: Optional[dict]) -> None:
+        state_handler = self.state_handler
+        # Resolve against the transition graph first so rejected transitions don't save history
+        target_state = state_handler.resolve_transition(params["target_state"], params)
+        if target_state is None:
+            return
+        # Custom handling for save_history
+        if params.get("save_history"):
+            # Re-entering the current state (e.g. enqueueing media on CANVAS) must not stack history,
+            # and an owner that already has a saved context (e.g. an interrupt cycle) keeps its first one
+            owner = params.get("context_owner")
+            if target_state != state_handler.get_state() and (owner is None or state_handler.get_owned_ctx(owner) is None):
+                state_handler.save_state_ctx(owner=owner)
+        state_handler.set_state(target_state, params, force=True)
+
+    def _handle_restore_state(self, params: Optional[dict]) -> None:
+        if params:
+            self.state_handler.restore_state_ctx(context_id=params.get("context_id"), owner=params.get("context_owner"))
+        else:
+            self.state_handler.restore_state_ctx()
+
+    def _handle_look_at(self, params: Optional[dict]) -> None:
+        physics = self.state_handler.render_engine.get_physics_engine()
+        if physics:
+            physics.set_look_at(int(params["x"]), int(params["y"]))
+
+    def _handle_play_media(self, params: Optional[dict]) -> None:
+        # CANVAS with "enqueue": starts the media, or queues it behind whatever is playing
+        canvas_params = dict(params, target_state=StateRegistry.CANVAS, enqueue=True)
+        canvas_params.setdefault("save_history", True)
+        self._handle_change_state(canvas_params)
+
+    def _handle_set_param(self, params: Optional[dict]) -> None:
+        # Copy so saved contexts sharing the old dict keep their values
+        current = dict(self.state_handler.current_state_params or {})
+        current[params["key"]] = params["value"]
+        self.state_handler.current_state_params = current
+
+    def _handle_blink(self, params: Optional[dict]) -> None:
+        physics = self.state_handler.render_engine.get_physics_engine()
+        if physics:
+            physics.blink()
+
+    def _handle_batch(self, params: Optional[dict]) -> None:
+        commands = params["commands"]
+        state_handler = self.state_handler
+        current_state = state_handler.get_state()
 
+        # One history save for the whole group, taken before any of it applies
+        wants_history = False
+        leaves_state = False
+        for command in commands:
+            if command.name in STATE_COMMANDS:
+                command_params = command.params or {}
+                default = command.name == CommandNames.PLAY_MEDIA
+                wants_history = wants_history or command_params.get("save_history", default)
+                target_state = StateRegistry.CANVAS if command.name == CommandNames.PLAY_MEDIA else command_params.get("target_state")
+                leaves_state = leaves_state or target_state != current_state
+        if wants_history and leaves_state:
+            state_handler.save_state_ctx()
 
+        state_handler.begin_batch()
+        try:
+            for command in commands:
+                handler = self.handlers.get(command.name)
+                if handler is None:
+                    logger.warning(f"Unknown command in batch: {command.name}")
+                    continue
+                command_params = command.params
+                if command.name in STATE_COMMANDS:
+                    command_params = dict(command_params or {}, save_history=False)
+                handler(command_params)
+        finally:
+            state_handler.end_batch(len(commands))
@@ -0,0 +1,148 @@
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from bot_ekko.core.logger import get_logger
+from bot_ekko.core.models import SystemConfig
+from bot_ekko.sys_config import CONFIG_WATCH_INTERVAL
+
+logger = get_logger("ConfigWatcher")
+
+ConfigHandler = Callable[[SystemConfig], None]
+
+
+def changed_sections(old: SystemConfig, new: SystemConfig) -> List[str]:
+    """
+    Args:
+        old (SystemConfig): The config in use.
+        new (SystemConfig): The reloaded config.
+
+    Returns:
+        List[str]: Top-level SystemConfig fields that differ, e.g. ["schedules", "services"].
+    """
+    return [field for field in SystemConfig.model_fields if getattr(old, field) != getattr(new, field)]
+
+
+class ConfigWatcher(threading.Thread):
+    """
+    Hot-reloads config.json.
+
+    The file's mtime is polled on this thread, and a changed file is parsed and validated here too,
+    so a slow or broken file never stalls a frame. The main loop calls update(), which runs the handlers
+    registered for the sections that changed. Sections without a handler need a restart to take effect.
+
+    `config` is the config in effect: a section only moves to the reloaded value once all its handlers
+    applied it. Sections that failed or have no handler keep the running value, so the next reload
+    tries them again, and reverting the file to the running values is not a change.
+    """
+    def __init__(self, path: str, config: SystemConfig, interval: float = CONFIG_WATCH_INTERVAL) -> None:
+        """
+        Args:
+            path (str): Path of config.json.
+            config (SystemConfig): The config the bot was started with.
+            interval (float, optional): Seconds between mtime checks. Defaults to CONFIG_WATCH_INTERVAL.
+        """
+        super().__init__(daemon=True, name="config_watcher")
+        self.path = path
+        self.config = config
+        self.interval = interval
+        self.reloads = 0
+
+        self._handlers: Dict[str, List[ConfigHandler]] = {}
+        self._signature = self._stat()
+        self._pending: Optional[SystemConfig] = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def register(self, section: str, handler: ConfigHandler) -> None:
+        """
+        Registers a handler for changes to one section of the config.
+
+        Args:
+            section (str): Top-level SystemConfig field, e.g. "schedules".
+            handler (ConfigHandler): Called on the main loop with the new SystemConfig.
+        """
+        if section not in SystemConfig.model_fields:
+            raise ValueError(f"Unknown config section: {section}")
+        self._handlers.setdefault(section, []).append(handler)
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self) -> bool:
+        """
+        Reloads the file if it changed since the last check.
+
+        Returns:
+            bool: True if a new, valid config is waiting for update().
+        """
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        # Remembered even if the file is invalid: it's retried once it changes again
+        self._signature = signature
+
+        try:
+            config = SystemConfig.from_json_file(self.path)
+        except Exception as e:
+            logger.error(f"Ignoring invalid config {self.path}: {e}")
+            return False
+
+        with self._lock:
+            self._pending = config
+        return True
+
+    def run(self) -> None:
+        """Background loop checking the file every interval seconds."""
+        logger.info(f"Watching {self.path} for changes")
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"Config check failed: {e}")
+
+    def update(self) -> List[str]:
+        """
+        Applies a reloaded config, if there is one. Called from the main loop.
+
+        Returns:
+            List[str]: The sections that changed.
+        """
+        if self._pending is None:
+            return []
+        with self._lock:
+            config, self._pending = self._pending, None
+
+        sections = changed_sections(self.config, config)
+        if not sections:
+            return []
+
+        self.reloads += 1
+        logger.info(f"Config reloaded, changed: {sections}")
+        applied = {}
+        for section in sections:
+            handlers = self._handlers.get(section)
+            if not handlers:
+                logger.warning(f"Config section '{section}' changed; restart to apply it")
+                continue
+            failed = False
+            for handler in handlers:
+                try:
+                    handler(config)
+                except Exception as e:
+                    logger.error(f"Failed to apply config section '{section}': {e}")
+                    failed = True
+            if not failed:
+                applied[section] = getattr(config, section)
+
+        if applied:
+            self.config = self.config.model_copy(update=applied)
+        return sections
+
+    def stop(self) -> None:
+        """Signal the watcher to stop."""
+        self._stop_event.set()
@@ -0,0 +1,191 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+MINUTES_PER_DAY = 24 * 60
+# Days searched before giving up on a spec that never matches (e.g. "0 0 31 2 *")
+MAX_SEARCH_DAYS = 5 * 366
+
+MONTH_NAMES: Dict[str, int] = {name: i + 1 for i, name in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"))}
+# Cron numbering: 0 = Sunday (7 is accepted too)
+WEEKDAY_NAMES: Dict[str, int] = {name: i for i, name in enumerate(("sun", "mon", "tue", "wed", "thu", "fri", "sat"))}
+
+
+def parse_field(field: str, low: int, high: int, names: Optional[Dict[str, int]] = None) -> int:
+    """
+    Parses one cron field into a bitset (bit n set = value n matches).
+
+    Args:
+        field (str): e.g. "*", "*/15", "9-17", "1-5/2", "mon,wed,fri".
+        low (int): Smallest allowed value.
+        high (int): Largest allowed value.
+        names (dict, optional): Lower-case aliases (month or weekday names).
+
+    Returns:
+        int: Bitset of matching values.
+
+    Raises:
+        ValueError: On a malformed field or an out-of-range value.
+    """
+    def value(text: str) -> int:
+        text = text.strip().lower()
+        if names and text in names:
+            return names[text]
+        number = int(text)
+        if not low <= number <= high:
+            raise ValueError(f"{number} not in {low}-{high}")
+        return number
+
+    mask = 0
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError(f"Invalid step in {field}")
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = value(start_text), value(end_text)
+        else:
+            start = value(part)
+            end = high if step > 1 else start
+        if start > end:
+            raise ValueError(f"Invalid range in {field}")
+        for n in range(start, end + 1, step):
+            mask |= 1 << n
+    return mask
+
+
+def weekday_mask(weekdays: Iterable) -> int:
+    """
+    Args:
+        weekdays (Iterable): Weekday names ("mon") or cron numbers (0 = Sunday).
+
+    Returns:
+        int: Cron weekday bitset.
+    """
+    mask = 0
+    for day in weekdays:
+        number = WEEKDAY_NAMES[day.strip().lower()[:3]] if isinstance(day, str) else int(day)
+        mask |= 1 << (number % 7)
+    return mask
+
+
+def _cron_weekday(day: date) -> int:
+    return (day.weekday() + 1) % 7
+
+
+class CronSpec:
+    """
+    A compiled cron expression: minute-of-day, day-of-month, month and weekday bitsets.
+
+    next_fire()/prev_fire() skip non-matching months and days whole and find the matching minute
+    within a day with bit operations, so they never step minute by minute.
+    """
+    __slots__ = ("minutes", "days", "months", "weekdays", "day_or")
+
+    def __init__(self, minutes: int, days: int = 0, months: int = 0, weekdays: int = 0, day_or: bool = False) -> None:
+        """
+        Args:
+            minutes (int): Bitset over minute of day (0-1439).
+            days (int, optional): Bitset over day of month (1-31). 0 = every day.
+            months (int, optional): Bitset over month (1-12). 0 = every month.
+            weekdays (int, optional): Bitset over cron weekday (0 = Sunday). 0 = every weekday.
+            day_or (bool, optional): Match days in `days` OR `weekdays` (cron rule when both are restricted).
+        """
+        self.minutes = minutes
+        self.days = days or parse_field("*", 1, 31)
+        self.months = months or parse_field("*", 1, 12)
+        self.weekdays = weekdays or parse_field("*", 0, 6)
+        self.day_or = day_or
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronSpec":
+        """
+        Compiles a five-field cron expression: minute hour day-of-month month weekday.
+
+        Raises:
+            ValueError: If the expression is malformed.
+        """
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        minute_field, hour_field, day_field, month_field, weekday_field = fields
+        minutes = parse_field(minute_field, 0, 59)
+        hours = parse_field(hour_field, 0, 23)
+        weekdays = parse_field(weekday_field, 0, 7, WEEKDAY_NAMES)
+        if weekdays & (1 << 7):
+            weekdays = (weekdays | 1) & ~(1 << 7)
+
+        minutes_of_day = 0
+        for hour in range(24):
+            if hours >> hour & 1:
+                minutes_of_day |= minutes << (hour * 60)
+        return cls(minutes_of_day, parse_field(day_field, 1, 31), parse_field(month_field, 1, 12, MONTH_NAMES),
+                   weekdays, day_or=day_field != "*" and weekday_field != "*")
+
+    @classmethod
+    def every(cls, interval_minutes: int, offset_minutes: int = 0, weekdays: int = 0) -> "CronSpec":
+        """
+        Fires every `interval_minutes` of the day, starting at `offset_minutes` after midnight.
+        """
+        if interval_minutes < 1:
+            raise ValueError("interval must be at least one minute")
+        minutes = 0
+        for minute in range(offset_minutes % interval_minutes, MINUTES_PER_DAY, interval_minutes):
+            minutes |= 1 << minute
+        return cls(minutes, weekdays=weekdays)
+
+    def matches_day(self, day: date) -> bool:
+        if not self.months >> day.month & 1:
+            return False
+        in_days = bool(self.days >> day.day & 1)
+        in_weekdays = bool(self.weekdays >> _cron_weekday(day) & 1)
+        return in_days or in_weekdays if self.day_or else in_days and in_weekdays
+
+    def next_fire(self, after: datetime) -> Optional[datetime]:
+        """
+        Returns:
+            Optional[datetime]: First matching minute strictly after `after`, or None if none within MAX_SEARCH_DAYS.
+        """
+        start = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.date()
+        minute = start.hour * 60 + start.minute
+        for _ in range(MAX_SEARCH_DAYS):
+            if not self.months >> day.month & 1:
+                # Jump to the first of the next month
+                day = (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+                minute = 0
+                continue
+            if self.matches_day(day):
+                remaining = self.minutes >> minute
+                if remaining:
+                    found = minute + (remaining & -remaining).bit_length() - 1
+                    return datetime.combine(day, datetime.min.time()) + timedelta(minutes=found)
+            day += timedelta(days=1)
+            minute = 0
+        return None
+
+    def prev_fire(self, at: datetime) -> Optional[datetime]:
+        """
+        Returns:
+            Optional[datetime]: Last matching minute at or before `at`, or None if none within MAX_SEARCH_DAYS.
+        """
+        day = at.date()
+        minute = at.hour * 60 + at.minute
+        for _ in range(MAX_SEARCH_DAYS):
+            if not self.months >> day.month & 1:
+                # Jump to the last day of the previous month
+                day = day.replace(day=1) - timedelta(days=1)
+                minute = MINUTES_PER_DAY - 1
+                continue
+            if self.matches_day(day):
+                remaining = self.minutes & ((2 << minute) - 1)
+                if remaining:
+                    return datetime.combine(day, datetime.min.time()) + timedelta(minutes=remaining.bit_length() - 1)
+            day -= timedelta(days=1)
+            minute = MINUTES_PER_DAY - 1
+        return None
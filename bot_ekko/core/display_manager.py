@@ -1,5 +1,5 @@
 import pygame
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 
 class DisplayManager:
     """
@@ -51,6 +51,55 @@ class DisplayManager:
 
         return self.screen, self.logical_surface
 
+    def present(self, logical_surface: pygame.Surface, rotation: int = 0, dirty_rects: Optional[List[pygame.Rect]] = None) -> None:
+        """
+        Pushes the logical surface to the screen.
+
+        Args:
+            logical_surface (pygame.Surface): The rendered frame.
+            rotation (int, optional): Rotation in degrees (multiples of 90). Defaults to 0.
+            dirty_rects (List[pygame.Rect], optional): Changed regions in logical coordinates.
+                                                       None updates the whole display.
+        """
+        if dirty_rects is not None and rotation % 90 == 0:
+            if not dirty_rects:
+                return
+            screen_rects = [self.map_logical_rect(rect, rotation) for rect in dirty_rects]
+            if rotation % 360 == 0:
+                for rect in dirty_rects:
+                    self.screen.blit(logical_surface, rect, rect)
+            else:
+                rotated = pygame.transform.rotate(logical_surface, rotation)
+                for rect in screen_rects:
+                    self.screen.blit(rotated, rect, rect)
+            pygame.display.update(screen_rects)
+            return
+
+        rotated = pygame.transform.rotate(logical_surface, rotation)
+        self.screen.blit(rotated, (0, 0))
+        pygame.display.flip()
+
+    def map_logical_rect(self, rect: pygame.Rect, rotation: int) -> pygame.Rect:
+        """
+        Maps a rect on the logical surface to the rotated output (pygame rotates counter-clockwise).
+
+        Args:
+            rect (pygame.Rect): Rect in logical coordinates.
+            rotation (int): Rotation in degrees (multiples of 90).
+
+        Returns:
+            pygame.Rect: The same region after rotation.
+        """
+        w, h = self.logical_size
+        rotation %= 360
+        if rotation == 90:
+            return pygame.Rect(rect.y, w - rect.x - rect.width, rect.height, rect.width)
+        if rotation == 180:
+            return pygame.Rect(w - rect.x - rect.width, h - rect.y - rect.height, rect.width, rect.height)
+        if rotation == 270:
+            return pygame.Rect(h - rect.y - rect.height, rect.x, rect.height, rect.width)
+        return pygame.Rect(rect)
+
     def release_display(self) -> None:
         """
         Uninitializes and quits Pygame display.
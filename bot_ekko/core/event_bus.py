@@ -0,0 +1,241 @@
+import itertools
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from bot_ekko.core.logger import get_logger
+from bot_ekko.core.models import BluetoothData, GestureData, IMUSensorData, TOFSensorData
+
+logger = get_logger("EventBus")
+
+
+class Topics:
+    SENSOR_TOF = "sensor.tof"
+    SENSOR_IMU = "sensor.imu"
+    GESTURE = "gesture"
+    AUDIO_LEVEL = "audio.level"
+    BT_COMMAND = "bt.command"
+    STATE_CHANGED = "state.changed"
+
+
+class StateChanged:
+    """Payload of state.changed."""
+    __slots__ = ("from_state", "to_state", "params")
+
+    def __init__(self, from_state: str, to_state: str, params: Optional[dict] = None):
+        self.from_state = from_state
+        self.to_state = to_state
+        self.params = params
+
+    def __repr__(self):
+        return f"{self.from_state} -> {self.to_state}"
+
+
+# Payload type of each topic, checked on publish
+TOPIC_TYPES: Dict[str, Tuple[type, ...]] = {
+    Topics.SENSOR_TOF: (TOFSensorData,),
+    Topics.SENSOR_IMU: (IMUSensorData,),
+    Topics.GESTURE: (GestureData,),
+    Topics.AUDIO_LEVEL: (float, int),
+    Topics.BT_COMMAND: (BluetoothData,),
+    Topics.STATE_CHANGED: (StateChanged,),
+}
+
+
+class Event:
+    """One published event. `seq` orders events across topics."""
+    __slots__ = ("seq", "topic", "payload", "timestamp")
+
+    def __init__(self, seq: int, topic: str, payload: Any, timestamp: float):
+        self.seq = seq
+        self.topic = topic
+        self.payload = payload
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return f"Event({self.topic}#{self.seq}: {self.payload})"
+
+
+class TopicRing:
+    """
+    Bounded ring of events for one topic, overwriting the oldest.
+
+    Lock-free under the GIL: a publisher claims a position from an atomic counter and stores a
+    single tuple, so it never waits on readers or other publishers. Readers check each slot's
+    position, which tells them whether it was overwritten (dropped) or isn't written yet.
+
+    head only ever moves over stored slots: publishers and readers walk it forward from the last
+    value written, and every value written was such a walk. A publisher preempted mid-walk can
+    write back an older value, but the slots after it are already stored, so the next walk passes them.
+    """
+    def __init__(self, topic: str, capacity: int) -> None:
+        self.topic = topic
+        self.capacity = capacity
+        self._slots: List[Optional[Tuple[int, Event]]] = [None] * capacity
+        self._positions = itertools.count()
+        # Last walked head; may lag behind (see head)
+        self._head = 0
+
+    @property
+    def head(self) -> int:
+        """Position after the stored events: every slot below it has been written (possibly overwritten since)."""
+        head = self._head
+        slots = self._slots
+        capacity = self.capacity
+        while True:
+            entry = slots[head % capacity]
+            # Not stored yet, or stored on the previous lap
+            if entry is None or entry[0] < head:
+                return head
+            head += 1
+
+    def append(self, event: Event) -> None:
+        position = next(self._positions)
+        self._slots[position % self.capacity] = (position, event)
+        self._head = self.head
+
+    def read(self, cursor: int, out: List[Event], limit: int) -> Tuple[int, int]:
+        """
+        Appends events from `cursor` on to `out`.
+
+        Args:
+            cursor (int): Position of the first unread event.
+            out (List[Event]): Destination.
+            limit (int): Maximum number of events to read.
+
+        Returns:
+            Tuple[int, int]: (new cursor, number of events dropped since cursor).
+        """
+        head = self.head
+        dropped = 0
+        if head - cursor > self.capacity:
+            dropped = head - self.capacity - cursor
+            cursor = head - self.capacity
+        while cursor < head and limit > 0:
+            entry = self._slots[cursor % self.capacity]
+            if entry is None or entry[0] < cursor:
+                # Claimed but not stored yet: stop here and pick it up next poll
+                break
+            if entry[0] > cursor:
+                # Overwritten while we were behind
+                dropped += 1
+            else:
+                out.append(entry[1])
+                limit -= 1
+            cursor += 1
+        return cursor, dropped
+
+
+class Subscription:
+    """
+    A consumer's view of the bus: a cursor per matching topic.
+    Created with EventBus.subscribe(); polled from one thread (usually the main loop).
+    """
+    def __init__(self, bus: "EventBus", patterns: Tuple[str, ...]) -> None:
+        self.bus = bus
+        self.patterns = patterns
+        # Start at the current head: only events published after subscribing are seen
+        self._cursors: Dict[str, int] = {
+            topic: ring.head for topic, ring in bus.rings.items() if self.matches(topic)
+        }
+        self.dropped = 0
+
+    def matches(self, topic: str) -> bool:
+        for pattern in self.patterns:
+            if pattern == "*" or pattern == topic or (pattern.endswith(".*") and topic.startswith(pattern[:-1])):
+                return True
+        return False
+
+    def poll(self, max_events: int = 256) -> List[Event]:
+        """
+        Reads the events published since the last poll.
+
+        Args:
+            max_events (int, optional): Maximum events per topic. Defaults to 256.
+
+        Returns:
+            List[Event]: Events in publish order. Events overwritten before being read are counted in `dropped`.
+        """
+        events: List[Event] = []
+        rings = self.bus.rings
+        for topic, cursor in self._cursors.items():
+            cursor, dropped = rings[topic].read(cursor, events, max_events)
+            self._cursors[topic] = cursor
+            if dropped:
+                self.dropped += dropped
+                logger.debug(f"Subscriber {self.patterns} dropped {dropped} {topic} events")
+        if len(self._cursors) > 1:
+            events.sort(key=lambda event: event.seq)
+        return events
+
+    def latest(self, topic: str) -> Optional[Any]:
+        """
+        Skips to the newest event of one topic.
+
+        Args:
+            topic (str): A topic this subscription matches.
+
+        Returns:
+            Optional[Any]: Payload of the newest unread event, or None.
+        """
+        ring = self.bus.rings[topic]
+        out: List[Event] = []
+        self._cursors[topic], _ = ring.read(max(self._cursors[topic], ring.head - 1), out, 1)
+        return out[-1].payload if out else None
+
+
+class EventBus:
+    """
+    In-process publish/subscribe bus with typed topics.
+
+    Service threads publish without blocking; the main loop polls subscriptions in batches.
+    Each topic has a bounded ring; slow subscribers lose the oldest events, never the producer.
+    """
+    def __init__(self, capacity: int = 256, topic_types: Optional[Dict[str, Tuple[type, ...]]] = None) -> None:
+        """
+        Initialize the bus.
+
+        Args:
+            capacity (int, optional): Events kept per topic. Defaults to 256.
+            topic_types (dict, optional): Topic -> accepted payload types. Defaults to TOPIC_TYPES.
+        """
+        self.capacity = capacity
+        self.topic_types = dict(topic_types if topic_types is not None else TOPIC_TYPES)
+        self.rings: Dict[str, TopicRing] = {topic: TopicRing(topic, capacity) for topic in self.topic_types}
+        self._seq = itertools.count()
+
+    def publish(self, topic: str, payload: Any) -> None:
+        """
+        Publishes an event. Safe from any thread; never blocks.
+
+        Args:
+            topic (str): One of the bus topics.
+            payload (Any): Instance of the topic's payload type.
+
+        Raises:
+            KeyError: Unknown topic.
+            TypeError: Wrong payload type.
+        """
+        if not isinstance(payload, self.topic_types[topic]):
+            raise TypeError(f"{topic} expects {self.topic_types[topic]}, got {type(payload).__name__}")
+        self.rings[topic].append(Event(next(self._seq), topic, payload, time.monotonic()))
+
+    def subscribe(self, *patterns: str) -> Subscription:
+        """
+        Creates a subscription.
+
+        Args:
+            *patterns (str): Topics, "prefix.*" or "*".
+
+        Returns:
+            Subscription: Cursor set over the matching topics.
+
+        Raises:
+            ValueError: If no topic matches.
+        """
+        subscription = Subscription(self, patterns or ("*",))
+        if not subscription._cursors:
+            raise ValueError(f"No topics match {patterns}")
+        return subscription
+
+    def topics(self) -> Iterable[str]:
+        return self.rings.keys()
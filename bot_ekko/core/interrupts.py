@@ -1,12 +1,18 @@
-import pygame
+import heapq
+import itertools
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from bot_ekko.core.command_center import CommandCenter, CommandNames
 from bot_ekko.core.state_machine import StateHandler
 from bot_ekko.core.logger import get_logger
+from bot_ekko.core.clock import Clock
+from bot_ekko.core.arbiter import ClaimSource
 
 logger = get_logger("InterruptHandler")
 
+# Owner tag of the context saved when an interrupt cycle starts, so the cycle restores exactly that context
+INTERRUPT_CONTEXT_OWNER = "interrupts"
+
 @dataclass
 class InterruptItem:
     name: str
@@ -16,22 +22,51 @@ class InterruptItem:
     start_time: int
     params: dict = field(default_factory=dict)
 
+    @property
+    def deadline(self) -> int:
+        """Last tick at which the interrupt is still active."""
+        return self.start_time + self.duration
+
 class InterruptHandler:
-    def __init__(self, command_center: CommandCenter, state_handler: StateHandler):
+    """
+    Keeps the set of active interrupts and drives the state to the highest priority one.
+
+    Expiry and priority are both min-heaps with lazy deletion: entries of removed interrupts stay in
+    the heaps and are discarded when they reach the top, and a refreshed interrupt's entry is moved
+    to its new deadline only when it reaches the top. That keeps set_interrupt(), update() and the
+    winner lookup O(log n) instead of scanning every interrupt.
+    """
+    def __init__(self, command_center: CommandCenter, state_handler: StateHandler, clock: Optional[Clock] = None):
         self.command_center = command_center
         self.state_handler = state_handler
+        # Interrupt timers run on the state handler's clock unless told otherwise
+        self.clock: Clock = clock or state_handler.clock
         self.active_interrupts: Dict[str, InterruptItem] = {}
         self.is_interrupted = False
+        # (deadline, seq, item); the deadline may be older than item.deadline after a refresh
+        self._deadlines: List[Tuple[int, int, InterruptItem]] = []
+        # (-priority, seq, item): ties go to the interrupt set first
+        self._priorities: List[Tuple[int, int, InterruptItem]] = []
+        self._seq = itertools.count()
 
     def set_interrupt(self, name: str, duration: int, target_state: str, priority: int = 10, params: dict = None):
         """
         Sets or updates an interrupt.
+        Refreshing an active interrupt with the same target and priority only extends its deadline; no command is issued.
         :param duration: Duration in seconds.
         """
-        current_time = pygame.time.get_ticks()
-        # Convert duration to milliseconds for comparison with pygame ticks
+        current_time = self.clock.ticks()
+        # Convert duration to milliseconds for comparison with clock ticks
         duration_ms = duration * 1000
-        
+
+        existing = self.active_interrupts.get(name)
+        if existing and current_time <= existing.deadline \
+                and existing.target_state == target_state and existing.priority == priority:
+            existing.start_time = current_time
+            existing.duration = duration_ms
+            existing.params = params or {}
+            return
+
         item = InterruptItem(
             name=name,
             target_state=target_state,
@@ -40,17 +75,79 @@ class InterruptHandler:
             start_time=current_time,
             params=params or {}
         )
-        if name in self.active_interrupts:
-            existing = self.active_interrupts[name]
-            # Check if existing interrupt is still active (units are now consistent in ms)
-            if current_time - existing.start_time <= existing.duration:
-                # logger.info(f"Interrupt '{name}' is already active. Skipping overwrite.")
-                return
-
-        self.active_interrupts[name] = item
+        self._add(item)
         logger.info(f"Set interrupt '{name}': {item} (duration_ms={duration_ms})")
         self._evaluate_state()
 
+    def _add(self, item: InterruptItem) -> None:
+        self.active_interrupts[item.name] = item
+        seq = next(self._seq)
+        heapq.heappush(self._deadlines, (item.deadline, seq, item))
+        heapq.heappush(self._priorities, (-item.priority, seq, item))
+
+    def _is_current(self, item: InterruptItem) -> bool:
+        return self.active_interrupts.get(item.name) is item
+
+    def restore_interrupts(self, items: Iterable[InterruptItem], is_interrupted: bool) -> None:
+        """
+        Replaces the active interrupts (e.g. from a checkpoint) without issuing commands.
+
+        Args:
+            items (Iterable[InterruptItem]): Interrupts to make active.
+            is_interrupted (bool): Whether an interrupt cycle (saved context) is in progress.
+        """
+        self.active_interrupts = {}
+        self._deadlines = []
+        self._priorities = []
+        for item in items:
+            self._add(item)
+        self.is_interrupted = is_interrupted
+
+    def resume(self) -> None:
+        """
+        Re-claims the winning interrupt's state after restore_interrupts(), so it keeps outranking the other
+        sources. The state is usually already the target, in which case the arbiter issues no transition.
+        """
+        highest = self.current_interrupt()
+        # Without an arbiter a claim is a plain state change, and the state is already restored
+        if highest is not None and self.command_center.arbiter is not None:
+            logger.info(f"Resuming interrupt: {highest.name} -> {highest.target_state} (P:{highest.priority})")
+            self._claim(highest)
+
+    def next_deadline(self) -> Optional[int]:
+        """
+        Returns:
+            Optional[int]: Tick after which the next interrupt expires, or None if none are active.
+                The main loop has nothing to do for interrupts before then.
+        """
+        self._settle_deadlines()
+        return self._deadlines[0][0] if self._deadlines else None
+
+    def _settle_deadlines(self) -> None:
+        """Drops removed entries from the top of the deadline heap and moves refreshed ones to their deadline."""
+        deadlines = self._deadlines
+        while deadlines:
+            deadline, _, item = deadlines[0]
+            if not self._is_current(item):
+                heapq.heappop(deadlines)
+            elif item.deadline != deadline:
+                heapq.heapreplace(deadlines, (item.deadline, next(self._seq), item))
+            else:
+                return
+
+    def current_interrupt(self) -> Optional[InterruptItem]:
+        """
+        Returns:
+            Optional[InterruptItem]: Highest priority active interrupt, or None.
+        """
+        priorities = self._priorities
+        while priorities:
+            item = priorities[0][2]
+            if self._is_current(item):
+                return item
+            heapq.heappop(priorities)
+        return None
+
     def update(self):
         """
         Checks for timeouts and updates state matches.
@@ -58,50 +155,51 @@ class InterruptHandler:
         if not self.active_interrupts:
             return
 
-        current_time = pygame.time.get_ticks()
-        expired_names = []
-        
-        # Check timeouts
-        for name, item in self.active_interrupts.items():
-            if current_time - item.start_time > item.duration:
-                expired_names.append(name)
-        
-        if expired_names:
-            for name in expired_names:
-                logger.info(f"Interrupt '{name}' timed out.")
-                del self.active_interrupts[name]
+        current_time = self.clock.ticks()
+        expired = False
+
+        deadlines = self._deadlines
+        self._settle_deadlines()
+        while deadlines and deadlines[0][0] < current_time:
+            item = heapq.heappop(deadlines)[2]
+            logger.info(f"Interrupt '{item.name}' timed out.")
+            del self.active_interrupts[item.name]
+            expired = True
+            self._settle_deadlines()
+
+        if expired:
             self._evaluate_state()
-            
+
     def _evaluate_state(self):
         """
         Determines the highest priority interrupt and transitions to it.
         """
-        if not self.active_interrupts:
+        highest = self.current_interrupt()
+        if highest is None:
             if self.is_interrupted:
                 logger.info("No active interrupts. Restoring original state.")
-                self.command_center.issue_command(CommandNames.RESTORE_STATE)
+                self.command_center.release_state(ClaimSource.INTERRUPTS)
+                self.command_center.issue_command(CommandNames.RESTORE_STATE, params={"context_owner": INTERRUPT_CONTEXT_OWNER})
                 self.is_interrupted = False
             return
 
-        # Find highest priority
-        highest = max(self.active_interrupts.values(), key=lambda x: x.priority)
-        
         # If we are not currently interrupted, this is the first interrupt. Save history.
-        save_history = False
         if not self.is_interrupted:
-            save_history = True
             self.is_interrupted = True
             logger.info("Interrupt cycle started. Requesting history save.")
-            
+
         current_state = self.state_handler.get_state()
-        
+
         # Transition if target state differs
         if current_state != highest.target_state:
             logger.info(f"Applying interrupt transition: {highest.name} -> {highest.target_state} (P:{highest.priority})")
-            cmd_params = {"target_state": highest.target_state, "save_history": save_history}
-            cmd_params.update(highest.params)
-            
-            self.command_center.issue_command(CommandNames.CHANGE_STATE, params=cmd_params)
+            self._claim(highest)
+
+    def _claim(self, item: InterruptItem) -> None:
+        # Every transition of the cycle asks for the save; only the first one saves (the owner keeps its context)
+        cmd_params = {"save_history": True, "context_owner": INTERRUPT_CONTEXT_OWNER}
+        cmd_params.update(item.params)
+        self.command_center.request_state(ClaimSource.INTERRUPTS, item.target_state, cmd_params, hold_ms=None)
 
     def stop_interrupt(self, name: str):
         if name in self.active_interrupts:
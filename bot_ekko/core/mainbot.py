@@ -1,7 +1,9 @@
 import queue
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 from bot_ekko.core.command_center import Command, CommandCenter
-from bot_ekko.services import SensorService, BluetoothService, GestureService, SystemLogsService, MicService
 from bot_ekko.core.models import ServicesConfig
 
 
@@ -9,15 +11,45 @@ from bot_ekko.core.interrupts import InterruptHandler
 from bot_ekko.core.state_machine import StateHandler
 from bot_ekko.core.logger import get_logger
 from bot_ekko.core.errors import SensorConnectionError
-from bot_ekko.core.base import ServiceStatus
+from bot_ekko.core.base import BaseService, ServiceStatus
+from bot_ekko.core.event_bus import EventBus
+from bot_ekko.core.recorder import InputRecorder
+from bot_ekko.core.startup import ServiceStarter, format_report, write_report
+from bot_ekko.sys_config import SERVICE_STOP_TIMEOUT, STARTUP_REPORT_PATH
+from bot_ekko.utils import load_class_from_path
 
 
 logger = get_logger("MainBotServicesManager")
 
 
+
+class ServicePlugin(NamedTuple):
+    """How the manager builds a service whose class is named in config.json (module_path / class_name)."""
+    # Manager attribute holding the instance
+    attribute: str
+    # Constructor keyword receiving the service's config
+    config_arg: str
+    # Manager attributes passed to the constructor as keywords of the same name
+    dependencies: Tuple[str, ...] = ()
+
+
+# ServicesConfig field -> plugin, in start order
+SERVICE_PLUGINS: Dict[str, ServicePlugin] = {
+    "sensor_service": ServicePlugin("service_sensor", "service_sensor_config",
+                                    ("command_center", "interrupt_handler", "event_bus")),
+    "bt_service": ServicePlugin("service_bt", "service_bt_config", ("command_center", "event_bus")),
+    "gesture_service": ServicePlugin("service_gesture", "service_gesture_config", ("command_center", "event_bus")),
+    "system_logs_service": ServicePlugin("service_system_logs", "service_config"),
+    "mic_service": ServicePlugin("service_mic", "service_mic_config", ("event_bus",)),
+}
+# ServicesConfig field -> manager attribute
+SERVICE_ATTRIBUTES = {key: plugin.attribute for key, plugin in SERVICE_PLUGINS.items()}
+
+
 class MainBotServicesManager:
 
-    def __init__(self, command_queue: queue.Queue[Command], interrupt_handler: InterruptHandler, state_handler: StateHandler):
+    def __init__(self, command_queue: queue.Queue[Command], interrupt_handler: InterruptHandler, state_handler: StateHandler,
+                 command_center: Optional[CommandCenter] = None, event_bus: Optional[EventBus] = None):
         self.command_queue = command_queue
 
         # services
@@ -28,58 +60,195 @@ class MainBotServicesManager:
         self.service_gesture = None
         self.service_mic = None
 
-        self.command_center = CommandCenter(self.command_queue, self.state_handler)
+        # Share the main loop's CommandCenter so handlers registered on it apply to service commands
+        self.command_center = command_center or CommandCenter(self.command_queue, self.state_handler)
         self.interrupt_handler = interrupt_handler
+        # Services publish their inputs here; the main loop reads them back in batches
+        self.event_bus = event_bus or EventBus()
 
+        self.services_config: Optional[ServicesConfig] = None
+        self._replace_lock = threading.Lock()
+        # Per-service init timings of the last start_services()
+        self.startup_report: Dict[str, Any] = {}
+        # Services whose class couldn't be loaded (e.g. a missing native library): key -> error
+        self.unavailable_services: Dict[str, str] = {}
+        self.include_disabled = False
         self.all_services = []
         self.enabled_services = []
 
-    def init_services(self, services_config: ServicesConfig):
-        self.service_sensor = SensorService(
-            command_center=self.command_center,
-            service_sensor_config=services_config.sensor_service,
-            interrupt_handler=self.interrupt_handler
-        )
-        self.service_bt = BluetoothService(
-            command_center=self.command_center,
-            service_bt_config=services_config.bt_service
-        )
-        self.service_gesture = GestureService(
-            command_center=self.command_center,
-            service_gesture_config=services_config.gesture_service
-        )
-
-        self.service_system_logs = SystemLogsService(
-            service_config=services_config.system_logs_service
-        )
-        self.service_mic = MicService(
-            service_mic_config=services_config.mic_service
-        )
-
-        # add services to the dictionary
-        self.all_services.append(self.service_sensor)
-        self.all_services.append(self.service_bt)
-        self.all_services.append(self.service_gesture)
-        self.all_services.append(self.service_system_logs)
-        self.all_services.append(self.service_mic)
-        
-        # add enabled services to the list
+    def init_services(self, services_config: ServicesConfig, include_disabled: bool = False):
+        """
+        Builds the services. Only enabled services are imported and constructed, so disabled ones
+        cost neither import time nor memory, and their native dependencies may be missing.
+
+        Args:
+            services_config (ServicesConfig): Services config.
+            include_disabled (bool, optional): Also build disabled services (the replayer uses their parsers).
+        """
+        self.services_config = services_config
+        self.include_disabled = include_disabled
+        for key in SERVICE_ATTRIBUTES:
+            setattr(self, SERVICE_ATTRIBUTES[key], self._create_service(key, getattr(services_config, key)))
+        self._refresh_service_lists()
+
+    def _refresh_service_lists(self) -> None:
+        # Rebinding the lists is atomic; the main loop sees either the old or the new list
+        self.all_services = [service for service in (getattr(self, attribute) for attribute in SERVICE_ATTRIBUTES.values())
+                             if service is not None]
         self.enabled_services = [i for i in self.all_services if i.enabled]
-    
-    def start_services(self):
-        for service in self.enabled_services:
-            if service.status == ServiceStatus.RUNNING:
-                logger.info(f"Service {service.name} is already running")
+
+    def _create_service(self, key: str, config: Any) -> Optional[BaseService]:
+        """
+        Imports and builds the service for one entry of ServicesConfig.
+
+        Args:
+            key (str): Field name in ServicesConfig, e.g. "gesture_service".
+            config (Any): The service's config.
+
+        Returns:
+            Optional[BaseService]: The new, not yet started service, or None if it is disabled or can't be loaded.
+        """
+        if config is None or not (config.enabled or self.include_disabled):
+            return None
+
+        plugin = SERVICE_PLUGINS[key]
+        try:
+            service_class = load_class_from_path(config.module_path, config.class_name)
+        except (ImportError, AttributeError) as e:
+            logger.error(f"Service {key} unavailable: {e}")
+            self.unavailable_services[key] = str(e)
+            return None
+        self.unavailable_services.pop(key, None)
+
+        kwargs = {plugin.config_arg: config}
+        kwargs.update({name: getattr(self, name) for name in plugin.dependencies})
+        service = service_class(**kwargs)
+        service.recorder = self.command_center.recorder
+        return service
+
+    def apply_services_config(self, services_config: ServicesConfig) -> List[str]:
+        """
+        Applies a reloaded ServicesConfig. Unchanged services are left alone, services that support it
+        are reconfigured in place and the rest are stopped, recreated and restarted on a background
+        thread, so the main loop keeps rendering meanwhile.
+
+        Args:
+            services_config (ServicesConfig): The new services config.
+
+        Returns:
+            List[str]: Keys of the services being restarted.
+        """
+        restarts = []
+        for key, attribute in SERVICE_ATTRIBUTES.items():
+            config = getattr(services_config, key)
+            if config == getattr(self.services_config, key):
                 continue
-            
-            logger.info(f"Starting service: {service.name}")
+            service = getattr(self, attribute)
+            if config is not None and service is not None and service.enabled and config.enabled \
+                    and service.reconfigure(config):
+                logger.info(f"Service {service.name} reconfigured in place")
+                continue
+            restarts.append(key)
+        self.services_config = services_config
+
+        if restarts:
+            threading.Thread(target=self._restart_services, args=(restarts, services_config),
+                             name="service_restart", daemon=True).start()
+        return restarts
+
+    def _restart_services(self, keys: List[str], services_config: ServicesConfig) -> None:
+        for key in keys:
+            self.replace_service(key, getattr(services_config, key))
+
+    def enabled_services_by_key(self) -> Dict[str, BaseService]:
+        """Returns the enabled services keyed by their ServicesConfig field."""
+        services = {key: getattr(self, attribute) for key, attribute in SERVICE_ATTRIBUTES.items()}
+        return {key: service for key, service in services.items() if service is not None and service.enabled}
+
+    def replace_service(self, key: str, config: Any = None) -> Optional[BaseService]:
+        """
+        Stops a service and starts a new instance built from its config.
+        Threads can't be restarted, so this is how failed or reconfigured services come back.
+        Blocks while the service initializes; call it off the main loop.
+
+        Args:
+            key (str): Field name in ServicesConfig, e.g. "sensor_service".
+            config (Any, optional): The service's config. Defaults to the current one.
+
+        Returns:
+            Optional[BaseService]: The new service, or None if it is disabled or couldn't be built.
+        """
+        with self._replace_lock:
+            attribute = SERVICE_ATTRIBUTES[key]
+            config = config if config is not None else getattr(self.services_config, key)
+            old = getattr(self, attribute)
+            if old is not None and old.status != ServiceStatus.NOT_INITIALIZED:
+                logger.info(f"Stopping service for restart: {old.name}...")
+                try:
+                    old.stop()
+                    if isinstance(old, threading.Thread) and old.is_alive():
+                        # Release its port/socket before the new instance opens it; a hung thread is left behind
+                        old.join(timeout=SERVICE_STOP_TIMEOUT)
+                except Exception as e:
+                    logger.error(f"Failed to stop service {old.name}: {e}")
+
             try:
-                service.start()
-            except SensorConnectionError as e:
-                logger.error(f"Failed to start service: {service.name}: {e}")
+                service = self._create_service(key, config)
             except Exception as e:
-                logger.error(f"Failed to start service: {service.name}: {e}")
-                raise
+                logger.error(f"Failed to recreate service {key}: {e}")
+                return None
+
+            if service is not None and service.enabled:
+                logger.info(f"Starting service: {service.name}")
+                try:
+                    service.start()
+                except Exception as e:
+                    logger.error(f"Failed to start service: {service.name}: {e}")
+
+            setattr(self, attribute, service)
+            self._refresh_service_lists()
+            return service
+    
+    def set_recorder(self, recorder: Optional[InputRecorder]) -> None:
+        """
+        Records every service's raw inputs and every issued command.
+
+        Args:
+            recorder (InputRecorder, optional): The recorder, or None to stop recording.
+        """
+        self.command_center.recorder = recorder
+        for service in self.all_services:
+            service.recorder = recorder
+
+    def start_services(self, background: bool = False) -> Optional[threading.Thread]:
+        """
+        Starts the enabled services concurrently, each after the services it depends on,
+        and logs/writes a startup report (STARTUP_REPORT_PATH).
+
+        Args:
+            background (bool, optional): Return immediately and start them on a background thread,
+                                         so the main loop renders while services come online. Defaults to False.
+
+        Returns:
+            Optional[threading.Thread]: The startup thread when background is set.
+        """
+        if background:
+            thread = threading.Thread(target=self._start_services, name="service_startup", daemon=True)
+            thread.start()
+            return thread
+        self._start_services(raise_errors=True)
+        return None
+
+    def _start_services(self, raise_errors: bool = False) -> None:
+        starter = ServiceStarter(self.enabled_services_by_key())
+        self.startup_report = starter.start()
+        logger.info(format_report(self.startup_report))
+        write_report(self.startup_report, STARTUP_REPORT_PATH)
+
+        # As before, a missing sensor board is not fatal in the foreground, anything else is
+        errors = [e for e in starter.errors if not isinstance(e, SensorConnectionError)]
+        if raise_errors and errors:
+            raise errors[0]
     
     def stop_services(self):
         for service in self.enabled_services:
@@ -88,9 +257,16 @@ class MainBotServicesManager:
                 service.stop()
     
     def service_loop_update(self):
+        """Calls update() on running services that received input since the last frame, timing each call."""
         for service in self.enabled_services:
-            if service.status == ServiceStatus.RUNNING:
-                service.update()
-            else:
+            if service.status != ServiceStatus.RUNNING:
                 logger.debug(f"Service {service.name} is not running, will not update. status: {service.status}")
+                continue
+            if not service.consume_dirty():
+                continue
+
+            started = time.perf_counter()
+            service.update()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            service.record_update(elapsed_ms)
 
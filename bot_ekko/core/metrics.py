@@ -0,0 +1,365 @@
+import math
+import os
+import socketserver
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from bot_ekko.core.logger import get_logger
+from bot_ekko.sys_config import METRICS_HOST, METRICS_PORT
+
+logger = get_logger("Metrics")
+
+# Seconds; suited to per-call and per-frame timings
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Number = Union[int, float]
+
+
+def _format_value(value: Number) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if math.isnan(value):
+            return "NaN"
+        return repr(value)
+    return str(value)
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class CounterChild:
+    """One labelled counter. inc() takes a lock, so it is safe from any thread."""
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value: Number = 0
+
+    def inc(self, amount: Number = 1) -> None:
+        """
+        Raises:
+            ValueError: If amount is negative.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> Number:
+        return self._value
+
+
+class GaugeChild:
+    """One labelled gauge, either set directly or read from a function at scrape time."""
+    __slots__ = ("_lock", "_value", "_function")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value: Number = 0
+        self._function: Optional[Callable[[], Number]] = None
+
+    def set(self, value: Number) -> None:
+        self._value = value
+
+    def inc(self, amount: Number = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: Number = 1) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Optional[Callable[[], Number]]) -> None:
+        """Reads the value from `function` on every scrape instead (None to go back to set())."""
+        self._function = function
+
+    @property
+    def value(self) -> Number:
+        function = self._function
+        return function() if function is not None else self._value
+
+
+class HistogramChild:
+    """One labelled histogram with fixed upper bounds; observe() is a bisect and a locked add."""
+    __slots__ = ("_lock", "_bounds", "_counts", "_sum")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self._lock = threading.Lock()
+        self._bounds = bounds
+        # Last slot counts observations above the highest bound
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        """
+        Returns:
+            Tuple[List[int], float, int]: Cumulative count per bound (then +Inf), sum and count.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = []
+        running = 0
+        for count in counts:
+            running += count
+            cumulative.append(running)
+        return cumulative, total, running
+
+
+class MetricFamily:
+    """
+    A named metric and its children, one per combination of label values.
+    Look up a child once with labels() and keep it; the lookup takes the family's lock.
+    """
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def labels(self, *values: Any, **labels: Any) -> Any:
+        """
+        Returns the child for these label values, creating it on first use.
+
+        Raises:
+            ValueError: If the labels don't match labelnames.
+        """
+        if labels:
+            if values or set(labels) != set(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {sorted(labels)}")
+            values = tuple(labels[name] for name in self.labelnames)
+        elif len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        key = tuple(str(value) for value in values)
+
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def remove(self, *values: Any) -> None:
+        """Drops the child for these label values (e.g. a service that is gone)."""
+        with self._lock:
+            self._children.pop(tuple(str(value) for value in values), None)
+
+    def children(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        with self._lock:
+            return list(self._children.items())
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {_escape_help(self.documentation)}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for values, child in self.children():
+            yield from self._render_child(values, child)
+
+    def _render_child(self, values: Tuple[str, ...], child: Any) -> Iterator[str]:
+        yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+
+
+class Counter(MetricFamily):
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: Number = 1) -> None:
+        """Increments the unlabelled counter."""
+        self.labels().inc(amount)
+
+
+class Gauge(MetricFamily):
+    kind = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def set(self, value: Number) -> None:
+        """Sets the unlabelled gauge."""
+        self.labels().set(value)
+
+    def _render_child(self, values: Tuple[str, ...], child: GaugeChild) -> Iterator[str]:
+        try:
+            value = child.value
+        except Exception as e:  # A function gauge whose source is gone
+            logger.debug(f"Skipping {self.name}{values}: {e}")
+            return
+        yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(value)}"
+
+
+class Histogram(MetricFamily):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Raises:
+            ValueError: If buckets are empty or not increasing.
+        """
+        super().__init__(name, documentation, labelnames)
+        bounds = tuple(float(bound) for bound in buckets if not math.isinf(bound))
+        if not bounds or any(a >= b for a, b in zip(bounds, bounds[1:])):
+            raise ValueError(f"{name}: buckets must be non-empty and increasing")
+        self.buckets = bounds
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Observes into the unlabelled histogram."""
+        self.labels().observe(value)
+
+    def _render_child(self, values: Tuple[str, ...], child: HistogramChild) -> Iterator[str]:
+        cumulative, total, count = child.snapshot()
+        for bound, running in zip(self.buckets + (math.inf,), cumulative):
+            labels = _format_labels(self.labelnames, values, f'le="{_format_value(bound)}"')
+            yield f"{self.name}_bucket{labels} {running}"
+        labels = _format_labels(self.labelnames, values)
+        yield f"{self.name}_sum{labels} {_format_value(total)}"
+        yield f"{self.name}_count{labels} {count}"
+
+
+class MetricsRegistry:
+    """
+    Named counters, gauges and histograms, rendered in the Prometheus text format.
+    Registering an existing name returns the existing family (so modules can declare
+    the metrics they use); a different type or label set for the same name is an error.
+    """
+    def __init__(self) -> None:
+        self._families: Dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, family: MetricFamily) -> Any:
+        with self._lock:
+            existing = self._families.get(family.name)
+            if existing is None:
+                self._families[family.name] = family
+                return family
+        if type(existing) is not type(family) or existing.labelnames != family.labelnames:
+            raise ValueError(f"Metric {family.name} already registered as {existing.kind} {existing.labelnames}")
+        return existing
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[MetricFamily]:
+        return self._families.get(name)
+
+    def render(self) -> str:
+        """Renders every family in the Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            families = sorted(self._families.values(), key=lambda family: family.name)
+        lines: List[str] = []
+        for family in families:
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry the core and services report to
+REGISTRY = MetricsRegistry()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Unix socket clients have no address
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class MetricsExporter(threading.Thread):
+    """
+    Serves a registry over HTTP (GET /metrics), on localhost or on a Unix socket
+    (curl --unix-socket PATH http://localhost/metrics). The socket is bound in the
+    constructor, so a port in use surfaces there rather than in the thread.
+    """
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = METRICS_HOST, port: int = METRICS_PORT,
+                 socket_path: Optional[str] = None) -> None:
+        """
+        Args:
+            registry (MetricsRegistry, optional): Registry to serve. Defaults to REGISTRY.
+            host (str, optional): Address to bind. Defaults to METRICS_HOST (localhost).
+            port (int, optional): TCP port, 0 for any free port. Defaults to METRICS_PORT.
+            socket_path (str, optional): Serve on this Unix socket instead of TCP.
+
+        Raises:
+            OSError: If the address can't be bound.
+        """
+        super().__init__(name="metrics_exporter", daemon=True)
+        self.socket_path = socket_path
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)  # Left over from a previous run
+            self._server = _UnixHTTPServer(socket_path, _MetricsHandler)
+        else:
+            self._server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            self._server.daemon_threads = True
+        self._server.registry = registry
+
+    @property
+    def address(self) -> Union[str, Tuple[str, int]]:
+        """The socket path, or the bound (host, port)."""
+        return self.socket_path or self._server.server_address[:2]
+
+    def run(self) -> None:
+        logger.info(f"Serving metrics on {self.address}")
+        self._server.serve_forever(poll_interval=0.5)
+
+    def stop(self) -> None:
+        if self.is_alive():
+            self._server.shutdown()
+        self._server.server_close()
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
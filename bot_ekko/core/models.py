@@ -9,6 +9,11 @@ from typing import Dict, Any, Union
 import json
 
 from bot_ekko.core.logger import get_logger
+from bot_ekko.sys_config import (
+    MEDIA_PREFETCH_LOOKAHEAD, MEDIA_PREFETCH_SCAN_INTERVAL,
+    CHECKPOINT_FILE_PATH, CHECKPOINT_INTERVAL_MS, CHECKPOINT_MAX_AGE,
+    METRICS_HOST, METRICS_PORT
+)
 
 logger = get_logger("Models")
 
@@ -50,6 +55,11 @@ class StateContext(BaseModel):
 class CommandNames(Enum):
     CHANGE_STATE = "change_state"
     RESTORE_STATE = "restore_state"
+    LOOK_AT = "look_at"
+    PLAY_MEDIA = "play_media"
+    SET_PARAM = "set_param"
+    BLINK = "blink"
+    BATCH = "batch"
 
 
 class CommandCtx(BaseModel):
@@ -73,6 +83,9 @@ class ServiceSensorConfig(BaseModel):
     baud: int
     port: str
     enabled: bool = False
+    # Service class, imported only when enabled
+    module_path: str = "bot_ekko.services.service_sensors"
+    class_name: str = "SensorService"
 
     sensor_triggers: Dict[str, Union[str, Dict[str, int]]]
     proximity_duration: int = 10
@@ -82,11 +95,15 @@ class ServiceSensorConfig(BaseModel):
 class ServiceBluetoothConfig(BaseModel):
     name: str
     enabled: bool = False
+    module_path: str = "bot_ekko.services.service_bt"
+    class_name: str = "BluetoothService"
     
 
 class ServiceGestureConfig(BaseModel):
     name: str
     enabled: bool = False
+    module_path: str = "bot_ekko.services.service_gesture"
+    class_name: str = "GestureService"
     socket_path: str = "/tmp/ekko_ipc.sock"
     gesture_update_rate: float = 0.1
     
@@ -97,6 +114,8 @@ class ServiceGestureConfig(BaseModel):
 class ServiceSystemLogsConfig(BaseModel):
     name: str
     enabled: bool = False
+    module_path: str = "bot_ekko.services.service_system_logs"
+    class_name: str = "SystemLogsService"
     sample_rate: float = 10.0
     log_file: Optional[str] = None
 
@@ -104,6 +123,8 @@ class ServiceSystemLogsConfig(BaseModel):
 class ServiceMicConfig(BaseModel):
     name: str = "mic"
     enabled: bool = False
+    module_path: str = "bot_ekko.services.service_mic"
+    class_name: str = "MicService"
     sample_rate: int = 44100
     channels: int = 1
     chunk_size: int = 1024
@@ -114,6 +135,52 @@ class ServiceMicConfig(BaseModel):
 
 
 
+class MediaPrefetchConfig(BaseModel):
+    enabled: bool = True
+    lookahead_seconds: float = MEDIA_PREFETCH_LOOKAHEAD
+    scan_interval: float = MEDIA_PREFETCH_SCAN_INTERVAL
+
+
+class TransitionRuleConfig(BaseModel):
+    # "*" matches every registered state
+    from_states: List[str] = ["*"]
+    to_states: List[str] = ["*"]
+    action: str = "allow"  # "allow", "deny" or "redirect"
+    redirect_to: Optional[str] = None
+    # Name of a registered guard; the rule only applies when the guard passes
+    guard: Optional[str] = None
+
+
+class TransitionGraphConfig(BaseModel):
+    enabled: bool = True
+    default_action: str = "allow"
+    # Later rules take precedence over earlier ones; a rule whose guard fails leaves the pair to the earlier ones.
+    # By default the scheduler can't interrupt CHAT; this default is the only copy of that rule,
+    # so "rules" in config replaces it rather than adding to it.
+    rules: List[TransitionRuleConfig] = [
+        TransitionRuleConfig(from_states=["CHAT"], action="deny", guard="from_scheduler")
+    ]
+    # state -> names of registered hooks
+    on_enter: Dict[str, List[str]] = {}
+    on_exit: Dict[str, List[str]] = {}
+
+
+class CheckpointConfig(BaseModel):
+    enabled: bool = True
+    path: str = CHECKPOINT_FILE_PATH
+    interval_ms: int = CHECKPOINT_INTERVAL_MS
+    # Older checkpoints are ignored (cold start)
+    max_age: float = CHECKPOINT_MAX_AGE
+
+
+class MetricsConfig(BaseModel):
+    enabled: bool = True
+    host: str = METRICS_HOST
+    port: int = METRICS_PORT
+    # Serve on this Unix socket instead of host:port
+    socket_path: Optional[str] = None
+
+
 class UIExpressionConfig(BaseModel):
     adapter_module_path: str = "bot_ekko.ui_expressions_lib.eyes.adapter"
     adapter_class_name: str = "EyesExpressionAdapter"
@@ -135,6 +202,10 @@ class SystemConfig(BaseModel):
     schedules: List[Dict[str, Any]] = []
     ui_expression_config: UIExpressionConfig
     services: ServicesConfig
+    media_prefetch: MediaPrefetchConfig = MediaPrefetchConfig()
+    transitions: TransitionGraphConfig = TransitionGraphConfig()
+    checkpoint: CheckpointConfig = CheckpointConfig()
+    metrics: MetricsConfig = MetricsConfig()
 
     @classmethod
     def from_json_file(cls, file_path: str):
@@ -0,0 +1,174 @@
+import json
+import struct
+import threading
+import time
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from bot_ekko.core.logger import get_logger
+from bot_ekko.core.models import CommandNames
+
+logger = get_logger("Recorder")
+
+RECORDING_MAGIC = b"EKRC\x01"
+# seconds since recording start (monotonic), record kind, payload length
+RECORD_HEADER = struct.Struct("<dBI")
+
+
+class RecordKind:
+    COMMAND = 1
+    SENSOR_LINE = 2
+    GESTURE_PAYLOAD = 3
+    BT_WRITE = 4
+
+
+def encode_command(name: CommandNames, params: Optional[dict]) -> bytes:
+    """
+    Serializes a command for a recording. Batches are stored as a list of their commands;
+    params that aren't JSON-serializable are stored as their repr.
+
+    Args:
+        name (CommandNames): Command name.
+        params (dict, optional): Command params.
+
+    Returns:
+        bytes: JSON payload.
+    """
+    if name == CommandNames.BATCH:
+        params = {"commands": [{"name": c.name.value, "params": c.params} for c in params["commands"]]}
+    return json.dumps({"name": name.value, "params": params}, separators=(",", ":"), default=repr).encode()
+
+
+def decode_command(payload: bytes) -> Tuple[CommandNames, Optional[dict]]:
+    """
+    Inverse of encode_command(). Batches come back as (CommandNames.BATCH, {"commands": [(name, params), ...]}).
+
+    Args:
+        payload (bytes): JSON payload.
+
+    Returns:
+        Tuple[CommandNames, Optional[dict]]: Command name and params.
+    """
+    data = json.loads(payload)
+    name = CommandNames(data["name"])
+    params = data["params"]
+    if name == CommandNames.BATCH:
+        params = {"commands": [(CommandNames(c["name"]), c["params"]) for c in params["commands"]]}
+    return name, params
+
+
+class InputRecorder:
+    """
+    Appends commands and raw service inputs to a binary recording.
+
+    Each record is a fixed header (monotonic time since start, kind, length) followed by the raw payload.
+    record() is called from service threads and the main loop, so writes are serialized by a lock.
+    """
+    def __init__(self, path: str) -> None:
+        """
+        Opens a new recording.
+
+        Args:
+            path (str): Output file (overwritten).
+        """
+        self.path = path
+        self._file: Optional[BinaryIO] = open(path, "wb")
+        self._file.write(RECORDING_MAGIC)
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+        self.records = 0
+        logger.info(f"Recording inputs to {path}")
+
+    def record(self, kind: int, payload: bytes) -> None:
+        """
+        Appends one record.
+
+        Args:
+            kind (int): RecordKind value.
+            payload (bytes): Raw input.
+        """
+        header = RECORD_HEADER.pack(time.monotonic() - self._start, kind, len(payload))
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(header)
+            self._file.write(payload)
+            self.records += 1
+
+    def record_command(self, name: CommandNames, params: Optional[dict]) -> None:
+        self.record(RecordKind.COMMAND, encode_command(name, params))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        logger.info(f"Recorded {self.records} records to {self.path}")
+
+
+def read_recording(path: str) -> Iterator[Tuple[float, int, bytes]]:
+    """
+    Reads a recording.
+
+    Args:
+        path (str): Recording file.
+
+    Yields:
+        Tuple[float, int, bytes]: (seconds since start, RecordKind, payload). A truncated last record is skipped.
+
+    Raises:
+        ValueError: If the file is not a recording.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(RECORDING_MAGIC)) != RECORDING_MAGIC:
+            raise ValueError(f"Not a recording: {path}")
+        while True:
+            header = f.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            timestamp, kind, length = RECORD_HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                logger.warning(f"Truncated record at {timestamp:.3f}s in {path}")
+                return
+            yield timestamp, kind, payload
+
+
+def summarize_recording(path: str) -> Dict[str, Any]:
+    """
+    Returns:
+        Dict[str, Any]: Record counts per kind and the duration of a recording.
+    """
+    counts: Dict[int, int] = {}
+    duration = 0.0
+    for timestamp, kind, _ in read_recording(path):
+        counts[kind] = counts.get(kind, 0) + 1
+        duration = timestamp
+    names = {value: name.lower() for name, value in vars(RecordKind).items() if not name.startswith("_")}
+    return {"duration": duration, "records": {names.get(kind, str(kind)): count for kind, count in counts.items()}}
+
+
+def frame_time_stats(frame_times: List[float]) -> Dict[str, float]:
+    """
+    Summarizes per-frame durations.
+
+    Args:
+        frame_times (List[float]): Frame durations in seconds.
+
+    Returns:
+        Dict[str, float]: frames, mean/p50/p95/p99/max in milliseconds.
+    """
+    if not frame_times:
+        return {"frames": 0}
+    ordered = sorted(frame_times)
+
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+    return {
+        "frames": len(ordered),
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": ordered[-1] * 1000,
+    }
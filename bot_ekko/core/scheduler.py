@@ -1,38 +1,265 @@
-import json
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+import heapq
+from datetime import datetime, timedelta
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from bot_ekko.core.logger import get_logger
+from bot_ekko.core.clock import Clock, RealClock
+from bot_ekko.core.cron import CronSpec, weekday_mask
 
 logger = get_logger("Scheduler")
 
+# States a schedule may interrupt when it lists no interruptible_states
+DEFAULT_INTERRUPTIBLE_STATES = frozenset({"ACTIVE", "SQUINTING", "THINKING", "SLEEPING", "WAKING"})
+
+
+class ScheduledEvent:
+    """
+    A schedule entry from config.json, parsed once at load.
+
+    kind "date": active in [start, end) datetimes.
+    kind "daily": active in [start_minute, end_minute) of the day; spans midnight if start > end.
+                  An optional "weekdays" list limits it to windows starting on those days.
+    kind "hourly": active for the first `duration` seconds of every hour.
+    kind "cron": active for `duration` seconds from each minute matching the "cron" expression.
+    kind "interval": active for `duration` seconds every "every_minutes" minutes, counted from midnight.
+    """
+    __slots__ = ("name", "kind", "state", "params", "priority", "interruptible", "event",
+                 "start_dt", "end_dt", "start_minute", "end_minute", "duration", "weekdays", "spec")
+
+    def __init__(self, event: Dict[str, Any]) -> None:
+        """
+        Args:
+            event (Dict[str, Any]): Raw schedule entry.
+
+        Raises:
+            ValueError: If the entry's times can't be parsed.
+        """
+        self.event = event
+        self.name: str = event.get("name", "")
+        self.kind: str = event.get("type", "")
+        self.state: str = event.get("state")
+        self.params: Optional[Dict] = event.get("params")
+        self.priority: int = event.get("priority", 0)
+        self.interruptible: FrozenSet[str] = frozenset(event.get("interruptible_states", [])) or DEFAULT_INTERRUPTIBLE_STATES
+        self.start_dt: Optional[datetime] = None
+        self.end_dt: Optional[datetime] = None
+        self.start_minute = 0
+        self.end_minute = 0
+        self.duration = 0
+        # Cron weekday bitset (0 = Sunday); 0 = every day
+        self.weekdays = weekday_mask(event.get("weekdays", []))
+        self.spec: Optional[CronSpec] = None
+
+        if self.kind == "date":
+            start_str, end_str = event.get("start_datetime"), event.get("end_datetime")
+            if not start_str or not end_str:
+                raise ValueError("date events need start_datetime and end_datetime")
+            # Expected format: YYYY-MM-DD HH:MM:SS
+            self.start_dt = datetime.strptime(start_str, "%Y-%m-%d %H:%M:%S")
+            self.end_dt = datetime.strptime(end_str, "%Y-%m-%d %H:%M:%S")
+        elif self.kind == "daily":
+            start_str, end_str = event.get("start_time"), event.get("end_time")
+            if not start_str or not end_str:
+                raise ValueError("daily events need start_time and end_time")
+            start_h, start_m = map(int, start_str.split(':'))
+            end_h, end_m = map(int, end_str.split(':'))
+            # "24:00" is kept as 1440 so it behaves as before: it never matches as a start
+            self.start_minute = start_h * 60 + start_m
+            self.end_minute = end_h * 60 + end_m
+        elif self.kind == "hourly":
+            self.duration = (self.params or {}).get("duration", 10)  # seconds
+        elif self.kind in ("cron", "interval"):
+            self.duration = event.get("duration", (self.params or {}).get("duration", 60))  # seconds
+            if self.duration <= 0:
+                raise ValueError(f"{self.kind} events need a positive duration")
+            if self.kind == "cron":
+                if not event.get("cron"):
+                    raise ValueError("cron events need a cron expression")
+                self.spec = CronSpec.parse(event["cron"])
+            else:
+                if not event.get("every_minutes"):
+                    raise ValueError("interval events need every_minutes")
+                self.spec = CronSpec.every(int(event["every_minutes"]), int(event.get("offset_minutes", 0)),
+                                           self.weekdays)
+
+    def is_active(self, now_dt: datetime) -> bool:
+        if self.kind == "date":
+            return self.start_dt <= now_dt < self.end_dt
+        if self.kind == "daily":
+            curr_total = now_dt.hour * 60 + now_dt.minute
+            if self.start_minute > self.end_minute:  # Spans midnight
+                if curr_total < self.end_minute:
+                    # The window started yesterday
+                    return self._on_weekday(now_dt - timedelta(days=1))
+                return curr_total >= self.start_minute and self._on_weekday(now_dt)
+            return self.start_minute <= curr_total < self.end_minute and self._on_weekday(now_dt)
+        if self.kind == "hourly":
+            return now_dt.minute * 60 + now_dt.second < self.duration
+        if self.spec is not None:
+            fired = self.spec.prev_fire(now_dt)
+            return fired is not None and now_dt < fired + timedelta(seconds=self.duration)
+        return False
+
+    def _on_weekday(self, day: datetime) -> bool:
+        return not self.weekdays or bool(self.weekdays >> ((day.weekday() + 1) % 7) & 1)
+
+    def next_start(self, now_dt: datetime) -> Optional[datetime]:
+        """Returns the next start after now_dt, or None if the event never starts again."""
+        if self.kind == "date":
+            return self.start_dt if self.start_dt > now_dt else None
+        if self.kind == "daily":
+            start = self._next_minute_of_day(now_dt, self.start_minute % (24 * 60))
+            for _ in range(7):
+                if self._on_weekday(start):
+                    return start
+                start += timedelta(days=1)
+            return None
+        if self.kind == "hourly":
+            return now_dt.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        if self.spec is not None:
+            return self.spec.next_fire(now_dt)
+        return None
+
+    def next_boundary(self, now_dt: datetime) -> Optional[datetime]:
+        """
+        Returns the first time after now_dt at which is_active() may change, or None if it never changes again.
+        """
+        if self.kind == "date":
+            return min((dt for dt in (self.start_dt, self.end_dt) if dt > now_dt), default=None)
+        if self.kind == "daily":
+            return min(self._next_minute_of_day(now_dt, self.start_minute % (24 * 60)),
+                       self._next_minute_of_day(now_dt, self.end_minute % (24 * 60)))
+        if self.kind == "hourly":
+            if not 0 < self.duration < 3600:
+                return None
+            hour = now_dt.replace(minute=0, second=0, microsecond=0)
+            end = hour + timedelta(seconds=self.duration)
+            return end if end > now_dt else hour + timedelta(hours=1)
+        if self.spec is not None:
+            fired = self.spec.prev_fire(now_dt)
+            if fired is not None:
+                end = fired + timedelta(seconds=self.duration)
+                if end > now_dt:
+                    return end
+            return self.spec.next_fire(now_dt)
+        return None
+
+    @staticmethod
+    def _next_minute_of_day(now_dt: datetime, minute: int) -> datetime:
+        midnight = now_dt.replace(hour=0, minute=0, second=0, microsecond=0)
+        at = midnight + timedelta(minutes=minute)
+        return at if at > now_dt else at + timedelta(days=1)
+
+    def __repr__(self):
+        return f"ScheduledEvent({self.name}: {self.kind} -> {self.state}, P:{self.priority})"
+
+
 class Scheduler:
     """
     Manages scheduled events and state transitions based on time.
+
+    Events are compiled once into ScheduledEvent records. A min-heap holds each event's next boundary
+    (a start or end), so the set of active events is only recomputed when a boundary is crossed;
+    next_change_at() tells callers when that is.
     """
-    def __init__(self, events: List[Dict] = None):
+    def __init__(self, events: List[Dict] = None, clock: Optional[Clock] = None):
         """
         Initialize the Scheduler.
 
         Args:
             events (List[Dict]): List of scheduled events.
+            clock (Clock, optional): Source of "now" for callers without a datetime. Defaults to real time.
         """
         self.events: List[Dict] = events or []
+        self.clock: Clock = clock or RealClock()
+        self.compiled: List[ScheduledEvent] = []
+        # (boundary, index into compiled)
+        self._boundaries: List[Tuple[datetime, int]] = []
+        self._active: List[ScheduledEvent] = []
+        self._active_flags: List[bool] = []
+        self._evaluated_at: Optional[datetime] = None
         self._prepare_schedule()
 
     def _prepare_schedule(self) -> None:
         """
-        Sorts events by priority.
+        Sorts events by priority and compiles them.
         """
         # Sort by priority (descending). Default priority 0 if not set.
         self.events.sort(key=lambda x: x.get("priority", 0), reverse=True)
-        
-        logger.info(f"Loaded {len(self.events)} scheduled events from config.")
+
+        self.compiled = []
+        for event in self.events:
+            try:
+                self.compiled.append(ScheduledEvent(event))
+            except ValueError as e:
+                logger.error(f"Invalid time format in event {event.get('name')}: {e}")
+        self._evaluated_at = None
+
+        logger.info(f"Loaded {len(self.compiled)} scheduled events from config.")
+
+    def set_events(self, events: List[Dict]) -> None:
+        """
+        Replaces the schedule (config hot-reload). The index is rebuilt on the next query.
+
+        Args:
+            events (List[Dict]): List of scheduled events.
+        """
+        self.events = events or []
+        self._prepare_schedule()
+
+    def _refresh(self, now_dt: datetime) -> None:
+        """Recomputes the active events if a boundary was crossed (or time went backwards) since the last call."""
+        if self._evaluated_at is not None and self._evaluated_at <= now_dt \
+                and (not self._boundaries or now_dt < self._boundaries[0][0]):
+            self._evaluated_at = now_dt
+            return
+
+        if self._evaluated_at is None or now_dt < self._evaluated_at:
+            self._boundaries = []
+            for index, event in enumerate(self.compiled):
+                boundary = event.next_boundary(now_dt)
+                if boundary is not None:
+                    self._boundaries.append((boundary, index))
+            heapq.heapify(self._boundaries)
+            self._active_flags = [event.is_active(now_dt) for event in self.compiled]
+            changed = True
+        else:
+            # Only events whose boundary was crossed can have changed
+            boundaries = self._boundaries
+            flags = self._active_flags
+            changed = False
+            while boundaries and boundaries[0][0] <= now_dt:
+                index = heapq.heappop(boundaries)[1]
+                event = self.compiled[index]
+                boundary = event.next_boundary(now_dt)
+                if boundary is not None:
+                    heapq.heappush(boundaries, (boundary, index))
+                active = event.is_active(now_dt)
+                if active != flags[index]:
+                    flags[index] = active
+                    changed = True
+
+        if changed:
+            self._active = [event for event, active in zip(self.compiled, self._active_flags) if active]
+        self._evaluated_at = now_dt
+
+    def next_change_at(self, now_dt: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Returns when the set of active events next changes.
+
+        Args:
+            now_dt (datetime, optional): Current datetime. Defaults to the clock's.
+
+        Returns:
+            Optional[datetime]: The next schedule boundary, or None if no event changes again.
+        """
+        self._refresh(now_dt or self.clock.now())
+        return self._boundaries[0][0] if self._boundaries else None
 
     def get_target_state(self, now_dt: datetime, current_state: str) -> Optional[Tuple[str, Optional[Dict]]]:
         """
         Checks if any scheduled event is active AND if the current state allows interruption.
-        
+
         Args:
             now_dt (datetime): Current datetime.
             current_state (str): Name of the current state.
@@ -40,95 +267,37 @@ class Scheduler:
         Returns:
             Optional[Tuple[str, Optional[Dict]]]: (target_state, params) if conditions are met, else None.
         """
-        for event in self.events:
-            target_state = event.get("state")
-            params = event.get("params")
-            # name = event.get("name") # unused
-            # priority = event.get("priority", 10) # unused here as list is sorted
-            
-            # 1. Check time window
-            if not self._is_event_active(event, now_dt):
-                continue
-                
-            # 2. Check overlap (already in state)
-            if current_state == target_state:
-                # We are already in the target state, keep it.
-                return target_state, params
-                
-            # 3. Check if current state is interruptible by this event
-            interruptible = set(event.get("interruptible_states", []))
-            
-            # Default fallback: if not specified, assume it can interrupt standard states
-            if not interruptible:
-                 interruptible = {"ACTIVE", "SQUINTING", "THINKING", "SLEEPING", "WAKING"}
-                 
-            if current_state in interruptible:
-                return target_state, params
-                
+        self._refresh(now_dt)
+        # Active events are in priority order
+        for event in self._active:
+            # Already in the target state (keep it), or the current state is interruptible by this event
+            if current_state == event.state or current_state in event.interruptible:
+                return event.state, event.params
+
         return None
 
-    def _is_event_active(self, event: Dict, now_dt: datetime) -> bool:
-        event_type = event.get("type")
-        if event_type == "daily":
-            return self._check_daily_interval(event, now_dt)
-        elif event_type == "date":
-            return self._check_date_interval(event, now_dt)
-        elif event_type == "hourly":
-            return self._check_hourly_interval(event, now_dt)
-        return False
+    def upcoming_events(self, now_dt: datetime, horizon_seconds: float) -> List[Tuple[datetime, Dict]]:
+        """
+        Lists events that are active now or start within the horizon.
+        Used to warm caches ahead of scheduled transitions.
 
-    def _check_date_interval(self, event: Dict, now_dt: datetime) -> bool:
-        start_str = event.get("start_datetime")
-        end_str = event.get("end_datetime")
-        
-        if not start_str or not end_str:
-            return False
-            
-        try:
-            # Expected format: YYYY-MM-DD HH:MM:SS
-            start_dt = datetime.strptime(start_str, "%Y-%m-%d %H:%M:%S")
-            end_dt = datetime.strptime(end_str, "%Y-%m-%d %H:%M:%S")
-            
-            return start_dt <= now_dt < end_dt
-        except ValueError:
-            logger.error(f"Invalid datetime format in event {event.get('name')}. Use YYYY-MM-DD HH:MM:SS")
-            return False
-
-    def _check_daily_interval(self, event: Dict, now_dt: datetime) -> bool:
-        start_str = event.get("start_time")
-        end_str = event.get("end_time")
-        
-        if not start_str or not end_str:
-            return False
-
-        try:
-            start_h, start_m = map(int, start_str.split(':'))
-            end_h, end_m = map(int, end_str.split(':'))
-            
-            curr_total = now_dt.hour * 60 + now_dt.minute
-            start_total = start_h * 60 + start_m
-            end_total = end_h * 60 + end_m
-            
-            if start_total > end_total: # Spans midnight
-                return curr_total >= start_total or curr_total < end_total
-            else: # Same day
-                return start_total <= curr_total < end_total
-                
-        except ValueError:
-            logger.error(f"Invalid time format in event {event.get('name')}")
-            return False
-
-    def _check_hourly_interval(self, event: Dict, now_dt: datetime) -> bool:
-        """
-        Active if current minute/second is within the first 'duration' seconds of the hour.
-        Default duration 10s.
-        """
-        params = event.get("params", {})
-        duration = params.get("duration", 10) # seconds
-        
-        # Check if we are in the first 'duration' seconds of the hour
-        # e.g. 10:00:00 to 10:00:10
-        
-        seconds_since_hour = now_dt.minute * 60 + now_dt.second
-        return seconds_since_hour < duration
+        Args:
+            now_dt (datetime): Current datetime.
+            horizon_seconds (float): How far ahead to look.
+
+        Returns:
+            List[Tuple[datetime, Dict]]: (start time, event) pairs sorted by start time.
+                                          Active events report now_dt as their start.
+        """
+        horizon_dt = now_dt + timedelta(seconds=horizon_seconds)
+        upcoming = []
+        for event in self.compiled:
+            if event.is_active(now_dt):
+                upcoming.append((now_dt, event.event))
+                continue
+            start_dt = event.next_start(now_dt)
+            if start_dt is not None and start_dt <= horizon_dt:
+                upcoming.append((start_dt, event.event))
 
+        upcoming.sort(key=lambda item: item[0])
+        return upcoming
@@ -0,0 +1,188 @@
+import os
+import struct
+import weakref
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+# Bytes reserved for the last error message (UTF-8, truncated to fit)
+LAST_ERROR_BYTES = 256
+
+_INT = struct.Struct("=q")
+_FLOAT = struct.Struct("=d")
+_LENGTH = struct.Struct("=I")
+# Attempts at a consistent read of last_error
+_READ_RETRIES = 100
+
+
+def _release(shm: shared_memory.SharedMemory, owner_pid: int) -> None:
+    shm.close()
+    # Forked children inherit the object; only the creating process removes the segment
+    if os.getpid() == owner_pid:
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedStats:
+    """
+    Fixed-layout stats block in shared memory, so a child process's stats can be read by its parent.
+
+    Layout (native byte order, every numeric slot 8-byte aligned):
+        status (int64), heartbeat (float64), counters (int64 each), gauges (float64 each),
+        last_error sequence (int64) + length (uint32) + LAST_ERROR_BYTES of UTF-8.
+
+    Each slot has a single writer (the child, except status before the child starts).
+    Aligned 8-byte stores don't tear on the 64-bit boards we run on, so readers need no lock;
+    a snapshot may mix values written a few microseconds apart. last_error spans several
+    writes, so it is guarded by a sequence counter (odd while a write is in progress).
+    Reads and writes go straight to the shared buffer with struct, nothing is copied
+    besides the values themselves.
+    """
+    def __init__(self, counters: Sequence[str] = (), gauges: Sequence[str] = (), name: Optional[str] = None):
+        """
+        Args:
+            counters (Sequence[str], optional): Integer slots.
+            gauges (Sequence[str], optional): Float slots.
+            name (str, optional): Attach to an existing block instead of creating one.
+
+        Raises:
+            ValueError: If a slot name is declared twice.
+        """
+        self.counters: Tuple[str, ...] = tuple(counters)
+        self.gauges: Tuple[str, ...] = tuple(gauges)
+        names = self.counters + self.gauges
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate stat slots in {names}")
+
+        # name -> (offset, struct)
+        self._slots: Dict[str, Tuple[int, struct.Struct]] = {}
+        offset = 16
+        for key in self.counters:
+            self._slots[key] = (offset, _INT)
+            offset += 8
+        for key in self.gauges:
+            self._slots[key] = (offset, _FLOAT)
+            offset += 8
+        self._error_offset = offset
+        # One call unpacks every numeric slot for snapshot()
+        self._numbers = struct.Struct(f"={len(self.counters)}q{len(self.gauges)}d")
+        size = offset + _INT.size + _LENGTH.size + LAST_ERROR_BYTES
+
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self._finalizer = weakref.finalize(self, _release, self._shm, os.getpid())
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            self._finalizer = weakref.finalize(self, self._shm.close)
+        self._buf = self._shm.buf
+
+    @property
+    def name(self) -> str:
+        """str: Name of the shared memory segment."""
+        return self._shm.name
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Spawned children get the segment name and reattach
+        return {"name": self.name, "counters": self.counters, "gauges": self.gauges}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["counters"], state["gauges"], name=state["name"])
+
+    def has(self, key: str) -> bool:
+        """Whether `key` is a counter or gauge slot."""
+        return key in self._slots
+
+    def get(self, key: str) -> Union[int, float]:
+        """
+        Reads one slot.
+
+        Raises:
+            KeyError: If `key` is not a slot.
+        """
+        offset, packer = self._slots[key]
+        return packer.unpack_from(self._buf, offset)[0]
+
+    def set(self, key: str, value: Union[int, float]) -> None:
+        """
+        Writes one slot (counters are truncated to int).
+
+        Raises:
+            KeyError: If `key` is not a slot.
+        """
+        offset, packer = self._slots[key]
+        packer.pack_into(self._buf, offset, int(value) if packer is _INT else float(value))
+
+    def increment(self, key: str, amount: Union[int, float] = 1) -> None:
+        """
+        Adds to a slot. Only atomic with a single writer per slot.
+
+        Raises:
+            KeyError: If `key` is not a slot.
+        """
+        offset, packer = self._slots[key]
+        current = packer.unpack_from(self._buf, offset)[0]
+        packer.pack_into(self._buf, offset, current + (int(amount) if packer is _INT else amount))
+
+    @property
+    def status(self) -> int:
+        """int: Status code, interpreted by the owner (e.g. the index of a ServiceStatus)."""
+        return _INT.unpack_from(self._buf, 0)[0]
+
+    @status.setter
+    def status(self, value: int) -> None:
+        _INT.pack_into(self._buf, 0, value)
+
+    @property
+    def heartbeat(self) -> float:
+        """float: Last heartbeat (time.monotonic(), which is system-wide on Linux)."""
+        return _FLOAT.unpack_from(self._buf, 8)[0]
+
+    @heartbeat.setter
+    def heartbeat(self, value: float) -> None:
+        _FLOAT.pack_into(self._buf, 8, value)
+
+    @property
+    def last_error(self) -> Optional[str]:
+        """Optional[str]: The last error message, or None."""
+        length_offset = self._error_offset + _INT.size
+        start = length_offset + _LENGTH.size
+        # Retry while a write is in progress; bounded, since a writer killed mid-write leaves the sequence odd
+        for _ in range(_READ_RETRIES):
+            sequence = _INT.unpack_from(self._buf, self._error_offset)[0]
+            length = min(_LENGTH.unpack_from(self._buf, length_offset)[0], LAST_ERROR_BYTES)
+            data = bytes(self._buf[start:start + length])
+            if not sequence & 1 and _INT.unpack_from(self._buf, self._error_offset)[0] == sequence:
+                break
+        return data.decode("utf-8", errors="ignore") if data else None
+
+    @last_error.setter
+    def last_error(self, message: Optional[str]) -> None:
+        # Truncate on a character boundary so the stored bytes always decode
+        data = (message or "").encode("utf-8")[:LAST_ERROR_BYTES].decode("utf-8", errors="ignore").encode("utf-8")
+        length_offset = self._error_offset + _INT.size
+        start = length_offset + _LENGTH.size
+        sequence = _INT.unpack_from(self._buf, self._error_offset)[0]
+        _INT.pack_into(self._buf, self._error_offset, sequence + 1)
+        self._buf[start:start + len(data)] = data
+        _LENGTH.pack_into(self._buf, length_offset, len(data))
+        _INT.pack_into(self._buf, self._error_offset, sequence + 2)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Reads every counter and gauge, plus last_error when set.
+
+        Returns:
+            Dict[str, Any]: Slot name -> value.
+        """
+        values = self._numbers.unpack_from(self._buf, 16)
+        snapshot = dict(zip(self.counters + self.gauges, values))
+        error = self.last_error
+        if error is not None:
+            snapshot["last_error"] = error
+        return snapshot
+
+    def close(self) -> None:
+        """Unmaps the block; the creating process also removes it."""
+        self._buf = None
+        self._finalizer()
@@ -0,0 +1,141 @@
+import os
+import queue
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+
+# Headless: no window, dummy audio
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from bot_ekko.core.arbiter import StateArbiter
+from bot_ekko.core.clock import Clock, FixedStepClock
+from bot_ekko.core.command_center import CommandCenter
+from bot_ekko.core.event_bus import EventBus
+from bot_ekko.core.interrupts import InterruptHandler
+from bot_ekko.core.logger import get_logger
+from bot_ekko.core.models import SystemConfig
+from bot_ekko.core.state_machine import StateHandler, StateMachine
+from bot_ekko.core.transitions import TransitionGraph
+from bot_ekko.modules.media_interface import MediaModule
+from bot_ekko.sys_config import BLACK, EVENT_BUS_CAPACITY, LOGICAL_H, LOGICAL_W
+from bot_ekko.utils import load_class_from_path
+
+logger = get_logger("Simulation")
+
+
+class HeadlessBot:
+    """
+    The core of main_bot.py (state, interrupts, schedules, adapter) on an injected clock, without a display.
+    With a FixedStepClock, time only moves when the caller steps it, so hours of schedules run in seconds.
+    """
+    def __init__(self, system_config: SystemConfig, clock: Optional[Clock] = None, media: bool = False) -> None:
+        """
+        Args:
+            system_config (SystemConfig): Config to build the bot with.
+            clock (Clock, optional): Time and RNG source. Defaults to a FixedStepClock at 60 fps.
+            media (bool, optional): Start the MediaModule thread (CANVAS/CLOCK content). Defaults to False.
+        """
+        pygame.init()
+        self.clock = clock or FixedStepClock(step_ms=1000 // 60)
+        self.surface = pygame.Surface((LOGICAL_W, LOGICAL_H))
+        self.queue: queue.Queue = queue.Queue()
+
+        ui_config = system_config.ui_expression_config
+        state_machine = StateMachine()
+        render_engine_class = load_class_from_path(ui_config.adapter_module_path, ui_config.adapter_class_name)
+        self.render_engine = render_engine_class(state_machine, self.clock)
+        self.state_handler = StateHandler(self.render_engine, state_machine, self.clock)
+        if system_config.transitions.enabled:
+            self.state_handler.set_transition_graph(TransitionGraph(system_config.transitions).compile())
+
+        self.event_bus = EventBus(EVENT_BUS_CAPACITY)
+        self.state_handler.set_event_bus(self.event_bus)
+        self.command_center = CommandCenter(self.queue, self.state_handler)
+        self.arbiter = StateArbiter(self.command_center, self.state_handler)
+        self.command_center.set_arbiter(self.arbiter)
+        self.render_engine.set_dependencies(self.state_handler, self.command_center, system_config)
+        self.interrupt_handler = InterruptHandler(self.command_center, self.state_handler, self.clock)
+
+        self.media_player: Optional[MediaModule] = None
+        if media:
+            self.media_player = MediaModule(self.interrupt_handler, self.command_center, clock=self.clock)
+            self.media_player.start()
+            if hasattr(self.render_engine, "set_media_player"):
+                self.render_engine.set_media_player(self.media_player)
+
+    def update_inputs(self) -> None:
+        """Hook for subclasses that feed inputs each frame."""
+        pass
+
+    def step(self) -> None:
+        """Runs one frame of the main loop at the clock's current time."""
+        now = self.clock.ticks()
+        while not self.queue.empty():
+            try:
+                self.command_center.dispatch(self.queue.get_nowait())
+            except queue.Empty:
+                pass
+        self.arbiter.update()
+
+        self.update_inputs()
+        interrupt_deadline = self.interrupt_handler.next_deadline()
+        if interrupt_deadline is not None and now > interrupt_deadline:
+            self.interrupt_handler.update()
+        self.render_engine.update(now)
+
+        self.surface.fill(BLACK)
+        self.render_engine.render(self.surface, now)
+        if self.media_player:
+            self.media_player.consume_dirty_rects()
+
+    def stop(self) -> None:
+        if self.media_player:
+            self.media_player.running = False
+
+
+def simulate(system_config: SystemConfig, hours: float = 24.0, step_ms: int = 1000,
+             start=None, seed: int = 0) -> Dict[str, Any]:
+    """
+    Runs the bot headless on a FixedStepClock.
+
+    Args:
+        system_config (SystemConfig): Config to build the bot with.
+        hours (float, optional): Simulated duration. Defaults to 24.0.
+        step_ms (int, optional): Simulated milliseconds per frame. Defaults to 1000.
+        start (datetime, optional): Simulated start time. Defaults to now.
+        seed (int, optional): RNG seed. Defaults to 0.
+
+    Returns:
+        Dict[str, Any]: Frames run, wall time, simulated seconds spent per state, state entries
+            and transitions issued by the arbiter.
+    """
+    clock = FixedStepClock(start=start, step_ms=step_ms, seed=seed)
+    bot = HeadlessBot(system_config, clock)
+    time_in_state: Counter = Counter()
+    entries: Counter = Counter()
+    frames = int(hours * 3600 * 1000 // step_ms)
+
+    wall_start = time.perf_counter()
+    previous = None
+    try:
+        for _ in range(frames):
+            bot.step()
+            state = bot.state_handler.get_state()
+            time_in_state[state] += step_ms / 1000
+            if state != previous:
+                entries[state] += 1
+                previous = state
+            clock.step()
+    finally:
+        bot.stop()
+
+    return {
+        "frames": frames,
+        "wall_time": time.perf_counter() - wall_start,
+        "time_in_state": dict(time_in_state),
+        "entries": dict(entries),
+        "transitions": bot.arbiter.transitions,
+    }
@@ -0,0 +1,130 @@
+from typing import Any, Dict, List, Optional
+
+from bot_ekko.core.logger import get_logger
+
+logger = get_logger("SnapshotRing")
+
+
+class StateSnapshot:
+    """
+    One saved state context. Records live in a SnapshotRing and are reused, never reallocated.
+
+    Attributes:
+        context_id (int): Unique, increasing id handed out by save_state_ctx().
+        state (str): Saved state name.
+        state_entry_time (int): Saved state entry time (ms).
+        params (dict, optional): Saved state params (shared, params dicts are replaced rather than mutated).
+        physics (List[Any]): Preallocated values of the render engine's physics_fields.
+        physics_state (dict, optional): Physics dict for render engines without physics_fields.
+    """
+    __slots__ = ("context_id", "state", "state_entry_time", "params", "physics", "physics_state")
+
+    def __init__(self, physics_size: int = 0) -> None:
+        self.context_id = 0
+        self.state = ""
+        self.state_entry_time = 0
+        self.params: Optional[Dict[str, Any]] = None
+        self.physics: List[Any] = [None] * physics_size
+        self.physics_state: Optional[Dict[str, Any]] = None
+
+
+class SnapshotRing:
+    """
+    Fixed-capacity stack of StateSnapshot records.
+
+    Pushing onto a full ring overwrites the oldest context (counted in `overflows`).
+    Popping a specific context id also drops every newer context (counted in `discarded`),
+    since those were saved while the popped context was interrupted.
+    """
+    def __init__(self, capacity: int, physics_size: int = 0) -> None:
+        """
+        Initialize the ring.
+
+        Args:
+            capacity (int): Maximum number of saved contexts.
+            physics_size (int, optional): Length of each snapshot's physics list.
+        """
+        self.capacity = capacity
+        self._slots = [StateSnapshot(physics_size) for _ in range(capacity)]
+        # Monotonic positions: live snapshots are in [_start, _end), slot = position % capacity
+        self._start = 0
+        self._end = 0
+        self._next_id = 1
+
+        self.overflows = 0
+        self.missed = 0
+        self.discarded = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def push(self) -> StateSnapshot:
+        """
+        Claims the next record; the caller fills in its fields.
+
+        Returns:
+            StateSnapshot: The record, with a fresh context_id.
+        """
+        if len(self) == self.capacity:
+            self._start += 1
+            self.overflows += 1
+            logger.warning(f"State history full ({self.capacity}); oldest context dropped")
+        snapshot = self._slots[self._end % self.capacity]
+        self._end += 1
+        snapshot.context_id = self._next_id
+        self._next_id += 1
+        return snapshot
+
+    def peek(self) -> Optional[StateSnapshot]:
+        """Returns the newest snapshot without removing it."""
+        if not len(self):
+            return None
+        return self._slots[(self._end - 1) % self.capacity]
+
+    def find(self, context_id: int) -> Optional[StateSnapshot]:
+        """Returns the snapshot with this context id without removing it, or None."""
+        for position in range(self._end - 1, self._start - 1, -1):
+            snapshot = self._slots[position % self.capacity]
+            if snapshot.context_id == context_id:
+                return snapshot
+        return None
+
+    def pop(self, context_id: Optional[int] = None) -> Optional[StateSnapshot]:
+        """
+        Removes and returns a snapshot. The record stays valid until the next push().
+
+        Args:
+            context_id (int, optional): Context to restore. Defaults to the newest.
+
+        Returns:
+            Optional[StateSnapshot]: The snapshot, or None if empty / the context was already dropped.
+        """
+        position = self._end - 1
+        if context_id is not None:
+            while position >= self._start and self._slots[position % self.capacity].context_id != context_id:
+                position -= 1
+        if position < self._start:
+            if context_id is not None:
+                self.missed += 1
+                logger.warning(f"Context {context_id} is no longer in the state history")
+            return None
+
+        self.discarded += self._end - 1 - position
+        self._end = position
+        return self._slots[position % self.capacity]
+
+    def clear(self) -> None:
+        self._start = self._end
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: size, capacity, overflows, missed and discarded counts.
+        """
+        return {
+            "size": len(self),
+            "capacity": self.capacity,
+            "overflows": self.overflows,
+            "missed": self.missed,
+            "discarded": self.discarded,
+        }
@@ -0,0 +1,138 @@
+import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from bot_ekko.core.base import BaseService, ServiceStatus
+from bot_ekko.core.logger import get_logger
+
+logger = get_logger("Startup")
+
+
+def startup_order(services: Dict[str, BaseService]) -> List[str]:
+    """
+    Orders services so each comes after the services it depends on.
+
+    Args:
+        services (Dict[str, BaseService]): Services to start, by key. Dependencies on keys
+                                           that aren't being started are ignored.
+
+    Returns:
+        List[str]: Keys in dependency order (otherwise in the given order).
+
+    Raises:
+        ValueError: On a dependency cycle.
+    """
+    order: List[str] = []
+    visiting = set()
+
+    def visit(key: str) -> None:
+        if key in order:
+            return
+        if key in visiting:
+            raise ValueError(f"Service dependency cycle through {key}")
+        visiting.add(key)
+        for dependency in services[key].depends_on:
+            if dependency in services:
+                visit(dependency)
+        visiting.discard(key)
+        order.append(key)
+
+    for key in services:
+        visit(key)
+    return order
+
+
+class ServiceStarter:
+    """
+    Starts services concurrently on a thread pool. A service starts as soon as the services
+    in its depends_on are up, and is skipped if one of them failed.
+
+    Each service's start offset, init duration and outcome are kept in `report`.
+    """
+    def __init__(self, services: Dict[str, BaseService]) -> None:
+        """
+        Args:
+            services (Dict[str, BaseService]): Services to start, by key.
+        """
+        self.services = services
+        self.report: Dict[str, Any] = {"total_ms": 0.0, "services": {}}
+        self.errors: List[Exception] = []
+        self._boot = 0.0
+
+    def start(self) -> Dict[str, Any]:
+        """
+        Starts every service and waits until all of them are up or failed.
+
+        Returns:
+            Dict[str, Any]: The startup report.
+        """
+        self._boot = time.perf_counter()
+        order = startup_order(self.services)
+        futures: Dict[str, Future] = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(order)), thread_name_prefix="service_start") as pool:
+            # Dependencies are submitted first; one worker per service, so waiting on them can't deadlock
+            for key in order:
+                dependencies = [(name, futures[name]) for name in self.services[key].depends_on if name in futures]
+                futures[key] = pool.submit(self._start_one, key, dependencies)
+
+        for key, future in futures.items():
+            if future.exception() is not None:
+                logger.error(f"Starting {key} failed unexpectedly: {future.exception()}")
+
+        self.report["total_ms"] = (time.perf_counter() - self._boot) * 1000
+        return self.report
+
+    def _start_one(self, key: str, dependencies: List) -> bool:
+        service = self.services[key]
+        entry: Dict[str, Any] = {"name": service.service_name, "depends_on": [name for name, _ in dependencies]}
+        self.report["services"][key] = entry
+
+        for name, future in dependencies:
+            if not future.result():
+                entry.update(status="SKIPPED", error=f"dependency {name} failed",
+                             start_ms=(time.perf_counter() - self._boot) * 1000, duration_ms=0.0)
+                logger.error(f"Not starting {service.service_name}: dependency {name} failed")
+                return False
+
+        started = time.perf_counter()
+        entry["start_ms"] = (started - self._boot) * 1000
+        ok = True
+        if service.status == ServiceStatus.RUNNING:
+            logger.info(f"Service {service.service_name} is already running")
+        else:
+            logger.info(f"Starting service: {service.service_name}")
+            try:
+                service.start()
+            except Exception as e:
+                logger.error(f"Failed to start service: {service.service_name}: {e}")
+                entry["error"] = str(e)
+                self.errors.append(e)
+                ok = False
+
+        entry["duration_ms"] = (time.perf_counter() - started) * 1000
+        entry["status"] = service.status.value
+        return ok and service.status != ServiceStatus.ERROR
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Renders a startup report as a timeline, one line per service in start order."""
+    lines = [f"Services started in {report['total_ms']:.1f} ms"]
+    entries = sorted(report["services"].items(), key=lambda item: item[1].get("start_ms", 0.0))
+    for key, entry in entries:
+        line = f"  {key:<20} +{entry.get('start_ms', 0.0):8.1f} ms  init {entry.get('duration_ms', 0.0):8.1f} ms  {entry.get('status')}"
+        if entry.get("error"):
+            line += f" ({entry['error']})"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def write_report(report: Dict[str, Any], path: Optional[str]) -> None:
+    """Writes the report as JSON; failures are logged, not raised."""
+    if not path:
+        return
+    try:
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+    except OSError as e:
+        logger.error(f"Failed to write startup report to {path}: {e}")
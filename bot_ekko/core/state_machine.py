@@ -1,17 +1,22 @@
 import random
 import math
-from collections import deque
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Tuple, Union
 
-import pygame
-
 from bot_ekko.core.state_registry import StateRegistry
 from bot_ekko.core.logger import get_logger
 from bot_ekko.core.models import StateContext
+from bot_ekko.core.snapshots import SnapshotRing, StateSnapshot
+from bot_ekko.sys_config import STATE_HISTORY_SIZE
+from bot_ekko.core.transitions import TransitionGraph
+from bot_ekko.core.event_bus import EventBus, StateChanged, Topics
+from bot_ekko.core.clock import Clock, RealClock
+from bot_ekko.core.metrics import REGISTRY
 
 logger = get_logger("StateHandler")
 
+STATE_ENTERED = REGISTRY.counter("ekko_state_entered_total", "Transitions into each state.", ("state",))
+
 
 class StateMachine:
     """
@@ -44,21 +49,71 @@ class BaseStateHandler:
     """
     Base class for handling state logic, transitions, and context management.
     """
-    def __init__(self, render_engine: Any, state_machine: StateMachine):
+    def __init__(self, render_engine: Any, state_machine: StateMachine, clock: Optional[Clock] = None):
         """
         Initialize the BaseStateHandler.
 
         Args:
             render_engine (AbstractRenderEngine): The render engine instance.
             state_machine (StateMachine): The state machine instance.
+            clock (Clock, optional): Time source for state entry times. Defaults to the render engine's clock.
         """
         self.render_engine = render_engine
         self.state_machine = state_machine
+        engine_clock = getattr(render_engine, "clock", None)
+        self.clock: Clock = clock or (engine_clock if isinstance(engine_clock, Clock) else RealClock())
         self.state_entry_time = 0
     
-        self.state_history: deque = deque(maxlen=5)
+        # Render engine attributes captured into snapshots; engines without them fall back to get_physics_state()
+        physics_fields = getattr(render_engine, "physics_fields", ())
+        self.physics_fields = physics_fields if isinstance(physics_fields, tuple) else ()
+        self.state_history = SnapshotRing(STATE_HISTORY_SIZE, len(self.physics_fields))
+        # owner (e.g. "interrupts") -> context id it saved
+        self._context_owners: Dict[str, int] = {}
         self.current_state_params: Optional[Dict[str, Any]] = None
         self.is_media_playing = False
+
+        # State when the running command batch started; transitions inside a batch are logged once
+        self._batch_start_state: Optional[str] = None
+
+        # Compiled transition rules; None allows every transition
+        self.transition_graph: Optional[TransitionGraph] = None
+
+        # state.changed is published here when set
+        self.event_bus: Optional[EventBus] = None
+
+    def set_transition_graph(self, transition_graph: Optional[TransitionGraph]) -> None:
+        """
+        Sets the rules transitions are checked against.
+
+        Args:
+            transition_graph (TransitionGraph, optional): A compiled graph, or None to allow everything.
+        """
+        self.transition_graph = transition_graph
+
+    def set_event_bus(self, event_bus: Optional[EventBus]) -> None:
+        """
+        Sets the bus state.changed events are published to.
+
+        Args:
+            event_bus (EventBus, optional): The shared bus, or None.
+        """
+        self.event_bus = event_bus
+
+    def resolve_transition(self, new_state: str, params: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Checks a transition from the current state against the transition graph.
+
+        Args:
+            new_state (str): Requested state.
+            params (dict, optional): Params of the requested state.
+
+        Returns:
+            Optional[str]: The state that would be entered (may be a redirect), or None if rejected.
+        """
+        if self.transition_graph is None:
+            return new_state
+        return self.transition_graph.resolve(self.state_machine.get_state(), new_state, params)
     
     def get_state(self) -> str:
         """
@@ -91,31 +146,81 @@ class BaseStateHandler:
             params=self.current_state_params
         )
     
-    def save_state_ctx(self) -> None:
+    def save_state_ctx(self, owner: Optional[str] = None, state: Optional[str] = None,
+                       state_entry_time: Optional[int] = None) -> int:
         """
         Saves the current state context to history.
+
+        Args:
+            owner (str, optional): Tag to restore this exact context later with restore_state_ctx(owner=...).
+            state (str, optional): Save this state instead of the current one (params are not saved then).
+            state_entry_time (int, optional): Entry time to save with `state`.
+
+        Returns:
+            int: The context id.
         """
-        state_ctx = self.get_current_state_ctx()
-        self.state_history.append(state_ctx)
+        snapshot = self.state_history.push()
+        if state is None:
+            snapshot.state = self.state_machine.get_state()
+            snapshot.state_entry_time = self.state_entry_time
+            snapshot.params = self.current_state_params
+        else:
+            snapshot.state = state
+            snapshot.state_entry_time = self.state_entry_time if state_entry_time is None else state_entry_time
+            snapshot.params = None
+
+        if self.physics_fields:
+            self.render_engine.capture_physics(snapshot.physics)
+            snapshot.physics_state = None
+        else:
+            snapshot.physics_state = self.render_engine.get_physics_state()
+
+        if owner is not None:
+            self._context_owners[owner] = snapshot.context_id
+        return snapshot.context_id
     
-    def restore_state_ctx(self) -> None:
+    def get_owned_ctx(self, owner: str) -> Optional[StateSnapshot]:
         """
-        Restores the most recently saved state context from history.
+        Returns the context saved with an owner tag without restoring it.
+
+        Args:
+            owner (str): Owner tag passed to save_state_ctx().
+
+        Returns:
+            Optional[StateSnapshot]: The snapshot, or None.
+        """
+        context_id = self._context_owners.get(owner)
+        return None if context_id is None else self.state_history.find(context_id)
+
+    def restore_state_ctx(self, context_id: Optional[int] = None, owner: Optional[str] = None) -> None:
         """
-        if self.state_history:
-            state_ctx = self.state_history.pop()
-            self.set_state(state_ctx.state, params=state_ctx.params)
-            self.state_entry_time = state_ctx.state_entry_time
-            
-            if state_ctx.physics_state:
-                self.render_engine.set_physics_state(state_ctx.physics_state)
-            else:
-                # Backwards compatible restore
-                self.render_engine.set_physics_state({"x": state_ctx.x, "y": state_ctx.y})
-                
-            logger.info(f"Context restored to: {state_ctx.state}")
+        Restores a saved state context from history. Contexts saved after it are dropped.
+
+        Args:
+            context_id (int, optional): Context to restore. Defaults to the most recent one.
+            owner (str, optional): Restore the context saved with this owner tag (nothing if it has none).
+        """
+        if owner is not None:
+            context_id = self._context_owners.pop(owner, None)
+            if context_id is None:
+                logger.debug(f"No saved context for {owner}")
+                return
+
+        snapshot = self.state_history.pop(context_id)
+        if snapshot is None:
+            return
+
+        # Restoring returns to a context that was already entered: skip transition rules
+        self.set_state(snapshot.state, params=snapshot.params, force=True)
+        self.state_entry_time = snapshot.state_entry_time
+        if snapshot.physics_state is not None:
+            self.render_engine.set_physics_state(snapshot.physics_state)
+        elif self.physics_fields:
+            self.render_engine.restore_physics(snapshot.physics)
 
-    def set_state(self, new_state: Union[str, Tuple], params: Optional[Dict[str, Any]] = None) -> None:
+        logger.info(f"Context {snapshot.context_id} restored to: {snapshot.state}")
+
+    def set_state(self, new_state: Union[str, Tuple], params: Optional[Dict[str, Any]] = None, force: bool = False) -> None:
         """
         Transitions to a new state.
         
@@ -123,6 +228,7 @@ class BaseStateHandler:
             new_state (Union[str, Tuple]): The name of the target state (must verify against config.STATES),
                                            or a tuple where the first element is the state name.
             params (dict, optional): Parameters to pass to the state handler. Defaults to None.
+            force (bool, optional): Skip the transition graph rules (hooks still run). Defaults to False.
         """
         args = []
         if isinstance(new_state, tuple):
@@ -133,14 +239,51 @@ class BaseStateHandler:
             logger.warning(f"Attempted to set invalid state: {new_state}")
             return
 
+        current_state = self.state_machine.get_state()
+        graph = self.transition_graph
+        if graph is not None and not force and current_state != new_state:
+            resolved = graph.resolve(current_state, new_state, params)
+            if resolved is None:
+                logger.debug(f"Transition rejected: {current_state} -> {new_state}")
+                return
+            if resolved != new_state:
+                logger.info(f"Transition {current_state} -> {new_state} redirected to {resolved}")
+                new_state = resolved
+
+        previous_params = self.current_state_params
         # Update params regardless of state change (sometimes we re-set same state with new params)
         self.current_state_params = params
 
-        current_state = self.state_machine.get_state()
         if current_state != new_state:
+            if graph is not None:
+                graph.run_exit_hooks(current_state, previous_params)
             self.state_machine.set_state(new_state)
-            self.state_entry_time = pygame.time.get_ticks()
-            logger.info(f"State transition: {current_state} -> {new_state}, state_entry_time: {self.state_entry_time}")
+            self.state_entry_time = self.clock.ticks()
+            STATE_ENTERED.labels(new_state).inc()
+            if self._batch_start_state is None:
+                logger.info(f"State transition: {current_state} -> {new_state}, state_entry_time: {self.state_entry_time}")
+            if graph is not None:
+                graph.run_enter_hooks(new_state, params)
+            if self.event_bus is not None:
+                self.event_bus.publish(Topics.STATE_CHANGED, StateChanged(current_state, new_state, params))
+
+    def begin_batch(self) -> None:
+        """
+        Marks the start of a command batch. Transitions are logged once, by end_batch().
+        """
+        self._batch_start_state = self.state_machine.get_state()
+
+    def end_batch(self, size: int) -> None:
+        """
+        Marks the end of a command batch and logs its net transition.
+
+        Args:
+            size (int): Number of commands in the batch.
+        """
+        start_state, self._batch_start_state = self._batch_start_state, None
+        current_state = self.state_machine.get_state()
+        if start_state is not None and start_state != current_state:
+            logger.info(f"State transition: {start_state} -> {current_state} (batch of {size}), state_entry_time: {self.state_entry_time}")
 
 
 class StateHandler(BaseStateHandler):
@@ -76,6 +76,16 @@ class StateRegistry:
         """
         return cls._data.get(name)
 
+    @classmethod
+    def get_states(cls) -> List[str]:
+        """
+        Get the names of all registered states.
+
+        Returns:
+            List[str]: State names.
+        """
+        return list(cls._data)
+
     @classmethod
     def has_state(cls, name: str) -> bool:
         """
@@ -0,0 +1,128 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from bot_ekko.core.base import BaseService, ServiceStatus
+from bot_ekko.core.logger import get_logger
+from bot_ekko.sys_config import (
+    SUPERVISOR_BACKOFF_BASE, SUPERVISOR_BACKOFF_MAX, SUPERVISOR_INTERVAL, SUPERVISOR_STABLE_SECONDS
+)
+
+logger = get_logger("ServiceSupervisor")
+
+
+class RestartState:
+    """Restart bookkeeping for one supervised service."""
+    __slots__ = ("failures", "next_attempt", "last_failure", "restarts", "last_problem")
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.next_attempt = 0.0
+        self.last_failure = 0.0
+        self.restarts = 0
+        self.last_problem: Optional[str] = None
+
+
+class ServiceSupervisor(threading.Thread):
+    """
+    Restarts failed and hung services with exponential backoff.
+
+    Runs on its own thread: diagnosing is cheap, but a restart blocks while the new service
+    initializes (serial port, BLE adapter, audio stream), and the face must keep rendering meanwhile.
+    The manager provides enabled_services_by_key() and replace_service(key).
+    """
+    def __init__(self, manager, interval: float = SUPERVISOR_INTERVAL, backoff_base: float = SUPERVISOR_BACKOFF_BASE,
+                 backoff_max: float = SUPERVISOR_BACKOFF_MAX, stable_seconds: float = SUPERVISOR_STABLE_SECONDS) -> None:
+        """
+        Args:
+            manager (MainBotServicesManager): Owner of the services.
+            interval (float, optional): Seconds between health checks.
+            backoff_base (float, optional): Delay before the second restart attempt; doubles with each failure.
+            backoff_max (float, optional): Longest delay between attempts.
+            stable_seconds (float, optional): Healthy time after which the backoff starts over.
+        """
+        super().__init__(daemon=True, name="service_supervisor")
+        self.manager = manager
+        self.interval = interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stable_seconds = stable_seconds
+        self.states: Dict[str, RestartState] = {}
+        self._stop_event = threading.Event()
+
+    @staticmethod
+    def diagnose(service: BaseService, now: float) -> Optional[str]:
+        """
+        Args:
+            service (BaseService): An enabled service.
+            now (float): time.monotonic() seconds.
+
+        Returns:
+            Optional[str]: Why the service needs a restart, or None if it's healthy (or deliberately stopped).
+        """
+        status = service.status
+        if status == ServiceStatus.ERROR:
+            error = service.stats.get("last_error") or service.stats.get("init_error")
+            return f"error: {error}" if error else "error"
+        if status != ServiceStatus.RUNNING:
+            return None
+        is_alive = getattr(service, "is_alive", None)
+        if is_alive is not None and not is_alive():
+            return "thread exited"
+        if service.heartbeat_timeout is not None and now - service.last_heartbeat > service.heartbeat_timeout:
+            return f"no heartbeat for {now - service.last_heartbeat:.1f}s"
+        return None
+
+    def backoff(self, failures: int) -> float:
+        """Seconds to wait after the given number of consecutive failed restarts."""
+        return min(self.backoff_base * 2 ** max(failures - 1, 0), self.backoff_max)
+
+    def check(self, now: Optional[float] = None) -> int:
+        """
+        Diagnoses every enabled service and restarts the failed ones whose backoff elapsed.
+
+        Args:
+            now (float, optional): time.monotonic() seconds. Defaults to now.
+
+        Returns:
+            int: Number of services restarted.
+        """
+        now = time.monotonic() if now is None else now
+        restarted = 0
+        for key, service in self.manager.enabled_services_by_key().items():
+            state = self.states.setdefault(key, RestartState())
+            problem = self.diagnose(service, now)
+            if problem is None:
+                if state.failures and now - state.last_failure >= self.stable_seconds:
+                    logger.info(f"Service {service.name} is stable again")
+                    state.failures = 0
+                continue
+            if now < state.next_attempt:
+                continue
+
+            state.failures += 1
+            state.restarts += 1
+            state.last_failure = now
+            state.last_problem = problem
+            state.next_attempt = now + self.backoff(state.failures)
+            logger.warning(f"Restarting service {service.name} ({problem}), attempt {state.failures}; "
+                           f"next attempt no sooner than {self.backoff(state.failures):.0f}s")
+            try:
+                self.manager.replace_service(key)
+            except Exception as e:
+                logger.error(f"Restart of {service.name} failed: {e}")
+            restarted += 1
+        return restarted
+
+    def run(self) -> None:
+        """Background loop checking the services every interval seconds."""
+        logger.info("Service supervisor started")
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"Supervisor check failed: {e}")
+
+    def stop(self) -> None:
+        """Signal the supervisor to stop."""
+        self._stop_event.set()
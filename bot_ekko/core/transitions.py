@@ -0,0 +1,219 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bot_ekko.core.logger import get_logger
+from bot_ekko.core.models import TransitionGraphConfig, TransitionRuleConfig
+from bot_ekko.core.state_registry import StateRegistry
+
+logger = get_logger("TransitionGraph")
+
+TRANSITION_ACTIONS = ("allow", "deny", "redirect")
+
+# guard(from_state, to_state, params) -> bool
+TransitionGuard = Callable[[str, str, Optional[Dict[str, Any]]], bool]
+# hook(state, params) -> None
+TransitionHook = Callable[[str, Optional[Dict[str, Any]]], None]
+
+
+def _from_scheduler(from_state: str, to_state: str, params: Optional[Dict[str, Any]]) -> bool:
+    return bool(params) and params.get("_source") == "scheduler"
+
+
+def _not_from_scheduler(from_state: str, to_state: str, params: Optional[Dict[str, Any]]) -> bool:
+    return not _from_scheduler(from_state, to_state, params)
+
+
+# Guards available to every graph; more can be added with TransitionGraph.register_guard()
+DEFAULT_GUARDS: Dict[str, TransitionGuard] = {
+    "from_scheduler": _from_scheduler,
+    "not_from_scheduler": _not_from_scheduler,
+}
+
+
+class CompiledTransition:
+    """One cell of the transition table: what happens when going from one state to another."""
+    __slots__ = ("action", "target", "guard", "guard_name")
+
+    def __init__(self, action: str, target: Optional[str], guard: Optional[TransitionGuard], guard_name: Optional[str]):
+        self.action = action
+        self.target = target
+        self.guard = guard
+        self.guard_name = guard_name
+
+
+class TransitionGraph:
+    """
+    Declarative state transition rules compiled into a (from, to) lookup table.
+
+    Rules from config are expanded once in compile(); resolve() is then two dict lookups
+    plus the guards of the rules in that cell, so StateHandler can check every transition cheaply.
+    A cell holds every rule matching its (from, to) pair, latest first, so when a guard fails
+    the earlier rules still apply before the default does.
+    """
+    def __init__(self, config: Optional[TransitionGraphConfig] = None) -> None:
+        """
+        Initialize the graph. Call compile() after all states are registered.
+
+        Args:
+            config (TransitionGraphConfig, optional): Rules and hooks. Defaults to allowing everything.
+        """
+        self.config = config or TransitionGraphConfig()
+        self.guards: Dict[str, TransitionGuard] = dict(DEFAULT_GUARDS)
+        self.hooks: Dict[str, TransitionHook] = {}
+
+        # from -> to -> matching rules, latest first
+        self._table: Dict[str, Dict[str, Tuple[CompiledTransition, ...]]] = {}
+        self._on_enter: Dict[str, List[TransitionHook]] = {}
+        self._on_exit: Dict[str, List[TransitionHook]] = {}
+        self._default = CompiledTransition(self.config.default_action, None, None, None)
+
+    def register_guard(self, name: str, guard: TransitionGuard) -> None:
+        """
+        Makes a guard available to rules. Call compile() again afterwards.
+
+        Args:
+            name (str): Name referenced by rules.
+            guard (Callable): guard(from_state, to_state, params) -> bool.
+        """
+        self.guards[name] = guard
+
+    def register_hook(self, name: str, hook: TransitionHook) -> None:
+        """
+        Makes an on-enter/on-exit hook available to config. Call compile() again afterwards.
+
+        Args:
+            name (str): Name referenced in on_enter / on_exit.
+            hook (Callable): hook(state, params) -> None.
+        """
+        self.hooks[name] = hook
+
+    def compile(self) -> "TransitionGraph":
+        """
+        Expands wildcards and resolves guard/hook names into the lookup tables.
+
+        Returns:
+            TransitionGraph: self, for chaining.
+
+        Raises:
+            ValueError: On unknown actions, states, guards or hooks.
+        """
+        if self.config.default_action not in ("allow", "deny"):
+            raise ValueError(f"Default transition action must be allow or deny: {self.config.default_action}")
+
+        states = StateRegistry.get_states()
+        table: Dict[str, Dict[str, Tuple[CompiledTransition, ...]]] = {}
+        for rule in self.config.rules:
+            compiled = self._compile_rule(rule)
+            for from_state in self._expand(rule.from_states, states):
+                row = table.setdefault(from_state, {})
+                for to_state in self._expand(rule.to_states, states):
+                    if from_state != to_state:
+                        # An unguarded rule always applies, so the earlier ones for this pair can never be reached
+                        row[to_state] = (compiled,) + row.get(to_state, ()) if compiled.guard else (compiled,)
+
+        self._table = table
+        self._on_enter = self._compile_hooks(self.config.on_enter)
+        self._on_exit = self._compile_hooks(self.config.on_exit)
+        self._default = CompiledTransition(self.config.default_action, None, None, None)
+        logger.info(f"Compiled transition graph: {sum(len(row) for row in table.values())} rules over {len(states)} states")
+        return self
+
+    def _compile_rule(self, rule: TransitionRuleConfig) -> CompiledTransition:
+        if rule.action not in TRANSITION_ACTIONS:
+            raise ValueError(f"Unknown transition action: {rule.action}")
+        if rule.action == "redirect" and not StateRegistry.has_state(rule.redirect_to or ""):
+            raise ValueError(f"Redirect target is not a registered state: {rule.redirect_to}")
+        guard = None
+        if rule.guard:
+            if rule.guard not in self.guards:
+                raise ValueError(f"Unknown transition guard: {rule.guard}")
+            guard = self.guards[rule.guard]
+        return CompiledTransition(rule.action, rule.redirect_to, guard, rule.guard)
+
+    def _compile_hooks(self, mapping: Dict[str, List[str]]) -> Dict[str, List[TransitionHook]]:
+        compiled = {}
+        for state, names in mapping.items():
+            missing = [name for name in names if name not in self.hooks]
+            if missing:
+                raise ValueError(f"Unknown transition hooks for {state}: {missing}")
+            compiled[state] = [self.hooks[name] for name in names]
+        return compiled
+
+    @staticmethod
+    def _expand(names: List[str], states: List[str]) -> List[str]:
+        if "*" in names:
+            return states
+        unknown = [name for name in names if not StateRegistry.has_state(name)]
+        if unknown:
+            raise ValueError(f"Unknown states in transition rule: {unknown}")
+        return names
+
+    def resolve(self, from_state: str, to_state: str, params: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Decides where a requested transition actually goes.
+
+        Args:
+            from_state (str): Current state.
+            to_state (str): Requested state.
+            params (dict, optional): Params of the requested state (passed to guards).
+
+        Returns:
+            Optional[str]: The state to enter (to_state or a redirect target), or None if rejected.
+        """
+        if from_state == to_state:
+            return to_state
+        for transition in self._table.get(from_state, {}).get(to_state, ()):
+            if transition.guard is None or transition.guard(from_state, to_state, params):
+                break
+        else:
+            transition = self._default
+
+        if transition.action == "allow":
+            return to_state
+        if transition.action == "redirect":
+            return transition.target
+        return None
+
+    def can_transition(self, from_state: str, to_state: str, params: Optional[Dict[str, Any]] = None) -> bool:
+        """Returns True if the transition is allowed as requested (not rejected or redirected)."""
+        return self.resolve(from_state, to_state, params) == to_state
+
+    def run_exit_hooks(self, state: str, params: Optional[Dict[str, Any]]) -> None:
+        for hook in self._on_exit.get(state, ()):
+            hook(state, params)
+
+    def run_enter_hooks(self, state: str, params: Optional[Dict[str, Any]]) -> None:
+        for hook in self._on_enter.get(state, ()):
+            hook(state, params)
+
+    def edges(self) -> List[Tuple[str, str, str, Optional[str], Optional[str]]]:
+        """
+        Lists the compiled rules for tooling.
+
+        Returns:
+            List[Tuple]: (from_state, to_state, action, redirect target, guard name) per explicit rule,
+                         latest first within a pair. Pairs not listed use the default action.
+        """
+        return [
+            (from_state, to_state, rule.action, rule.target, rule.guard_name)
+            for from_state, row in self._table.items()
+            for to_state, rules in row.items()
+            for rule in rules
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializable view of the compiled graph (e.g. for visualisation).
+
+        Returns:
+            Dict[str, Any]: {"states", "default_action", "edges", "on_enter", "on_exit"}.
+        """
+        return {
+            "states": StateRegistry.get_states(),
+            "default_action": self.config.default_action,
+            "edges": [
+                {"from": f, "to": t, "action": action, "redirect_to": target, "guard": guard}
+                for f, t, action, target, guard in self.edges()
+            ],
+            "on_enter": dict(self.config.on_enter),
+            "on_exit": dict(self.config.on_exit),
+        }
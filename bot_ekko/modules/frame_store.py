@@ -0,0 +1,183 @@
+from typing import Iterable, List, Tuple
+
+import numpy as np
+import pygame
+
+from bot_ekko.core.logger import get_logger
+
+logger = get_logger("FrameStore")
+
+# Changed pixels are grouped into tiles of this size before being merged into rects
+DELTA_TILE_SIZE = 16
+
+
+def _changed_rects(prev: np.ndarray, curr: np.ndarray, tile: int = DELTA_TILE_SIZE) -> List[pygame.Rect]:
+    """
+    Finds the regions that differ between two RGBA frames.
+
+    Args:
+        prev (np.ndarray): Previous frame, shape (h, w, 4).
+        curr (np.ndarray): Current frame, shape (h, w, 4).
+        tile (int, optional): Tile size used to group changes.
+
+    Returns:
+        List[pygame.Rect]: Non-overlapping rects covering every changed pixel.
+    """
+    changed = np.any(prev != curr, axis=2)
+    if not changed.any():
+        return []
+
+    h, w = changed.shape
+    rows, cols = -(-h // tile), -(-w // tile)
+    padded = np.zeros((rows * tile, cols * tile), dtype=bool)
+    padded[:h, :w] = changed
+    tiles = padded.reshape(rows, tile, cols, tile).any(axis=(1, 3))
+
+    # Horizontal runs of changed tiles per tile row: (start col, end col) -> rect
+    rects: List[pygame.Rect] = []
+    open_runs = {}
+    for ty in range(rows):
+        row = tiles[ty]
+        runs = []
+        tx = 0
+        while tx < cols:
+            if row[tx]:
+                start = tx
+                while tx < cols and row[tx]:
+                    tx += 1
+                runs.append((start, tx))
+            else:
+                tx += 1
+
+        next_open = {}
+        for run in runs:
+            rect = open_runs.pop(run, None)
+            if rect is not None:
+                # Same span as the row above: grow that rect downwards
+                rect.height += tile
+            else:
+                rect = pygame.Rect(run[0] * tile, ty * tile, (run[1] - run[0]) * tile, tile)
+                rects.append(rect)
+            next_open[run] = rect
+        open_runs = next_open
+
+    bounds = pygame.Rect(0, 0, w, h)
+    return [rect.clip(bounds) for rect in rects]
+
+
+class DeltaFrameStore:
+    """
+    Animation frames stored as a keyframe plus per-frame changed rects.
+
+    deltas[i] turns frame i-1 into frame i; deltas[0] wraps from the last frame back to the first,
+    so looping playback only ever patches the changed regions onto one persistent surface.
+    """
+    def __init__(self, keyframe: pygame.Surface, deltas: List[List[Tuple[pygame.Rect, pygame.Surface]]]) -> None:
+        """
+        Initialize the store. Use DeltaFrameStore.from_arrays() to build one from decoded frames.
+
+        Args:
+            keyframe (pygame.Surface): The first frame.
+            deltas (List[List[Tuple[pygame.Rect, pygame.Surface]]]): Per-frame (rect, patch) pairs.
+        """
+        self.keyframe = keyframe
+        self.deltas = deltas
+        self.surface = pygame.Surface(keyframe.get_size(), pygame.SRCALPHA)
+        self.index = 0
+        self.reset()
+
+    @classmethod
+    def from_arrays(cls, frames: Iterable[np.ndarray]) -> "DeltaFrameStore":
+        """
+        Builds a store from RGBA frame arrays, keeping only one previous frame in memory.
+
+        Args:
+            frames (Iterable[np.ndarray]): RGBA arrays of shape (h, w, 4).
+
+        Returns:
+            DeltaFrameStore: The delta-encoded animation.
+        """
+        first = None
+        prev = None
+        deltas: List[List[Tuple[pygame.Rect, pygame.Surface]]] = [[]]
+        for curr in frames:
+            if first is None:
+                first = curr
+            else:
+                deltas.append(cls._patches(prev, curr))
+            prev = curr
+
+        if first is None:
+            raise ValueError("Cannot build a DeltaFrameStore without frames")
+
+        # Wrap-around delta so looping back to frame 0 is a patch, not a full redraw
+        deltas[0] = cls._patches(prev, first) if len(deltas) > 1 else []
+        keyframe = cls._to_surface(first)
+        return cls(keyframe, deltas)
+
+    @staticmethod
+    def _to_surface(pixels: np.ndarray) -> pygame.Surface:
+        h, w = pixels.shape[:2]
+        return pygame.image.fromstring(np.ascontiguousarray(pixels).tobytes(), (w, h), "RGBA")
+
+    @classmethod
+    def _patches(cls, prev: np.ndarray, curr: np.ndarray) -> List[Tuple[pygame.Rect, pygame.Surface]]:
+        return [
+            (rect, cls._to_surface(curr[rect.top:rect.bottom, rect.left:rect.right]))
+            for rect in _changed_rects(prev, curr)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.deltas)
+
+    @property
+    def nbytes(self) -> int:
+        """int: Approximate pixel memory used by the keyframe, persistent surface and patches."""
+        w, h = self.keyframe.get_size()
+        total = 2 * w * h * 4
+        for patches in self.deltas:
+            total += sum(rect.width * rect.height * 4 for rect, _ in patches)
+        return total
+
+    def reset(self) -> pygame.Rect:
+        """
+        Restores the persistent surface to the keyframe.
+
+        Returns:
+            pygame.Rect: The full frame rect (everything changed).
+        """
+        self.surface.fill((0, 0, 0, 0))
+        self.surface.blit(self.keyframe, (0, 0))
+        self.index = 0
+        return self.surface.get_rect()
+
+    def seek(self, index: int) -> List[pygame.Rect]:
+        """
+        Moves the persistent surface to the given frame.
+
+        Args:
+            index (int): Target frame index.
+
+        Returns:
+            List[pygame.Rect]: Regions of the surface that changed, in frame coordinates.
+        """
+        count = len(self.deltas)
+        index %= count
+        steps = (index - self.index) % count
+        if steps == 0:
+            return []
+
+        # Walking forward further than keyframe + `index` patches (e.g. a restart) costs more than resetting
+        dirty: List[pygame.Rect] = []
+        if steps > index + 1:
+            dirty.append(self.reset())
+            steps = index
+
+        for _ in range(steps):
+            self.index = (self.index + 1) % count
+            for rect, patch in self.deltas[self.index]:
+                # Clear first: blitting onto transparent pixels copies RGBA exactly instead of blending
+                self.surface.fill((0, 0, 0, 0), rect)
+                self.surface.blit(patch, rect.topleft)
+                dirty.append(rect)
+        return dirty
@@ -1,36 +1,103 @@
+import os
 import threading
 import time
-from typing import Optional, TYPE_CHECKING, List, Tuple, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, TYPE_CHECKING, List, Tuple, Dict, Any, Union
 
+import numpy as np
 import pygame
 from PIL import Image, ImageSequence
 
 from bot_ekko.core.logger import get_logger
-from bot_ekko.sys_config import LOGICAL_W, MAIN_FONT, CANVAS_DURATION, CYAN
+from bot_ekko.core.clock import Clock, RealClock
+from bot_ekko.sys_config import LOGICAL_W, MAIN_FONT, CANVAS_DURATION, CYAN, ASSETS_DIR, DEFAULT_GIF_PATH, MEDIA_FRAME_STORAGE
 from bot_ekko.core.models import CommandNames
+from bot_ekko.modules.sprite_sheet import find_sprite_sheet, load_sprite_sheet
+from bot_ekko.modules.frame_store import DeltaFrameStore
+from bot_ekko.modules.media_playlist import MediaPlaylist, PlaylistItem
+from bot_ekko.modules.text_effects import TextEffect, TextStrip
 
 if TYPE_CHECKING:
-    from bot_ekko.core.interrupt_manager import InterruptManager
+    from bot_ekko.core.interrupts import InterruptHandler
     from bot_ekko.core.command_center import CommandCenter
 
 logger = get_logger("MediaModule")
 
+# Rendered text surfaces kept around (CLOCK alone produces a new string every minute)
+TEXT_CACHE_SIZE = 32
+# Decoded static images kept around; each is a full surface, so far fewer than text strips
+IMAGE_CACHE_SIZE = 8
+
+# Upper bound on how long switching waits for a background-prepared playlist item (seconds)
+PLAYLIST_PREPARE_TIMEOUT = 5.0
+
+# Full frame surfaces (sprite sheets, "full" storage) or a delta-encoded store
+GifFrames = Union[List[pygame.Surface], DeltaFrameStore]
+
+
+def resolve_media_path(path: str) -> str:
+    """Resolves a media path relative to the assets directory."""
+    if os.path.isabs(path):
+        return path
+    return os.path.join(ASSETS_DIR, path)
+
+
+def resolve_canvas_media(params: Optional[Dict[str, Any]]) -> Tuple[str, Any]:
+    """
+    Works out what a CANVAS state should show from its params.
+
+    Understands the schedule format ({"show": "text"|"gif"|"image", "value": ...}),
+    playlists ({"show": "playlist", "items": [...]}) as well as the older
+    {"param": {"text": ...}} and {"media_path": ...} forms.
+
+    Args:
+        params (dict, optional): CANVAS state params.
+
+    Returns:
+        Tuple[str, Any]: (media kind, text / resolved path / list of PlaylistItem).
+                         Falls back to the default GIF.
+    """
+    if not params:
+        return "gif", DEFAULT_GIF_PATH
+
+    show = params.get("show")
+    value = params.get("value")
+    if show == "playlist" and params.get("items"):
+        return "playlist", [PlaylistItem.from_dict(item) for item in params["items"]]
+    if show == "text" and value:
+        return "text", str(value)
+    if show in ("gif", "image") and value:
+        return show, resolve_media_path(str(value))
+
+    legacy = params.get("param")
+    if isinstance(legacy, dict) and legacy.get("text"):
+        return "text", legacy["text"]
+
+    return "gif", resolve_media_path(params.get("media_path", DEFAULT_GIF_PATH))
+
+
 class MediaModule(threading.Thread):
     """
     Handles playback of visual media (GIFs, Images, Text) on the robot's face.
     Runs in a background thread to manage timing.
     """
-    def __init__(self, interrupt_manager: 'InterruptManager', command_center: 'CommandCenter') -> None:
+    def __init__(self, interrupt_manager: 'InterruptHandler', command_center: 'CommandCenter', frame_storage: str = MEDIA_FRAME_STORAGE,
+                 clock: Optional[Clock] = None) -> None:
         """
         Initialize the Media Module.
 
         Args:
-            interrupt_manager (InterruptManager): Manager for handling state interrupts.
+            interrupt_manager (InterruptHandler): Handler for clearing state interrupts.
             command_center (CommandCenter): For restoring state after media.
+            frame_storage (str, optional): "full" keeps every GIF frame as a surface,
+                                           "delta" keeps a keyframe plus changed rects. Defaults to MEDIA_FRAME_STORAGE.
+            clock (Clock, optional): Time source for durations and frame timing. Defaults to the interrupt handler's clock.
         """
         super().__init__(daemon=True)
         self.interrupt_manager = interrupt_manager
         self.command_center = command_center
+        handler_clock = getattr(interrupt_manager, "clock", None)
+        self.clock: Clock = clock or (handler_clock if isinstance(handler_clock, Clock) else RealClock())
         self.current_media_type: Optional[str] = None
         self.media_end_time: float = 0
         self.current_interrupt_name: Optional[str] = None
@@ -43,20 +110,43 @@ class MediaModule(threading.Thread):
         self.lock = threading.Lock()
         
         # GIF specific
-        self.gif_frames: List[pygame.Surface] = []
+        self.frame_storage = frame_storage
+        self.gif_frames: GifFrames = []
         self.gif_delays: List[float] = []
         self.current_frame_index = 0
         self.last_frame_time: float = 0
         
         # Image specific
         self.current_image: Optional[pygame.Surface] = None
+        self.image_cache: Dict[str, pygame.Surface] = {}
         
         # Text specific
         self.current_text = ""
         self.text_surface: Optional[pygame.Surface] = None
+        self.text_effect: Optional[TextEffect] = None
+        self._text_effect_start: float = 0
         
         # Cache: path -> (frames, delays)
-        self.gif_cache: Dict[str, Tuple[List[pygame.Surface], List[float]]] = {}
+        self.gif_cache: Dict[str, Tuple[GifFrames, List[float]]] = {}
+        # Cache: (text, font id, color, max width) -> rendered strip; max width 0 is a single line
+        self.text_cache: Dict[Tuple[str, int, Tuple[int, int, int], int], TextStrip] = {}
+
+        # Dirty rects (destination coordinates) produced by update() since the last consume
+        self.dirty_rects: List[pygame.Rect] = []
+        self._drawn_this_frame = False
+        self._full_redraw = True
+        self._last_drawn_frame_index = -1
+
+        # Playlist: queued items and the next item being prepared in the background
+        self.playlist = MediaPlaylist()
+        self.playlist_interrupt_name: Optional[str] = None
+        self._prepare_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="media_prepare")
+        self._prepared: Optional[Tuple[PlaylistItem, Future]] = None
+
+        # Fade transition: copy of the outgoing frame, start time and length (seconds)
+        self._fade_from: Optional[pygame.Surface] = None
+        self._fade_start: float = 0
+        self._fade_duration: float = 0
 
     def _start_media(self, duration: Optional[float] = None, save_context: bool = True, interrupt_name: Optional[str] = None) -> None:
         """
@@ -71,44 +161,77 @@ class MediaModule(threading.Thread):
             
         self.current_interrupt_name = interrupt_name
         self.is_playing = True
+        self._full_redraw = True
         
         if duration:
-            self.media_end_time = time.time() + duration
+            self.media_end_time = self.clock.time() + duration
         else:
             self.media_end_time = 0 # Indefinite or controlled by logic (like GIF loop)
 
+    def _load_gif_frames(self, path: str) -> Tuple[GifFrames, List[float]]:
+        """
+        Decodes a GIF into frames and delays, preferring a sprite sheet if one exists.
+
+        Args:
+            path (str): Path to a GIF file or a sprite sheet manifest.
+
+        Returns:
+            Tuple[GifFrames, List[float]]: Frames (or a DeltaFrameStore) and per-frame delays in seconds.
+        """
+        frames: List[pygame.Surface] = []
+        delays: List[float] = []
+
+        # Sprite sheets decode with a single image load instead of per-frame LZW
+        manifest_path = find_sprite_sheet(path)
+        if manifest_path:
+            sheet = load_sprite_sheet(manifest_path)
+            return sheet.frames(), sheet.delays
+
+        pil_image = Image.open(path)
+
+        if self.frame_storage == "delta":
+            store = DeltaFrameStore.from_arrays(self._iter_gif_arrays(pil_image, delays))
+            logger.debug(f"Delta-encoded {path}: {store.nbytes // 1024} KB for {len(store)} frames")
+            return store, delays
+
+        # Extract frames and duration
+        for frame in ImageSequence.Iterator(pil_image):
+            # Convert to RGBA and then to pygame surface
+            frame_rgba = frame.convert("RGBA")
+            mode = frame_rgba.mode
+            size = frame_rgba.size
+            data = frame_rgba.tobytes()
+
+            py_image = pygame.image.fromstring(data, size, mode)
+            frames.append(py_image)
+            delays.append(frame.info.get('duration', 100) / 1000.0) # Convert ms to seconds
+
+        return frames, delays
+
+    @staticmethod
+    def _iter_gif_arrays(pil_image: Image.Image, delays: List[float]):
+        """Yields RGBA frame arrays one at a time, appending each frame's delay to `delays`."""
+        for frame in ImageSequence.Iterator(pil_image):
+            delays.append(frame.info.get('duration', 100) / 1000.0) # Convert ms to seconds
+            yield np.asarray(frame.convert("RGBA"))
+
     def play_gif(self, path: str, duration: Optional[float] = None, save_context: bool = True, interrupt_name: Optional[str] = None) -> None:
         """
-        Plays a GIF.
+        Plays a GIF. If a sprite sheet manifest (see sprite_sheet.py) exists next to the GIF,
+        or `path` is a manifest itself, the sprite sheet is used instead.
         
         Args:
-            path (str): Path to GIF file.
+            path (str): Path to GIF file or sprite sheet manifest.
             duration (float, optional): Duration to play.
             save_context (bool, optional): Whether to save state.
             interrupt_name (str, optional): Interrupt name.
         """
         try:
-            frames: List[pygame.Surface] = []
-            delays: List[float] = []
-            
             # Check cache
             if path in self.gif_cache:
                 frames, delays = self.gif_cache[path]
             else:
-                pil_image = Image.open(path)
-                
-                # Extract frames and duration
-                for frame in ImageSequence.Iterator(pil_image):
-                    # Convert to RGBA and then to pygame surface
-                    frame_rgba = frame.convert("RGBA")
-                    mode = frame_rgba.mode
-                    size = frame_rgba.size
-                    data = frame_rgba.tobytes()
-                    
-                    py_image = pygame.image.fromstring(data, size, mode)
-                    frames.append(py_image)
-                    delays.append(frame.info.get('duration', 100) / 1000.0) # Convert ms to seconds
-                
+                frames, delays = self._load_gif_frames(path)
                 if frames:
                     self.gif_cache[path] = (frames, delays)
 
@@ -117,10 +240,12 @@ class MediaModule(threading.Thread):
                 return
 
             with self.lock:
+                if isinstance(frames, DeltaFrameStore):
+                    frames.reset()
                 self.gif_frames = frames
                 self.gif_delays = delays
                 self.current_frame_index = 0
-                self.last_frame_time = time.time()
+                self.last_frame_time = self.clock.time()
                 self.current_media_type = "GIF"
             
             self._start_media(duration, save_context, interrupt_name)
@@ -129,6 +254,112 @@ class MediaModule(threading.Thread):
         except Exception as e:
             logger.error(f"Failed to load GIF {path}: {e}")
 
+    def preload_gif(self, path: str) -> bool:
+        """
+        Decodes a GIF into the cache without playing it.
+        Safe to call from a background thread.
+
+        Args:
+            path (str): Path to GIF file or sprite sheet manifest.
+
+        Returns:
+            bool: True if the GIF is cached after the call.
+        """
+        if path in self.gif_cache:
+            return True
+        try:
+            frames, delays = self._load_gif_frames(path)
+        except Exception as e:
+            logger.warning(f"Failed to preload GIF {path}: {e}")
+            return False
+        if not frames:
+            return False
+        self.gif_cache[path] = (frames, delays)
+        logger.info(f"Preloaded GIF: {path} ({len(frames)} frames)")
+        return True
+
+    def preload_text(self, text: str, font: Optional[pygame.font.Font] = None, effect: str = "static") -> pygame.Surface:
+        """
+        Renders text into the cache without showing it.
+
+        Args:
+            text (str): The text to render.
+            font (pygame.font.Font, optional): Font to use. Defaults to MAIN_FONT.
+            effect (str, optional): Text effect it will be shown with (picks the layout).
+
+        Returns:
+            pygame.Surface: The cached surface.
+        """
+        return self.get_text_strip(text.capitalize(), font, single_line=effect == "marquee_h").surface
+
+    def preload_image(self, path: str) -> bool:
+        """
+        Loads a static image into the cache without showing it.
+
+        Args:
+            path (str): Path to image.
+
+        Returns:
+            bool: True if the image is cached after the call.
+        """
+        if path in self.image_cache:
+            return True
+        try:
+            image = pygame.image.load(path)
+        except Exception as e:
+            logger.warning(f"Failed to preload Image {path}: {e}")
+            return False
+        if len(self.image_cache) >= IMAGE_CACHE_SIZE:
+            self.image_cache.pop(next(iter(self.image_cache)))
+        self.image_cache[path] = image
+        return True
+
+    def is_cached(self, kind: str, value: str, effect: str = "static") -> bool:
+        """
+        Whether a media item is in the caches right now (they are bounded, so an item can drop out again).
+
+        Args:
+            kind (str): "gif", "image" or "text".
+            value (str): Path or text.
+            effect (str, optional): Text effect it will be shown with (picks the layout).
+
+        Returns:
+            bool: True if showing the item needs no decoding or rendering.
+        """
+        if kind == "text":
+            return self._text_key(value.capitalize(), None, effect == "marquee_h") in self.text_cache
+        if kind == "image":
+            return value in self.image_cache
+        return value in self.gif_cache
+
+    def _text_key(self, text: str, font: Optional[pygame.font.Font], single_line: bool) -> Tuple[str, int, Tuple[int, int, int], int]:
+        font = font if font else MAIN_FONT
+        # LOGICAL_W is 800, let's use 760 for padding
+        max_width = 0 if single_line else LOGICAL_W - 40
+        return text, id(font), CYAN, max_width
+
+    def get_text_strip(self, text: str, font: Optional[pygame.font.Font] = None, single_line: bool = False) -> TextStrip:
+        """
+        Returns the rasterized text strip, rendering it only on a cache miss.
+
+        Args:
+            text (str): The text to render.
+            font (pygame.font.Font, optional): Font to use. Defaults to MAIN_FONT.
+            single_line (bool, optional): Render one unwrapped line (horizontal marquee).
+
+        Returns:
+            TextStrip: The cached strip.
+        """
+        key = self._text_key(text, font, single_line)
+        strip = self.text_cache.get(key)
+        if strip is None:
+            strip = TextStrip.render(text, font if font else MAIN_FONT, CYAN, key[3] or None)
+            if len(self.text_cache) >= TEXT_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest entry
+                self.text_cache.pop(next(iter(self.text_cache)))
+            self.text_cache[key] = strip
+        return strip
+
     def show_image(self, path: str, duration: float = 5.0, save_context: bool = True, interrupt_name: Optional[str] = None) -> None:
         """
         Shows a static image.
@@ -138,7 +369,7 @@ class MediaModule(threading.Thread):
             duration (float, optional): Duration to show. Defaults to 5.0.
         """
         try:
-            image = pygame.image.load(path)
+            image = self.image_cache.get(path) or pygame.image.load(path)
             with self.lock:
                 self.current_image = image
                 self.current_media_type = "IMAGE"
@@ -149,51 +380,10 @@ class MediaModule(threading.Thread):
 
     def _render_wrapped_text(self, text: str, font: pygame.font.Font, color: Tuple[int, int, int], max_width: int) -> pygame.Surface:
         """Helper to render text wrapped to a max width."""
-        words = text.split(' ')
-        lines = []
-        current_line: List[str] = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            w, h = font.size(test_line)
-            if w < max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    # Word itself is too long, just add it (or could split char by char)
-                    lines.append(word)
-                    current_line = []
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-            
-        # Render lines
-        rendered_lines = [font.render(line, True, color) for line in lines]
-        
-        # specific case for empty text
-        if not rendered_lines:
-             return font.render("", True, color)
+        return TextStrip.render(text, font, color, max_width).surface
 
-        total_height = sum(line.get_height() for line in rendered_lines)
-        max_line_width = max(line.get_width() for line in rendered_lines)
-        
-        # Create surface
-        # We use transparent background
-        surface = pygame.Surface((max_line_width, total_height), pygame.SRCALPHA)
-        
-        y = 0
-        for line_surf in rendered_lines:
-            # Center align
-            x = (max_line_width - line_surf.get_width()) // 2
-            surface.blit(line_surf, (x, y))
-            y += line_surf.get_height()
-            
-        return surface
-
-    def show_text(self, text: str, duration: float = CANVAS_DURATION, save_context: bool = True, interrupt_name: Optional[str] = None, font: Optional[pygame.font.Font] = None) -> None:
+    def show_text(self, text: str, duration: float = CANVAS_DURATION, save_context: bool = True, interrupt_name: Optional[str] = None,
+                  font: Optional[pygame.font.Font] = None, effect: str = "static", speed: Optional[float] = None) -> None:
         """
         Displays wrapped text.
         
@@ -203,31 +393,140 @@ class MediaModule(threading.Thread):
             save_context (bool, optional): Whether to save previous state.
             interrupt_name (str, optional): Interrupt name.
             font (pygame.font.Font, optional): Font to use. Defaults to MAIN_FONT.
+            effect (str, optional): "static", "typewriter", "marquee_v" or "marquee_h".
+            speed (float, optional): Characters (typewriter) or pixels (marquee) per second.
         """
-        # LOGICAL_W is 800, let's use 760 for padding
         text = text.capitalize()
-        max_width = LOGICAL_W - 40 
-        
-        use_font = font if font else MAIN_FONT
-        surf = self._render_wrapped_text(text, use_font, CYAN, max_width)
+        strip = self.get_text_strip(text, font, single_line=effect == "marquee_h")
+        text_effect = TextEffect(strip, effect, speed) if effect != "static" else None
         
         with self.lock:
             self.current_text = text
-            self.text_surface = surf
+            self.text_surface = strip.surface
+            self.text_effect = text_effect
+            self._text_effect_start = self.clock.time()
             self.current_media_type = "TEXT"
         self._start_media(duration, save_context, interrupt_name)
         logger.info(f"Showing Text for {duration}s")
 
+    def play_playlist(self, items: List[Any], interrupt_name: Optional[str] = None) -> None:
+        """
+        Replaces the playlist and starts its first item.
+        Each following item is prepared in the background while the current one plays.
+
+        Args:
+            items (List[PlaylistItem | dict]): Items, or dicts in the CANVAS params format.
+            interrupt_name (str, optional): Interrupt to clear when the playlist finishes.
+        """
+        items = [item if isinstance(item, PlaylistItem) else PlaylistItem.from_dict(item) for item in items]
+        self.playlist.clear()
+        self._prepared = None
+        self.playlist.extend(items)
+        self.playlist_interrupt_name = interrupt_name
+        logger.info(f"Playing playlist with {len(items)} items")
+        self.advance_playlist()
+
+    def enqueue(self, item: Any) -> None:
+        """
+        Appends an item to the playlist, starting playback if nothing is playing.
+
+        Args:
+            item (PlaylistItem | dict): The item to queue.
+        """
+        if not isinstance(item, PlaylistItem):
+            item = PlaylistItem.from_dict(item)
+        if not self.is_playing:
+            self.play_playlist([item], interrupt_name=self.playlist_interrupt_name)
+            return
+        self.playlist.append(item)
+        logger.info(f"Enqueued {item.kind} ({len(self.playlist)} queued)")
+        self._prepare_next()
+
+    def advance_playlist(self) -> bool:
+        """
+        Switches to the next playlist item.
+
+        Returns:
+            bool: False if the playlist is empty.
+        """
+        item = self.playlist.pop()
+        if item is None:
+            return False
+
+        prepared, self._prepared = self._prepared, None
+        if prepared and prepared[0] is item:
+            try:
+                # Normally finished long ago; the wait only matters for very short items
+                prepared[1].result(timeout=PLAYLIST_PREPARE_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"Preparing playlist item failed, loading inline: {e}")
+
+        fade_from = self._snapshot_frame() if item.transition == "fade" and self.is_playing else None
+        self._play_item(item)
+        if fade_from is not None:
+            with self.lock:
+                self._fade_from = fade_from
+                self._fade_start = self.clock.time()
+                self._fade_duration = item.transition_duration
+
+        self._prepare_next()
+        return True
+
+    def _play_item(self, item: PlaylistItem) -> None:
+        """Starts a playlist item through the regular show/play methods."""
+        interrupt_name = self.playlist_interrupt_name
+        if item.kind == "text":
+            self.show_text(item.value, duration=item.duration, save_context=False, interrupt_name=interrupt_name, effect=item.effect)
+        elif item.kind == "image":
+            self.show_image(resolve_media_path(item.value), duration=item.duration, save_context=False, interrupt_name=interrupt_name)
+        else:
+            self.play_gif(resolve_media_path(item.value), duration=item.duration, save_context=False, interrupt_name=interrupt_name)
+
+    def _prepare(self, item: PlaylistItem) -> None:
+        """Decodes / lays out an item into the caches (runs on the prepare thread)."""
+        if item.kind == "text":
+            self.preload_text(item.value, effect=item.effect)
+        elif item.kind == "image":
+            self.preload_image(resolve_media_path(item.value))
+        else:
+            self.preload_gif(resolve_media_path(item.value))
+
+    def _prepare_next(self) -> None:
+        """Starts preparing the next queued item if it isn't already."""
+        upcoming = self.playlist.peek()
+        if upcoming is None:
+            return
+        if self._prepared is not None and self._prepared[0] is upcoming:
+            return
+        self._prepared = (upcoming, self._prepare_executor.submit(self._prepare, upcoming))
+
+    def _snapshot_frame(self) -> Optional[pygame.Surface]:
+        """Copies the frame currently on screen, used as the outgoing side of a fade."""
+        with self.lock:
+            if self.current_media_type == "GIF" and self.gif_frames:
+                if isinstance(self.gif_frames, DeltaFrameStore):
+                    return self.gif_frames.surface.copy()
+                return self.gif_frames[self.current_frame_index].copy()
+            if self.current_media_type == "IMAGE" and self.current_image:
+                return self.current_image.copy()
+            if self.current_media_type == "TEXT" and self.text_surface:
+                return self.text_surface.copy()
+        return None
+
     def stop_media(self) -> None:
         """Stops media and restores state."""
         if self.is_playing:
             self.is_playing = False
+            self.playlist.clear()
+            self._prepared = None
+            self.playlist_interrupt_name = None
             with self.lock:
                 self.current_media_type = None
+                self._fade_from = None
             
             if self.current_interrupt_name:
                 logger.info(f"Clearing interrupt: {self.current_interrupt_name}")
-                self.interrupt_manager.clear_interrupt(self.current_interrupt_name)
+                self.interrupt_manager.stop_interrupt(self.current_interrupt_name)
                 self.current_interrupt_name = None
             else:
                 logger.info("Restoring state via CommandCenter")
@@ -242,16 +541,17 @@ class MediaModule(threading.Thread):
                 time.sleep(0.1)
                 continue
 
-            # Check duration expiry
-            if self.media_end_time > 0 and time.time() > self.media_end_time:
-                self.stop_media()
+            # Check duration expiry; queued playlist items take over without a gap
+            if self.media_end_time > 0 and self.clock.time() > self.media_end_time:
+                if not self.advance_playlist():
+                    self.stop_media()
                 continue
 
             with self.lock:
                 media_type = self.current_media_type
                 
             if media_type == "GIF":
-                now = time.time()
+                now = self.clock.time()
                 with self.lock:
                     if self.gif_delays:
                         current_delay = self.gif_delays[self.current_frame_index]
@@ -264,7 +564,7 @@ class MediaModule(threading.Thread):
                             self.current_frame_index = (self.current_frame_index + 1) % len(self.gif_frames)
                             self.last_frame_time = now
                     # Calculate sleep to avoid busy loop, but be responsive
-                    time.sleep(max(0.001, current_delay - (time.time() - now)))
+                    time.sleep(max(0.001, current_delay - (self.clock.time() - now)))
                 else:
                     time.sleep(0.01)
             else:
@@ -281,22 +581,91 @@ class MediaModule(threading.Thread):
         if not self.is_playing:
             return
 
+        center = (surface.get_width() // 2, surface.get_height() // 2)
         with self.lock:
-            media_type = self.current_media_type
-            
-            if media_type == "GIF":
-                if self.gif_frames:
-                    frame = self.gif_frames[self.current_frame_index]
-                    rect = frame.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2))
-                    surface.blit(frame, rect)
-                
-            elif media_type == "IMAGE":
-                if self.current_image:
-                    rect = self.current_image.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2))
-                    surface.blit(self.current_image, rect)
-                    
-            elif media_type == "TEXT":
-                if self.text_surface:
-                     rect = self.text_surface.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2))
-                     surface.blit(self.text_surface, rect)
+            if self.current_media_type == "TEXT" and self.text_effect is not None:
+                # Animated text blits areas of its pre-rendered strip and reports what moved
+                self._fade_from = None
+                self.dirty_rects.extend(self.text_effect.draw(surface, self.clock.time() - self._text_effect_start))
+                self._drawn_this_frame = True
+                return
+
+            frame, rect = self._current_frame(center)
+            if frame is None:
+                return
+
+            if self._fade_from is not None:
+                progress = (self.clock.time() - self._fade_start) / self._fade_duration if self._fade_duration > 0 else 1.0
+                # Fading touches every pixel of both frames: push whole frames to the display
+                self._full_redraw = True
+                if progress < 1.0:
+                    outgoing = self._fade_from
+                    outgoing.set_alpha(int(255 * (1.0 - progress)))
+                    surface.blit(outgoing, outgoing.get_rect(center=center))
+                    incoming = frame.copy()
+                    incoming.set_alpha(int(255 * progress))
+                    frame = incoming
+                else:
+                    self._fade_from = None
+
+            surface.blit(frame, rect)
+            self._drawn_this_frame = True
+
+    def _current_frame(self, center: Tuple[int, int]) -> Tuple[Optional[pygame.Surface], Optional[pygame.Rect]]:
+        """
+        Resolves the surface to draw for the current media and records dirty rects.
+        Must be called with self.lock held.
+        """
+        media_type = self.current_media_type
+
+        if media_type == "GIF":
+            if self.gif_frames:
+                index = self.current_frame_index
+                if isinstance(self.gif_frames, DeltaFrameStore):
+                    # Patch only the changed regions onto the persistent frame surface
+                    changed = self.gif_frames.seek(index)
+                    frame = self.gif_frames.surface
+                    rect = frame.get_rect(center=center)
+                    self.dirty_rects.extend(r.move(rect.topleft) for r in changed)
+                else:
+                    frame = self.gif_frames[index]
+                    rect = frame.get_rect(center=center)
+                    if index != self._last_drawn_frame_index:
+                        self.dirty_rects.append(rect)
+                self._last_drawn_frame_index = index
+                return frame, rect
+
+        elif media_type == "IMAGE":
+            if self.current_image:
+                return self.current_image, self.current_image.get_rect(center=center)
+
+        elif media_type == "TEXT":
+            if self.text_surface:
+                return self.text_surface, self.text_surface.get_rect(center=center)
+
+        return None, None
+
+    def consume_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """
+        Returns the regions changed by media since the last call.
+        Call once per frame after rendering.
+
+        Returns:
+            Optional[List[pygame.Rect]]: Changed rects in surface coordinates, or None if the
+                                         whole display must be updated (media not drawn this frame,
+                                         or media just started).
+        """
+        drawn = self._drawn_this_frame
+        self._drawn_this_frame = False
+        rects = self.dirty_rects
+        self.dirty_rects = []
 
+        if not drawn:
+            # Something else owns the frame; the next media frame needs a full update
+            self._full_redraw = True
+            self._last_drawn_frame_index = -1
+            return None
+        if self._full_redraw:
+            self._full_redraw = False
+            return None
+        return rects
@@ -0,0 +1,99 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+from bot_ekko.modules.text_effects import TEXT_EFFECTS
+from bot_ekko.sys_config import CANVAS_DURATION
+
+PLAYLIST_KINDS = ("text", "image", "gif")
+TRANSITIONS = ("cut", "fade")
+
+
+@dataclass
+class PlaylistItem:
+    """
+    One entry of a media playlist.
+
+    Attributes:
+        kind (str): "text", "image" or "gif".
+        value (str): The text to show, or a media path (relative paths resolve against ASSETS_DIR).
+        duration (float): Seconds to show the item.
+        transition (str): How the item replaces the previous one: "cut" or "fade".
+        transition_duration (float): Length of the fade in seconds.
+        effect (str): Text effect for text items (see TEXT_EFFECTS).
+    """
+    kind: str
+    value: str
+    duration: float = CANVAS_DURATION
+    transition: str = "cut"
+    transition_duration: float = 0.5
+    effect: str = "static"
+
+    def __post_init__(self) -> None:
+        if self.kind not in PLAYLIST_KINDS:
+            raise ValueError(f"Unknown playlist item kind: {self.kind}")
+        if self.transition not in TRANSITIONS:
+            raise ValueError(f"Unknown playlist transition: {self.transition}")
+        if self.effect not in TEXT_EFFECTS:
+            raise ValueError(f"Unknown text effect: {self.effect}")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PlaylistItem":
+        """
+        Builds an item from the CANVAS params format used by schedules, BLE and Tenor.
+
+        Args:
+            data (Dict[str, Any]): {"show": kind, "value": ..., "duration": ..., "transition": ...}
+
+        Returns:
+            PlaylistItem: The parsed item.
+        """
+        return cls(
+            kind=data.get("show", data.get("kind", "gif")),
+            value=str(data["value"]),
+            duration=float(data.get("duration", CANVAS_DURATION)),
+            transition=data.get("transition", "cut"),
+            transition_duration=float(data.get("transition_duration", 0.5)),
+            effect=data.get("effect", "static"),
+        )
+
+
+class MediaPlaylist:
+    """
+    Thread-safe FIFO of playlist items.
+    Items are appended by command handlers on the main thread and consumed by the media thread.
+    """
+    def __init__(self, items: Optional[Iterable[PlaylistItem]] = None) -> None:
+        self._items: Deque[PlaylistItem] = deque(items or [])
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def append(self, item: PlaylistItem) -> None:
+        with self._lock:
+            self._items.append(item)
+
+    def extend(self, items: Iterable[PlaylistItem]) -> None:
+        with self._lock:
+            self._items.extend(items)
+
+    def peek(self) -> Optional[PlaylistItem]:
+        """Returns the next item without removing it."""
+        with self._lock:
+            return self._items[0] if self._items else None
+
+    def pop(self) -> Optional[PlaylistItem]:
+        """Removes and returns the next item."""
+        with self._lock:
+            return self._items.popleft() if self._items else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def items(self) -> List[PlaylistItem]:
+        """Returns a snapshot of the queued items."""
+        with self._lock:
+            return list(self._items)
@@ -0,0 +1,116 @@
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from bot_ekko.core.logger import get_logger
+from bot_ekko.core.models import MediaPrefetchConfig
+from bot_ekko.core.scheduler import Scheduler
+from bot_ekko.core.state_registry import StateRegistry
+from bot_ekko.modules.media_interface import MediaModule, resolve_canvas_media, resolve_media_path
+
+logger = get_logger("MediaPrefetcher")
+
+
+class MediaPrefetcher(threading.Thread):
+    """
+    Warms MediaModule caches ahead of scheduled CANVAS transitions.
+    Scans upcoming schedule windows periodically and decodes GIFs / renders text
+    in the background, so the frame where the handler runs only does a cache lookup.
+    """
+    def __init__(self, media_player: MediaModule, scheduler: Scheduler, config: Optional[MediaPrefetchConfig] = None,
+                 state_mappings: Optional[Iterable[Dict[str, Any]]] = None) -> None:
+        """
+        Initialize the Media Prefetcher.
+
+        Args:
+            media_player (MediaModule): Media module whose caches are warmed.
+            scheduler (Scheduler): Scheduler to scan for upcoming events.
+            config (MediaPrefetchConfig, optional): Lookahead and scan interval.
+            state_mappings (Iterable[Dict], optional): Params of interrupt/gesture mappings that
+                                                       can switch to CANVAS at any time. Warmed once on start.
+        """
+        super().__init__(daemon=True, name="media_prefetcher")
+        self.media_player = media_player
+        self.scheduler = scheduler
+        self.config = config or MediaPrefetchConfig()
+        self.state_mappings = list(state_mappings or [])
+
+        self._stop_event = threading.Event()
+
+    def media_for_params(self, params: Optional[Dict[str, Any]]) -> List[Tuple[str, str, str]]:
+        """Returns the (kind, value, text effect) items a CANVAS state with these params will show."""
+        kind, value = resolve_canvas_media(params)
+        if kind == "playlist":
+            return [(item.kind, resolve_media_path(item.value) if item.kind != "text" else item.value, item.effect)
+                    for item in value]
+        return [(kind, value, params.get("effect", "static") if params else "static")]
+
+    def warm(self, kind: str, value: str, effect: str = "static") -> bool:
+        """
+        Loads one media item into the caches, unless it is still there from an earlier scan.
+
+        Args:
+            kind (str): "gif", "image" or "text".
+            value (str): Path or text.
+            effect (str, optional): Text effect it will be shown with (picks the layout).
+
+        Returns:
+            bool: True if the item is cached.
+        """
+        # Checked against the caches themselves: they are bounded, and other media can push an item out
+        if self.media_player.is_cached(kind, value, effect):
+            return True
+        if kind == "text":
+            self.media_player.preload_text(value, effect=effect)
+            return True
+        if kind == "gif":
+            return self.media_player.preload_gif(value)
+        return self.media_player.preload_image(value)
+
+    def scan(self, now_dt: Optional[datetime] = None) -> List[Tuple[str, str]]:
+        """
+        Warms media for CANVAS events that are active or start within the lookahead.
+
+        Args:
+            now_dt (datetime, optional): Time to scan from. Defaults to now.
+
+        Returns:
+            List[Tuple[str, str, str]]: The (kind, value, text effect) items that were requested.
+        """
+        now_dt = now_dt or self.scheduler.clock.now()
+        requested = []
+        for start_dt, event in self.scheduler.upcoming_events(now_dt, self.config.lookahead_seconds):
+            if event.get("state") != StateRegistry.CANVAS:
+                continue
+            for kind, value, effect in self.media_for_params(event.get("params")):
+                logger.debug(f"Prefetching {kind} for '{event.get('name')}' starting at {start_dt}")
+                self.warm(kind, value, effect)
+                requested.append((kind, value, effect))
+        return requested
+
+    def warm_mappings(self) -> None:
+        """Warms media referenced by interrupt and gesture mappings."""
+        for params in self.state_mappings:
+            if params.get("target_state") != StateRegistry.CANVAS:
+                continue
+            for kind, value, effect in self.media_for_params(params):
+                self.warm(kind, value, effect)
+
+    def run(self) -> None:
+        """Background loop scanning the schedule every scan_interval seconds."""
+        logger.info(f"Media prefetcher started (lookahead={self.config.lookahead_seconds}s)")
+        try:
+            self.warm_mappings()
+        except Exception as e:
+            logger.error(f"Failed to warm mapped media: {e}")
+
+        while not self._stop_event.is_set():
+            try:
+                self.scan()
+            except Exception as e:
+                logger.error(f"Media prefetch scan failed: {e}")
+            self._stop_event.wait(self.config.scan_interval)
+
+    def stop(self) -> None:
+        """Signal the prefetcher to stop."""
+        self._stop_event.set()
@@ -0,0 +1,206 @@
+import hashlib
+import json
+import math
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+from PIL import Image, ImageSequence
+
+from bot_ekko.core.logger import get_logger
+
+logger = get_logger("SpriteSheet")
+
+# Manifest files live next to their atlas, e.g. anime.gif -> anime.sprites.json + anime.sprites.png
+SPRITE_SHEET_SUFFIX = ".sprites.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class SpriteSheet:
+    """
+    A decoded sprite sheet: one atlas surface plus frame rects and playback timing.
+
+    Attributes:
+        atlas (pygame.Surface): The surface holding every unique frame.
+        frame_rects (List[pygame.Rect]): Rect of each unique frame inside the atlas.
+        sequence (List[int]): Playback order as indices into frame_rects.
+        delays (List[float]): Delay in seconds for each sequence entry.
+    """
+    atlas: pygame.Surface
+    frame_rects: List[pygame.Rect]
+    sequence: List[int]
+    delays: List[float] = field(default_factory=list)
+
+    def frames(self) -> List[pygame.Surface]:
+        """
+        Builds the playback frame list as subsurfaces of the atlas.
+        Subsurfaces share the atlas pixels, so duplicate frames cost nothing.
+
+        Returns:
+            List[pygame.Surface]: One surface per sequence entry.
+        """
+        unique = [self.atlas.subsurface(rect) for rect in self.frame_rects]
+        return [unique[index] for index in self.sequence]
+
+
+def sprite_sheet_path_for(media_path: str) -> str:
+    """
+    Returns the manifest path that would accompany a media file.
+
+    Args:
+        media_path (str): Path to a GIF (or an existing manifest).
+
+    Returns:
+        str: Path of the sprite sheet manifest.
+    """
+    if media_path.endswith(SPRITE_SHEET_SUFFIX):
+        return media_path
+    return os.path.splitext(media_path)[0] + SPRITE_SHEET_SUFFIX
+
+
+def find_sprite_sheet(media_path: str) -> Optional[str]:
+    """
+    Looks for a sprite sheet manifest for the given media path.
+
+    Args:
+        media_path (str): Path to a GIF or a manifest.
+
+    Returns:
+        Optional[str]: The manifest path if it exists, else None.
+    """
+    manifest_path = sprite_sheet_path_for(media_path)
+    if os.path.exists(manifest_path):
+        return manifest_path
+    return None
+
+
+def load_sprite_sheet(manifest_path: str) -> SpriteSheet:
+    """
+    Loads a sprite sheet with a single image load.
+
+    Args:
+        manifest_path (str): Path to the JSON manifest.
+
+    Returns:
+        SpriteSheet: The decoded sprite sheet.
+
+    Raises:
+        ValueError: If the manifest is malformed or of an unknown version.
+    """
+    with open(manifest_path, "r") as f:
+        manifest = json.load(f)
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported sprite sheet version: {manifest.get('version')}")
+
+    image_path = os.path.join(os.path.dirname(manifest_path), manifest["image"])
+    image_format = manifest.get("format", "png")
+
+    if image_format == "raw":
+        # Raw RGBA atlas: no decompression at all, just a copy into a surface
+        atlas_w, atlas_h = manifest["atlas_size"]
+        with open(image_path, "rb") as f:
+            data = f.read()
+        if len(data) != atlas_w * atlas_h * 4:
+            raise ValueError(f"Raw atlas {image_path} does not match atlas_size {atlas_w}x{atlas_h}")
+        atlas = pygame.image.fromstring(data, (atlas_w, atlas_h), "RGBA")
+    else:
+        atlas = pygame.image.load(image_path)
+
+    frame_rects = [pygame.Rect(*rect) for rect in manifest["frames"]]
+    sequence: List[int] = []
+    delays: List[float] = []
+    for entry in manifest["sequence"]:
+        sequence.append(entry["frame"])
+        delays.append(entry.get("duration", 100) / 1000.0)  # Convert ms to seconds
+
+    logger.debug(f"Loaded sprite sheet {manifest_path}: {len(frame_rects)} unique frames, {len(sequence)} steps")
+    return SpriteSheet(atlas=atlas, frame_rects=frame_rects, sequence=sequence, delays=delays)
+
+
+def convert_gif_to_sprite_sheet(gif_path: str, output_dir: Optional[str] = None, image_format: str = "png") -> str:
+    """
+    Converts a GIF into a sprite sheet, deduplicating identical frames.
+    Consecutive duplicates are merged into one sequence entry with their durations summed.
+
+    Args:
+        gif_path (str): Source GIF.
+        output_dir (str, optional): Where to write the sheet. Defaults to the GIF's directory.
+        image_format (str, optional): "png" or "raw" (uncompressed RGBA). Defaults to "png".
+
+    Returns:
+        str: Path to the written manifest.
+    """
+    if image_format not in ("png", "raw"):
+        raise ValueError(f"Unknown sprite sheet image format: {image_format}")
+
+    base_name = os.path.splitext(os.path.basename(gif_path))[0]
+    output_dir = output_dir or os.path.dirname(os.path.abspath(gif_path))
+    os.makedirs(output_dir, exist_ok=True)
+
+    unique_frames: List[Image.Image] = []
+    seen: Dict[bytes, List[int]] = {}
+    sequence: List[Dict[str, int]] = []
+
+    with Image.open(gif_path) as pil_image:
+        for frame in ImageSequence.Iterator(pil_image):
+            frame_rgba = frame.convert("RGBA")
+            data = frame_rgba.tobytes()
+            duration = int(frame.info.get("duration", 100))
+
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            index = None
+            for candidate in seen.get(digest, []):
+                if unique_frames[candidate].tobytes() == data:
+                    index = candidate
+                    break
+            if index is None:
+                index = len(unique_frames)
+                unique_frames.append(frame_rgba)
+                seen.setdefault(digest, []).append(index)
+
+            if sequence and sequence[-1]["frame"] == index:
+                sequence[-1]["duration"] += duration
+            else:
+                sequence.append({"frame": index, "duration": duration})
+
+    if not unique_frames:
+        raise ValueError(f"No frames found in GIF: {gif_path}")
+
+    frame_w, frame_h = unique_frames[0].size
+    columns = math.ceil(math.sqrt(len(unique_frames)))
+    rows = math.ceil(len(unique_frames) / columns)
+    atlas = Image.new("RGBA", (columns * frame_w, rows * frame_h), (0, 0, 0, 0))
+
+    frame_rects: List[Tuple[int, int, int, int]] = []
+    for i, frame in enumerate(unique_frames):
+        x = (i % columns) * frame_w
+        y = (i // columns) * frame_h
+        atlas.paste(frame, (x, y))
+        frame_rects.append((x, y, frame.size[0], frame.size[1]))
+
+    image_name = f"{base_name}.sprites.{'png' if image_format == 'png' else 'rgba'}"
+    image_path = os.path.join(output_dir, image_name)
+    if image_format == "raw":
+        with open(image_path, "wb") as f:
+            f.write(atlas.tobytes())
+    else:
+        atlas.save(image_path, optimize=True)
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "image": image_name,
+        "format": image_format,
+        "atlas_size": list(atlas.size),
+        "frame_size": [frame_w, frame_h],
+        "frames": [list(rect) for rect in frame_rects],
+        "sequence": sequence,
+    }
+    manifest_path = os.path.join(output_dir, base_name + SPRITE_SHEET_SUFFIX)
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f)
+
+    logger.info(f"Converted {gif_path} -> {manifest_path} ({len(unique_frames)} unique frames, {len(sequence)} steps)")
+    return manifest_path
@@ -0,0 +1,215 @@
+from typing import List, Optional, Tuple
+
+import pygame
+
+from bot_ekko.sys_config import TEXT_MARQUEE_SPEED, TEXT_TYPEWRITER_SPEED
+
+TEXT_EFFECTS = ("static", "typewriter", "marquee_v", "marquee_h")
+
+
+def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
+    """
+    Splits text into lines that fit max_width.
+
+    Args:
+        text (str): Text to wrap.
+        font (pygame.font.Font): Font used for measuring.
+        max_width (int): Maximum line width in pixels.
+
+    Returns:
+        List[str]: The wrapped lines.
+    """
+    lines = []
+    current_line: List[str] = []
+
+    for word in text.split(' '):
+        test_line = ' '.join(current_line + [word])
+        w, _ = font.size(test_line)
+        if w < max_width:
+            current_line.append(word)
+        else:
+            if current_line:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+            else:
+                # Word itself is too long, just add it (or could split char by char)
+                lines.append(word)
+                current_line = []
+
+    if current_line:
+        lines.append(' '.join(current_line))
+    return lines
+
+
+class TextStrip:
+    """
+    Text rasterized once into a single surface, with the position of every glyph.
+
+    Effects never re-render the font: they only pick which area of the strip to blit.
+    """
+    def __init__(self, surface: pygame.Surface, line_rects: List[pygame.Rect], glyph_offsets: List[List[int]]) -> None:
+        """
+        Initialize the strip. Use TextStrip.render() to build one.
+
+        Args:
+            surface (pygame.Surface): The rendered text.
+            line_rects (List[pygame.Rect]): Rect of each line inside the surface.
+            glyph_offsets (List[List[int]]): Per line, the x advance after each character (line relative).
+        """
+        self.surface = surface
+        self.line_rects = line_rects
+        self.glyph_offsets = glyph_offsets
+        self.char_count = sum(len(offsets) for offsets in glyph_offsets)
+
+    @classmethod
+    def render(cls, text: str, font: pygame.font.Font, color: Tuple[int, int, int],
+               max_width: Optional[int] = None) -> "TextStrip":
+        """
+        Renders text into a strip.
+
+        Args:
+            text (str): Text to render.
+            font (pygame.font.Font): Font to use.
+            color (Tuple[int, int, int]): Text color.
+            max_width (int, optional): Wrap width. None renders one line (horizontal marquee).
+
+        Returns:
+            TextStrip: The rendered strip, lines centered.
+        """
+        lines = wrap_text(text, font, max_width) if max_width else [text]
+        if not lines:
+            lines = [""]
+
+        rendered_lines = [font.render(line, True, color) for line in lines]
+        width = max(line.get_width() for line in rendered_lines)
+        height = sum(line.get_height() for line in rendered_lines)
+
+        # We use transparent background
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        line_rects = []
+        y = 0
+        for line_surf in rendered_lines:
+            # Center align
+            rect = line_surf.get_rect(topleft=((width - line_surf.get_width()) // 2, y))
+            surface.blit(line_surf, rect)
+            line_rects.append(rect)
+            y += rect.height
+
+        glyph_offsets = [[font.size(line[:i + 1])[0] for i in range(len(line))] for line in lines]
+        return cls(surface, line_rects, glyph_offsets)
+
+    def reveal_rects(self, count: int) -> List[pygame.Rect]:
+        """
+        Areas of the strip covering the first `count` characters.
+
+        Args:
+            count (int): Number of characters revealed.
+
+        Returns:
+            List[pygame.Rect]: Full lines, then the partial line being typed.
+        """
+        rects = []
+        for rect, offsets in zip(self.line_rects, self.glyph_offsets):
+            if count <= 0:
+                break
+            if count >= len(offsets):
+                rects.append(rect)
+            else:
+                rects.append(pygame.Rect(rect.x, rect.y, min(offsets[count - 1], rect.width), rect.height))
+            count -= len(offsets)
+        return rects
+
+    def line_at(self, count: int) -> int:
+        """Index of the line holding character `count` (the one being typed)."""
+        for index, offsets in enumerate(self.glyph_offsets):
+            if count <= len(offsets):
+                return index
+            count -= len(offsets)
+        return len(self.glyph_offsets) - 1
+
+
+class TextEffect:
+    """
+    Animates a TextStrip inside a viewport.
+
+    "static" centers the strip, "typewriter" reveals characters (scrolling up once the text
+    overflows the viewport), "marquee_v" / "marquee_h" loop the strip upwards / leftwards.
+    """
+    def __init__(self, strip: TextStrip, effect: str = "static", speed: Optional[float] = None) -> None:
+        """
+        Initialize the effect.
+
+        Args:
+            strip (TextStrip): The pre-rendered text.
+            effect (str, optional): One of TEXT_EFFECTS. Defaults to "static".
+            speed (float, optional): Characters per second (typewriter) or pixels per second (marquee).
+        """
+        if effect not in TEXT_EFFECTS:
+            raise ValueError(f"Unknown text effect: {effect}")
+        self.strip = strip
+        self.effect = effect
+        self.speed = speed or (TEXT_TYPEWRITER_SPEED if effect == "typewriter" else TEXT_MARQUEE_SPEED)
+
+        # Last drawn position, used to report only what changed
+        self._last: Optional[Tuple[int, int, int]] = None
+
+    def draw(self, surface: pygame.Surface, elapsed: float, viewport: Optional[pygame.Rect] = None) -> List[pygame.Rect]:
+        """
+        Draws the effect at `elapsed` seconds since it started.
+
+        Args:
+            surface (pygame.Surface): Destination surface.
+            elapsed (float): Seconds since the effect started.
+            viewport (pygame.Rect, optional): Area to draw in. Defaults to the whole surface.
+
+        Returns:
+            List[pygame.Rect]: Regions of the surface that changed since the previous draw.
+        """
+        viewport = viewport or surface.get_rect()
+        strip_rect = self.strip.surface.get_rect()
+        count = self.strip.char_count
+        dest = strip_rect.copy()
+
+        if self.effect == "marquee_v":
+            travel = viewport.height + strip_rect.height
+            dest.centerx = viewport.centerx
+            dest.top = viewport.bottom - int(elapsed * self.speed) % travel
+        elif self.effect == "marquee_h":
+            travel = viewport.width + strip_rect.width
+            dest.centery = viewport.centery
+            dest.left = viewport.right - int(elapsed * self.speed) % travel
+        else:
+            dest.center = viewport.center
+            if self.effect == "typewriter":
+                count = min(count, int(elapsed * self.speed))
+                if strip_rect.height > viewport.height:
+                    # Keep the line being typed at the bottom of the viewport
+                    current = self.strip.line_rects[self.strip.line_at(count)]
+                    dest.top = viewport.top - max(0, current.bottom - viewport.height)
+
+        # Only the visible part of the strip is blitted
+        if count >= self.strip.char_count:
+            areas = [strip_rect]
+        else:
+            areas = self.strip.reveal_rects(count)
+        for area in areas:
+            visible = viewport.clip(area.move(dest.topleft))
+            if visible.width and visible.height:
+                surface.blit(self.strip.surface, visible.topleft, visible.move(-dest.x, -dest.y))
+
+        changed = self._changed(dest, count, viewport)
+        self._last = (dest.x, dest.y, count)
+        return changed
+
+    def _changed(self, dest: pygame.Rect, count: int, viewport: pygame.Rect) -> List[pygame.Rect]:
+        if self._last is None or self._last[:2] != (dest.x, dest.y):
+            # First draw or the strip moved
+            return [viewport.clip(dest.union(dest.move(self._last[0] - dest.x, self._last[1] - dest.y)))
+                    if self._last else viewport.clip(dest)]
+        last_count = self._last[2]
+        if count == last_count:
+            return []
+        # Newly typed characters: redraw the lines they sit on
+        first, last = self.strip.line_at(last_count + 1), self.strip.line_at(count)
+        rects = [viewport.clip(self.strip.line_rects[i].move(dest.topleft)) for i in range(first, last + 1)]
+        return [rect for rect in rects if rect.width and rect.height]
@@ -1,7 +1,19 @@
-from .service_sensors import SensorService
-from .service_bt import BluetoothService
-from .service_gesture import GestureService
-from .service_system_logs import SystemLogsService
-from .service_mic import MicService
+import importlib
 
+# Service classes are imported on first access, so importing this package doesn't pull in
+# the native dependencies (serial, bluezero, pyaudio) of services that aren't used
+_SERVICE_MODULES = {
+    "SensorService": ".service_sensors",
+    "BluetoothService": ".service_bt",
+    "GestureService": ".service_gesture",
+    "SystemLogsService": ".service_system_logs",
+    "MicService": ".service_mic",
+}
 
+__all__ = list(_SERVICE_MODULES)
+
+
+def __getattr__(name):
+    if name in _SERVICE_MODULES:
+        return getattr(importlib.import_module(_SERVICE_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,18 +1,23 @@
 import subprocess
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from bluezero import peripheral # type: ignore
 
 from bot_ekko.core.base import ThreadedService
 from bot_ekko.core.errors import ServiceDependencyError
 from bot_ekko.core.models import BluetoothData, ServiceBluetoothConfig, CommandNames
 from bot_ekko.core.command_center import CommandCenter
+from bot_ekko.core.arbiter import ClaimSource
+from bot_ekko.core.event_bus import EventBus, Topics
+from bot_ekko.core.recorder import RecordKind
+from bot_ekko.modules.media_playlist import PLAYLIST_KINDS
 
 class BluetoothService(ThreadedService):
     """
     Manages Bluetooth Low Energy (BLE) communication.
     Acts as a peripheral to accept commands from a central device (e.g., phone app).
     """
-    def __init__(self, service_bt_config: ServiceBluetoothConfig, command_center: CommandCenter, name: str = "bluetooth"):
+    def __init__(self, service_bt_config: ServiceBluetoothConfig, command_center: CommandCenter, name: str = "bluetooth",
+                 event_bus: Optional[EventBus] = None):
         """
         Initialize the Bluetooth Service.
 
@@ -20,6 +25,7 @@ class BluetoothService(ThreadedService):
             service_bt_config (ServiceBluetoothConfig): Configuration object.
             command_center (CommandCenter): Command issuer.
             name (str, optional): Service name. Defaults to "bluetooth".
+            event_bus (EventBus, optional): Bus writes are published to (bt.command) and read back from in update().
         """
         super().__init__(name, enabled=service_bt_config.enabled)
         self.adapter_address: Optional[str] = None
@@ -28,6 +34,8 @@ class BluetoothService(ThreadedService):
         self.bt_data: Optional[BluetoothData] = None
         self.service_bt_config: ServiceBluetoothConfig = service_bt_config
         self.command_center: CommandCenter = command_center
+        self.event_bus = event_bus or EventBus()
+        self._command_events = self.event_bus.subscribe(Topics.BT_COMMAND)
 
     def init(self) -> None:
         """
@@ -82,11 +90,15 @@ class BluetoothService(ThreadedService):
             value (List[int]): The byte values received.
             options (Dict[str, Any]): Write options.
         """
+        if self.recorder:
+            self.recorder.record(RecordKind.BT_WRITE, bytes(value))
         try:
             cmd = bytes(value).decode().strip()
             self.logger.info(f"Command received via Bluetooth: {cmd}")
             self.is_connected = True
             self.bt_data = BluetoothData(text=cmd, is_connected=self.is_connected)
+            self.event_bus.publish(Topics.BT_COMMAND, self.bt_data)
+            self.mark_dirty()
             self.increment_stat("commands_received")
         except Exception as e: # pylint: disable=broad-except
             self.logger.error(f"Error processing bluetooth command: {e}")
@@ -143,21 +155,53 @@ class BluetoothService(ThreadedService):
         # Relies on daemon thread termination for now.
 
     def update(self) -> None:
-        """Checks for new commands and issues them to the command center."""
-        data = self.get_bt_data()
-        if data and data.is_connected:
-            # Simple command parsing: CMD;QUERY
-            parts = data.text.split(";")
-            cmd = parts[0].upper()
-            query = parts[1] if len(parts) > 1 else None
-
-            if cmd == "STATE" and query:
-                self.command_center.issue_command(
-                    command_name=CommandNames.CHANGE_STATE,
-                    params={"target_state": query.upper()}
-                )
-            
-
+        """Issues the commands written since the last frame to the command center."""
+        for event in self._command_events.poll():
+            self._process_command(event.payload)
+
+    def _process_command(self, data: BluetoothData) -> None:
+        if data.is_connected:
+            # Several commands separated by "|" (e.g. "STATE;HAPPY|LOOK;40;0") apply together in one frame
+            commands = [self.parse_command(text) for text in data.text.split("|")]
+            if None in commands:
+                self.logger.warning(f"Invalid Bluetooth command: {data.text}")
+                return
+
+            # External input: validated here via ingest(), never again inside the process
+            if len(commands) == 1:
+                self.command_center.ingest(*commands[0], source=ClaimSource.BLE)
+            else:
+                self.command_center.ingest_batch(commands)
+
+    def parse_command(self, text: str) -> Optional[Tuple[CommandNames, Optional[Dict[str, Any]]]]:
+        """
+        Parses one text command.
 
+        Args:
+            text (str): e.g. "STATE;HAPPY", "MEDIA;gif;birthday.gif", "LOOK;40;-20", "BLINK", "SET;key;value".
 
-        
\ No newline at end of file
+        Returns:
+            Optional[Tuple[CommandNames, Optional[dict]]]: (command name, params), or None if unrecognised.
+        """
+        # Simple command parsing: CMD;QUERY
+        parts = text.strip().split(";")
+        cmd = parts[0].upper()
+        query = parts[1] if len(parts) > 1 else None
+
+        if cmd == "STATE" and query:
+            return CommandNames.CHANGE_STATE, {"target_state": query.upper()}
+        if cmd == "MEDIA" and query and query.lower() in PLAYLIST_KINDS and len(parts) > 2:
+            # MEDIA;<text|image|gif>;<value> - queued behind whatever is playing
+            return CommandNames.PLAY_MEDIA, {"show": query.lower(), "value": ";".join(parts[2:])}
+        if cmd == "LOOK" and len(parts) > 2:
+            # LOOK;<x>;<y> - offset from center
+            try:
+                return CommandNames.LOOK_AT, {"x": int(parts[1]), "y": int(parts[2])}
+            except ValueError:
+                return None
+        if cmd == "BLINK":
+            return CommandNames.BLINK, None
+        if cmd == "SET" and len(parts) > 2:
+            # SET;<key>;<value> - updates a param of the current state
+            return CommandNames.SET_PARAM, {"key": parts[1], "value": ";".join(parts[2:])}
+        return None
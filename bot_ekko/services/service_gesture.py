@@ -6,21 +6,27 @@ import time
 from typing import Optional, Dict
 
 from bot_ekko.core.base import ThreadedService, ServiceStatus
-from bot_ekko.core.models import GestureData, CommandNames, ServiceGestureConfig
+from bot_ekko.core.models import GestureData, ServiceGestureConfig
 from bot_ekko.core.command_center import CommandCenter
+from bot_ekko.core.arbiter import ClaimSource
+from bot_ekko.sys_config import SERVICE_HEARTBEAT_TIMEOUT, STATE_CLAIM_HOLD_MS
+from bot_ekko.core.event_bus import EventBus, Topics
+from bot_ekko.core.recorder import RecordKind
 
 class GestureService(ThreadedService):
     """
     Service to handle gesture input via a Unix Domain Socket.
     Receives JSON payloads from an external gesture recognition process.
     """
-    def __init__(self, command_center: CommandCenter, service_gesture_config: ServiceGestureConfig) -> None:
+    def __init__(self, command_center: CommandCenter, service_gesture_config: ServiceGestureConfig,
+                 event_bus: Optional[EventBus] = None) -> None:
         """
         Initialize the Gesture Service.
 
         Args:
             command_center (CommandCenter): Command issuer.
             service_gesture_config (ServiceGestureConfig): Configuration.
+            event_bus (EventBus, optional): Bus gestures are published to and read back from in update().
         """
         super().__init__(service_gesture_config.name, enabled=service_gesture_config.enabled)
 
@@ -29,6 +35,10 @@ class GestureService(ThreadedService):
         self.service_config = service_gesture_config
         
         self.sock: Optional[socket.socket] = None
+        self.heartbeat_timeout = SERVICE_HEARTBEAT_TIMEOUT
+
+        self.event_bus = event_bus or EventBus()
+        self._gesture_events = self.event_bus.subscribe(Topics.GESTURE)
 
         # Default mapping if not provided in config
         self._gesture_state_mapping = service_gesture_config.gesture_state_mapping
@@ -77,6 +87,7 @@ class GestureService(ThreadedService):
         self.logger.info("Gesture Service Loop Started")
 
         while not self._stop_event.is_set():
+            self.heartbeat()
             try:
                 # Accept connection
                 try:
@@ -91,6 +102,7 @@ class GestureService(ThreadedService):
                 with conn:
                     conn.settimeout(1.0) # Timeout for recv
                     while not self._stop_event.is_set():
+                        self.heartbeat()
                         # Read header (4 bytes length)
                         try:
                             hdr = self._recv_exact(conn, 4)
@@ -102,26 +114,10 @@ class GestureService(ThreadedService):
                             if not payload:
                                 break
                             
-                            msg = json.loads(payload.decode("utf-8"))
-                            
-                            # Update stats
-                            self.increment_stat("messages_received")
-                            
-                            # Parse message
-                            # Expected format: {"gesture": "name", "score": 0.9}
-                            gesture = msg.get("gesture", "").lower()
-                            score = float(msg.get("score", 0.0))
-                            
-                            # Update internal data
-                            self.vision_data = GestureData(
-                                gesture=gesture,
-                                score=score,
-                                status="ok"
-                            )
+                            if self.recorder:
+                                self.recorder.record(RecordKind.GESTURE_PAYLOAD, payload)
+                            self.handle_payload(payload)
                             
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            self.increment_stat("decode_errors")
-                            continue
                         except socket.timeout:
                             continue
                         except Exception as e:
@@ -137,6 +133,53 @@ class GestureService(ThreadedService):
 
                 time.sleep(1)
 
+    def handle_payload(self, payload: bytes) -> None:
+        """
+        Parses one gesture message and publishes it.
+        Called from the service thread, or by the replayer with recorded payloads.
+
+        Args:
+            payload (bytes): JSON message, e.g. {"gesture": "name", "score": 0.9}.
+        """
+        try:
+            msg = json.loads(payload.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            self.increment_stat("decode_errors")
+            return
+
+        # Update stats
+        self.increment_stat("messages_received")
+
+        gesture = msg.get("gesture", "").lower()
+        score = float(msg.get("score", 0.0))
+
+        # Update internal data
+        self.vision_data = GestureData(
+            gesture=gesture,
+            score=score,
+            status="ok"
+        )
+        self.event_bus.publish(Topics.GESTURE, self.vision_data)
+        self.mark_dirty()
+
+    def reconfigure(self, config: ServiceGestureConfig) -> bool:
+        """
+        Swaps the gesture mapping in place. Any other change needs a new socket, so the service is recreated.
+
+        Args:
+            config (ServiceGestureConfig): The new configuration.
+
+        Returns:
+            bool: True if applied in place.
+        """
+        if config.model_dump(exclude={"gesture_state_mapping"}) != \
+                self.service_config.model_dump(exclude={"gesture_state_mapping"}):
+            return False
+        self.service_config = config
+        self._gesture_state_mapping = config.gesture_state_mapping
+        self.logger.info(f"Gesture mapping reloaded: {self._gesture_state_mapping}")
+        return True
+
     def _recv_exact(self, conn: socket.socket, n: int) -> Optional[bytes]:
         """
         Reads exactly n bytes from the socket.
@@ -158,6 +201,7 @@ class GestureService(ThreadedService):
             except socket.timeout:
                 if self._stop_event.is_set():
                     return None
+                self.heartbeat()
                 continue
         return buf
 
@@ -179,9 +223,11 @@ class GestureService(ThreadedService):
         """
         Check for gesture changes and trigger commands.
         """
+        for event in self._gesture_events.poll():
+            self._process_gesture(event.payload)
+
+    def _process_gesture(self, current_data: GestureData) -> None:
         # Logic similar to original gesture_triggers.py
-        current_data = self.vision_data
-        
         if current_data.status != "ok":
             return
             
@@ -198,8 +244,7 @@ class GestureService(ThreadedService):
         
         if gesture in self._gesture_state_mapping:
             target_state = self._gesture_state_mapping[gesture]
-            self.command_center.issue_command(
-                CommandNames.CHANGE_STATE, 
-                params={"target_state": target_state, "score": current_data.score}
+            self.command_center.request_state(
+                ClaimSource.GESTURE, target_state, {"score": current_data.score}, hold_ms=STATE_CLAIM_HOLD_MS
             )
 
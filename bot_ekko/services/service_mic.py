@@ -1,3 +1,4 @@
+import numpy as np
 import pyaudio
 import sys
 import queue
@@ -9,6 +10,8 @@ from typing import Optional, List
 from bot_ekko.core.base import ThreadedService
 from bot_ekko.core.errors import ServiceDependencyError
 from bot_ekko.core.models import ServiceMicConfig
+from bot_ekko.core.event_bus import EventBus, Topics
+from bot_ekko.sys_config import SERVICE_HEARTBEAT_TIMEOUT
 
 
 class MicService(ThreadedService):
@@ -16,23 +19,26 @@ class MicService(ThreadedService):
     Manages USB Microphone audio stream collection.
     Captures audio and places it in a thread-safe queue buffer.
     """
-    def __init__(self, service_mic_config: ServiceMicConfig, name: str = "mic"):
+    def __init__(self, service_mic_config: ServiceMicConfig, name: str = "mic", event_bus: Optional[EventBus] = None):
         """
         Initialize the Mic Service.
 
         Args:
             service_mic_config (ServiceMicConfig): Configuration object.
             name (str, optional): Service name. Defaults to "mic".
+            event_bus (EventBus, optional): Bus the level of each chunk is published to (audio.level).
         """
         super().__init__(name, enabled=service_mic_config.enabled)
         self.service_mic_config: ServiceMicConfig = service_mic_config
         self.audio_interface: Optional[pyaudio.PyAudio] = None
         self.stream: Optional[pyaudio.Stream] = None
         self.chunk_size = self.service_mic_config.chunk_size
+        self.heartbeat_timeout = SERVICE_HEARTBEAT_TIMEOUT
         self.sample_rate = self.service_mic_config.sample_rate
         self.channels = self.service_mic_config.channels
         self.audio_buffer: queue.Queue = queue.Queue(maxsize=self.service_mic_config.buffer_size)
         self.wav_file: Optional[wave.Wave_write] = None
+        self.event_bus = event_bus or EventBus()
 
     def init(self) -> None:
         """
@@ -76,6 +82,22 @@ class MicService(ThreadedService):
             return None
         return chunks
 
+    @staticmethod
+    def audio_level(data: bytes) -> float:
+        """
+        RMS level of a 16-bit PCM chunk.
+
+        Args:
+            data (bytes): Raw chunk.
+
+        Returns:
+            float: Level between 0.0 (silence) and 1.0 (full scale).
+        """
+        samples = np.frombuffer(data, dtype=np.int16)
+        if not samples.size:
+            return 0.0
+        return float(np.sqrt(np.mean(np.square(samples, dtype=np.float32)))) / 32768.0
+
     def _setup_audio_recording(self) -> None:
         """Sets up the wave file for recording if configured."""
         if self.service_mic_config.save_audio and self.service_mic_config.save_audio_path:
@@ -105,6 +127,7 @@ class MicService(ThreadedService):
 
         try:
             while not self._stop_event.is_set():
+                self.heartbeat()
                 try:
                     # Read single chunk, non-blocking exceptions
                     data = self.stream.read(self.chunk_size, exception_on_overflow=False)
@@ -119,6 +142,8 @@ class MicService(ThreadedService):
                         except queue.Empty:
                             pass
                             
+                    self.event_bus.publish(Topics.AUDIO_LEVEL, self.audio_level(data))
+
                     if self.wav_file:
                         self.wav_file.writeframes(data)
                         
@@ -155,5 +180,6 @@ class MicService(ThreadedService):
         """
         Update is not strictly required here if another component consumes via `read_mic()`, 
         but we implement it to satisfy BaseService abstract method.
+        The service never marks itself dirty, so the manager doesn't call it.
         """
         pass
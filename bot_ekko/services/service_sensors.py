@@ -1,4 +1,5 @@
 import json
+import logging
 import serial
 import time
 from typing import Optional, Dict, Union, Any
@@ -8,7 +9,10 @@ from bot_ekko.core.errors import SensorConnectionError
 from bot_ekko.core.models import SensorData, TOFSensorData, IMUSensorData, ServiceSensorConfig
 from bot_ekko.core.command_center import CommandCenter
 from bot_ekko.core.interrupts import InterruptHandler
+from bot_ekko.core.event_bus import EventBus, Topics
+from bot_ekko.core.recorder import RecordKind
 from bot_ekko.core.logger import get_logger
+from bot_ekko.sys_config import SERVICE_HEARTBEAT_TIMEOUT
 
 
 class SensorTriggers:
@@ -53,7 +57,8 @@ class SensorService(ThreadedService):
     """
     Service to interface with external hardware sensors via Serial (e.g. ESP32).
     """
-    def __init__(self, command_center: CommandCenter, service_sensor_config: ServiceSensorConfig, interrupt_handler: InterruptHandler) -> None:
+    def __init__(self, command_center: CommandCenter, service_sensor_config: ServiceSensorConfig, interrupt_handler: InterruptHandler,
+                 event_bus: Optional[EventBus] = None) -> None:
         """
         Initialize the Sensor Service.
 
@@ -61,6 +66,7 @@ class SensorService(ThreadedService):
             command_center (CommandCenter): For issuing downstream commands (unused currently but passed).
             service_sensor_config (ServiceSensorConfig): Configuration.
             interrupt_handler (InterruptHandler): For triggering immediate state interrupts.
+            event_bus (EventBus, optional): Bus readings are published to (sensor.tof, sensor.imu).
         """
         super().__init__(service_sensor_config.name, enabled=service_sensor_config.enabled)
         
@@ -71,8 +77,10 @@ class SensorService(ThreadedService):
 
         self.command_center = command_center
         self.interrupt_handler = interrupt_handler
+        self.event_bus = event_bus or EventBus()
 
         self.sensor_triggers = SensorTriggers(service_sensor_config.sensor_triggers)
+        self.heartbeat_timeout = SERVICE_HEARTBEAT_TIMEOUT
         
         # Initialize empty sensor data
         self.sensor_data = SensorData(
@@ -114,43 +122,14 @@ class SensorService(ThreadedService):
         self.logger.info("Sensor Service Loop Started")
         
         while not self._stop_event.is_set():
+            self.heartbeat()
             try:
                 if self.ser.in_waiting > 0:
-                    try:
-                        # 1. Read the JSON line from ESP32
-                        line = self.ser.readline().decode('utf-8').strip()
-                        if not line:
-                            continue
-                            
-                        raw_json = json.loads(line)
-                        
-                        # Update stats
-                        self.increment_stat("messages_received")
-                        
-                        vlox_sensor_data = raw_json.get('sensor_vlox', {}).get('data', {})
-                        imu_sensor_data = raw_json.get('sensor_imu', {}).get('data', {})
-                        
-                        self.sensor_data = SensorData(
-                            tof=TOFSensorData(
-                                mm=vlox_sensor_data.get('mm', 0),
-                                status=vlox_sensor_data.get('status', "NA")
-                            ),
-                            imu=IMUSensorData(
-                                ax=imu_sensor_data.get('ax', 0),
-                                ay=imu_sensor_data.get('ay', 0),
-                                az=imu_sensor_data.get('az', 0),
-                                status=imu_sensor_data.get('status', "NA")
-                            )
-                        )
-
-                    except (json.JSONDecodeError, UnicodeDecodeError):
-                        # Skip partial lines or serial noise
-                        self.increment_stat("decode_errors")
-                        continue
-                    except Exception as e:
-                        self.logger.error(f"Sensor Loop Error: {e}")
-                        self.increment_stat("processing_errors")
-                        self.update_stat("last_error", str(e))
+                    # 1. Read the JSON line from ESP32
+                    raw_line = self.ser.readline()
+                    if self.recorder:
+                        self.recorder.record(RecordKind.SENSOR_LINE, raw_line)
+                    self.handle_line(raw_line)
                 
                 # managing loop frequency
                 self._stop_event.wait(self.service_sensor_config.sensor_update_rate)
@@ -160,6 +139,69 @@ class SensorService(ThreadedService):
                 self.set_status(ServiceStatus.ERROR)
                 time.sleep(1) # Prevent tight loop on permanent error
 
+    def handle_line(self, raw_line: bytes) -> None:
+        """
+        Parses one line from the sensor board and publishes the readings.
+        Called from the service thread, or by the replayer with recorded lines.
+
+        Args:
+            raw_line (bytes): Raw serial line.
+        """
+        try:
+            line = raw_line.decode('utf-8').strip()
+            if not line:
+                return
+
+            raw_json = json.loads(line)
+            
+            # Update stats
+            self.increment_stat("messages_received")
+            
+            vlox_sensor_data = raw_json.get('sensor_vlox', {}).get('data', {})
+            imu_sensor_data = raw_json.get('sensor_imu', {}).get('data', {})
+            
+            self.sensor_data = SensorData(
+                tof=TOFSensorData(
+                    mm=vlox_sensor_data.get('mm', 0),
+                    status=vlox_sensor_data.get('status', "NA")
+                ),
+                imu=IMUSensorData(
+                    ax=imu_sensor_data.get('ax', 0),
+                    ay=imu_sensor_data.get('ay', 0),
+                    az=imu_sensor_data.get('az', 0),
+                    status=imu_sensor_data.get('status', "NA")
+                )
+            )
+            self.event_bus.publish(Topics.SENSOR_TOF, self.sensor_data.tof)
+            self.event_bus.publish(Topics.SENSOR_IMU, self.sensor_data.imu)
+            self.mark_dirty()
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # Skip partial lines or serial noise
+            self.increment_stat("decode_errors")
+        except Exception as e:
+            self.logger.error(f"Sensor Loop Error: {e}")
+            self.increment_stat("processing_errors")
+            self.update_stat("last_error", str(e))
+
+    def reconfigure(self, config: ServiceSensorConfig) -> bool:
+        """
+        Swaps thresholds, proximity duration and update rate in place.
+        A changed port, baud rate or name needs a new serial connection, so the service is recreated.
+
+        Args:
+            config (ServiceSensorConfig): The new configuration.
+
+        Returns:
+            bool: True if applied in place.
+        """
+        connection_fields = {"name", "port", "baud", "enabled"}
+        if config.model_dump(include=connection_fields) != self.service_sensor_config.model_dump(include=connection_fields):
+            return False
+        self.service_sensor_config = config
+        self.sensor_triggers = SensorTriggers(config.sensor_triggers)
+        self.logger.info(f"Sensor triggers reloaded: {config.sensor_triggers}")
+        return True
+
     def get_sensor_data(self) -> SensorData:
         return self.sensor_data
 
@@ -174,9 +216,10 @@ class SensorService(ThreadedService):
                 self.logger.error(f"Error closing serial port: {e}")
     
     def update(self) -> None:
-        """Checks sensor triggers and interrupts if needed."""
+        """Checks sensor triggers against a new reading and interrupts if needed."""
         sensor_data = self.get_sensor_data()
-        self.logger.debug(f"Sensor Data: {sensor_data}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Sensor Data: {sensor_data}")
 
         is_proximity_triggered = self.sensor_triggers.check_proximity(sensor_data)
 
@@ -6,7 +6,7 @@ from typing import Dict, Any, Union
 
 from bot_ekko.core.base import ThreadedService, ServiceStatus
 from bot_ekko.core.models import ServiceSystemLogsConfig
-from bot_ekko.sys_config import SYSTEM_LOG_FILE as DEFAULT_LOG_FILE
+from bot_ekko.sys_config import SYSTEM_LOG_FILE as DEFAULT_LOG_FILE, SERVICE_HEARTBEAT_TIMEOUT
 
 
 class SystemLogsService(ThreadedService):
@@ -23,6 +23,8 @@ class SystemLogsService(ThreadedService):
         super().__init__(service_config.name, enabled=service_config.enabled)
         self.config = service_config
         self.sample_rate = service_config.sample_rate
+        # The loop sleeps sample_rate seconds between heartbeats
+        self.heartbeat_timeout = max(SERVICE_HEARTBEAT_TIMEOUT, 3 * self.sample_rate)
         self.log_file = service_config.log_file or DEFAULT_LOG_FILE
 
         # CPU Usage Calculation State
@@ -41,6 +43,7 @@ class SystemLogsService(ThreadedService):
         self.logger.info("System Logs Service Loop Started")
 
         while not self._stop_event.is_set():
+            self.heartbeat()
             try:
                 stats = self._collect_stats()
                 self._log_stats(stats)
@@ -184,7 +187,7 @@ class SystemLogsService(ThreadedService):
             return 0.0
 
     def update(self) -> None:
-        """Empty update method as this service runs in a thread."""
+        """Empty update method as this service runs in a thread. Never marked dirty, so never called."""
         pass
 
     def stop(self) -> None:
@@ -47,12 +47,64 @@ SENSOR_TRIGGER_EXIT_TIME = 3000
 
 CANVAS_DURATION = 10
 
+# Number of saved state contexts (interrupts, media) kept for restoring
+STATE_HISTORY_SIZE = 8
+
+# Scheduler waits this long after startup (ms) unless the bot resumed from a checkpoint
+SCHEDULE_GRACE_MS = 2000
+# Longest time (ms) between schedule evaluations when no boundary or state change is due
+SCHEDULE_RECHECK_MS = 60000
+
+# WARM RESTART CHECKPOINT
+CHECKPOINT_FILE_PATH = "/tmp/ekko_state.ckpt"
+CHECKPOINT_INTERVAL_MS = 1000
+CHECKPOINT_MAX_AGE = 300  # seconds
+
+# EVENT BUS: events kept per topic before the oldest are dropped
+EVENT_BUS_CAPACITY = 256
+
+# STATE ARBITER: how long (ms) a gesture/BLE state request outranks lower priority sources
+STATE_CLAIM_HOLD_MS = 5000
+
+# GIF frame storage: "full" (one surface per frame) or "delta" (keyframe + changed rects)
+MEDIA_FRAME_STORAGE = "delta"
+
+# TEXT EFFECTS: "static", "typewriter", "marquee_v" or "marquee_h"
+CHAT_TEXT_EFFECT = "typewriter"
+TEXT_TYPEWRITER_SPEED = 30  # characters per second
+TEXT_MARQUEE_SPEED = 80     # pixels per second
+
+# MEDIA PREFETCH (seconds)
+MEDIA_PREFETCH_LOOKAHEAD = 120
+MEDIA_PREFETCH_SCAN_INTERVAL = 30
+
+# CONFIG HOT-RELOAD: seconds between checks of config.json's mtime
+CONFIG_WATCH_INTERVAL = 2.0
+
+# SERVICE SUPERVISOR (seconds)
+SUPERVISOR_INTERVAL = 1.0
+SUPERVISOR_BACKOFF_BASE = 1.0
+SUPERVISOR_BACKOFF_MAX = 60.0
+# A service that stays healthy this long after a restart starts over at the base backoff
+SUPERVISOR_STABLE_SECONDS = 30.0
+# Services whose loop heartbeat is older than this are considered hung
+SERVICE_HEARTBEAT_TIMEOUT = 10.0
+# How long a restart waits for the old service thread to exit
+SERVICE_STOP_TIMEOUT = 2.0
+# Per-service init timings of the last boot (JSON); None to only log them
+STARTUP_REPORT_PATH = "/tmp/ekko_startup.json"
+
+# METRICS EXPORTER (Prometheus text format, GET /metrics)
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9464
+
 # BLUETOOTH CONFIGURATION
 BLUETOOTH_NAME = "Ekko"
 
 # File Paths
 SCHEDULE_FILE_PATH = os.path.join(BASE_DIR, "bot_ekko", "config.json")
-DEFAULT_GIF_PATH = os.path.join(BASE_DIR, "bot_ekko", "assets", "anime.gif")
+ASSETS_DIR = os.path.join(BASE_DIR, "bot_ekko", "assets")
+DEFAULT_GIF_PATH = os.path.join(ASSETS_DIR, "anime.gif")
 
 # LOGGING CONFIGURATION
 LOG_LEVEL = "INFO"
@@ -0,0 +1,32 @@
+import argparse
+import os
+import sys
+
+# Add the project root to the path so we can run this directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from bot_ekko.modules.sprite_sheet import convert_gif_to_sprite_sheet
+from bot_ekko.sys_config import DEFAULT_GIF_PATH
+
+
+def main() -> None:
+    """
+    Converts GIFs into sprite sheets that MediaModule picks up automatically.
+
+    Usage:
+        python -m bot_ekko.tools.gif_to_sprites [gif ...] [--output-dir DIR] [--raw]
+    """
+    parser = argparse.ArgumentParser(description="Convert GIFs to sprite sheets (atlas + JSON manifest).")
+    parser.add_argument("gifs", nargs="*", default=[DEFAULT_GIF_PATH], help="GIF files to convert. Defaults to DEFAULT_GIF_PATH.")
+    parser.add_argument("--output-dir", default=None, help="Output directory. Defaults to each GIF's directory.")
+    parser.add_argument("--raw", action="store_true", help="Write an uncompressed RGBA atlas instead of PNG.")
+    args = parser.parse_args()
+
+    image_format = "raw" if args.raw else "png"
+    for gif_path in args.gifs:
+        manifest_path = convert_gif_to_sprite_sheet(gif_path, output_dir=args.output_dir, image_format=image_format)
+        print(manifest_path)
+
+
+if __name__ == "__main__":
+    main()
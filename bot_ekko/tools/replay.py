@@ -0,0 +1,183 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+# Add the project root to the path so we can run this directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from bot_ekko.core.clock import Clock, FixedStepClock, RealClock
+from bot_ekko.core.logger import get_logger
+from bot_ekko.core.mainbot import MainBotServicesManager
+from bot_ekko.core.models import CommandNames, SystemConfig
+from bot_ekko.core.recorder import (
+    RecordKind, decode_command, frame_time_stats, read_recording, summarize_recording
+)
+from bot_ekko.core.simulation import HeadlessBot
+
+logger = get_logger("Replay")
+
+REPLAY_MODES = ("inputs", "commands")
+
+
+class CommandLog:
+    """Stands in for the recorder on the replay's CommandCenter to collect the commands it issues."""
+    def __init__(self) -> None:
+        self.names: Counter = Counter()
+
+    def record_command(self, name: CommandNames, params: Optional[dict]) -> None:
+        self.names[name.value] += 1
+
+
+class ReplayBot(HeadlessBot):
+    """
+    The main loop of main_bot.py without a display or service threads.
+    Recorded inputs are fed to the services' parsers; commands go through the real CommandCenter.
+    """
+    def __init__(self, system_config: SystemConfig, clock: Optional[Clock] = None) -> None:
+        super().__init__(system_config, clock or RealClock(), media=True)
+
+        # Services are constructed for their parsers and update() only; they are never started
+        self.services = MainBotServicesManager(self.queue, self.interrupt_handler, self.state_handler,
+                                               self.command_center, self.event_bus)
+        self.services.init_services(system_config.services, include_disabled=True)
+        # A service whose native library is missing here is None; its records are skipped
+        self.input_services = [service for service in (self.services.service_sensor, self.services.service_gesture,
+                                                       self.services.service_bt) if service is not None]
+
+        self.command_log = CommandLog()
+        self.command_center.recorder = self.command_log
+
+    def feed(self, kind: int, payload: bytes, mode: str) -> None:
+        """
+        Delivers one recorded record.
+
+        Args:
+            kind (int): RecordKind.
+            payload (bytes): Recorded payload.
+            mode (str): "inputs" feeds raw service inputs, "commands" feeds recorded commands.
+        """
+        if mode == "commands":
+            if kind == RecordKind.COMMAND:
+                name, params = decode_command(payload)
+                if name == CommandNames.BATCH:
+                    self.command_center.issue_batch(params["commands"])
+                else:
+                    self.command_center.issue_command(name, params=params)
+            return
+
+        if kind == RecordKind.SENSOR_LINE and self.services.service_sensor:
+            self.services.service_sensor.handle_line(payload)
+        elif kind == RecordKind.GESTURE_PAYLOAD and self.services.service_gesture:
+            self.services.service_gesture.handle_payload(payload)
+        elif kind == RecordKind.BT_WRITE and self.services.service_bt:
+            self.services.service_bt.on_write(list(payload), {})
+
+    def update_inputs(self) -> None:
+        for service in self.input_services:
+            if service.consume_dirty():
+                service.update()
+
+
+def replay(path: str, system_config: SystemConfig, mode: str = "inputs", realtime: bool = False,
+           fps: int = 60, tail: float = 1.0) -> Dict[str, Any]:
+    """
+    Replays a recording headless.
+
+    Args:
+        path (str): Recording from `main_bot.py --record`.
+        system_config (SystemConfig): Config to build the bot with.
+        mode (str, optional): "inputs" or "commands". Defaults to "inputs".
+        realtime (bool, optional): Pace frames at `fps` like the real loop; otherwise run as fast as possible.
+        fps (int, optional): Frames per recorded second. Defaults to 60.
+        tail (float, optional): Seconds of frames to run after the last record. Defaults to 1.0.
+
+    Returns:
+        Dict[str, Any]: Frame timings (seconds per frame), their summary and command counts.
+    """
+    records = list(read_recording(path))
+    recorded_commands = Counter(
+        json.loads(payload)["name"] for _, kind, payload in records if kind == RecordKind.COMMAND
+    )
+    # Fast replays run on simulated time that follows the recording, so timers fire as they did when recorded
+    clock = RealClock() if realtime else FixedStepClock()
+    bot = ReplayBot(system_config, clock)
+
+    frame_dt = 1.0 / fps
+    duration = (records[-1][0] if records else 0.0) + tail
+    frame_times: List[float] = []
+    index = 0
+    frame = 0
+    start = time.perf_counter()
+    try:
+        while frame * frame_dt <= duration:
+            frame_time = frame * frame_dt
+            if realtime:
+                delay = start + frame_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            else:
+                clock.advance(round(frame_time * 1000) - clock.ticks())
+            while index < len(records) and records[index][0] <= frame_time:
+                _, kind, payload = records[index]
+                bot.feed(kind, payload, mode)
+                index += 1
+
+            frame_start = time.perf_counter()
+            bot.step()
+            frame_times.append(time.perf_counter() - frame_start)
+            frame += 1
+    finally:
+        bot.stop()
+
+    return {
+        "recording": summarize_recording(path),
+        "mode": mode,
+        "realtime": realtime,
+        "wall_time": time.perf_counter() - start,
+        "frame_stats": frame_time_stats(frame_times),
+        "commands": {"recorded": dict(recorded_commands), "replayed": dict(bot.command_log.names)},
+        "frame_times": frame_times,
+    }
+
+
+def main() -> None:
+    """
+    Replays a recording and reports per-frame timings.
+
+    Usage:
+        python -m bot_ekko.tools.replay <recording> [--mode inputs|commands] [--realtime]
+            [--timings out.json] [--baseline previous.json]
+    """
+    parser = argparse.ArgumentParser(description="Replay a recorded command/input stream headless.")
+    parser.add_argument("recording", help="File written by main_bot.py --record.")
+    parser.add_argument("--config", default="bot_ekko/config.json", help="Path to config.json.")
+    parser.add_argument("--mode", choices=REPLAY_MODES, default="inputs",
+                        help="inputs: feed raw service inputs; commands: feed the recorded commands.")
+    parser.add_argument("--realtime", action="store_true", help="Pace frames like the real loop.")
+    parser.add_argument("--fps", type=int, default=60, help="Frames per recorded second.")
+    parser.add_argument("--timings", help="Write the result with per-frame timings to this JSON file.")
+    parser.add_argument("--baseline", help="Timings JSON of another build to compare against.")
+    args = parser.parse_args()
+
+    result = replay(args.recording, SystemConfig.from_json_file(args.config), mode=args.mode,
+                    realtime=args.realtime, fps=args.fps)
+    if args.timings:
+        with open(args.timings, "w") as f:
+            json.dump(result, f)
+
+    report = {key: value for key, value in result.items() if key != "frame_times"}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["frame_stats"]
+        report["vs_baseline"] = {
+            key: value - baseline[key] for key, value in result["frame_stats"].items() if key in baseline
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
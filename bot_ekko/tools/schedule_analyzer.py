@@ -0,0 +1,261 @@
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Add the project root to the path so we can run this directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from bot_ekko.core.cron import MINUTES_PER_DAY, CronSpec
+from bot_ekko.core.models import SystemConfig
+from bot_ekko.core.scheduler import ScheduledEvent, Scheduler
+from bot_ekko.core.state_registry import StateRegistry
+
+# State the bot returns to when a schedule ends (SLEEPING goes through WAKING first)
+IDLE_STATE = StateRegistry.ACTIVE
+
+
+def _weekdays_of(first_day: date, days: int) -> np.ndarray:
+    """Cron weekday (0 = Sunday) of each of `days` days starting at first_day."""
+    return (np.arange(days) + (first_day.weekday() + 1)) % 7
+
+
+def _bits(mask: int, width: int) -> np.ndarray:
+    """Expands an int bitset into a bool array of `width` entries (bit n -> index n)."""
+    raw = np.frombuffer(mask.to_bytes((width + 7) // 8, "little"), dtype=np.uint8)
+    return np.unpackbits(raw, bitorder="little")[:width].astype(bool)
+
+
+def _cron_activity(spec: CronSpec, duration: float, start: datetime, minutes: int) -> np.ndarray:
+    # A firing at minute f covers minute t (evaluated at second 0) if 0 <= t - f < duration / 60
+    window = max(1, math.ceil(duration / 60))
+    pad_days = math.ceil((window - 1) / MINUTES_PER_DAY)
+    first_day = start.date() - timedelta(days=pad_days)
+    days = pad_days + math.ceil(minutes / MINUTES_PER_DAY)
+
+    day_match = np.array([spec.matches_day(first_day + timedelta(days=d)) for d in range(days)], dtype=bool)
+    fires = (day_match[:, None] & _bits(spec.minutes, MINUTES_PER_DAY)[None, :]).ravel()
+
+    # Sliding-window OR via a running count of firings
+    counts = np.concatenate(([0], np.cumsum(fires, dtype=np.int64)))
+    offset = pad_days * MINUTES_PER_DAY
+    t = np.arange(offset, offset + minutes)
+    return counts[t + 1] - counts[np.maximum(t + 1 - window, 0)] > 0
+
+
+def activity_matrix(events: List[ScheduledEvent], start: datetime, minutes: int) -> np.ndarray:
+    """
+    Evaluates when each event is active, at the start of every minute, without a per-minute loop.
+
+    Args:
+        events (List[ScheduledEvent]): Compiled events.
+        start (datetime): First minute (midnight).
+        minutes (int): Number of minutes.
+
+    Returns:
+        np.ndarray: Bool array (len(events), minutes); [i, t] is events[i].is_active(start + t minutes).
+    """
+    axis = np.arange(minutes)
+    minute_of_day = axis % MINUTES_PER_DAY
+    day = axis // MINUTES_PER_DAY
+    days = int(day[-1]) + 1 if minutes else 0
+    # Index 0 is the day before start, for windows that began yesterday
+    weekdays = _weekdays_of(start.date() - timedelta(days=1), days + 1)
+
+    matrix = np.zeros((len(events), minutes), dtype=bool)
+    for row, event in enumerate(events):
+        if event.kind == "date":
+            first = math.ceil((event.start_dt - start).total_seconds() / 60)
+            last = math.ceil((event.end_dt - start).total_seconds() / 60)
+            matrix[row, max(first, 0):max(min(last, minutes), 0)] = True
+        elif event.kind == "daily":
+            on_day = np.ones(days + 1, dtype=bool) if not event.weekdays else \
+                (event.weekdays >> weekdays) & 1 == 1
+            if event.start_minute > event.end_minute:  # Spans midnight
+                matrix[row] = ((minute_of_day >= event.start_minute) & on_day[day + 1]) | \
+                              ((minute_of_day < event.end_minute) & on_day[day])
+            else:
+                matrix[row] = (minute_of_day >= event.start_minute) & (minute_of_day < event.end_minute) & \
+                              on_day[day + 1]
+        elif event.kind == "hourly":
+            matrix[row] = (minute_of_day % 60) * 60 < event.duration
+        elif event.spec is not None:
+            matrix[row] = _cron_activity(event.spec, event.duration, start, minutes)
+    return matrix
+
+
+def _settle(events: List[ScheduledEvent], active: List[int], state: str, driven: bool) -> Tuple[str, Optional[int]]:
+    """
+    The state the scheduler leaves the bot in while this set of events is active.
+    Mirrors Scheduler.get_target_state() plus the renderer's revert to ACTIVE when a schedule ends.
+
+    Returns:
+        Tuple[str, Optional[int]]: (state, index of the event holding it or None).
+    """
+    for _ in range(2):
+        for index in active:
+            event = events[index]
+            if state == event.state or state in event.interruptible:
+                return event.state, index
+        if not driven:
+            return state, None
+        state, driven = IDLE_STATE, False
+    return state, None
+
+
+def analyze(schedules: List[Dict[str, Any]], start: date, end: date, initial_state: str = IDLE_STATE) -> Dict[str, Any]:
+    """
+    Evaluates a schedule minute by minute over [start, end).
+
+    Event activity is computed with NumPy over the whole minute axis; the state recurrence
+    (which depends on the previous state through interruptible_states) only runs once per
+    stretch of minutes with the same set of active events.
+
+    Args:
+        schedules (List[Dict]): The "schedules" entries of config.json.
+        start (date): First day.
+        end (date): Day after the last one.
+        initial_state (str, optional): State at the start. Defaults to ACTIVE.
+
+    Returns:
+        Dict[str, Any]: "timeline" (effective state segments), "events" (active/effective minutes per event),
+            "overlaps", "shadowed" and "unreachable" events, and "elapsed" seconds.
+    """
+    started = time.perf_counter()
+    events = Scheduler([dict(event) for event in schedules]).compiled
+    start_dt = datetime.combine(start, datetime.min.time())
+    minutes = max(0, (end - start).days) * MINUTES_PER_DAY
+    matrix = activity_matrix(events, start_dt, minutes)
+
+    # Stretches where the set of active events is constant
+    if minutes:
+        changes = np.flatnonzero(np.any(matrix[:, 1:] != matrix[:, :-1], axis=0)) + 1
+        bounds = np.concatenate(([0], changes, [minutes])).tolist()
+    else:
+        bounds = [0]
+
+    timeline: List[Dict[str, Any]] = []
+    effective = Counter()
+    shadowed_by: Dict[int, Counter] = defaultdict(Counter)
+    state, driven = initial_state, False
+    for seg_start, seg_end in zip(bounds, bounds[1:]):
+        active = np.flatnonzero(matrix[:, seg_start]).tolist()
+        state, winner = _settle(events, active, state, driven)
+        driven = winner is not None
+        length = seg_end - seg_start
+        if winner is not None:
+            effective[winner] += length
+        for index in active:
+            if index != winner:
+                shadowed_by[index][events[winner].name if winner is not None else None] += length
+
+        name = events[winner].name if winner is not None else None
+        if timeline and timeline[-1]["state"] == state and timeline[-1]["event"] == name:
+            timeline[-1]["end"] = seg_end
+        else:
+            timeline.append({"start": seg_start, "end": seg_end, "state": state, "event": name})
+
+    for segment in timeline:
+        segment["start"] = (start_dt + timedelta(minutes=segment["start"])).isoformat()
+        segment["end"] = (start_dt + timedelta(minutes=segment["end"])).isoformat()
+
+    active_minutes = matrix.sum(axis=1)
+    counts = matrix.astype(np.float32)
+    overlap_minutes = counts @ counts.T
+    overlaps = []
+    for i in range(len(events)):
+        for j in range(i + 1, len(events)):
+            if overlap_minutes[i, j] > 0:
+                first = int(np.argmax(matrix[i] & matrix[j]))
+                overlaps.append({
+                    "events": [events[i].name, events[j].name],
+                    "minutes": int(overlap_minutes[i, j]),
+                    "first": (start_dt + timedelta(minutes=first)).isoformat(),
+                })
+
+    report_events = []
+    shadowed = []
+    unreachable = []
+    for index, event in enumerate(events):
+        report_events.append({
+            "name": event.name, "type": event.kind, "state": event.state, "priority": event.priority,
+            "active_minutes": int(active_minutes[index]), "effective_minutes": effective[index],
+        })
+        outranked = {name: count for name, count in shadowed_by[index].items() if name is not None}
+        if outranked:
+            shadowed.append({"event": event.name, "by": outranked})
+        if effective[index] == 0:
+            if active_minutes[index] == 0:
+                reason = "never active in range"
+            elif outranked:
+                reason = "always outranked"
+            else:
+                reason = "interruptible_states never match"
+            unreachable.append({"event": event.name, "reason": reason})
+
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "minutes": minutes,
+        "timeline": timeline,
+        "events": report_events,
+        "overlaps": overlaps,
+        "shadowed": shadowed,
+        "unreachable": unreachable,
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+def main() -> None:
+    """
+    Analyzes the schedule in a config file over a date range.
+
+    Usage:
+        python -m bot_ekko.tools.schedule_analyzer [--config bot_ekko/config.json] [--start 2026-01-01]
+            [--days 365] [--timeline] [--format text|json]
+    """
+    parser = argparse.ArgumentParser(description="Evaluate the schedule offline and report conflicts.")
+    parser.add_argument("--config", default="bot_ekko/config.json", help="Path to config.json.")
+    parser.add_argument("--start", type=date.fromisoformat, default=date.today(), help="First day (YYYY-MM-DD).")
+    parser.add_argument("--days", type=int, default=365, help="Number of days to evaluate.")
+    parser.add_argument("--initial-state", default=IDLE_STATE, help="State at the start of the range.")
+    parser.add_argument("--timeline", action="store_true", help="Include the effective state timeline.")
+    parser.add_argument("--format", choices=("text", "json"), default="text", help="Output format.")
+    args = parser.parse_args()
+
+    report = analyze(SystemConfig.from_json_file(args.config).schedules, args.start,
+                     args.start + timedelta(days=args.days), args.initial_state)
+    if not args.timeline:
+        report.pop("timeline")
+
+    if args.format == "json":
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{report['start']} .. {report['end']}: {report['minutes']} minutes in {report['elapsed'] * 1000:.1f} ms")
+    for segment in report.get("timeline", []):
+        print(f"  {segment['start']} - {segment['end']}  {segment['state']:<10} {segment['event'] or ''}")
+    print("Events:")
+    for event in report["events"]:
+        print(f"  {event['name']:<24} P:{event['priority']:<3} {event['state']:<10} "
+              f"active {event['active_minutes']:>7} min, shown {event['effective_minutes']:>7} min")
+    print("Overlaps:")
+    for overlap in report["overlaps"]:
+        print(f"  {' / '.join(overlap['events'])}: {overlap['minutes']} min (first {overlap['first']})")
+    print("Shadowed:")
+    for item in report["shadowed"]:
+        print(f"  {item['event']} by " + ", ".join(f"{name} ({count} min)" for name, count in item["by"].items()))
+    print("Unreachable:")
+    for item in report["unreachable"]:
+        print(f"  {item['event']}: {item['reason']}")
+
+
+if __name__ == "__main__":
+    main()
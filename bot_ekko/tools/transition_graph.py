@@ -0,0 +1,56 @@
+import argparse
+import json
+import os
+import sys
+
+# Add the project root to the path so we can run this directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from bot_ekko.core.models import SystemConfig
+from bot_ekko.core.transitions import TransitionGraph
+
+
+def to_dot(graph: TransitionGraph) -> str:
+    """
+    Renders the explicit rules of a compiled graph as Graphviz DOT.
+
+    Args:
+        graph (TransitionGraph): A compiled graph.
+
+    Returns:
+        str: DOT source. Denied edges are dashed red, redirects point at their target.
+    """
+    lines = ["digraph transitions {", f'  label="default: {graph.config.default_action}";']
+    for from_state, to_state, action, target, guard in graph.edges():
+        label = f"{action}" + (f" [{guard}]" if guard else "")
+        if action == "redirect":
+            lines.append(f'  "{from_state}" -> "{target}" [label="{to_state}: {label}", color=blue];')
+        elif action == "deny":
+            lines.append(f'  "{from_state}" -> "{to_state}" [label="{label}", style=dashed, color=red];')
+        else:
+            lines.append(f'  "{from_state}" -> "{to_state}" [label="{label}"];')
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """
+    Prints the compiled state transition graph from a config file.
+
+    Usage:
+        python -m bot_ekko.tools.transition_graph [--config bot_ekko/config.json] [--format json|dot]
+    """
+    parser = argparse.ArgumentParser(description="Print the compiled state transition graph.")
+    parser.add_argument("--config", default="bot_ekko/config.json", help="Path to config.json.")
+    parser.add_argument("--format", choices=("json", "dot"), default="json", help="Output format.")
+    args = parser.parse_args()
+
+    graph = TransitionGraph(SystemConfig.from_json_file(args.config).transitions).compile()
+    if args.format == "dot":
+        print(to_dot(graph))
+    else:
+        print(json.dumps(graph.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
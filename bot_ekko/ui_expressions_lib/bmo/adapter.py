@@ -1,10 +1,9 @@
 import pygame
-import random
 from typing import Dict, Any, Optional
 
 from bot_ekko.core.base import BaseStateRenderer
 from bot_ekko.core.state_registry import StateRegistry
-from bot_ekko.core.models import CommandNames
+from bot_ekko.core.arbiter import ClaimSource
 from bot_ekko.core.logger import get_logger
 from bot_ekko.ui_expressions_lib.bmo.physics import BMOPhysics
 from bot_ekko.ui_expressions_lib.bmo.expressions import BMOExpressions
@@ -27,14 +26,15 @@ BMO_STATE_DATA = {
 }
 
 class MainAdapter(BaseStateRenderer):
-    def __init__(self, state_machine):
-        super().__init__(state_machine)
+    def __init__(self, state_machine, clock=None):
+        super().__init__(state_machine, clock)
         self.state_machine = state_machine
         self.state_handler = None
         self.command_center = None
         
         # Init Components
         self.physics = BMOPhysics(self.state_machine)
+        self.physics.clock = self.clock
         self.expressions = BMOExpressions(self.physics, self.state_machine)
         self.movements = BaseMovements(self.physics)
         
@@ -76,33 +76,36 @@ class MainAdapter(BaseStateRenderer):
     def handle_fallback(self, surface: pygame.Surface, now: int):
         self.expressions.draw_default(surface)
 
+    physics_fields = ("target_x", "target_y", "curr_lx", "curr_ly", "curr_rx", "curr_ry",
+                      "blink_phase", "blink_progress")
+
+    def get_physics_engine(self):
+        return self.physics
+
     def random_blink(self, surface, now):
-        if self.physics.blink_phase == "IDLE" and (now - self.last_blink > random.randint(3000, 9000)):
+        if self.physics.blink_phase == "IDLE" and (now - self.last_blink > self.clock.random.randint(3000, 9000)):
             self.physics.blink_phase = "CLOSING"
             self.last_blink = now
 
     def handle_ACTIVE(self, surface: pygame.Surface, now: int, params=None):
         # 1. Random Gaze
-        if now - self.last_gaze > random.randint(5000, 10000):
-            self.physics.target_x = random.randint(-40, 40)
-            self.physics.target_y = random.randint(-40, 40)
+        if now - self.last_gaze > self.clock.random.randint(5000, 10000):
+            self.physics.target_x = self.clock.random.randint(-40, 40)
+            self.physics.target_y = self.clock.random.randint(-40, 40)
             self.last_gaze = now
 
         # 2. Random Blink
         self.random_blink(surface, now)
 
         # 3. Random Mood (Smile)
-        if now - self.last_mood_change > random.randint(8000, 15000):
-            if random.random() > 0.6:
+        if now - self.last_mood_change > self.clock.random.randint(8000, 15000):
+            if self.clock.random.random() > 0.6:
                 logger.info("Triggering HAPPY state (Smiling) from random mood")
                 
                 # Randomly pick a variant: "closed_eyes" or "open_eyes"
-                variant = "closed_eyes" if random.random() > 0.5 else "open_eyes"
+                variant = "closed_eyes" if self.clock.random.random() > 0.5 else "open_eyes"
                 
-                self.command_center.issue_command(CommandNames.CHANGE_STATE, params={
-                    "target_state": StateRegistry.HAPPY,
-                    "variant": variant
-                })
+                self.command_center.request_state(ClaimSource.ADAPTER, StateRegistry.HAPPY, {"variant": variant})
                 self.last_mood_change = now
 
         self.expressions.draw_default(surface)
@@ -116,10 +119,10 @@ class MainAdapter(BaseStateRenderer):
         # We check entry time of state
         if self.state_handler:
              elapsed = now - self.state_handler.state_entry_time
-             if elapsed > random.randint(2000, 5000):
-                 if random.random() > 0.05: # Small chance per frame once duration passed? No, deterministic once time passed.
+             if elapsed > self.clock.random.randint(2000, 5000):
+                 if self.clock.random.random() > 0.05: # Small chance per frame once duration passed? No, deterministic once time passed.
                      logger.info("Triggering ACTIVE state from HAPPY (Done smiling)")
-                     self.command_center.issue_command(CommandNames.CHANGE_STATE, params={"target_state": StateRegistry.ACTIVE})
+                     self.command_center.request_state(ClaimSource.ADAPTER, StateRegistry.ACTIVE)
                      self.last_mood_change = now
 
         self.expressions.draw_happy(surface, eyes_closed=eyes_closed)
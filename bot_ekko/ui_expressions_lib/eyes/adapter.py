@@ -1,17 +1,18 @@
-import random
 import math
 import pygame
-from datetime import datetime
 from typing import Dict, Any, Optional
 
 from bot_ekko.ui_expressions_lib.eyes.expressions import EyesExpressions
 from bot_ekko.core.base import BaseStateRenderer
 from bot_ekko.ui_expressions_lib.eyes.physics import Eyes
 from bot_ekko.core.logger import get_logger
-from bot_ekko.core.models import CommandNames, StateContext
+from bot_ekko.core.arbiter import ClaimSource
 from bot_ekko.sys_config import *
 from bot_ekko.core.state_registry import StateRegistry
 from bot_ekko.modules.effects import EffectsRenderer
+from bot_ekko.modules.media_interface import resolve_canvas_media
+from bot_ekko.modules.media_playlist import PlaylistItem
+from bot_ekko.modules.text_effects import TextEffect
 from bot_ekko.core.movements import BaseMovements
 
 # STATE DATA: Each state maps to physics parameters for the eyes.
@@ -42,14 +43,15 @@ DEFAULT_EYE_STATES = {
 logger = get_logger("MainAdapter")
 
 class MainAdapter(BaseStateRenderer):
-    def __init__(self, state_machine):
-        super().__init__(state_machine)
+    def __init__(self, state_machine, clock=None):
+        super().__init__(state_machine, clock)
         self.state_machine = state_machine
         self.state_handler = None
         self.command_center = None
         
         # Initialize internal components
         self.eyes = Eyes(self.state_machine)
+        self.eyes.clock = self.clock
         self.expressions = EyesExpressions(self.eyes, self.state_machine)
         
         # Register states
@@ -67,6 +69,11 @@ class MainAdapter(BaseStateRenderer):
         self.movements = BaseMovements(self.eyes)
         
         self.media_player = None 
+        self._canvas_params = None
+        # CHAT text effect: (text, effect) it was built for, the effect and its start tick
+        self._chat_key = None
+        self._chat_effect = None
+        self._chat_start = 0
 
     def set_dependencies(self, state_handler, command_center, system_config=None):
         super().set_dependencies(state_handler, command_center, system_config)
@@ -86,6 +93,12 @@ class MainAdapter(BaseStateRenderer):
          # Fallback to standard eyes if no specific handler
          self.expressions.draw_generic(surface)
 
+    physics_fields = ("target_x", "target_y", "curr_lx", "curr_ly", "curr_rx", "curr_ry",
+                      "curr_lh", "curr_rh", "blink_phase")
+
+    def get_physics_engine(self):
+        return self.eyes
+
     def get_physics_state(self) -> Dict[str, Any]:
         """Return current eyes state."""
         return {
@@ -118,23 +131,23 @@ class MainAdapter(BaseStateRenderer):
     # --- Render Handlers (Moved from StateRenderer) ---
 
     def random_blink(self, surface, now):
-        if self.eyes.blink_phase == "IDLE" and (now - self.last_blink > random.randint(3000, 9000)):
+        if self.eyes.blink_phase == "IDLE" and (now - self.last_blink > self.clock.random.randint(3000, 9000)):
             self.eyes.blink_phase = "CLOSING"
             self.last_blink = now
 
     def handle_ACTIVE(self, surface, now, params=None):
         # --- LOGIC ---
         # 1. Random Gaze
-        if now - self.eyes.last_gaze > random.randint(5000, 10000):
-            self.eyes.target_x = random.randint(-100, 100)
-            self.eyes.target_y = random.randint(-40, 40)
+        if now - self.eyes.last_gaze > self.clock.random.randint(5000, 10000):
+            self.eyes.target_x = self.clock.random.randint(-100, 100)
+            self.eyes.target_y = self.clock.random.randint(-40, 40)
             self.eyes.last_gaze = now
 
         # 2. Random Mood (Squint)
-        if now - self.last_mood_change > random.randint(5000, 12000):
-            if random.random() > 0.6:
+        if now - self.last_mood_change > self.clock.random.randint(5000, 12000):
+            if self.clock.random.random() > 0.6:
                 logger.info("Triggering SQUINTING state from random mood")
-                self.command_center.issue_command(CommandNames.CHANGE_STATE, params={"target_state": StateRegistry.SQUINTING})
+                self.command_center.request_state(ClaimSource.ADAPTER, StateRegistry.SQUINTING)
                 self.last_mood_change = now
 
         # 3. Random Blink
@@ -156,9 +169,9 @@ class MainAdapter(BaseStateRenderer):
         
     def handle_EXCITED(self, surface, now, params=None):
         # Jittery gaze
-        if now - self.eyes.last_gaze > random.randint(200, 500):
-            self.eyes.target_x = random.randint(-20, 20)
-            self.eyes.target_y = random.randint(-20, 20)
+        if now - self.eyes.last_gaze > self.clock.random.randint(200, 500):
+            self.eyes.target_x = self.clock.random.randint(-20, 20)
+            self.eyes.target_y = self.clock.random.randint(-20, 20)
             self.eyes.last_gaze = now
             
         self.random_blink(surface, now)
@@ -173,7 +186,7 @@ class MainAdapter(BaseStateRenderer):
         # Static wide stare
         self.movements.look_center()
         # Rare blink
-        if self.eyes.blink_phase == "IDLE" and (now - self.last_blink > random.randint(5000, 15000)):
+        if self.eyes.blink_phase == "IDLE" and (now - self.last_blink > self.clock.random.randint(5000, 15000)):
             self.eyes.blink_phase = "CLOSING"
             self.last_blink = now
             
@@ -182,9 +195,9 @@ class MainAdapter(BaseStateRenderer):
     def handle_CONFUSED(self, surface, now, params=None):
         # Asymmetric eyes handled by physics (confused state params)
         # Maybe slow look around
-        if now - self.eyes.last_gaze > random.randint(3000, 6000):
-            self.eyes.target_x = random.randint(-40, 40)
-            self.eyes.target_y = random.randint(-20, 20)
+        if now - self.eyes.last_gaze > self.clock.random.randint(3000, 6000):
+            self.eyes.target_x = self.clock.random.randint(-40, 40)
+            self.eyes.target_y = self.clock.random.randint(-20, 20)
             self.eyes.last_gaze = now
             
         self.random_blink(surface, now)
@@ -192,37 +205,60 @@ class MainAdapter(BaseStateRenderer):
 
     def handle_SQUINTING(self, surface, now, params=None):
         # --- LOGIC ---
-        if now - self.eyes.last_gaze > random.randint(2000, 5000):
-            self.eyes.target_x = random.randint(-100, 100)
-            self.eyes.target_y = random.randint(-40, 40)
+        if now - self.eyes.last_gaze > self.clock.random.randint(2000, 5000):
+            self.eyes.target_x = self.clock.random.randint(-100, 100)
+            self.eyes.target_y = self.clock.random.randint(-40, 40)
             self.eyes.last_gaze = now
             
-        if now - self.last_mood_change > random.randint(2000, 5000):
+        if now - self.last_mood_change > self.clock.random.randint(2000, 5000):
             logger.info("Triggering ACTIVE state from random mood")
-            self.command_center.issue_command(CommandNames.CHANGE_STATE, params={"target_state": StateRegistry.ACTIVE})
+            self.command_center.request_state(ClaimSource.ADAPTER, StateRegistry.ACTIVE)
             self.last_mood_change = now
             
         # --- RENDERING ---
         self.expressions.draw_generic(surface)
     
     def handle_CANVAS(self, surface, now, params=None):
-        if self.media_player and self.media_player.is_playing:
+        if not self.media_player:
+            return
+
+        # New params with "enqueue" while media plays (BLE, Tenor, schedules) join the playlist
+        if params is not self._canvas_params:
+            self._canvas_params = params
+            if params and params.get("enqueue") and self.media_player.is_playing:
+                for item in self._playlist_items(params):
+                    self.media_player.enqueue(item)
+
+        if self.media_player.is_playing:
             self.media_player.update(surface)
             return
 
-        if self.media_player:
-            interrupt_name = params.get('interrupt_name') if params else None
-            text = None
-            if params and 'param' in params and isinstance(params['param'], dict):
-                 text = params['param'].get('text')
-            
-            duration = params.get("duration", CANVAS_DURATION) if params else CANVAS_DURATION
-            
-            if text:
-                self.media_player.show_text(text, duration=duration, save_context=False, interrupt_name=interrupt_name)
-            else:
-                gif_path = params.get("media_path", DEFAULT_GIF_PATH) if params else DEFAULT_GIF_PATH
-                self.media_player.play_gif(gif_path, duration=duration, save_context=False, interrupt_name=interrupt_name)
+        interrupt_name = params.get('interrupt_name') if params else None
+        duration = params.get("duration", CANVAS_DURATION) if params else CANVAS_DURATION
+        kind, value = resolve_canvas_media(params)
+
+        if kind == "playlist":
+            self.media_player.play_playlist(value, interrupt_name=interrupt_name)
+        elif kind == "text":
+            self.media_player.show_text(value, duration=duration, save_context=False, interrupt_name=interrupt_name,
+                                        effect=params.get("effect", "static"), speed=params.get("speed"))
+        elif kind == "image":
+            self.media_player.show_image(value, duration=duration, save_context=False, interrupt_name=interrupt_name)
+        else:
+            self.media_player.play_gif(value, duration=duration, save_context=False, interrupt_name=interrupt_name)
+
+    def _playlist_items(self, params):
+        """Turns CANVAS params (single media or playlist) into playlist items."""
+        kind, value = resolve_canvas_media(params)
+        if kind == "playlist":
+            return value
+        return [PlaylistItem(
+            kind=kind,
+            value=value,
+            duration=params.get("duration", CANVAS_DURATION),
+            transition=params.get("transition", "cut"),
+            effect=params.get("effect", "static"),
+        )]
 
     def handle_ANGRY(self, surface, now, params=None):
         self.movements.look_center()
@@ -231,8 +267,8 @@ class MainAdapter(BaseStateRenderer):
 
     def handle_SCARED(self, surface, now, params=None):
         # --- LOGIC ---
-        self.eyes.target_x = random.randint(-40, 40)
-        self.eyes.target_y = random.randint(-20, 20)
+        self.eyes.target_x = self.clock.random.randint(-40, 40)
+        self.eyes.target_y = self.clock.random.randint(-20, 20)
         self.eyes.last_gaze = now
 
         self.random_blink(surface, now)
@@ -280,11 +316,15 @@ class MainAdapter(BaseStateRenderer):
             except ImportError:
                 font = MAIN_FONT
              
-            # assuming media_player exposes this util or we duplicate/move it
-            if self.media_player:   
-                surf = self.media_player._render_wrapped_text(text, font, CYAN, LOGICAL_W - 40)
-                rect = surf.get_rect(center=(center_x, center_y))
-                surface.blit(surf, rect)
+            if self.media_player:
+                # Text is rasterized once per reply; frames only reveal / scroll the strip
+                effect = params.get("effect", CHAT_TEXT_EFFECT)
+                if self._chat_key != (text, effect):
+                    strip = self.media_player.get_text_strip(text, font, single_line=effect == "marquee_h")
+                    self._chat_effect = TextEffect(strip, effect, params.get("speed"))
+                    self._chat_key = (text, effect)
+                    self._chat_start = now
+                self._chat_effect.draw(surface, (now - self._chat_start) / 1000.0)
 
     def handle_WINK(self, surface, now, params=None):
         cycle_time = (now - self.state_handler.state_entry_time) % 4000
@@ -323,16 +363,16 @@ class MainAdapter(BaseStateRenderer):
         elapsed = now - self.state_handler.state_entry_time
         if elapsed < 1500: # Stage 0: Jitter
             self.wake_stage = 0
-            self.eyes.target_x = random.randint(-25, 25)
-            self.eyes.target_y = random.randint(-25, 25)
-            if random.random() > 0.7: self.eyes.blink_phase = "CLOSING"
+            self.eyes.target_x = self.clock.random.randint(-25, 25)
+            self.eyes.target_y = self.clock.random.randint(-25, 25)
+            if self.clock.random.random() > 0.7: self.eyes.blink_phase = "CLOSING"
         elif elapsed < 4000: # Stage 1: Confusion
             self.wake_stage = 1
             self.eyes.target_x = -50
             self.eyes.curr_lh, self.eyes.curr_rh = 140, 60 
         else: # Stage 2: Fully Awake
             logger.info("Triggering ACTIVE state from WAKING")
-            self.command_center.issue_command(CommandNames.CHANGE_STATE, params={"target_state": StateRegistry.ACTIVE})
+            self.command_center.request_state(ClaimSource.ADAPTER, StateRegistry.ACTIVE)
             self.last_mood_change = now
             
         self.expressions.draw_generic(surface)
@@ -342,8 +382,7 @@ class MainAdapter(BaseStateRenderer):
 
     def handle_FUNNY(self, surface, now, params=None):
         if self.media_player and not self.media_player.is_playing:
-            fallback_ctx = StateContext(state=StateRegistry.ACTIVE, state_entry_time=now, x=0, y=0)
-            self.state_handler.state_history.append(fallback_ctx)
+            self.state_handler.save_state_ctx(state=StateRegistry.ACTIVE, state_entry_time=now)
             self.media_player.play_gif(DEFAULT_GIF_PATH, duration=5.0, save_context=False)
             
         if self.media_player and self.media_player.is_playing:
@@ -353,7 +392,7 @@ class MainAdapter(BaseStateRenderer):
         if not self.media_player:
             return
 
-        current_time = datetime.now().strftime("%I:%M %p") 
+        current_time = self.clock.now().strftime("%I:%M %p") 
         if current_time.startswith("0"):
             current_time = current_time[1:] 
             
@@ -367,7 +406,7 @@ class MainAdapter(BaseStateRenderer):
 
     # --- Drawing Helpers (Delegated to EyesExpressions) ---
     def _update_particles(self, now):
-        if random.random() < 0.03:
+        if self.clock.random.random() < 0.03:
             # X, Y, Alpha
             self.particles.append([self.eyes.base_rx + 40, self.eyes.base_ry - 40, 255])
         for p in self.particles[:]:
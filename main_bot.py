@@ -1,12 +1,14 @@
+import argparse
 import pygame
 import sys
 import signal
 import queue
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from bot_ekko.sys_config import PHYSICAL_W, PHYSICAL_H, LOGICAL_W, LOGICAL_H, BLACK, SYSTEM_MONITORING_ENABLED
+from bot_ekko.sys_config import PHYSICAL_W, PHYSICAL_H, LOGICAL_W, LOGICAL_H, BLACK, SYSTEM_MONITORING_ENABLED, EVENT_BUS_CAPACITY
 from bot_ekko.core.logger import get_logger
 
 # Core Components
@@ -21,17 +23,35 @@ from bot_ekko.sys_config import SCREEN_ROTATION
 from bot_ekko.core.mainbot import MainBotServicesManager
 from bot_ekko.core.models import SystemConfig
 from bot_ekko.core.interrupts import InterruptHandler
+from bot_ekko.core.transitions import TransitionGraph
+from bot_ekko.core.checkpoint import StateCheckpointer
+from bot_ekko.core.event_bus import EventBus
+from bot_ekko.core.recorder import InputRecorder
+from bot_ekko.core.clock import RealClock
+from bot_ekko.core.arbiter import StateArbiter
+from bot_ekko.core.config_watcher import ConfigWatcher
+from bot_ekko.core.supervisor import ServiceSupervisor
+from bot_ekko.core.metrics import REGISTRY, MetricsExporter
+from bot_ekko.modules.media_interface import MediaModule
+from bot_ekko.modules.media_prefetcher import MediaPrefetcher
 import json
 
 
 logger = get_logger("Main")
 
+FRAME_SECONDS = REGISTRY.histogram("ekko_frame_seconds", "Main loop work per frame, before the frame cap sleep.",
+                                   ("adapter", "state"))
 
 
 def handle_sigterm(signum, frame):
     raise KeyboardInterrupt
 
 def main():
+    parser = argparse.ArgumentParser(description="Bot Ekko")
+    parser.add_argument("--record", metavar="PATH",
+                        help="Record commands and raw service inputs (replay with bot_ekko.tools.replay)")
+    args = parser.parse_args()
+
     logger.info("Starting Bot Ekko...")
 
     display_manager = DisplayManager((PHYSICAL_W, PHYSICAL_H), (LOGICAL_W, LOGICAL_H), fullscreen=True)
@@ -44,8 +64,9 @@ def main():
     cmd_queue: queue.Queue[Command] = queue.Queue()
     
     # Load System Config
+    config_path = "bot_ekko/config.json"
     try:
-        system_config = SystemConfig.from_json_file("bot_ekko/config.json")
+        system_config = SystemConfig.from_json_file(config_path)
     except Exception as e:
         logger.critical(f"Failed to load system config: {e}")
         sys.exit(1)
@@ -57,50 +78,138 @@ def main():
 
     # 2. Initialize Architecture
     state_machine = StateMachine()
+    # Single time/RNG source shared by the core, adapter and media
+    bot_clock = RealClock()
     
     # Render Engine (Dynamic Loading)
     try:
         RenderEngineClass = load_class_from_path(adapter_module, adapter_class)
-        render_engine = RenderEngineClass(state_machine)
+        render_engine = RenderEngineClass(state_machine, bot_clock)
     except Exception as e:
         logger.critical(f"Failed to load render engine: {e}")
         sys.exit(1)
     
     # Create StateHandler with render_engine
-    state_handler = StateHandler(render_engine, state_machine)
+    state_handler = StateHandler(render_engine, state_machine, bot_clock)
+
+    # Transition rules (compiled after the adapter registered its states)
+    if system_config.transitions.enabled:
+        try:
+            state_handler.set_transition_graph(TransitionGraph(system_config.transitions).compile())
+        except ValueError as e:
+            logger.critical(f"Invalid transition graph: {e}")
+            sys.exit(1)
     
+    # Typed pub/sub between services and the main loop (sensor.*, gesture, audio.level, bt.command, state.changed)
+    event_bus = EventBus(EVENT_BUS_CAPACITY)
+    state_handler.set_event_bus(event_bus)
+
     # Command Center
     command_center = CommandCenter(cmd_queue, state_handler)
+    # One arbiter decides between the state requests of schedules, interrupts, moods, gestures and BLE
+    state_arbiter = StateArbiter(command_center, state_handler)
+    command_center.set_arbiter(state_arbiter)
     
     # Post-Init Injection for Render Engine
     render_engine.set_dependencies(state_handler, command_center, system_config)
 
-    interrupt_handler = InterruptHandler(command_center, state_handler)
+    interrupt_handler = InterruptHandler(command_center, state_handler, bot_clock)
+
+    # Media playback (CANVAS / CLOCK) and schedule-aware cache warming
+    media_player = MediaModule(interrupt_handler, command_center, clock=bot_clock)
+    media_player.start()
+    if hasattr(render_engine, "set_media_player"):
+        render_engine.set_media_player(media_player)
+
+    media_prefetcher = None
+    if system_config.media_prefetch.enabled and render_engine.scheduler:
+        gesture_mapping = system_config.services.gesture_service.gesture_state_mapping or {}
+        media_prefetcher = MediaPrefetcher(
+            media_player,
+            render_engine.scheduler,
+            config=system_config.media_prefetch,
+            state_mappings=[{"target_state": state} for state in gesture_mapping.values()]
+        )
+        media_prefetcher.start()
+
+    # Warm restart: resume state, interrupts and physics from the last checkpoint
+    checkpointer = None
+    if system_config.checkpoint.enabled:
+        checkpoint_config = system_config.checkpoint
+        try:
+            checkpointer = StateCheckpointer(
+                state_handler, interrupt_handler, checkpoint_config.path,
+                interval_ms=checkpoint_config.interval_ms, max_age=checkpoint_config.max_age
+            )
+            if checkpointer.restore():
+                render_engine.schedule_grace_ms = 0
+        except OSError as e:
+            logger.error(f"Checkpoint unavailable: {e}")
+            checkpointer = None
 
-    mainbot = MainBotServicesManager(cmd_queue, interrupt_handler, state_handler)
+    mainbot = MainBotServicesManager(cmd_queue, interrupt_handler, state_handler, command_center, event_bus)
     mainbot.init_services(system_config.services)
-    mainbot.start_services()
+    recorder = InputRecorder(args.record) if args.record else None
+    if recorder:
+        mainbot.set_recorder(recorder)
+    # Services come online in the background while the face is already rendering
+    mainbot.start_services(background=True)
+    # Restarts crashed or hung services in the background
+    supervisor = ServiceSupervisor(mainbot)
+    supervisor.start()
+
+    # Hot-reload: schedules, transition rules and changed services are swapped in without a restart
+    def reload_transitions(config: SystemConfig) -> None:
+        graph = TransitionGraph(config.transitions).compile() if config.transitions.enabled else None
+        state_handler.set_transition_graph(graph)
+
+    config_watcher = ConfigWatcher(config_path, system_config)
+    config_watcher.register("schedules", lambda config: render_engine.reload_schedules(config.schedules))
+    config_watcher.register("transitions", reload_transitions)
+    config_watcher.register("services", lambda config: mainbot.apply_services_config(config.services))
+    config_watcher.start()
+
+    # Prometheus text on localhost (or a Unix socket); a busy port only disables the exporter
+    metrics_exporter = None
+    if system_config.metrics.enabled:
+        metrics_config = system_config.metrics
+        try:
+            metrics_exporter = MetricsExporter(REGISTRY, metrics_config.host, metrics_config.port,
+                                               metrics_config.socket_path)
+            metrics_exporter.start()
+        except OSError as e:
+            logger.error(f"Metrics exporter unavailable: {e}")
+
+    # Frame-time histogram children by state, looked up once
+    frame_time = {}
 
     signal.signal(signal.SIGTERM, handle_sigterm)
 
     try:
         while True:
             try:
-                now = pygame.time.get_ticks()
+                now = bot_clock.ticks()
+                frame_started = time.perf_counter()
 
                 # Process Command Queue
                 while not cmd_queue.empty():
                     try:
-                        command = cmd_queue.get_nowait()
-                        logger.debug(f"Processing command: {command}")
-                        command.execute()
+                        command_center.dispatch(cmd_queue.get_nowait())
                     except queue.Empty:
                         pass
+                # State requests made since the last frame
+                state_arbiter.update()
 
+                config_watcher.update()
                 mainbot.service_loop_update()
-                interrupt_handler.update()
+                # Interrupts only need attention once the earliest one has expired
+                interrupt_deadline = interrupt_handler.next_deadline()
+                if interrupt_deadline is not None and now > interrupt_deadline:
+                    interrupt_handler.update()
 
                 render_engine.update(now)
+                if checkpointer:
+                    checkpointer.update(now)
 
                 # Render
                 if pygame.display.get_init():
@@ -109,12 +218,16 @@ def main():
                     logical_surface.fill(BLACK)
                     render_engine.render(logical_surface, now)
                     
-                    # Transform and Display
-                    rotated = pygame.transform.rotate(logical_surface, SCREEN_ROTATION)
-                    screen.blit(rotated, (0, 0))
-                    pygame.display.flip()
+                    # Transform and Display (only the regions media changed, when it owns the frame)
+                    display_manager.present(logical_surface, SCREEN_ROTATION, media_player.consume_dirty_rects())
                 else:
                     print('no display')
+
+                state = state_handler.get_state()
+                frame_histogram = frame_time.get(state)
+                if frame_histogram is None:
+                    frame_histogram = frame_time[state] = FRAME_SECONDS.labels(adapter_class, state)
+                frame_histogram.observe(time.perf_counter() - frame_started)
                 clock.tick(60)
                 
             except Exception as e:
@@ -122,9 +235,23 @@ def main():
                 raise
     except KeyboardInterrupt:
         logger.info("\nStopping bot...")
+        # Clean stop: next start is a cold start
+        if checkpointer:
+            checkpointer.clear()
     finally:
         logger.info("Cleaning up resources...")
+        config_watcher.stop()
+        supervisor.stop()
+        if metrics_exporter:
+            metrics_exporter.stop()
         mainbot.stop_services()
+        if media_prefetcher:
+            media_prefetcher.stop()
+        media_player.running = False
+        if checkpointer:
+            checkpointer.close()
+        if recorder:
+            recorder.close()
         pygame.quit()
         sys.exit()
 
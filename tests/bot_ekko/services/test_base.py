@@ -1,5 +1,10 @@
-from bot_ekko.core.base import ServiceStatus, ThreadedService
+import queue
 import time
+from unittest.mock import MagicMock
+
+from bot_ekko.core.base import Service, ServiceStatus, ThreadedService
+from bot_ekko.core.event_bus import EventBus
+from bot_ekko.core.mainbot import MainBotServicesManager
 
 class TestService:
     def test_initial_status(self, base_service):
@@ -32,6 +37,50 @@ class TestService:
         base_service.increment_stat("string_stat")
         assert base_service.stats["string_stat"] == "value"
 
+
+class UpdatingService(Service):
+    """Concrete service (the conftest MockService doesn't define update())."""
+    def __init__(self, name: str):
+        super().__init__(name, enabled=True)
+        self.updates = 0
+
+    def update(self) -> None:
+        self.updates += 1
+
+
+class TestChangeDrivenUpdate:
+    def test_dirty_flag(self):
+        service = UpdatingService("dirty_service")
+        assert not service.consume_dirty()
+        service.mark_dirty()
+        service.mark_dirty()
+        assert service.consume_dirty()
+        assert not service.consume_dirty()
+
+    def test_record_update(self):
+        service = UpdatingService("timed_service")
+        service.record_update(2.0)
+        service.record_update(0.5)
+        assert service.stats["updates"] == 2
+        assert service.stats["update_time_ms"] == 2.5
+        assert service.stats["update_time_max_ms"] == 2.0
+
+    def test_manager_updates_only_dirty_services(self):
+        dirty, clean = UpdatingService("dirty"), UpdatingService("clean")
+        manager = MainBotServicesManager(queue.Queue(), MagicMock(), MagicMock(), MagicMock(), EventBus())
+        manager.enabled_services = [dirty, clean]
+        dirty.start()
+        clean.start()
+
+        dirty.mark_dirty()
+        manager.service_loop_update()
+        manager.service_loop_update()
+
+        assert dirty.updates == 1
+        assert clean.updates == 0
+        assert dirty.stats["updates"] == 1
+        assert "updates" not in clean.stats
+
 class TestThreadedService:
     def test_lifecycle(self, threaded_service):
         assert threaded_service.status == ServiceStatus.INITIALIZED
@@ -1,3 +1,4 @@
+import signal
 import unittest
 import time
 from bot_ekko.core.base import ProcessService, ServiceStatus
@@ -8,6 +9,26 @@ class DummyProcessService(ProcessService):
             self.increment_stat("ticks")
             time.sleep(0.01)
 
+class CountingProcessService(ProcessService):
+    stat_counters = ("ticks",)
+    stat_gauges = ("level",)
+
+    def __init__(self, name, fail=False):
+        super().__init__(name)
+        self.fail = fail
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self.increment_stat("ticks")
+            self.update_stat("level", 0.5)
+            self.heartbeat()
+            time.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("serial port vanished")
+
+    def update(self) -> None:
+        pass
+
 class TestProcessService(unittest.TestCase):
     def setUp(self):
         self.service = DummyProcessService(name="test_process")
@@ -63,5 +84,49 @@ class TestProcessService(unittest.TestCase):
         self.service.stop()
         self.service.join()
 
+class TestProcessServiceSharedStats(unittest.TestCase):
+    def start(self, **kwargs):
+        self.service = CountingProcessService("counting", **kwargs)
+        self.addCleanup(self.cleanup)
+        self.service.start()
+        deadline = time.time() + 2
+        while self.service.stats.get("ticks", 0) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+
+    def stop(self):
+        self.service.stop()
+        self.service.join(timeout=2)
+
+    def cleanup(self):
+        if self.service.is_alive():
+            self.service.kill()
+            self.service.join(timeout=2)
+        self.service.close()
+
+    def test_child_stats_are_visible_to_parent(self):
+        self.start()
+        stats = self.service.stats
+        self.assertGreaterEqual(stats["ticks"], 3)
+        self.assertEqual(stats["level"], 0.5)
+        self.assertEqual(self.service.status, ServiceStatus.RUNNING)
+        self.assertLess(time.monotonic() - self.service.last_heartbeat, 1.0)
+        self.stop()
+        self.assertEqual(self.service.status, ServiceStatus.STOPPED)
+
+    def test_child_error_is_reported(self):
+        self.start(fail=True)
+        self.stop()
+        self.assertEqual(self.service.status, ServiceStatus.ERROR)
+        self.assertEqual(self.service.stats["last_error"], "serial port vanished")
+
+    def test_killed_child_is_an_error(self):
+        # Like pygame/SDL, install a SIGTERM handler the forked child inherits
+        previous = signal.signal(signal.SIGTERM, lambda signum, frame: None)
+        self.addCleanup(signal.signal, signal.SIGTERM, previous)
+        self.start()
+        self.service.terminate()
+        self.service.join(timeout=2)
+        self.assertEqual(self.service.status, ServiceStatus.ERROR)
+
 if __name__ == '__main__':
     unittest.main()
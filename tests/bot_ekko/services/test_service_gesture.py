@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock
+
+from bot_ekko.core.event_bus import EventBus, Topics
+from bot_ekko.core.arbiter import ClaimSource
+from bot_ekko.core.models import GestureData, ServiceGestureConfig
+from bot_ekko.services.service_gesture import GestureService
+
+
+def test_update_reads_gesture_batches():
+    bus = EventBus()
+    command_center = MagicMock()
+    service = GestureService(command_center, ServiceGestureConfig(name="gesture", gesture_state_mapping={
+        "thumbs_up": "HAPPY", "open_palm": "SURPRISED"
+    }), event_bus=bus)
+
+    # Two gestures arrive between frames: both are handled, in order
+    bus.publish(Topics.GESTURE, GestureData(gesture="thumbs_up", score=0.9, status="ok"))
+    bus.publish(Topics.GESTURE, GestureData(gesture="open_palm", score=0.8, status="ok"))
+    service.update()
+
+    targets = [call.args[1] for call in command_center.request_state.call_args_list]
+    assert targets == ["HAPPY", "SURPRISED"]
+    assert command_center.request_state.call_args.args[0] == ClaimSource.GESTURE
+
+
+def test_repeated_gesture_is_ignored():
+    bus = EventBus()
+    command_center = MagicMock()
+    service = GestureService(command_center, ServiceGestureConfig(name="gesture", gesture_state_mapping={"thumbs_up": "HAPPY"}),
+                             event_bus=bus)
+    for _ in range(3):
+        bus.publish(Topics.GESTURE, GestureData(gesture="thumbs_up", score=0.9, status="ok"))
+    service.update()
+    assert command_center.request_state.call_count == 1
+
+
+def test_reconfigure_swaps_mapping_in_place():
+    bus = EventBus()
+    command_center = MagicMock()
+    config = ServiceGestureConfig(name="gesture", gesture_state_mapping={"thumbs_up": "HAPPY"})
+    service = GestureService(command_center, config, event_bus=bus)
+
+    assert service.reconfigure(config.model_copy(update={"gesture_state_mapping": {"thumbs_up": "ANGRY"}}))
+    bus.publish(Topics.GESTURE, GestureData(gesture="thumbs_up", score=0.9, status="ok"))
+    service.update()
+    assert command_center.request_state.call_args.args[1] == "ANGRY"
+
+    # A new socket path needs a new service
+    assert not service.reconfigure(config.model_copy(update={"socket_path": "/tmp/other.sock"}))
+
+
+def test_payload_marks_service_dirty():
+    service = GestureService(MagicMock(), ServiceGestureConfig(name="gesture"), event_bus=EventBus())
+    assert not service.consume_dirty()
+    service.handle_payload(b'{"gesture": "thumbs_up", "score": 0.9}')
+    assert service.consume_dirty()
+    service.handle_payload(b"not json")
+    assert not service.consume_dirty()
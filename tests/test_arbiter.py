@@ -0,0 +1,102 @@
+import queue
+import unittest
+
+from bot_ekko.core.arbiter import ClaimSource, StateArbiter
+from bot_ekko.core.clock import FixedStepClock
+from bot_ekko.core.command_center import CommandCenter
+from bot_ekko.core.interrupts import InterruptHandler
+from bot_ekko.core.models import TransitionGraphConfig
+from bot_ekko.core.state_machine import StateHandler, StateMachine
+from bot_ekko.core.state_registry import StateRegistry
+from bot_ekko.core.transitions import TransitionGraph
+
+
+class FakeRenderEngine:
+    def get_physics_state(self):
+        return {}
+
+    def set_physics_state(self, state):
+        pass
+
+
+class TestStateArbiter(unittest.TestCase):
+    def setUp(self):
+        for state in (StateRegistry.ACTIVE, StateRegistry.SQUINTING, StateRegistry.SLEEPING, StateRegistry.HAPPY,
+                      StateRegistry.ANGRY, StateRegistry.CHAT, StateRegistry.CLOCK):
+            StateRegistry.register_state(state, [0, 0, 0, 0, 0])
+        self.clock = FixedStepClock()
+        self.queue = queue.Queue()
+        self.state_handler = StateHandler(FakeRenderEngine(), StateMachine(StateRegistry.ACTIVE), self.clock)
+        self.command_center = CommandCenter(self.queue, self.state_handler)
+        self.arbiter = StateArbiter(self.command_center, self.state_handler)
+        self.command_center.set_arbiter(self.arbiter)
+
+    def frame(self):
+        while not self.queue.empty():
+            self.command_center.dispatch(self.queue.get_nowait())
+        self.arbiter.update()
+
+    def test_one_transition_per_change(self):
+        self.command_center.request_state(ClaimSource.ADAPTER, StateRegistry.SQUINTING)
+        self.command_center.request_state(ClaimSource.SCHEDULER, StateRegistry.SLEEPING, hold_ms=None)
+        self.frame()
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.SLEEPING)
+        self.assertEqual(self.arbiter.transitions, 1)
+
+        outcome = self.arbiter.outcome(ClaimSource.ADAPTER)
+        self.assertFalse(outcome.won)
+        self.assertEqual(outcome.winner, ClaimSource.SCHEDULER)
+        self.assertIn("outranked by scheduler", outcome.reason)
+
+        # Repeating the held claim every frame changes nothing
+        for _ in range(10):
+            self.command_center.request_state(ClaimSource.SCHEDULER, StateRegistry.SLEEPING, hold_ms=None)
+            self.frame()
+        self.assertEqual(self.arbiter.transitions, 1)
+
+    def test_timed_claim_falls_back_to_held_claim(self):
+        self.command_center.request_state(ClaimSource.SCHEDULER, StateRegistry.CLOCK, hold_ms=None)
+        self.frame()
+        self.command_center.request_state(ClaimSource.BLE, StateRegistry.HAPPY, hold_ms=5000)
+        self.frame()
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.HAPPY)
+
+        self.clock.advance(5001)
+        self.frame()
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.CLOCK)
+        self.assertEqual(self.arbiter.outcome(ClaimSource.BLE).reason, "expired")
+        self.assertEqual(self.arbiter.transitions, 3)
+
+    def test_denied_claim_explains(self):
+        self.state_handler.set_transition_graph(TransitionGraph(TransitionGraphConfig(rules=[
+            {"from_states": ["CHAT"], "to_states": ["CLOCK"], "action": "deny"},
+        ])).compile())
+        self.state_handler.set_state(StateRegistry.CHAT)
+        self.command_center.request_state(ClaimSource.SCHEDULER, StateRegistry.CLOCK, hold_ms=None)
+        self.command_center.request_state(ClaimSource.ADAPTER, StateRegistry.ACTIVE)
+        self.frame()
+
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.ACTIVE)
+        self.assertEqual(self.arbiter.outcome(ClaimSource.SCHEDULER).reason, "transition CHAT -> CLOCK denied")
+        # The held claim is retried once the state changed
+        self.frame()
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.CLOCK)
+
+    def test_interrupt_outranks_and_restores(self):
+        interrupts = InterruptHandler(self.command_center, self.state_handler)
+        interrupts.set_interrupt("proximity", 2, StateRegistry.ANGRY)
+        self.command_center.request_state(ClaimSource.GESTURE, StateRegistry.HAPPY, hold_ms=5000)
+        self.frame()
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.ANGRY)
+        self.assertFalse(self.arbiter.outcome(ClaimSource.GESTURE).won)
+
+        self.clock.advance(2001)
+        interrupts.update()
+        self.frame()
+        # The interrupt's saved context is restored; the gesture claim still holds and takes over
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.HAPPY)
+        self.assertIsNone(self.state_handler.get_owned_ctx("interrupts"))
+
+
+if __name__ == '__main__':
+    unittest.main()
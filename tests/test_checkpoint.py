@@ -0,0 +1,165 @@
+import os
+import queue
+import tempfile
+import unittest
+
+from bot_ekko.core.arbiter import ClaimSource, StateArbiter
+from bot_ekko.core.base import BasePhysicsEngine
+from bot_ekko.core.checkpoint import CHECKPOINT_HEADER, CheckpointFile, StateCheckpointer
+from bot_ekko.core.command_center import CommandCenter
+from bot_ekko.core.interrupts import InterruptHandler
+from bot_ekko.core.state_machine import StateHandler, StateMachine
+from bot_ekko.core.state_registry import StateRegistry
+
+
+class FakePhysics(BasePhysicsEngine):
+    def __init__(self):
+        super().__init__()
+        self.blink_phase = "IDLE"
+
+
+class FakeRenderEngine:
+    physics_fields = ("target_x", "target_y", "blink_phase")
+
+    def __init__(self):
+        self.physics = FakePhysics()
+
+    def capture_physics(self, out):
+        for index, name in enumerate(self.physics_fields):
+            out[index] = getattr(self.physics, name)
+
+    def restore_physics(self, values):
+        for name, value in zip(self.physics_fields, values):
+            setattr(self.physics, name, value)
+
+
+class TestCheckpointFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "state.ckpt")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_latest_write_wins_across_reopen(self):
+        checkpoint = CheckpointFile(self.path, 256)
+        checkpoint.write(b"first")
+        checkpoint.write(b"second")
+        checkpoint.close()
+
+        reopened = CheckpointFile(self.path, 256)
+        self.assertEqual(reopened.read()[1], b"second")
+        reopened.close()
+
+    def test_torn_write_falls_back_to_previous(self):
+        checkpoint = CheckpointFile(self.path, 256)
+        checkpoint.write(b"good")
+        checkpoint.write(b"torn")
+        # Corrupt the payload of the latest slot, as if the process died mid-write
+        start = checkpoint._slot * 256 + CHECKPOINT_HEADER.size
+        checkpoint._map[start:start + 4] = b"xxxx"
+        checkpoint.close()
+
+        reopened = CheckpointFile(self.path, 256)
+        self.assertEqual(reopened.read()[1], b"good")
+        reopened.close()
+
+    def test_oversized_payload_is_rejected(self):
+        checkpoint = CheckpointFile(self.path, 64)
+        self.assertFalse(checkpoint.write(b"x" * 64))
+        self.assertIsNone(checkpoint.read())
+        checkpoint.close()
+
+
+class TestStateCheckpointer(unittest.TestCase):
+    def setUp(self):
+        for state in (StateRegistry.ACTIVE, StateRegistry.HAPPY, StateRegistry.SLEEPING):
+            StateRegistry.register_state(state, [0, 0, 0, 0, 0])
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "state.ckpt")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _bot(self):
+        render_engine = FakeRenderEngine()
+        state_handler = StateHandler(render_engine, StateMachine(StateRegistry.ACTIVE))
+        interrupts = InterruptHandler(CommandCenter(queue.Queue(), state_handler), state_handler)
+        checkpointer = StateCheckpointer(state_handler, interrupts, self.path, interval_ms=1000)
+        return render_engine, state_handler, interrupts, checkpointer
+
+    def test_resume_interrupted_state(self):
+        render_engine, state_handler, interrupts, checkpointer = self._bot()
+        # Scheduled SLEEPING, then an interrupt took over HAPPY
+        state_handler.set_state(StateRegistry.SLEEPING, params={"_source": "scheduler"})
+        render_engine.physics.target_x = 25
+        state_handler.save_state_ctx(owner="interrupts")
+        state_handler.set_state(StateRegistry.HAPPY, params={"target_state": StateRegistry.HAPPY, "callback": object()})
+        interrupts.set_interrupt("petting", 10, StateRegistry.HAPPY, priority=5)
+        render_engine.physics.target_x = -10
+        checkpointer.save(4000)
+        checkpointer.close()
+
+        # Fresh process
+        render_engine, state_handler, interrupts, checkpointer = self._bot()
+        self.assertTrue(checkpointer.restore(now=0))
+        self.assertEqual(state_handler.get_state(), StateRegistry.HAPPY)
+        self.assertNotIn("callback", state_handler.current_state_params)
+        self.assertEqual(render_engine.physics.target_x, -10)
+        self.assertTrue(interrupts.is_interrupted)
+        self.assertIn("petting", interrupts.active_interrupts)
+
+        # Interrupt ends: back to the scheduled state
+        state_handler.restore_state_ctx(owner="interrupts")
+        self.assertEqual(state_handler.get_state(), StateRegistry.SLEEPING)
+        self.assertEqual(state_handler.current_state_params, {"_source": "scheduler"})
+        self.assertEqual(render_engine.physics.target_x, 25)
+
+    def test_restored_interrupt_outranks_scheduler(self):
+        render_engine, state_handler, interrupts, checkpointer = self._bot()
+        interrupts.set_interrupt("petting", 10, StateRegistry.HAPPY)
+        state_handler.set_state(StateRegistry.HAPPY)
+        checkpointer.save(0)
+        checkpointer.close()
+
+        # Fresh process, with the arbiter main_bot sets up before restoring
+        render_engine, state_handler, interrupts, checkpointer = self._bot()
+        command_center = interrupts.command_center
+        arbiter = StateArbiter(command_center, state_handler)
+        command_center.set_arbiter(arbiter)
+        self.assertTrue(checkpointer.restore(now=0))
+        entry_time = state_handler.state_entry_time
+
+        command_center.request_state(ClaimSource.SCHEDULER, StateRegistry.SLEEPING)
+        arbiter.update()
+        self.assertEqual(state_handler.get_state(), StateRegistry.HAPPY)
+        self.assertEqual(state_handler.state_entry_time, entry_time)
+        self.assertEqual(arbiter.outcome(ClaimSource.SCHEDULER).winner, ClaimSource.INTERRUPTS)
+
+    def test_writes_on_change_and_interval(self):
+        _, state_handler, _, checkpointer = self._bot()
+        checkpointer.update(0)
+        checkpointer.update(16)
+        self.assertEqual(checkpointer.writes, 1)
+
+        state_handler.set_state(StateRegistry.HAPPY)
+        checkpointer.update(32)
+        self.assertEqual(checkpointer.writes, 2)
+
+        checkpointer.update(1100)
+        self.assertEqual(checkpointer.writes, 3)
+
+    def test_stale_or_cleared_checkpoint_is_cold_start(self):
+        _, state_handler, _, checkpointer = self._bot()
+        state_handler.set_state(StateRegistry.HAPPY)
+        checkpointer.save(0)
+        checkpointer.clear()
+        self.assertFalse(checkpointer.restore(now=0))
+
+        checkpointer.save(0)
+        checkpointer.max_age = -1
+        self.assertFalse(checkpointer.restore(now=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
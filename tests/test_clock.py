@@ -0,0 +1,106 @@
+import logging
+import queue
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from bot_ekko.core.clock import AcceleratedClock, Clock, FixedStepClock
+from bot_ekko.core.command_center import CommandCenter
+from bot_ekko.core.interrupts import InterruptHandler
+from bot_ekko.core.models import SystemConfig
+from bot_ekko.core.simulation import HeadlessBot, simulate
+from bot_ekko.core.state_machine import StateHandler, StateMachine
+from bot_ekko.core.state_registry import StateRegistry
+
+
+class FakeRenderEngine:
+    def get_physics_state(self):
+        return {}
+
+    def set_physics_state(self, state):
+        pass
+
+
+class TestClock(unittest.TestCase):
+    def test_fixed_step(self):
+        clock = FixedStepClock(start=datetime(2026, 1, 5, 23, 59, 59), step_ms=500)
+        clock.step()
+        clock.step()
+        self.assertEqual(clock.ticks(), 1000)
+        self.assertEqual(clock.now(), datetime(2026, 1, 6, 0, 0, 0))
+        self.assertAlmostEqual(clock.time(), clock.now().timestamp())
+
+    def test_clock_is_abstract(self):
+        with self.assertRaises(TypeError):
+            Clock()
+
+    def test_seeded_rng_is_deterministic(self):
+        a, b = FixedStepClock(seed=7), FixedStepClock(seed=7)
+        self.assertEqual([a.random.randint(0, 1000) for _ in range(10)],
+                         [b.random.randint(0, 1000) for _ in range(10)])
+
+    def test_accelerated(self):
+        clock = AcceleratedClock(factor=1000, start=datetime(2026, 1, 5))
+        time.sleep(0.01)
+        self.assertGreaterEqual(clock.ticks(), 10000)
+
+    def test_interrupt_expires_on_simulated_time(self):
+        StateRegistry.register_state(StateRegistry.ACTIVE, [0, 0, 0, 0, 0])
+        StateRegistry.register_state(StateRegistry.HAPPY, [0, 0, 0, 0, 0])
+        clock = FixedStepClock()
+        state_handler = StateHandler(FakeRenderEngine(), StateMachine(StateRegistry.ACTIVE), clock)
+        command_queue = queue.Queue()
+        command_center = CommandCenter(command_queue, state_handler)
+        interrupts = InterruptHandler(command_center, state_handler)
+
+        interrupts.set_interrupt("test", 5, StateRegistry.HAPPY)
+        command_center.dispatch(command_queue.get_nowait())
+        self.assertEqual(state_handler.get_state(), StateRegistry.HAPPY)
+
+        clock.advance(5000)
+        interrupts.update()
+        self.assertTrue(command_queue.empty())
+        clock.advance(1)
+        interrupts.update()
+        command_center.dispatch(command_queue.get_nowait())
+        self.assertEqual(state_handler.get_state(), StateRegistry.ACTIVE)
+
+
+class TestSimulation(unittest.TestCase):
+    def test_schedules_over_midnight(self):
+        logging.disable(logging.INFO)
+        try:
+            result = simulate(SystemConfig.from_json_file("bot_ekko/config.json"), hours=2, step_ms=1000,
+                              start=datetime(2026, 1, 5, 22, 30))
+        finally:
+            logging.disable(logging.NOTSET)
+
+        self.assertEqual(result["frames"], 7200)
+        # Hourly clock at 23:00; sleep from the first ACTIVE frame after midnight
+        self.assertGreaterEqual(result["entries"][StateRegistry.CLOCK], 1)
+        self.assertGreater(result["time_in_state"][StateRegistry.SLEEPING], 0)
+
+    def test_interrupts_update_only_after_deadline(self):
+        clock = FixedStepClock(start=datetime(2026, 1, 5, 12, 0), step_ms=500)
+        bot = HeadlessBot(SystemConfig.from_json_file("bot_ekko/config.json"), clock)
+        try:
+            bot.step()
+            bot.interrupt_handler.set_interrupt("test", 1, StateRegistry.HAPPY)
+            with patch.object(bot.interrupt_handler, "update", wraps=bot.interrupt_handler.update) as update:
+                # Deadline is one second out; the expiring frame is the first to update
+                for _ in range(3):
+                    clock.advance(500)
+                    bot.step()
+                self.assertEqual(update.call_count, 1)
+                self.assertEqual(bot.interrupt_handler.active_interrupts, {})
+
+                clock.advance(500)
+                bot.step()
+                self.assertEqual(update.call_count, 1)
+        finally:
+            bot.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
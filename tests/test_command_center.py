@@ -0,0 +1,136 @@
+import queue
+import unittest
+
+from bot_ekko.core.command_center import Command, CommandCenter
+from bot_ekko.core.models import CommandNames
+from bot_ekko.core.state_machine import StateHandler, StateMachine
+from bot_ekko.core.base import BasePhysicsEngine
+from bot_ekko.core.state_registry import StateRegistry
+
+
+class FakePhysics(BasePhysicsEngine):
+    def __init__(self):
+        super().__init__()
+        self.blink_phase = "IDLE"
+
+
+class FakeRenderEngine:
+    def __init__(self):
+        self.physics = FakePhysics()
+
+    def get_physics_engine(self):
+        return self.physics
+
+    def get_physics_state(self):
+        return {}
+
+    def set_physics_state(self, state):
+        pass
+
+
+class CommandCenterTestCase(unittest.TestCase):
+    def setUp(self):
+        for state in (StateRegistry.ACTIVE, StateRegistry.HAPPY, StateRegistry.CANVAS):
+            StateRegistry.register_state(state, [0, 0, 0, 0, 0])
+        self.queue = queue.Queue()
+        self.render_engine = FakeRenderEngine()
+        self.state_handler = StateHandler(self.render_engine, StateMachine(StateRegistry.ACTIVE))
+        self.center = CommandCenter(self.queue, self.state_handler)
+
+    def run_queue(self):
+        while not self.queue.empty():
+            self.center.dispatch(self.queue.get_nowait())
+
+
+class TestCommandCenter(CommandCenterTestCase):
+    def test_command_is_slotted(self):
+        command = Command(CommandNames.BLINK)
+        with self.assertRaises(AttributeError):
+            command.extra = 1
+
+    def test_change_and_restore_state(self):
+        self.center.issue_command(CommandNames.CHANGE_STATE, params={"target_state": StateRegistry.HAPPY, "save_history": True})
+        self.run_queue()
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.HAPPY)
+
+        self.center.issue_command(CommandNames.RESTORE_STATE)
+        self.run_queue()
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.ACTIVE)
+
+    def test_reentry_does_not_stack_history(self):
+        for _ in range(3):
+            self.center.issue_command(CommandNames.PLAY_MEDIA, params={"show": "text", "value": "hi"})
+        self.run_queue()
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.CANVAS)
+        self.assertTrue(self.state_handler.current_state_params["enqueue"])
+        self.assertEqual(len(self.state_handler.state_history), 1)
+
+    def test_look_at_blink_and_set_param(self):
+        self.center.issue_command(CommandNames.LOOK_AT, params={"x": 30, "y": -10})
+        self.center.issue_command(CommandNames.BLINK)
+        self.center.issue_command(CommandNames.SET_PARAM, params={"key": "text", "value": "hello"})
+        self.run_queue()
+        physics = self.render_engine.physics
+        self.assertEqual((physics.target_x, physics.target_y), (30, -10))
+        self.assertEqual(physics.blink_phase, "CLOSING")
+        self.assertEqual(self.state_handler.current_state_params, {"text": "hello"})
+
+    def test_register_handler(self):
+        seen = []
+        self.center.register_handler(CommandNames.BLINK, seen.append)
+        self.center.issue_command(CommandNames.BLINK, params={"eye": "left"})
+        self.run_queue()
+        self.assertEqual(seen, [{"eye": "left"}])
+
+    def test_ingest_validates(self):
+        self.assertTrue(self.center.ingest("change_state", {"target_state": StateRegistry.HAPPY}))
+        self.assertFalse(self.center.ingest("dance", {}))
+        self.assertFalse(self.center.ingest(CommandNames.LOOK_AT, {"x": 1}))
+        self.assertFalse(self.center.ingest(CommandNames.CHANGE_STATE, {"target_state": "NOT_A_STATE"}))
+        self.assertEqual(self.queue.qsize(), 1)
+        self.assertIsInstance(self.queue.get_nowait().name, CommandNames)
+
+
+class TestCommandBatch(CommandCenterTestCase):
+    def test_batch_is_one_queue_item(self):
+        self.center.issue_batch([
+            (CommandNames.CHANGE_STATE, {"target_state": StateRegistry.HAPPY, "save_history": True}),
+            (CommandNames.LOOK_AT, {"x": 20, "y": 0}),
+        ])
+        self.assertEqual(self.queue.qsize(), 1)
+        self.run_queue()
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.HAPPY)
+        self.assertEqual(self.render_engine.physics.target_x, 20)
+
+    def test_batch_saves_history_once(self):
+        self.center.issue_batch([
+            (CommandNames.CHANGE_STATE, {"target_state": StateRegistry.HAPPY, "save_history": True}),
+            (CommandNames.PLAY_MEDIA, {"show": "text", "value": "hi"}),
+        ])
+        self.run_queue()
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.CANVAS)
+        self.assertEqual(len(self.state_handler.state_history), 1)
+        # The saved context is the state before the batch
+        self.assertEqual(self.state_handler.state_history.peek().state, StateRegistry.ACTIVE)
+
+    def test_batch_logs_one_transition(self):
+        with self.assertLogs("StateHandler", level="INFO") as logs:
+            self.center.issue_batch([
+                (CommandNames.CHANGE_STATE, {"target_state": StateRegistry.HAPPY}),
+                (CommandNames.CHANGE_STATE, {"target_state": StateRegistry.CANVAS}),
+            ])
+            self.run_queue()
+        transitions = [line for line in logs.output if "State transition" in line]
+        self.assertEqual(len(transitions), 1)
+        self.assertIn("ACTIVE -> CANVAS", transitions[0])
+
+    def test_ingest_batch_rejects_whole_group(self):
+        self.assertFalse(self.center.ingest_batch([
+            (CommandNames.BLINK, None),
+            (CommandNames.LOOK_AT, {"x": 1}),
+        ]))
+        self.assertTrue(self.queue.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
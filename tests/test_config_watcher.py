@@ -0,0 +1,119 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from bot_ekko.core.config_watcher import ConfigWatcher, changed_sections
+from bot_ekko.core.models import SystemConfig
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "..", "bot_ekko", "config.json")
+
+
+class TestConfigWatcher(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "config.json")
+        shutil.copy(CONFIG_PATH, self.path)
+        with open(self.path) as f:
+            self.data = json.load(f)
+        self.watcher = ConfigWatcher(self.path, SystemConfig.from_json_file(self.path))
+        self.applied = []
+        self.watcher.register("schedules", lambda config: self.applied.append(("schedules", len(config.schedules))))
+        self.watcher.register("services", lambda config: self.applied.append(
+            ("services", config.services.gesture_service.gesture_state_mapping)))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self, text):
+        mtime = os.stat(self.path).st_mtime_ns
+        with open(self.path, "w") as f:
+            f.write(text)
+        # Coarse filesystem timestamps: make sure the change is visible
+        os.utime(self.path, ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+
+    def test_unchanged_file_is_not_reloaded(self):
+        self.assertFalse(self.watcher.check())
+        self.assertEqual(self.watcher.update(), [])
+
+    def test_changed_sections_are_applied(self):
+        self.data["schedules"] = self.data["schedules"][:1]
+        self.data["services"]["gesture_service"]["gesture_state_mapping"] = {"thumb_up": "ANGRY"}
+        self.write(json.dumps(self.data))
+
+        self.assertTrue(self.watcher.check())
+        # Nothing is applied until the main loop asks
+        self.assertEqual(self.applied, [])
+        self.assertEqual(self.watcher.update(), ["schedules", "services"])
+        self.assertEqual(self.applied, [("schedules", 1), ("services", {"thumb_up": "ANGRY"})])
+        self.assertEqual(self.watcher.update(), [])
+
+    def test_invalid_file_keeps_current_config(self):
+        config = self.watcher.config
+        self.write("{ not json")
+        self.assertFalse(self.watcher.check())
+        self.data["ui_expression_config"] = "eyes"
+        self.write(json.dumps(self.data))
+        self.assertFalse(self.watcher.check())
+        self.assertEqual(self.watcher.update(), [])
+        self.assertIs(self.watcher.config, config)
+
+    def test_handler_errors_do_not_stop_other_sections(self):
+        def broken(config):
+            raise ValueError("bad graph")
+        self.watcher.register("transitions", broken)
+        self.data["transitions"]["rules"] = []
+        self.data["schedules"] = []
+        self.write(json.dumps(self.data))
+        self.watcher.check()
+        self.assertEqual(self.watcher.update(), ["schedules", "transitions"])
+        self.assertEqual(self.applied, [("schedules", 0)])
+        # Only the applied section is in effect
+        self.assertEqual(self.watcher.config.schedules, [])
+        self.assertNotEqual(self.watcher.config.transitions.rules, [])
+
+    def test_failed_section_is_retried_on_next_reload(self):
+        attempts = []
+
+        def flaky(config):
+            attempts.append(config.transitions.rules)
+            if len(attempts) == 1:
+                raise ValueError("bad graph")
+        self.watcher.register("transitions", flaky)
+        self.data["transitions"]["rules"] = []
+        self.write(json.dumps(self.data))
+        self.watcher.check()
+        self.assertEqual(self.watcher.update(), ["transitions"])
+
+        # Any later reload (here an unrelated schedule edit) applies it again
+        self.data["schedules"] = []
+        self.write(json.dumps(self.data))
+        self.watcher.check()
+        self.assertEqual(self.watcher.update(), ["schedules", "transitions"])
+        self.assertEqual(attempts, [[], []])
+        self.assertEqual(self.watcher.config.transitions.rules, [])
+
+    def test_unhandled_section_stays_at_running_value(self):
+        running = self.watcher.config.checkpoint
+        self.data["checkpoint"]["interval_ms"] = 1
+        self.write(json.dumps(self.data))
+        self.watcher.check()
+        self.assertEqual(self.watcher.update(), ["checkpoint"])
+        self.assertEqual(self.watcher.config.checkpoint, running)
+
+        # Reverting the file: the bot never stopped running these values
+        self.data["checkpoint"]["interval_ms"] = running.interval_ms
+        self.write(json.dumps(self.data))
+        self.watcher.check()
+        self.assertEqual(self.watcher.update(), [])
+
+    def test_changed_sections(self):
+        old = SystemConfig.from_json_file(self.path)
+        self.assertEqual(changed_sections(old, SystemConfig.from_json_file(self.path)), [])
+        with self.assertRaises(ValueError):
+            self.watcher.register("nope", print)
+
+
+if __name__ == '__main__':
+    unittest.main()
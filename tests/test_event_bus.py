@@ -0,0 +1,146 @@
+import threading
+import unittest
+
+from bot_ekko.core.event_bus import EventBus, StateChanged, Topics
+from bot_ekko.core.models import TOFSensorData
+from bot_ekko.core.state_machine import StateHandler, StateMachine
+from bot_ekko.core.state_registry import StateRegistry
+
+
+class FakeRenderEngine:
+    def get_physics_state(self):
+        return {}
+
+    def set_physics_state(self, state):
+        pass
+
+
+def _tof(mm):
+    return TOFSensorData(mm=mm, status="ok")
+
+
+class TestEventBus(unittest.TestCase):
+    def test_payload_types_are_checked(self):
+        bus = EventBus()
+        with self.assertRaises(TypeError):
+            bus.publish(Topics.SENSOR_TOF, {"mm": 100})
+        with self.assertRaises(KeyError):
+            bus.publish("sensor.unknown", 1.0)
+
+    def test_drop_oldest_per_subscriber(self):
+        bus = EventBus(capacity=4)
+        slow = bus.subscribe(Topics.SENSOR_TOF)
+        fast = bus.subscribe(Topics.SENSOR_TOF)
+
+        for mm in range(3):
+            bus.publish(Topics.SENSOR_TOF, _tof(mm))
+        self.assertEqual([e.payload.mm for e in fast.poll()], [0, 1, 2])
+
+        for mm in range(3, 10):
+            bus.publish(Topics.SENSOR_TOF, _tof(mm))
+        self.assertEqual([e.payload.mm for e in slow.poll()], [6, 7, 8, 9])
+        self.assertEqual(slow.dropped, 6)
+        self.assertEqual([e.payload.mm for e in fast.poll()], [6, 7, 8, 9])
+        self.assertEqual(fast.poll(), [])
+
+    def test_topic_filtering_and_order(self):
+        bus = EventBus()
+        sensors = bus.subscribe("sensor.*")
+        everything = bus.subscribe("*")
+
+        bus.publish(Topics.SENSOR_TOF, _tof(1))
+        bus.publish(Topics.AUDIO_LEVEL, 0.5)
+        bus.publish(Topics.SENSOR_TOF, _tof(2))
+
+        self.assertEqual([e.topic for e in sensors.poll()], [Topics.SENSOR_TOF, Topics.SENSOR_TOF])
+        self.assertEqual([e.topic for e in everything.poll()], [Topics.SENSOR_TOF, Topics.AUDIO_LEVEL, Topics.SENSOR_TOF])
+        with self.assertRaises(ValueError):
+            bus.subscribe("vision.*")
+
+    def test_latest_skips_backlog(self):
+        bus = EventBus()
+        subscription = bus.subscribe(Topics.AUDIO_LEVEL)
+        for level in (0.1, 0.2, 0.3):
+            bus.publish(Topics.AUDIO_LEVEL, level)
+        self.assertEqual(subscription.latest(Topics.AUDIO_LEVEL), 0.3)
+        self.assertIsNone(subscription.latest(Topics.AUDIO_LEVEL))
+
+    def test_concurrent_producers(self):
+        bus = EventBus(capacity=10000)
+        subscription = bus.subscribe(Topics.AUDIO_LEVEL)
+
+        def produce():
+            for _ in range(1000):
+                bus.publish(Topics.AUDIO_LEVEL, 0.1)
+
+        threads = [threading.Thread(target=produce) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        events = []
+        while any(thread.is_alive() for thread in threads):
+            events.extend(subscription.poll(max_events=100))
+        for thread in threads:
+            thread.join()
+        events.extend(subscription.poll(max_events=10000))
+
+        self.assertEqual(len(events), 4000)
+        self.assertEqual(subscription.dropped, 0)
+
+    def test_head_follows_claims_when_publishers_interleave(self):
+        bus = EventBus(capacity=8)
+        subscription = bus.subscribe(Topics.AUDIO_LEVEL)
+        ring = bus.rings[Topics.AUDIO_LEVEL]
+        seen = []
+
+        class Slots(list):
+            def __setitem__(self, index, entry):
+                if entry[0] == 0:
+                    # The first publisher is preempted after claiming position 0, before storing it
+                    bus.publish(Topics.AUDIO_LEVEL, 0.2)
+                    seen.append((ring.head, [e.payload for e in subscription.poll()]))
+                super().__setitem__(index, entry)
+
+        ring._slots = Slots(ring._slots)
+        bus.publish(Topics.AUDIO_LEVEL, 0.1)
+
+        # head stops at the unstored slot, so the reader waits there rather than skipping it
+        self.assertEqual(seen, [(0, [])])
+        self.assertEqual(ring.head, 2)
+        self.assertEqual([e.payload for e in subscription.poll()], [0.1, 0.2])
+        self.assertEqual(subscription.dropped, 0)
+
+    def test_stale_head_write_does_not_move_head_back(self):
+        bus = EventBus(capacity=4)
+        ring = bus.rings[Topics.AUDIO_LEVEL]
+        for level in range(6):
+            bus.publish(Topics.AUDIO_LEVEL, float(level))
+        self.assertEqual(ring.head, 6)
+
+        # A publisher preempted mid-walk writes back the head it saw before the others published
+        ring._head = 1
+        self.assertEqual(ring.head, 6)
+        subscription = bus.subscribe(Topics.AUDIO_LEVEL)
+        bus.publish(Topics.AUDIO_LEVEL, 6.0)
+        self.assertEqual([e.payload for e in subscription.poll()], [6.0])
+
+
+class TestEventBusIntegration(unittest.TestCase):
+    def test_state_changed(self):
+        StateRegistry.register_state(StateRegistry.ACTIVE, [0, 0, 0, 0, 0])
+        StateRegistry.register_state(StateRegistry.HAPPY, [0, 0, 0, 0, 0])
+        bus = EventBus()
+        subscription = bus.subscribe(Topics.STATE_CHANGED)
+        state_handler = StateHandler(FakeRenderEngine(), StateMachine(StateRegistry.ACTIVE))
+        state_handler.set_event_bus(bus)
+
+        state_handler.set_state(StateRegistry.HAPPY)
+        state_handler.set_state(StateRegistry.HAPPY, params={"x": 1})
+
+        events = subscription.poll()
+        self.assertEqual(len(events), 1)
+        self.assertIsInstance(events[0].payload, StateChanged)
+        self.assertEqual((events[0].payload.from_state, events[0].payload.to_state), (StateRegistry.ACTIVE, StateRegistry.HAPPY))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pygame
+from PIL import Image
+
+from bot_ekko.core.display_manager import DisplayManager
+from bot_ekko.modules.frame_store import DeltaFrameStore, _changed_rects
+from bot_ekko.modules.media_interface import MediaModule
+
+
+def _frames(count=5, size=(64, 48)):
+    w, h = size
+    base = np.zeros((h, w, 4), dtype=np.uint8)
+    base[..., 3] = 255
+    frames = []
+    for i in range(count):
+        frame = base.copy()
+        # A small moving square: only a few tiles change per frame
+        frame[10:18, 4 + i * 8:12 + i * 8] = (255, 0, 0, 255)
+        frames.append(frame)
+    return frames
+
+
+def _surface_array(surface):
+    rgb = pygame.surfarray.array3d(surface).transpose(1, 0, 2)
+    alpha = pygame.surfarray.array_alpha(surface).T[..., None]
+    return np.concatenate([rgb, alpha], axis=2)
+
+
+class TestDeltaFrameStore(unittest.TestCase):
+    def setUp(self):
+        self.frames = _frames()
+        self.store = DeltaFrameStore.from_arrays(iter(self.frames))
+
+    def test_changed_rects_cover_only_changes(self):
+        rects = _changed_rects(self.frames[0], self.frames[1])
+        self.assertTrue(rects)
+        covered = sum(r.width * r.height for r in rects)
+        self.assertLess(covered, 64 * 48)
+        self.assertEqual(_changed_rects(self.frames[0], self.frames[0]), [])
+
+    def test_seek_reproduces_frames(self):
+        # forward, wrap-around, and a restart from the middle
+        for index in [1, 2, 3, 4, 0, 1, 3, 0, 2]:
+            self.store.seek(index)
+            np.testing.assert_array_equal(_surface_array(self.store.surface), self.frames[index])
+
+    def test_seek_returns_dirty_rects(self):
+        self.assertEqual(self.store.seek(0), [])
+        dirty = self.store.seek(1)
+        self.assertTrue(dirty)
+        self.assertTrue(all(r.width < 64 for r in dirty))
+
+        # Wrapping from the last frame to the first is a patch, not a reset
+        self.store.seek(4)
+        dirty = self.store.seek(0)
+        self.assertTrue(all(r != self.store.surface.get_rect() for r in dirty))
+
+    def test_uses_less_memory_than_full_frames(self):
+        self.assertLess(self.store.nbytes, len(self.frames) * 64 * 48 * 4)
+
+
+class TestMediaModuleDeltaPlayback(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.gif_path = os.path.join(self.tmp.name, "moving.gif")
+        images = [Image.fromarray(frame[..., :3]) for frame in _frames()]
+        images[0].save(self.gif_path, save_all=True, append_images=images[1:], duration=100)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_dirty_rects_after_first_frame(self):
+        media = MediaModule(None, None, frame_storage="delta")
+        media.play_gif(self.gif_path)
+        self.assertIsInstance(media.gif_frames, DeltaFrameStore)
+
+        surface = pygame.Surface((200, 100))
+        media.update(surface)
+        # First frame of new media: full display update
+        self.assertIsNone(media.consume_dirty_rects())
+
+        media.update(surface)
+        self.assertEqual(media.consume_dirty_rects(), [])
+
+        media.current_frame_index = 1
+        media.update(surface)
+        rects = media.consume_dirty_rects()
+        self.assertTrue(rects)
+        frame_rect = media.gif_frames.surface.get_rect(center=(100, 50))
+        self.assertTrue(all(frame_rect.contains(r) for r in rects))
+
+    def test_not_drawn_forces_full_update(self):
+        media = MediaModule(None, None, frame_storage="full")
+        media.play_gif(self.gif_path)
+        surface = pygame.Surface((200, 100))
+        media.update(surface)
+        media.consume_dirty_rects()
+
+        # A frame where media wasn't drawn (e.g. eyes showing) -> next media frame is full again
+        self.assertIsNone(media.consume_dirty_rects())
+        media.update(surface)
+        self.assertIsNone(media.consume_dirty_rects())
+
+
+class TestDisplayRectMapping(unittest.TestCase):
+    def test_map_logical_rect(self):
+        display = DisplayManager((480, 800), (800, 480))
+        rect = pygame.Rect(10, 20, 30, 40)
+        self.assertEqual(display.map_logical_rect(rect, 0), rect)
+        self.assertEqual(display.map_logical_rect(rect, 90), pygame.Rect(20, 760, 40, 30))
+        self.assertEqual(display.map_logical_rect(rect, 180), pygame.Rect(760, 420, 30, 40))
+        self.assertEqual(display.map_logical_rect(rect, 270), pygame.Rect(420, 10, 40, 30))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import MagicMock
+
+from bot_ekko.core.clock import FixedStepClock
+from bot_ekko.core.interrupts import InterruptHandler, InterruptItem
+from bot_ekko.core.models import CommandNames
+
+
+class TestInterruptHandler(unittest.TestCase):
+    def setUp(self):
+        self.clock = FixedStepClock()
+        self.state_handler = MagicMock()
+        self.state_handler.get_state.return_value = "ACTIVE"
+        self.command_center = MagicMock()
+        self.interrupts = InterruptHandler(self.command_center, self.state_handler, self.clock)
+
+    def _target_states(self):
+        return [c.args[1] for c in self.command_center.request_state.call_args_list]
+
+    def test_refresh_extends_without_commands(self):
+        self.interrupts.set_interrupt("proximity", 2, "ANGRY")
+        self.state_handler.get_state.return_value = "ANGRY"
+        self.assertEqual(self._target_states(), ["ANGRY"])
+        self.assertEqual(self.interrupts.next_deadline(), 2000)
+
+        # Held for three seconds: refreshed every frame
+        for _ in range(180):
+            self.clock.advance(1000 // 60)
+            self.interrupts.set_interrupt("proximity", 2, "ANGRY")
+            self.interrupts.update()
+        self.assertEqual(self.command_center.request_state.call_count, 1)
+        self.command_center.issue_command.assert_not_called()
+        self.assertEqual(len(self.interrupts._deadlines), 1)
+        self.assertEqual(self.interrupts.next_deadline(), self.clock.ticks() + 2000)
+
+        self.clock.advance(2001)
+        self.interrupts.update()
+        self.assertEqual(self.interrupts.active_interrupts, {})
+        self.assertIsNone(self.interrupts.next_deadline())
+        self.command_center.issue_command.assert_called_with(
+            CommandNames.RESTORE_STATE, params={"context_owner": "interrupts"})
+
+    def test_priority_and_expiry_order(self):
+        self.interrupts.set_interrupt("low", 10, "LOW", priority=1)
+        self.state_handler.get_state.return_value = "LOW"
+        self.interrupts.set_interrupt("high", 2, "HIGH", priority=9)
+        self.state_handler.get_state.return_value = "HIGH"
+        self.interrupts.set_interrupt("mid", 5, "MID", priority=5)
+        self.assertEqual(self.interrupts.current_interrupt().name, "high")
+        self.assertEqual(self._target_states(), ["LOW", "HIGH"])
+
+        self.clock.advance(2001)
+        self.interrupts.update()
+        self.assertEqual(self.interrupts.current_interrupt().name, "mid")
+        self.state_handler.get_state.return_value = "MID"
+
+        self.interrupts.stop_interrupt("mid")
+        self.assertEqual(self._target_states(), ["LOW", "HIGH", "MID", "LOW"])
+        self.assertEqual(self.interrupts.next_deadline(), 10000)
+
+    def test_equal_priority_keeps_first(self):
+        self.interrupts.set_interrupt("a", 5, "A")
+        self.interrupts.set_interrupt("b", 5, "B")
+        self.assertEqual(self.interrupts.current_interrupt().name, "a")
+
+    def test_restore_interrupts(self):
+        self.interrupts.restore_interrupts([InterruptItem("petting", "HAPPY", 5, 3000, 0)], True)
+        self.assertEqual(self.interrupts.next_deadline(), 3000)
+        self.command_center.request_state.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import pygame
+from PIL import Image
+
+from bot_ekko.modules.media_interface import MediaModule, resolve_canvas_media
+from bot_ekko.modules.media_playlist import MediaPlaylist, PlaylistItem
+
+
+class TestPlaylistItem(unittest.TestCase):
+    def test_from_dict(self):
+        item = PlaylistItem.from_dict({"show": "text", "value": "hi", "duration": 3, "transition": "fade"})
+        self.assertEqual((item.kind, item.value, item.duration, item.transition), ("text", "hi", 3.0, "fade"))
+
+    def test_rejects_unknown_kind_and_transition(self):
+        with self.assertRaises(ValueError):
+            PlaylistItem("video", "x.mp4")
+        with self.assertRaises(ValueError):
+            PlaylistItem("text", "hi", transition="wipe")
+
+    def test_fifo(self):
+        playlist = MediaPlaylist([PlaylistItem("text", "a"), PlaylistItem("text", "b")])
+        self.assertEqual(playlist.peek().value, "a")
+        self.assertEqual(playlist.pop().value, "a")
+        self.assertEqual(len(playlist), 1)
+        playlist.clear()
+        self.assertIsNone(playlist.pop())
+
+
+class TestMediaModulePlaylist(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.gif_path = os.path.join(self.tmp.name, "party.gif")
+        frames = [Image.new("RGB", (8, 8), c) for c in [(255, 0, 0), (0, 255, 0)]]
+        frames[0].save(self.gif_path, save_all=True, append_images=frames[1:], duration=100)
+        self.media = MediaModule(None, MagicMock())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_next_item_prepared_in_background(self):
+        self.media.play_playlist([
+            {"show": "text", "value": "first", "duration": 1},
+            {"show": "gif", "value": self.gif_path, "duration": 1},
+        ])
+        self.assertEqual(self.media.current_media_type, "TEXT")
+
+        # While the text plays, the GIF is decoded on the prepare thread
+        item, future = self.media._prepared
+        self.assertEqual(item.value, self.gif_path)
+        future.result(timeout=5)
+        self.assertIn(self.gif_path, self.media.gif_cache)
+
+        self.assertTrue(self.media.advance_playlist())
+        self.assertEqual(self.media.current_media_type, "GIF")
+        self.assertIs(self.media.gif_frames, self.media.gif_cache[self.gif_path][0])
+        self.assertFalse(self.media.advance_playlist())
+
+    def test_enqueue_starts_or_appends(self):
+        self.media.enqueue({"show": "text", "value": "now"})
+        self.assertTrue(self.media.is_playing)
+        self.assertEqual(len(self.media.playlist), 0)
+
+        self.media.enqueue(PlaylistItem("text", "later"))
+        self.assertEqual([i.value for i in self.media.playlist.items()], ["later"])
+
+        self.media.stop_media()
+        self.assertEqual(len(self.media.playlist), 0)
+
+    def test_fade_transition_blends_then_settles(self):
+        self.media.play_playlist([
+            PlaylistItem("text", "one", duration=1),
+            PlaylistItem("text", "two", duration=1, transition="fade", transition_duration=10),
+        ])
+        self.media.advance_playlist()
+        self.assertIsNotNone(self.media._fade_from)
+
+        surface = pygame.Surface((200, 100))
+        self.media.update(surface)
+        # Fading redraws whole frames
+        self.assertIsNone(self.media.consume_dirty_rects())
+
+        self.media._fade_start = time.time() - 20
+        self.media.update(surface)
+        self.assertIsNone(self.media._fade_from)
+
+    def test_resolve_playlist_params(self):
+        kind, items = resolve_canvas_media({"show": "playlist", "items": [{"show": "text", "value": "a"}]})
+        self.assertEqual(kind, "playlist")
+        self.assertEqual(items[0].value, "a")
+
+
+if __name__ == '__main__':
+    unittest.main()
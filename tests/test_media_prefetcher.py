@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from PIL import Image
+
+from bot_ekko.core.scheduler import Scheduler
+from bot_ekko.modules.media_interface import TEXT_CACHE_SIZE, MediaModule, resolve_canvas_media
+from bot_ekko.modules.media_prefetcher import MediaPrefetcher
+from bot_ekko.core.models import MediaPrefetchConfig
+from bot_ekko.sys_config import DEFAULT_GIF_PATH
+
+
+class TestMediaPrefetcher(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.gif_path = os.path.join(self.tmp.name, "birthday.gif")
+        frames = [Image.new("RGB", (4, 4), c) for c in [(255, 0, 0), (0, 255, 0)]]
+        frames[0].save(self.gif_path, save_all=True, append_images=frames[1:], duration=100)
+
+        self.events = [
+            {
+                "name": "happy_birthday_text", "type": "date",
+                "start_datetime": "2026-04-06 10:00:00", "end_datetime": "2026-04-06 10:05:00",
+                "state": "CANVAS", "priority": 10,
+                "params": {"show": "text", "value": "Happy Birthday!", "duration": 300}
+            },
+            {
+                "name": "happy_birthday_gif", "type": "date",
+                "start_datetime": "2026-04-06 10:05:00", "end_datetime": "2026-04-06 10:10:00",
+                "state": "CANVAS", "priority": 10,
+                "params": {"show": "gif", "value": self.gif_path, "duration": 300}
+            },
+            {"name": "Hourly Clock", "type": "hourly", "state": "CLOCK", "priority": 5, "params": {"duration": 10}},
+        ]
+        self.scheduler = Scheduler(self.events)
+        self.media = MediaModule(None, None)
+        self.prefetcher = MediaPrefetcher(self.media, self.scheduler, MediaPrefetchConfig(lookahead_seconds=120))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_resolve_canvas_media(self):
+        self.assertEqual(resolve_canvas_media({"show": "text", "value": "hi"}), ("text", "hi"))
+        self.assertEqual(resolve_canvas_media({"param": {"text": "legacy"}}), ("text", "legacy"))
+        self.assertEqual(resolve_canvas_media(None), ("gif", DEFAULT_GIF_PATH))
+        kind, path = resolve_canvas_media({"show": "gif", "value": "birthday.gif"})
+        self.assertEqual(kind, "gif")
+        self.assertTrue(os.path.isabs(path))
+
+    def test_upcoming_events_window(self):
+        upcoming = self.scheduler.upcoming_events(datetime(2026, 4, 6, 9, 59, 0), 120)
+        names = [event["name"] for _, event in upcoming]
+        # The text event and the top-of-hour clock start at 10:00; the GIF is still 6 minutes out
+        self.assertEqual(sorted(names), ["Hourly Clock", "happy_birthday_text"])
+
+        upcoming = self.scheduler.upcoming_events(datetime(2026, 4, 6, 10, 4, 0), 120)
+        names = [event["name"] for _, event in upcoming]
+        self.assertIn("happy_birthday_text", names)
+        self.assertIn("happy_birthday_gif", names)
+
+    def test_scan_warms_caches_ahead(self):
+        # Far away from any event: nothing is loaded
+        self.assertEqual(self.prefetcher.scan(datetime(2026, 4, 5, 12, 30, 0)), [])
+        self.assertEqual(self.media.gif_cache, {})
+
+        self.prefetcher.scan(datetime(2026, 4, 6, 10, 4, 0))
+        self.assertIn(self.gif_path, self.media.gif_cache)
+        self.assertEqual(len(self.media.text_cache), 1)
+
+        # show_text at transition time is served from the cache
+        cached = next(iter(self.media.text_cache.values()))
+        self.media.show_text("Happy Birthday!")
+        self.assertIs(self.media.text_surface, cached.surface)
+
+    def test_evicted_text_is_warmed_again(self):
+        self.assertTrue(self.prefetcher.warm("text", "Happy Birthday!"))
+        # Chat messages and clock strings push it out of the bounded text cache
+        for index in range(TEXT_CACHE_SIZE):
+            self.media.preload_text(f"message {index}")
+        self.assertFalse(self.media.is_cached("text", "Happy Birthday!"))
+
+        self.prefetcher.scan(datetime(2026, 4, 6, 10, 0, 0))
+        self.assertTrue(self.media.is_cached("text", "Happy Birthday!"))
+
+    def test_text_is_warmed_with_its_effect(self):
+        params = {"show": "text", "value": "Scrolling by", "effect": "marquee_h"}
+        self.assertEqual(self.prefetcher.media_for_params(params), [("text", "Scrolling by", "marquee_h")])
+        self.prefetcher.warm(*self.prefetcher.media_for_params(params)[0])
+        self.assertTrue(self.media.is_cached("text", "Scrolling by", "marquee_h"))
+        self.assertFalse(self.media.is_cached("text", "Scrolling by"))
+
+        # show_text with the marquee is served from the cache
+        cached = self.media.get_text_strip("Scrolling by", single_line=True)
+        self.media.show_text("Scrolling by", effect="marquee_h")
+        self.assertIs(self.media.text_surface, cached.surface)
+
+    def test_missing_media_is_not_fatal(self):
+        self.assertFalse(self.prefetcher.warm("gif", os.path.join(self.tmp.name, "missing.gif")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+import os
+import socket
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+
+from bot_ekko.core.base import Service
+from bot_ekko.core.metrics import REGISTRY, MetricsExporter, MetricsRegistry
+
+
+def parse(text):
+    """Prometheus text -> {'name{labels}': value}, skipping comments."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            series, value = line.rsplit(" ", 1)
+            samples[series] = float(value)
+    return samples
+
+
+def scrape_unix(path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        client.sendall(b"GET /metrics HTTP/1.0\r\nHost: localhost\r\n\r\n")
+        response = b""
+        while chunk := client.recv(65536):
+            response += chunk
+    head, _, body = response.partition(b"\r\n\r\n")
+    return head.decode(), body.decode()
+
+
+class CountingService(Service):
+    def update(self):
+        pass
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter_is_thread_safe(self):
+        counter = self.registry.counter("ekko_test_total", "Test.", ("service",)).labels(service="sensor")
+
+        def work():
+            for _ in range(10000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(counter.value, 80000)
+
+    def test_render_counters_and_gauges(self):
+        counter = self.registry.counter("ekko_events_total", "Events.", ("service", "stat"))
+        counter.labels(service="gesture", stat="decode_errors").inc(2)
+        gauge = self.registry.gauge("ekko_level", "Level.")
+        gauge.set(0.25)
+        self.registry.gauge("ekko_live", "Live.", ("state",)).labels("ACTIVE").set_function(lambda: 3)
+
+        text = self.registry.render()
+        self.assertIn("# TYPE ekko_events_total counter", text)
+        samples = parse(text)
+        self.assertEqual(samples['ekko_events_total{service="gesture",stat="decode_errors"}'], 2)
+        self.assertEqual(samples["ekko_level"], 0.25)
+        self.assertEqual(samples['ekko_live{state="ACTIVE"}'], 3)
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = self.registry.histogram("ekko_frame_seconds", "Frames.", ("adapter",), buckets=(0.01, 0.1))
+        child = histogram.labels(adapter="EyesExpressionAdapter")
+        for value in (0.005, 0.01, 0.05, 2.0):
+            child.observe(value)
+
+        samples = parse(self.registry.render())
+        prefix = 'ekko_frame_seconds_bucket{adapter="EyesExpressionAdapter",le='
+        self.assertEqual(samples[prefix + '"0.01"}'], 2)
+        self.assertEqual(samples[prefix + '"0.1"}'], 3)
+        self.assertEqual(samples[prefix + '"+Inf"}'], 4)
+        self.assertEqual(samples['ekko_frame_seconds_count{adapter="EyesExpressionAdapter"}'], 4)
+        self.assertAlmostEqual(samples['ekko_frame_seconds_sum{adapter="EyesExpressionAdapter"}'], 2.065)
+
+    def test_label_values_are_escaped(self):
+        self.registry.counter("ekko_errors_total", "Errors.", ("stat",)).labels('say "hi"\n').inc()
+        self.assertIn('ekko_errors_total{stat="say \\"hi\\"\\n"} 1', self.registry.render())
+
+    def test_failing_gauge_function_is_skipped(self):
+        gauge = self.registry.gauge("ekko_gone", "Gone.", ("service",))
+        gauge.labels("mic").set_function(lambda: 1 / 0)
+        gauge.labels("bt").set(1)
+        samples = parse(self.registry.render())
+        self.assertNotIn('ekko_gone{service="mic"}', samples)
+        self.assertEqual(samples['ekko_gone{service="bt"}'], 1)
+
+    def test_registration(self):
+        first = self.registry.counter("ekko_same_total", "Same.", ("service",))
+        self.assertIs(self.registry.counter("ekko_same_total", "Same.", ("service",)), first)
+        with self.assertRaises(ValueError):
+            self.registry.gauge("ekko_same_total", "Same.", ("service",))
+        with self.assertRaises(ValueError):
+            first.labels(state="ACTIVE")
+        with self.assertRaises(ValueError):
+            first.labels("a").inc(-1)
+        with self.assertRaises(ValueError):
+            self.registry.histogram("ekko_bad_seconds", "Bad.", buckets=(1.0, 0.5))
+
+
+class TestServiceMetrics(unittest.TestCase):
+    def test_service_stats_are_exported(self):
+        service = CountingService("metrics_test_service", enabled=True)
+        threads = [threading.Thread(target=lambda: [service.increment_stat("messages_received") for _ in range(1000)])
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        service.update_stat("cpu_temp", 51.5)
+        service.update_stat("last_error", "timeout")
+        service.record_update(2.0)
+        service.start()
+
+        self.assertEqual(service.stats["messages_received"], 4000)
+        samples = parse(REGISTRY.render())
+        self.assertEqual(samples['ekko_service_events_total{service="metrics_test_service",stat="messages_received"}'], 4000)
+        self.assertEqual(samples['ekko_service_stat{service="metrics_test_service",stat="cpu_temp"}'], 51.5)
+        self.assertEqual(samples['ekko_service_running{service="metrics_test_service"}'], 1)
+        self.assertEqual(samples['ekko_service_update_seconds_count{service="metrics_test_service"}'], 1)
+        self.assertNotIn('ekko_service_stat{service="metrics_test_service",stat="last_error"}', samples)
+
+    def test_increment_continues_from_updated_value(self):
+        service = CountingService("metrics_update_then_increment", enabled=True)
+        service.update_stat("counter", 10)
+        service.increment_stat("counter")
+        service.increment_stat("counter", 5)
+        service.update_stat("string_stat", "value")
+        service.increment_stat("string_stat")
+        self.assertEqual(service.stats["counter"], 16)
+        self.assertEqual(service.stats["string_stat"], "value")
+
+
+class TestMetricsExporter(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        self.registry.counter("ekko_scrapes_total", "Test.", ("service",)).labels("sensor").inc(5)
+
+    def serve(self, **kwargs):
+        exporter = MetricsExporter(self.registry, **kwargs)
+        exporter.start()
+        self.addCleanup(exporter.stop)
+        return exporter
+
+    def test_scrape_over_http(self):
+        host, port = self.serve(host="127.0.0.1", port=0).address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            self.assertTrue(response.headers["Content-Type"].startswith("text/plain; version=0.0.4"))
+            samples = parse(response.read().decode())
+        self.assertEqual(samples['ekko_scrapes_total{service="sensor"}'], 5)
+
+        with self.assertRaises(urllib.error.HTTPError) as raised:
+            urllib.request.urlopen(f"http://{host}:{port}/other", timeout=5)
+        self.assertEqual(raised.exception.code, 404)
+
+    def test_scrape_over_unix_socket(self):
+        path = os.path.join(tempfile.mkdtemp(), "metrics.sock")
+        exporter = self.serve(socket_path=path)
+        self.assertEqual(exporter.address, path)
+        head, body = scrape_unix(path)
+        self.assertIn("200", head.splitlines()[0])
+        self.assertEqual(parse(body)['ekko_scrapes_total{service="sensor"}'], 5)
+
+        exporter.stop()
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
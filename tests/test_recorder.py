@@ -0,0 +1,78 @@
+import os
+import queue
+import tempfile
+import unittest
+
+from bot_ekko.core.command_center import CommandCenter
+from bot_ekko.core.models import CommandNames
+from bot_ekko.core.recorder import (
+    InputRecorder, RecordKind, decode_command, frame_time_stats, read_recording, summarize_recording
+)
+from bot_ekko.core.state_machine import StateHandler, StateMachine
+from bot_ekko.core.state_registry import StateRegistry
+
+
+class FakeRenderEngine:
+    def get_physics_state(self):
+        return {}
+
+    def set_physics_state(self, state):
+        pass
+
+
+class TestRecorder(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "session.rec")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_records_roundtrip(self):
+        recorder = InputRecorder(self.path)
+        recorder.record(RecordKind.SENSOR_LINE, b'{"sensor_vlox":{"data":{"mm":120,"status":"ok"}}}\n')
+        recorder.record(RecordKind.BT_WRITE, b"STATE;HAPPY")
+        recorder.close()
+
+        records = list(read_recording(self.path))
+        self.assertEqual([kind for _, kind, _ in records], [RecordKind.SENSOR_LINE, RecordKind.BT_WRITE])
+        self.assertEqual(records[1][2], b"STATE;HAPPY")
+        self.assertLessEqual(records[0][0], records[1][0])
+        self.assertEqual(summarize_recording(self.path)["records"], {"sensor_line": 1, "bt_write": 1})
+
+    def test_truncated_record_is_skipped(self):
+        recorder = InputRecorder(self.path)
+        recorder.record(RecordKind.BT_WRITE, b"BLINK")
+        recorder.record(RecordKind.BT_WRITE, b"LOOK;10;10")
+        recorder.close()
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 3)
+        self.assertEqual([payload for _, _, payload in read_recording(self.path)], [b"BLINK"])
+
+    def test_command_center_records_commands_and_batches(self):
+        StateRegistry.register_state(StateRegistry.ACTIVE, [0, 0, 0, 0, 0])
+        recorder = InputRecorder(self.path)
+        center = CommandCenter(queue.Queue(), StateHandler(FakeRenderEngine(), StateMachine(StateRegistry.ACTIVE)))
+        center.recorder = recorder
+
+        center.issue_command(CommandNames.CHANGE_STATE, params={"target_state": "HAPPY", "callback": object()})
+        center.issue_batch([(CommandNames.LOOK_AT, {"x": 1, "y": 2}), (CommandNames.BLINK, None)])
+        recorder.close()
+
+        commands = [decode_command(payload) for _, kind, payload in read_recording(self.path)]
+        self.assertEqual(commands[0][0], CommandNames.CHANGE_STATE)
+        self.assertEqual(commands[0][1]["target_state"], "HAPPY")
+        self.assertEqual(commands[1], (CommandNames.BATCH, {"commands": [
+            (CommandNames.LOOK_AT, {"x": 1, "y": 2}), (CommandNames.BLINK, None)
+        ]}))
+
+    def test_frame_time_stats(self):
+        stats = frame_time_stats([0.001] * 99 + [0.1])
+        self.assertEqual(stats["frames"], 100)
+        self.assertAlmostEqual(stats["p50_ms"], 1.0)
+        self.assertAlmostEqual(stats["max_ms"], 100.0)
+        self.assertEqual(frame_time_stats([]), {"frames": 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from datetime import date, datetime, timedelta
+
+from bot_ekko.core.scheduler import Scheduler
+from bot_ekko.tools.schedule_analyzer import activity_matrix, analyze
+
+EVENTS = [
+    {"name": "Sleep", "type": "daily", "start_time": "23:00", "end_time": "07:00", "weekdays": ["fri", "sat"],
+     "state": "SLEEPING", "priority": 1, "interruptible_states": ["ACTIVE"]},
+    {"name": "Night", "type": "daily", "start_time": "24:00", "end_time": "06:00", "state": "SLEEPING", "priority": 1,
+     "interruptible_states": ["ACTIVE"]},
+    {"name": "Lunch", "type": "daily", "start_time": "12:30", "end_time": "13:00", "state": "HAPPY", "priority": 2},
+    {"name": "Clock", "type": "hourly", "state": "CLOCK", "priority": 5, "params": {"duration": 90}},
+    {"name": "Standup", "type": "cron", "cron": "*/20 9-11 * * mon-fri", "duration": 150, "state": "CHAT",
+     "priority": 4},
+    {"name": "Stretch", "type": "interval", "every_minutes": 50, "duration": 60, "state": "HAPPY", "priority": 3},
+    {"name": "Party", "type": "date", "start_datetime": "2026-01-07 12:15:30", "end_datetime": "2026-01-07 12:45:00",
+     "state": "CANVAS", "priority": 10},
+    {"name": "Past", "type": "date", "start_datetime": "2020-01-01 00:00:00", "end_datetime": "2020-01-02 00:00:00",
+     "state": "CANVAS", "priority": 10},
+    {"name": "Buried", "type": "daily", "start_time": "12:35", "end_time": "12:40", "state": "ANGRY", "priority": 0},
+]
+
+
+class TestScheduleAnalyzer(unittest.TestCase):
+    def test_activity_matches_scheduler(self):
+        events = Scheduler([dict(event) for event in EVENTS]).compiled
+        start = datetime(2026, 1, 4)
+        matrix = activity_matrix(events, start, 8 * 24 * 60)
+        for minute in range(0, 8 * 24 * 60, 7):
+            now = start + timedelta(minutes=minute)
+            for row, event in enumerate(events):
+                self.assertEqual(matrix[row, minute], event.is_active(now), (event.name, now))
+
+    def test_report(self):
+        report = analyze(EVENTS, date(2026, 1, 5), date(2026, 1, 12))
+        events = {event["name"]: event for event in report["events"]}
+        self.assertEqual(report["minutes"], 7 * 24 * 60)
+        self.assertEqual(events["Party"]["active_minutes"], 29)
+        self.assertEqual(events["Party"]["effective_minutes"], 29)
+        # Every weekday 09:00-11:40, every 20 minutes, 3 minutes each
+        self.assertEqual(events["Standup"]["active_minutes"], 5 * 9 * 3)
+
+        unreachable = {item["event"]: item["reason"] for item in report["unreachable"]}
+        self.assertEqual(unreachable["Past"], "never active in range")
+        self.assertEqual(unreachable["Buried"], "always outranked")
+        shadowed = {item["event"]: item["by"] for item in report["shadowed"]}
+        self.assertIn("Lunch", shadowed["Buried"])
+        self.assertIn(["Lunch", "Buried"], [overlap["events"] for overlap in report["overlaps"]])
+
+        timeline = report["timeline"]
+        self.assertEqual(timeline[0]["start"], "2026-01-05T00:00:00")
+        self.assertEqual(timeline[-1]["end"], "2026-01-12T00:00:00")
+        self.assertEqual(timeline[0]["state"], "CLOCK")
+        # The night is resumed after the clock: sleep can interrupt ACTIVE again
+        self.assertEqual((timeline[1]["state"], timeline[1]["event"]), ("SLEEPING", "Night"))
+
+    def test_year_is_fast(self):
+        report = analyze(EVENTS, date(2026, 1, 1), date(2027, 1, 1))
+        self.assertEqual(report["minutes"], 365 * 24 * 60)
+        self.assertLess(report["elapsed"], 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import unittest
+from datetime import datetime, timedelta
+
+from bot_ekko.core.cron import CronSpec
+from bot_ekko.core.scheduler import Scheduler
+
+EVENTS = [
+    {"name": "Sleep Schedule", "type": "daily", "start_time": "24:00", "end_time": "07:00",
+     "state": "SLEEPING", "priority": 1, "interruptible_states": ["ACTIVE"]},
+    {"name": "Lunch", "type": "daily", "start_time": "12:30", "end_time": "13:00", "state": "HAPPY", "priority": 2},
+    {"name": "birthday", "type": "date", "start_datetime": "2026-04-06 10:00:00",
+     "end_datetime": "2026-04-06 10:05:00", "state": "CANVAS", "priority": 10},
+    {"name": "Hourly Clock", "type": "hourly", "state": "CLOCK", "priority": 5, "params": {"duration": 10}},
+    {"name": "broken", "type": "daily", "start_time": "noon", "end_time": "13:00", "state": "HAPPY"},
+]
+
+
+class TestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = Scheduler([dict(event) for event in EVENTS])
+
+    def test_invalid_event_is_skipped(self):
+        self.assertEqual(len(self.scheduler.compiled), 4)
+        self.assertEqual([e.name for e in self.scheduler.compiled][0], "birthday")
+
+    def test_target_states(self):
+        s = self.scheduler
+        self.assertEqual(s.get_target_state(datetime(2026, 1, 5, 0, 30), "ACTIVE")[0], "SLEEPING")
+        # Not interruptible from HAPPY
+        self.assertIsNone(s.get_target_state(datetime(2026, 1, 5, 0, 31), "HAPPY"))
+        self.assertEqual(s.get_target_state(datetime(2026, 1, 5, 0, 31), "SLEEPING")[0], "SLEEPING")
+        # Clock outranks sleep at the top of the hour
+        self.assertEqual(s.get_target_state(datetime(2026, 1, 5, 1, 0, 5), "SLEEPING")[0], "CLOCK")
+        self.assertEqual(s.get_target_state(datetime(2026, 1, 5, 1, 0, 10), "ACTIVE")[0], "SLEEPING")
+        self.assertIsNone(s.get_target_state(datetime(2026, 1, 5, 7, 0, 30), "ACTIVE"))
+        self.assertEqual(s.get_target_state(datetime(2026, 4, 6, 10, 0, 30), "ACTIVE"), ("CANVAS", None))
+
+    def test_next_change_at(self):
+        s = self.scheduler
+        self.assertEqual(s.next_change_at(datetime(2026, 1, 5, 23, 59, 50)), datetime(2026, 1, 6, 0, 0))
+        self.assertEqual(s.next_change_at(datetime(2026, 1, 6, 0, 0)), datetime(2026, 1, 6, 0, 0, 10))
+        self.assertEqual(s.next_change_at(datetime(2026, 1, 6, 6, 30)), datetime(2026, 1, 6, 7, 0))
+        self.assertEqual(s.next_change_at(datetime(2026, 1, 6, 12, 10)), datetime(2026, 1, 6, 12, 30))
+        self.assertEqual(s.next_change_at(datetime(2026, 4, 6, 9, 59)), datetime(2026, 4, 6, 10, 0))
+        self.assertEqual(s.next_change_at(datetime(2026, 4, 6, 10, 0, 10)), datetime(2026, 4, 6, 10, 5))
+        # Going back in time rebuilds the index
+        self.assertEqual(s.next_change_at(datetime(2026, 1, 5, 23, 59, 50)), datetime(2026, 1, 6, 0, 0))
+
+    def test_set_events_reindexes(self):
+        s = self.scheduler
+        self.assertEqual(s.get_target_state(datetime(2026, 1, 5, 12, 40), "ACTIVE")[0], "HAPPY")
+        s.set_events([dict(EVENTS[0])])
+        self.assertIsNone(s.get_target_state(datetime(2026, 1, 5, 12, 41), "ACTIVE"))
+        self.assertEqual(s.next_change_at(datetime(2026, 1, 5, 12, 41)), datetime(2026, 1, 6, 0, 0))
+
+    def test_matches_evaluation_at_every_minute(self):
+        s = self.scheduler
+        reference = Scheduler([dict(event) for event in EVENTS])
+        now = datetime(2026, 4, 5, 22, 0, 5)
+        for _ in range(24 * 60):
+            for state in ("ACTIVE", "SLEEPING", "HAPPY"):
+                # A fresh index for every query is the straightforward evaluation
+                reference._evaluated_at = None
+                self.assertEqual(s.get_target_state(now, state), reference.get_target_state(now, state), (now, state))
+            now += timedelta(minutes=1)
+
+
+CRON_EVENTS = [
+    {"name": "Weeknight Sleep", "type": "daily", "start_time": "22:00", "end_time": "06:30", "weekdays": ["mon", "tue"],
+     "state": "SLEEPING", "priority": 1, "interruptible_states": ["ACTIVE"]},
+    {"name": "Standup", "type": "cron", "cron": "*/15 9-11 * * mon-fri", "duration": 90, "state": "CLOCK", "priority": 4},
+    {"name": "Stretch", "type": "interval", "every_minutes": 45, "duration": 20, "state": "HAPPY", "priority": 3},
+    {"name": "New Year", "type": "cron", "cron": "0 0 1 jan *", "duration": 3600, "state": "CANVAS", "priority": 9},
+    {"name": "bad cron", "type": "cron", "cron": "61 * * * *", "state": "HAPPY"},
+]
+
+
+class TestCronSpec(unittest.TestCase):
+    def test_next_and_prev_fire(self):
+        spec = CronSpec.parse("30 9 * * mon-fri")
+        # Friday 09:30 -> Monday 09:30
+        self.assertEqual(spec.next_fire(datetime(2026, 1, 9, 9, 30)), datetime(2026, 1, 12, 9, 30))
+        self.assertEqual(spec.prev_fire(datetime(2026, 1, 11, 12, 0)), datetime(2026, 1, 9, 9, 30))
+        self.assertEqual(spec.prev_fire(datetime(2026, 1, 9, 9, 30, 59)), datetime(2026, 1, 9, 9, 30))
+
+    def test_month_and_day_fields(self):
+        self.assertEqual(CronSpec.parse("0 0 29 feb *").next_fire(datetime(2026, 3, 1)), datetime(2028, 2, 29))
+        # Day-of-month and weekday both restricted: either matches
+        spec = CronSpec.parse("0 12 13 * fri")
+        self.assertEqual(spec.next_fire(datetime(2026, 1, 5)), datetime(2026, 1, 9, 12, 0))
+        self.assertEqual(spec.next_fire(datetime(2026, 1, 12)), datetime(2026, 1, 13, 12, 0))
+        self.assertEqual(CronSpec.parse("0 8 * * 7").next_fire(datetime(2026, 1, 5)), datetime(2026, 1, 11, 8, 0))
+        self.assertIsNone(CronSpec.parse("0 0 31 feb *").next_fire(datetime(2026, 1, 1)))
+
+    def test_invalid_expressions(self):
+        for expression in ("* * * *", "60 * * * *", "5-1 * * * *", "*/0 * * * *", "* * * foo *"):
+            with self.assertRaises(ValueError, msg=expression):
+                CronSpec.parse(expression)
+
+
+class TestCronEvents(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = Scheduler([dict(event) for event in CRON_EVENTS])
+
+    def test_invalid_event_is_skipped(self):
+        self.assertEqual(len(self.scheduler.compiled), 4)
+
+    def test_target_states(self):
+        s = self.scheduler
+        # Monday 2026-01-05: the sleep window runs into Tuesday morning, but not from Wednesday night
+        self.assertEqual(s.get_target_state(datetime(2026, 1, 6, 5, 0), "ACTIVE")[0], "SLEEPING")
+        self.assertIsNone(s.get_target_state(datetime(2026, 1, 8, 5, 0), "ACTIVE"))
+        self.assertEqual(s.get_target_state(datetime(2026, 1, 5, 9, 46, 29), "ACTIVE")[0], "CLOCK")
+        self.assertIsNone(s.get_target_state(datetime(2026, 1, 5, 9, 46, 30), "ACTIVE"))
+        self.assertIsNone(s.get_target_state(datetime(2026, 1, 10, 9, 30, 10), "ACTIVE"))
+        self.assertEqual(s.get_target_state(datetime(2026, 1, 10, 13, 30, 10), "ACTIVE")[0], "HAPPY")
+        self.assertEqual(s.get_target_state(datetime(2027, 1, 1, 0, 59), "SLEEPING")[0], "CANVAS")
+
+    def test_next_change_at(self):
+        s = self.scheduler
+        self.assertEqual(s.next_change_at(datetime(2026, 1, 10, 9, 50)), datetime(2026, 1, 10, 10, 30))
+        self.assertEqual(s.next_change_at(datetime(2026, 1, 10, 10, 30, 5)), datetime(2026, 1, 10, 10, 30, 20))
+        self.assertEqual(s.next_change_at(datetime(2026, 1, 12, 9, 0, 5)), datetime(2026, 1, 12, 9, 0, 20))
+
+    def test_upcoming_events(self):
+        # Wednesday evening: the next weeknight sleep is on Monday
+        upcoming = self.scheduler.upcoming_events(datetime(2026, 1, 7, 21, 0), 6 * 24 * 3600)
+        sleep_starts = [start for start, event in upcoming if event["name"] == "Weeknight Sleep"]
+        self.assertEqual(sleep_starts, [datetime(2026, 1, 12, 22, 0)])
+        stretch = [start for start, event in upcoming if event["name"] == "Stretch"]
+        self.assertEqual(stretch, [datetime(2026, 1, 7, 21, 0)])
+
+    def test_matches_evaluation_at_every_minute(self):
+        s = self.scheduler
+        reference = Scheduler([dict(event) for event in CRON_EVENTS])
+        now = datetime(2026, 1, 4, 20, 0, 15)
+        for _ in range(3 * 24 * 60):
+            reference._evaluated_at = None
+            self.assertEqual(s.get_target_state(now, "ACTIVE"), reference.get_target_state(now, "ACTIVE"), now)
+            now += timedelta(minutes=1)
+
+    def test_many_events_only_reevaluate_at_boundaries(self):
+        events = [{"name": f"ping {i}", "type": "cron", "cron": f"{i % 60} {i // 60 % 24} * * *", "duration": 30,
+                   "state": "HAPPY", "priority": i % 7} for i in range(2000)]
+        s = Scheduler(events)
+        now = datetime(2026, 1, 5, 0, 0, 40)
+        s.get_target_state(now, "ACTIVE")
+        boundary = s.next_change_at(now)
+        self.assertEqual(boundary, datetime(2026, 1, 5, 0, 1))
+        self.assertEqual(s.get_target_state(boundary, "ACTIVE"), ("HAPPY", None))
+        self.assertIsNone(s.get_target_state(boundary + timedelta(seconds=30), "ACTIVE"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import queue
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+from bot_ekko.core.base import Service
+from bot_ekko.core.event_bus import EventBus
+from bot_ekko.core.mainbot import MainBotServicesManager
+from bot_ekko.core.models import (ServiceBluetoothConfig, ServiceGestureConfig, ServiceMicConfig,
+                                  ServiceSensorConfig, ServicesConfig, ServiceSystemLogsConfig)
+
+
+class FakeGestureService(Service):
+    def __init__(self, command_center, service_gesture_config, event_bus=None):
+        super().__init__(service_gesture_config.name, enabled=service_gesture_config.enabled)
+        self.command_center = command_center
+        self.config = service_gesture_config
+        self.event_bus = event_bus
+
+    def update(self):
+        pass
+
+
+class FakeLogsService(Service):
+    def __init__(self, service_config):
+        super().__init__(service_config.name, enabled=service_config.enabled)
+
+    def update(self):
+        pass
+
+
+def services_config(**overrides):
+    config = {
+        "sensor_service": ServiceSensorConfig(name="sensor", baud=115200, port="/dev/null", sensor_triggers={},
+                                              module_path="bot_ekko.tests_missing.sensor"),
+        "bt_service": ServiceBluetoothConfig(name="bt", module_path="bot_ekko.tests_missing.bt"),
+        "gesture_service": ServiceGestureConfig(name="gesture", enabled=True, module_path=__name__,
+                                                class_name="FakeGestureService"),
+        "mic_service": ServiceMicConfig(module_path="bot_ekko.tests_missing.mic"),
+        "system_logs_service": ServiceSystemLogsConfig(name="logs", enabled=True, module_path=__name__,
+                                                       class_name="FakeLogsService"),
+    }
+    config.update(overrides)
+    return ServicesConfig(**config)
+
+
+class TestServicePlugins(unittest.TestCase):
+    def setUp(self):
+        self.command_center = MagicMock()
+        self.event_bus = EventBus()
+        self.manager = MainBotServicesManager(queue.Queue(), MagicMock(), MagicMock(),
+                                              self.command_center, self.event_bus)
+
+    def test_enabled_services_are_built_from_config(self):
+        self.manager.init_services(services_config())
+        gesture = self.manager.service_gesture
+        self.assertIsInstance(gesture, FakeGestureService)
+        self.assertIs(gesture.command_center, self.command_center)
+        self.assertIs(gesture.event_bus, self.event_bus)
+        self.assertIsInstance(self.manager.service_system_logs, FakeLogsService)
+        self.assertEqual(set(self.manager.enabled_services_by_key()), {"gesture_service", "system_logs_service"})
+
+    def test_disabled_services_are_not_imported(self):
+        self.manager.init_services(services_config())
+        self.assertIsNone(self.manager.service_sensor)
+        self.assertIsNone(self.manager.service_bt)
+        self.assertIsNone(self.manager.service_mic)
+        self.assertEqual(self.manager.unavailable_services, {})
+        self.assertEqual(len(self.manager.all_services), 2)
+
+    def test_missing_module_only_disables_that_service(self):
+        config = services_config(mic_service=ServiceMicConfig(enabled=True, module_path="bot_ekko.tests_missing.mic"))
+        self.manager.init_services(config)
+        self.assertIsNone(self.manager.service_mic)
+        self.assertIn("mic_service", self.manager.unavailable_services)
+        self.assertIsInstance(self.manager.service_gesture, FakeGestureService)
+
+    def test_missing_class_is_unavailable(self):
+        config = services_config(gesture_service=ServiceGestureConfig(name="gesture", enabled=True,
+                                                                      module_path=__name__, class_name="Nope"))
+        self.manager.init_services(config)
+        self.assertIsNone(self.manager.service_gesture)
+        self.assertIn("gesture_service", self.manager.unavailable_services)
+
+    def test_include_disabled_builds_everything_loadable(self):
+        config = services_config(gesture_service=ServiceGestureConfig(name="gesture", module_path=__name__,
+                                                                      class_name="FakeGestureService"))
+        self.manager.init_services(config, include_disabled=True)
+        self.assertIsInstance(self.manager.service_gesture, FakeGestureService)
+        self.assertNotIn(self.manager.service_gesture, self.manager.enabled_services)
+        self.assertIn("sensor_service", self.manager.unavailable_services)
+
+    def test_services_package_imports_lazily(self):
+        import bot_ekko.services
+        self.assertIn("GestureService", bot_ekko.services.__all__)
+        with self.assertRaises(AttributeError):
+            bot_ekko.services.NotAService
+        self.assertIs(bot_ekko.services.GestureService,
+                      sys.modules["bot_ekko.services.service_gesture"].GestureService)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import pickle
+import threading
+import unittest
+
+from bot_ekko.core.shared_stats import LAST_ERROR_BYTES, SharedStats
+
+
+class TestSharedStats(unittest.TestCase):
+    def setUp(self):
+        self.stats = SharedStats(counters=("frames", "errors"), gauges=("fps",))
+        self.addCleanup(self.stats.close)
+
+    def test_slots_start_at_zero(self):
+        self.assertEqual(self.stats.snapshot(), {"frames": 0, "errors": 0, "fps": 0.0})
+        self.assertIsNone(self.stats.last_error)
+
+    def test_counters_and_gauges_are_typed(self):
+        self.stats.increment("frames")
+        self.stats.increment("frames", 2)
+        self.stats.set("fps", 59.5)
+        self.stats.set("errors", 4.9)
+        self.assertEqual(self.stats.snapshot(), {"frames": 3, "errors": 4, "fps": 59.5})
+        self.assertIsInstance(self.stats.get("frames"), int)
+
+    def test_attached_block_sees_writes(self):
+        other = pickle.loads(pickle.dumps(self.stats))
+        self.addCleanup(other.close)
+        self.assertEqual(other.name, self.stats.name)
+        other.increment("frames", 7)
+        other.status = 2
+        other.heartbeat = 12.5
+        other.last_error = "boom"
+        self.assertEqual(self.stats.get("frames"), 7)
+        self.assertEqual(self.stats.status, 2)
+        self.assertEqual(self.stats.heartbeat, 12.5)
+        self.assertEqual(self.stats.snapshot()["last_error"], "boom")
+
+    def test_last_error_is_truncated(self):
+        self.stats.last_error = "x" * (LAST_ERROR_BYTES + 10)
+        self.assertEqual(len(self.stats.last_error), LAST_ERROR_BYTES)
+        self.stats.last_error = "short"
+        self.assertEqual(self.stats.last_error, "short")
+
+    def test_last_error_truncates_on_character_boundary(self):
+        self.stats.last_error = "x" + "é" * LAST_ERROR_BYTES
+        error = self.stats.last_error
+        self.assertEqual(error, "x" + "é" * ((LAST_ERROR_BYTES - 1) // 2))
+        self.assertLessEqual(len(error.encode("utf-8")), LAST_ERROR_BYTES)
+
+    def test_concurrent_last_error_reads_are_consistent(self):
+        reader = pickle.loads(pickle.dumps(self.stats))
+        self.addCleanup(reader.close)
+        messages = ("a" * 200, "port closed")
+        done = threading.Event()
+
+        def write():
+            index = 0
+            while not done.is_set():
+                self.stats.last_error = messages[index % 2]
+                index += 1
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            seen = {reader.last_error for _ in range(5000)}
+        finally:
+            done.set()
+            writer.join()
+        self.assertLessEqual(seen, set(messages) | {None})
+
+    def test_unknown_and_duplicate_slots(self):
+        self.assertFalse(self.stats.has("missing"))
+        with self.assertRaises(KeyError):
+            self.stats.increment("missing")
+        with self.assertRaises(ValueError):
+            SharedStats(counters=("a",), gauges=("a",))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import queue
+import unittest
+from unittest.mock import patch
+
+from bot_ekko.core.base import BasePhysicsEngine
+from bot_ekko.core.command_center import Command, CommandCenter
+from bot_ekko.core.models import CommandNames
+from bot_ekko.core.snapshots import SnapshotRing
+from bot_ekko.core.state_machine import StateHandler, StateMachine
+from bot_ekko.core.state_registry import StateRegistry
+
+
+class FakePhysics(BasePhysicsEngine):
+    def __init__(self):
+        super().__init__()
+        self.blink_phase = "IDLE"
+
+
+class FieldRenderEngine:
+    """Render engine exposing physics_fields, like the eyes and BMO adapters."""
+    physics_fields = ("target_x", "target_y", "blink_phase")
+
+    def __init__(self):
+        self.physics = FakePhysics()
+
+    def get_physics_engine(self):
+        return self.physics
+
+    def capture_physics(self, out):
+        for index, name in enumerate(self.physics_fields):
+            out[index] = getattr(self.physics, name)
+
+    def restore_physics(self, values):
+        for name, value in zip(self.physics_fields, values):
+            setattr(self.physics, name, value)
+
+    def get_physics_state(self):
+        raise AssertionError("dict physics state should not be used")
+
+    def set_physics_state(self, state):
+        raise AssertionError("dict physics state should not be used")
+
+
+class TestSnapshotRing(unittest.TestCase):
+    def test_overflow_drops_oldest(self):
+        ring = SnapshotRing(3)
+        ids = [ring.push().context_id for _ in range(5)]
+        self.assertEqual(len(ring), 3)
+        self.assertEqual(ring.metrics()["overflows"], 2)
+        self.assertEqual(ring.peek().context_id, ids[-1])
+
+        # The overwritten contexts can't be restored
+        self.assertIsNone(ring.pop(ids[0]))
+        self.assertEqual(ring.metrics()["missed"], 1)
+        self.assertEqual(len(ring), 3)
+
+    def test_pop_by_id_discards_newer(self):
+        ring = SnapshotRing(4)
+        first = ring.push()
+        first.state = "ACTIVE"
+        ring.push()
+        ring.push()
+
+        snapshot = ring.pop(first.context_id)
+        self.assertEqual(snapshot.state, "ACTIVE")
+        self.assertEqual(len(ring), 0)
+        self.assertEqual(ring.metrics()["discarded"], 2)
+
+    def test_records_are_reused(self):
+        ring = SnapshotRing(2, physics_size=3)
+        slots = {id(ring.push()) for _ in range(6)}
+        self.assertEqual(len(slots), 2)
+        self.assertEqual(len(ring.peek().physics), 3)
+
+
+class TestStateHandlerSnapshots(unittest.TestCase):
+    def setUp(self):
+        for state in (StateRegistry.ACTIVE, StateRegistry.HAPPY, StateRegistry.CANVAS):
+            StateRegistry.register_state(state, [0, 0, 0, 0, 0])
+        self.render_engine = FieldRenderEngine()
+        self.state_handler = StateHandler(self.render_engine, StateMachine(StateRegistry.ACTIVE))
+
+    def test_physics_roundtrip_without_pydantic(self):
+        self.render_engine.physics.target_x = 12
+        self.render_engine.physics.blink_phase = "CLOSING"
+        with patch("bot_ekko.core.models.StateContext.__init__", side_effect=AssertionError):
+            context_id = self.state_handler.save_state_ctx()
+            self.state_handler.set_state(StateRegistry.HAPPY)
+            self.render_engine.physics.target_x = -40
+            self.render_engine.physics.blink_phase = "IDLE"
+            self.state_handler.restore_state_ctx(context_id)
+
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.ACTIVE)
+        self.assertEqual(self.render_engine.physics.target_x, 12)
+        self.assertEqual(self.render_engine.physics.blink_phase, "CLOSING")
+
+    def test_owner_restores_its_own_context(self):
+        center = CommandCenter(queue.Queue(), self.state_handler)
+        # Interrupt saves ACTIVE, media then saves HAPPY on top of it
+        center.dispatch(Command(CommandNames.CHANGE_STATE, {"target_state": StateRegistry.HAPPY, "save_history": True,
+                                                             "context_owner": "interrupts"}))
+        center.dispatch(Command(CommandNames.CHANGE_STATE, {"target_state": StateRegistry.CANVAS, "save_history": True}))
+        self.assertEqual(len(self.state_handler.state_history), 2)
+
+        center.dispatch(Command(CommandNames.RESTORE_STATE, {"context_owner": "interrupts"}))
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.ACTIVE)
+        self.assertEqual(len(self.state_handler.state_history), 0)
+
+        # A second restore for the same owner is a no-op
+        self.state_handler.set_state(StateRegistry.HAPPY)
+        center.dispatch(Command(CommandNames.RESTORE_STATE, {"context_owner": "interrupts"}))
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.HAPPY)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import json
+import os
+import tempfile
+import unittest
+
+from PIL import Image
+
+from bot_ekko.modules.media_interface import MediaModule
+from bot_ekko.modules.sprite_sheet import (
+    SPRITE_SHEET_SUFFIX,
+    convert_gif_to_sprite_sheet,
+    find_sprite_sheet,
+    load_sprite_sheet,
+)
+
+
+def _write_gif(path, colors, duration=50):
+    frames = [Image.new("RGB", (8, 6), color) for color in colors]
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=duration, loop=0, disposal=1)
+
+
+class TestSpriteSheet(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.gif_path = os.path.join(self.tmp.name, "anim.gif")
+        # red, red, blue, red -> 2 unique frames, 3 sequence steps
+        _write_gif(self.gif_path, [(255, 0, 0), (255, 0, 0), (0, 0, 255), (255, 0, 0)])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_convert_deduplicates_frames(self):
+        manifest_path = convert_gif_to_sprite_sheet(self.gif_path)
+        self.assertTrue(manifest_path.endswith(SPRITE_SHEET_SUFFIX))
+
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+        self.assertEqual(len(manifest["frames"]), 2)
+        self.assertEqual([entry["frame"] for entry in manifest["sequence"]], [0, 1, 0])
+        # Consecutive duplicates are merged into one longer step
+        self.assertEqual(manifest["sequence"][0]["duration"], 100)
+
+    def test_load_png_and_raw(self):
+        for image_format in ("png", "raw"):
+            out_dir = os.path.join(self.tmp.name, image_format)
+            manifest_path = convert_gif_to_sprite_sheet(self.gif_path, output_dir=out_dir, image_format=image_format)
+            sheet = load_sprite_sheet(manifest_path)
+
+            frames = sheet.frames()
+            self.assertEqual(len(frames), 3)
+            self.assertEqual(frames[0].get_size(), (8, 6))
+            self.assertEqual(tuple(frames[0].get_at((0, 0)))[:3], (255, 0, 0))
+            self.assertEqual(tuple(frames[1].get_at((0, 0)))[:3], (0, 0, 255))
+            self.assertAlmostEqual(sheet.delays[0], 0.1)
+
+    def test_media_module_prefers_sprite_sheet(self):
+        self.assertIsNone(find_sprite_sheet(self.gif_path))
+        convert_gif_to_sprite_sheet(self.gif_path)
+        self.assertIsNotNone(find_sprite_sheet(self.gif_path))
+
+        media = MediaModule(None, None)
+        media.play_gif(self.gif_path, duration=1.0)
+
+        self.assertEqual(media.current_media_type, "GIF")
+        self.assertEqual(len(media.gif_frames), 3)
+        # Frames come from the shared atlas
+        self.assertIsNotNone(media.gif_frames[0].get_parent())
+
+
+if __name__ == '__main__':
+    unittest.main()
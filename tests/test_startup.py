@@ -0,0 +1,83 @@
+import threading
+import time
+import unittest
+
+from bot_ekko.core.base import Service, ServiceStatus
+from bot_ekko.core.startup import ServiceStarter, format_report, startup_order
+
+
+class SlowService(Service):
+    def __init__(self, name, delay=0.0, fail=False, depends_on=(), log=None):
+        super().__init__(name, enabled=True)
+        self.delay = delay
+        self.fail = fail
+        self.depends_on = tuple(depends_on)
+        self.log = log if log is not None else []
+
+    def init(self):
+        time.sleep(self.delay)
+        if self.fail:
+            self.set_status(ServiceStatus.ERROR)
+            raise OSError(f"{self.service_name} unavailable")
+        super().init()
+
+    def start(self):
+        self.log.append(("start", self.service_name, threading.current_thread().name))
+        super().start()
+
+    def update(self):
+        pass
+
+
+class TestServiceStarter(unittest.TestCase):
+    def test_services_start_concurrently(self):
+        services = {key: SlowService(key, delay=0.2) for key in ("sensor", "bt", "gesture", "mic")}
+        started = time.perf_counter()
+        report = ServiceStarter(services).start()
+        self.assertLess(time.perf_counter() - started, 0.6)
+        self.assertTrue(all(service.status == ServiceStatus.RUNNING for service in services.values()))
+        for entry in report["services"].values():
+            self.assertGreaterEqual(entry["duration_ms"], 150)
+            self.assertEqual(entry["status"], "RUNNING")
+
+    def test_dependencies_start_first(self):
+        log = []
+        services = {
+            "gesture": SlowService("gesture", depends_on=["bt"], log=log),
+            "bt": SlowService("bt", delay=0.1, log=log),
+            "mic": SlowService("mic", depends_on=["disabled"], log=log),
+        }
+        self.assertEqual(startup_order(services), ["bt", "gesture", "mic"])
+        report = ServiceStarter(services).start()
+        names = [name for _, name, _ in log]
+        self.assertLess(names.index("bt"), names.index("gesture"))
+        self.assertGreaterEqual(report["services"]["gesture"]["start_ms"],
+                                report["services"]["bt"]["start_ms"] + report["services"]["bt"]["duration_ms"] - 1)
+        self.assertEqual(report["services"]["gesture"]["depends_on"], ["bt"])
+
+    def test_failed_dependency_skips_dependents(self):
+        services = {
+            "sensor": SlowService("sensor", fail=True),
+            "logger": SlowService("logger", depends_on=["sensor"]),
+            "mic": SlowService("mic"),
+        }
+        starter = ServiceStarter(services)
+        report = starter.start()
+        self.assertEqual(report["services"]["sensor"]["status"], "ERROR")
+        self.assertEqual(report["services"]["logger"]["status"], "SKIPPED")
+        self.assertEqual(services["logger"].status, ServiceStatus.NOT_INITIALIZED)
+        self.assertEqual(services["mic"].status, ServiceStatus.RUNNING)
+        self.assertEqual([str(e) for e in starter.errors], ["sensor unavailable"])
+
+        text = format_report(report)
+        self.assertIn("sensor unavailable", text)
+        self.assertIn("dependency sensor failed", text)
+
+    def test_cycle_is_rejected(self):
+        services = {"a": SlowService("a", depends_on=["b"]), "b": SlowService("b", depends_on=["a"])}
+        with self.assertRaises(ValueError):
+            startup_order(services)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import threading
+import unittest
+
+from bot_ekko.core.base import ServiceStatus, ThreadedService
+from bot_ekko.core.supervisor import ServiceSupervisor
+
+
+class LoopService(ThreadedService):
+    def __init__(self, name, crash=False, hang=False):
+        super().__init__(name, enabled=True)
+        self.crash = crash
+        self.hang = hang
+        self.heartbeat_timeout = 5.0
+
+    def _run(self):
+        if self.crash:
+            raise RuntimeError("port vanished")
+        while not self._stop_event.is_set():
+            if not self.hang:
+                self.heartbeat()
+            self._stop_event.wait(0.01)
+
+    def update(self):
+        pass
+
+
+class FakeManager:
+    def __init__(self, **services):
+        self.services = services
+        self.replaced = []
+        self.factory = lambda key: LoopService(key)
+
+    def enabled_services_by_key(self):
+        return dict(self.services)
+
+    def replace_service(self, key):
+        self.services[key].stop()
+        self.replaced.append(key)
+        service = self.factory(key)
+        service.start()
+        self.services[key] = service
+        return service
+
+
+class TestServiceSupervisor(unittest.TestCase):
+    def tearDown(self):
+        for service in self.manager.services.values():
+            service.stop()
+            service.join(timeout=1)
+
+    def start(self, **services):
+        self.manager = FakeManager(**services)
+        for service in services.values():
+            service.start()
+        self.supervisor = ServiceSupervisor(self.manager, backoff_base=1.0, backoff_max=4.0, stable_seconds=30.0)
+
+    def test_crashed_service_is_recreated(self):
+        self.start(sensor=LoopService("sensor", crash=True), gesture=LoopService("gesture"))
+        self.manager.services["sensor"].join(timeout=1)
+        self.assertEqual(self.manager.services["sensor"].status, ServiceStatus.ERROR)
+
+        self.assertEqual(self.supervisor.check(now=100.0), 1)
+        self.assertEqual(self.manager.replaced, ["sensor"])
+        self.assertEqual(self.supervisor.states["sensor"].last_problem, "error: port vanished")
+        self.assertIsNone(self.supervisor.diagnose(self.manager.services["sensor"], 100.0))
+
+    def test_backoff_doubles_and_resets_when_stable(self):
+        self.start(sensor=LoopService("sensor", crash=True))
+        self.manager.factory = lambda key: LoopService(key, crash=True)
+        self.manager.services["sensor"].join(timeout=1)
+
+        attempts = []
+        now = 0.0
+        while now < 20:
+            self.manager.services["sensor"].join(timeout=1)
+            if self.supervisor.check(now=now):
+                attempts.append(now)
+            now += 0.5
+        self.assertEqual(attempts, [0.0, 1.0, 3.0, 7.0, 11.0, 15.0, 19.0])
+
+        self.manager.factory = lambda key: LoopService(key)
+        self.supervisor.check(now=23.0)
+        self.assertEqual(self.supervisor.states["sensor"].failures, 8)
+        self.supervisor.check(now=53.0)
+        self.assertEqual(self.supervisor.states["sensor"].failures, 0)
+
+    def test_hung_and_exited_services(self):
+        self.start(mic=LoopService("mic", hang=True))
+        service = self.manager.services["mic"]
+        start = service.last_heartbeat
+        self.assertIsNone(self.supervisor.diagnose(service, start + 4.0))
+        self.assertEqual(self.supervisor.diagnose(service, start + 6.0), "no heartbeat for 6.0s")
+
+        # The loop returned without an error: still RUNNING, but the thread is gone
+        service.stop()
+        service.join(timeout=1)
+        service.set_status(ServiceStatus.RUNNING)
+        self.assertEqual(self.supervisor.diagnose(service, start), "thread exited")
+
+    def test_stopped_service_is_left_alone(self):
+        self.start(gesture=LoopService("gesture"))
+        self.manager.services["gesture"].stop()
+        self.assertEqual(self.supervisor.check(now=100.0), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import pygame
+
+from bot_ekko.modules.media_interface import MediaModule
+from bot_ekko.modules.text_effects import TextEffect, TextStrip, wrap_text
+from bot_ekko.sys_config import CHAT_FONT, CYAN, MAIN_FONT
+
+class CountingFont(pygame.font.Font):
+    renders = 0
+
+    def render(self, *args, **kwargs):
+        CountingFont.renders += 1
+        return super().render(*args, **kwargs)
+
+
+LONG_TEXT = " ".join(["marquee"] * 400)
+
+
+class TestTextStrip(unittest.TestCase):
+    def test_glyph_offsets_match_lines(self):
+        strip = TextStrip.render("hello wide world", MAIN_FONT, CYAN, 200)
+        lines = wrap_text("hello wide world", MAIN_FONT, 200)
+        self.assertEqual(len(strip.line_rects), len(lines))
+        self.assertEqual(strip.char_count, sum(len(line) for line in lines))
+        for offsets in strip.glyph_offsets:
+            self.assertEqual(offsets, sorted(offsets))
+
+    def test_reveal_rects_grow(self):
+        strip = TextStrip.render("abc def", MAIN_FONT, CYAN)
+        self.assertEqual(strip.reveal_rects(0), [])
+        partial = strip.reveal_rects(3)[0]
+        self.assertLess(partial.width, strip.line_rects[0].width)
+        self.assertEqual(strip.reveal_rects(strip.char_count), strip.line_rects)
+
+
+class TestTextEffect(unittest.TestCase):
+    def setUp(self):
+        self.surface = pygame.Surface((800, 480))
+
+    def test_font_rendered_once(self):
+        strip = TextStrip.render(LONG_TEXT, CountingFont(None, 30), CYAN, 760)
+        rendered = CountingFont.renders
+        effect = TextEffect(strip, "typewriter", speed=50)
+        for step in range(20):
+            effect.draw(self.surface, step * 0.5)
+        self.assertEqual(CountingFont.renders, rendered)
+
+    def test_typewriter_reports_only_typed_lines(self):
+        strip = TextStrip.render("short reply", MAIN_FONT, CYAN, 760)
+        effect = TextEffect(strip, "typewriter", speed=10)
+        effect.draw(self.surface, 0.0)
+        changed = effect.draw(self.surface, 0.3)
+        self.assertEqual(len(changed), 1)
+        self.assertLessEqual(changed[0].height, strip.line_rects[0].height)
+        # Fully typed: nothing changes anymore
+        effect.draw(self.surface, 10.0)
+        self.assertEqual(effect.draw(self.surface, 11.0), [])
+
+    def test_typewriter_scrolls_overflowing_text(self):
+        strip = TextStrip.render(LONG_TEXT, CHAT_FONT, CYAN, 760)
+        self.assertGreater(strip.surface.get_height(), 480)
+        effect = TextEffect(strip, "typewriter", speed=1000)
+        effect.draw(self.surface, 0.1)
+        effect.draw(self.surface, 100.0)
+        # Last line ends at the bottom of the viewport
+        self.assertEqual(effect._last[1] + strip.line_rects[-1].bottom, 480)
+
+    def test_marquees_move_and_loop(self):
+        for mode, axis in (("marquee_v", 1), ("marquee_h", 0)):
+            strip = TextStrip.render("loop", MAIN_FONT, CYAN, None if mode == "marquee_h" else 760)
+            effect = TextEffect(strip, mode, speed=100)
+            effect.draw(self.surface, 0.0)
+            start = effect._last[axis]
+            changed = effect.draw(self.surface, 0.5)
+            self.assertEqual(effect._last[axis], start - 50)
+            self.assertTrue(changed)
+            travel = (480 if axis else 800) + strip.surface.get_size()[axis]
+            effect.draw(self.surface, travel / 100.0)
+            self.assertEqual(effect._last[axis], start)
+
+    def test_rejects_unknown_effect(self):
+        with self.assertRaises(ValueError):
+            TextEffect(TextStrip.render("x", MAIN_FONT, CYAN), "bounce")
+
+
+class TestMediaModuleTextEffects(unittest.TestCase):
+    def test_show_text_with_effect(self):
+        media = MediaModule(None, None)
+        media.show_text(LONG_TEXT, effect="marquee_h", speed=200)
+        self.assertEqual(media.text_effect.effect, "marquee_h")
+        self.assertEqual(len(media.text_effect.strip.line_rects), 1)
+
+        surface = pygame.Surface((800, 480))
+        media.update(surface)
+        self.assertIsNone(media.consume_dirty_rects())
+        media._text_effect_start -= 0.5
+        media.update(surface)
+        self.assertTrue(media.consume_dirty_rects())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import queue
+import unittest
+
+from bot_ekko.core.command_center import CommandCenter
+from bot_ekko.core.models import CommandNames, SystemConfig, TransitionGraphConfig
+from bot_ekko.core.state_machine import StateHandler, StateMachine
+from bot_ekko.core.state_registry import StateRegistry
+from bot_ekko.core.transitions import TransitionGraph
+
+
+class FakeRenderEngine:
+    def get_physics_state(self):
+        return {}
+
+    def set_physics_state(self, state):
+        pass
+
+
+def _graph(**config):
+    return TransitionGraphConfig(**config)
+
+
+class TestTransitionGraph(unittest.TestCase):
+    def test_default_blocks_scheduler_during_chat(self):
+        graph = TransitionGraph().compile()
+        self.assertIsNone(graph.resolve("CHAT", "CLOCK", {"_source": "scheduler"}))
+        self.assertEqual(graph.resolve("CHAT", "HAPPY", {}), "HAPPY")
+
+    def test_shipped_config_uses_default_rules(self):
+        config = SystemConfig.from_json_file("bot_ekko/config.json").transitions
+        self.assertEqual(config.rules, TransitionGraphConfig().rules)
+        graph = TransitionGraph(config).compile()
+        self.assertEqual(graph.resolve("SLEEPING", "ACTIVE"), "ACTIVE")
+
+    def test_redirect_and_deny(self):
+        graph = TransitionGraph(_graph(rules=[
+            {"from_states": ["SLEEPING"], "to_states": ["ACTIVE"], "action": "redirect", "redirect_to": "WAKING"},
+            {"from_states": ["*"], "to_states": ["CLOCK"], "action": "deny"},
+            # Later rules win
+            {"from_states": ["ACTIVE"], "to_states": ["CLOCK"], "action": "allow"},
+        ])).compile()
+        self.assertEqual(graph.resolve("SLEEPING", "ACTIVE"), "WAKING")
+        self.assertIsNone(graph.resolve("HAPPY", "CLOCK"))
+        self.assertEqual(graph.resolve("ACTIVE", "CLOCK"), "CLOCK")
+        self.assertFalse(graph.can_transition("SLEEPING", "ACTIVE"))
+
+    def test_default_deny_with_guarded_allow(self):
+        graph = TransitionGraph(_graph(default_action="deny", rules=[
+            {"from_states": ["ACTIVE"], "to_states": ["*"], "action": "allow", "guard": "not_from_scheduler"},
+        ])).compile()
+        self.assertEqual(graph.resolve("ACTIVE", "HAPPY"), "HAPPY")
+        self.assertIsNone(graph.resolve("ACTIVE", "HAPPY", {"_source": "scheduler"}))
+        self.assertIsNone(graph.resolve("HAPPY", "ACTIVE"))
+
+    def test_failed_guard_falls_back_to_earlier_rules(self):
+        graph = TransitionGraph(_graph(rules=[
+            {"from_states": ["SLEEPING"], "to_states": ["*"], "action": "deny"},
+            {"from_states": ["SLEEPING"], "to_states": ["ACTIVE"], "action": "redirect", "redirect_to": "WAKING",
+             "guard": "from_scheduler"},
+            {"from_states": ["SLEEPING"], "to_states": ["HAPPY"], "action": "allow", "guard": "not_from_scheduler"},
+        ])).compile()
+        self.assertEqual(graph.resolve("SLEEPING", "ACTIVE", {"_source": "scheduler"}), "WAKING")
+        # The guarded rules fail: the earlier deny applies, not the default allow
+        self.assertIsNone(graph.resolve("SLEEPING", "ACTIVE", {}))
+        self.assertIsNone(graph.resolve("SLEEPING", "HAPPY", {"_source": "scheduler"}))
+        self.assertEqual(graph.resolve("SLEEPING", "HAPPY", {}), "HAPPY")
+        self.assertEqual(graph.resolve("ACTIVE", "HAPPY", {"_source": "scheduler"}), "HAPPY")
+        self.assertEqual([edge[2:] for edge in graph.edges() if edge[:2] == ("SLEEPING", "ACTIVE")],
+                         [("redirect", "WAKING", "from_scheduler"), ("deny", None, None)])
+
+    def test_unguarded_rule_hides_earlier_rules(self):
+        graph = TransitionGraph(_graph(rules=[
+            {"from_states": ["SLEEPING"], "to_states": ["ACTIVE"], "action": "deny", "guard": "from_scheduler"},
+            {"from_states": ["SLEEPING"], "to_states": ["ACTIVE"], "action": "allow"},
+        ])).compile()
+        self.assertEqual(graph.resolve("SLEEPING", "ACTIVE", {"_source": "scheduler"}), "ACTIVE")
+        self.assertEqual(len(graph.edges()), 1)
+
+    def test_compile_rejects_bad_config(self):
+        for rules in (
+            [{"to_states": ["NOPE"]}],
+            [{"action": "teleport"}],
+            [{"action": "redirect", "redirect_to": "NOPE"}],
+            [{"guard": "unknown_guard"}],
+        ):
+            with self.assertRaises(ValueError):
+                TransitionGraph(_graph(rules=rules)).compile()
+        with self.assertRaises(ValueError):
+            TransitionGraph(_graph(on_enter={"HAPPY": ["missing_hook"]})).compile()
+
+    def test_to_dict_exposes_edges(self):
+        graph = TransitionGraph(_graph(rules=[
+            {"from_states": ["SLEEPING"], "to_states": ["ACTIVE"], "action": "redirect", "redirect_to": "WAKING"},
+        ])).compile()
+        data = graph.to_dict()
+        self.assertIn("SLEEPING", data["states"])
+        self.assertEqual(data["edges"], [{"from": "SLEEPING", "to": "ACTIVE", "action": "redirect", "redirect_to": "WAKING", "guard": None}])
+
+
+class TestStateHandlerTransitions(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        graph = TransitionGraph(_graph(
+            rules=[
+                {"from_states": ["SLEEPING"], "to_states": ["ACTIVE"], "action": "redirect", "redirect_to": "WAKING"},
+                {"from_states": ["SLEEPING"], "to_states": ["HAPPY"], "action": "deny"},
+                {"from_states": ["HAPPY"], "to_states": ["SLEEPING"], "action": "deny"},
+            ],
+            on_enter={"WAKING": ["record"]},
+            on_exit={"SLEEPING": ["record"]},
+        ))
+        graph.register_hook("record", lambda state, params: self.calls.append(state))
+        self.state_handler = StateHandler(FakeRenderEngine(), StateMachine(StateRegistry.SLEEPING))
+        self.state_handler.set_transition_graph(graph.compile())
+        self.queue = queue.Queue()
+        self.center = CommandCenter(self.queue, self.state_handler)
+
+    def run_queue(self):
+        while not self.queue.empty():
+            self.center.dispatch(self.queue.get_nowait())
+
+    def test_redirect_runs_hooks(self):
+        self.state_handler.set_state(StateRegistry.ACTIVE)
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.WAKING)
+        self.assertEqual(self.calls, ["SLEEPING", "WAKING"])
+
+    def test_rejected_command_keeps_state_and_history(self):
+        self.center.issue_command(CommandNames.CHANGE_STATE, params={"target_state": StateRegistry.HAPPY, "save_history": True})
+        self.run_queue()
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.SLEEPING)
+        self.assertEqual(len(self.state_handler.state_history), 0)
+        self.assertIsNone(self.state_handler.current_state_params)
+
+    def test_restore_bypasses_rules(self):
+        self.state_handler.save_state_ctx()
+        self.state_handler.set_state(StateRegistry.ACTIVE)
+        self.state_handler.set_state(StateRegistry.HAPPY)
+        self.state_handler.set_state(StateRegistry.SLEEPING)
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.HAPPY)
+
+        self.state_handler.restore_state_ctx()
+        self.assertEqual(self.state_handler.get_state(), StateRegistry.SLEEPING)
+
+
+if __name__ == '__main__':
+    unittest.main()